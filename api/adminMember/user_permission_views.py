@@ -17,7 +17,7 @@ from api.services.admin_permissions import (
     fetch_admin_menu_catalog,
     reapply_level_template_permissions,
 )
-from core.models import AuditLog
+from core.audit import record_audit
 from sites.admin_api.authentication import AdminJWTAuthentication
 from sites.admin_api.menu_codes import ADMIN_MENU_ROOT, MenuCodes
 from sites.admin_api.permissions import MenuPermission
@@ -64,7 +64,7 @@ class UserPermissionReapplyTemplateView(APIView):
         except ValueError as exc:
             return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
-        AuditLog.objects.create(
+        record_audit(
             user_id=str(request.user.memberShipSid),
             site_slug="admin_api",
             action="update",
@@ -201,7 +201,7 @@ class UserPermissionListCreateView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        AuditLog.objects.create(
+        record_audit(
             user_id=str(request.user.memberShipSid),
             site_slug="admin_api",
             action="create",
@@ -264,7 +264,7 @@ class UserPermissionDetailView(APIView):
 
         obj.save()
 
-        AuditLog.objects.create(
+        record_audit(
             user_id=str(request.user.memberShipSid),
             site_slug="admin_api",
             action="update",
@@ -307,7 +307,7 @@ class UserPermissionDetailView(APIView):
         menu_code = obj.menu_code
         obj.delete()
 
-        AuditLog.objects.create(
+        record_audit(
             user_id=str(request.user.memberShipSid),
             site_slug="admin_api",
             action="delete",
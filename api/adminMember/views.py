@@ -16,7 +16,8 @@ from datetime import datetime
 from django.db.models import Q
 
 from api.models import AdminMemberShip
-from core.models import AuditLog
+from core.audit import record_audit
+from core.throttling import AccountRateThrottle, IPRateThrottle
 from api.adminMember.serializers import AdminRegisterSerializer, AdminLoginSerializer, AdminUpdateSerializer
 from api.services.admin_permissions import build_admin_user_payload
 from api.adminMember.utils import create_admin_member_jwt_tokens
@@ -148,7 +149,7 @@ class AdminRegisterView(APIView):
             assign_default_permissions(admin_member)
             
             # 회원 가입 로그 기록 (등록한 관리자 정보 기록)
-            AuditLog.objects.create(
+            record_audit(
                 user_id=str(request.user.memberShipSid),  # 등록한 관리자의 memberShipSid 저장
                 site_slug='admin_api',
                 action='create',
@@ -203,6 +204,10 @@ class AdminLoginView(APIView):
     memberShipId와 비밀번호로 로그인하여 JWT 토큰을 발급받습니다.
     """
     permission_classes = [AllowAny]  # 로그인은 인증 불필요
+    # IP·memberShipId 별 요청 제한 (비밀번호 해시 검증 전)
+    throttle_classes = [IPRateThrottle, AccountRateThrottle]
+    throttle_scope = 'admin_login'
+    throttle_account_fields = ('memberShipId',)
 
     def post(self, request):
         """
@@ -255,7 +260,7 @@ class AdminLoginView(APIView):
             
             if not password_check_result:
                 # 로그인 실패 로그 기록
-                AuditLog.objects.create(
+                record_audit(
                     user_id=str(admin_member.memberShipSid),  # memberShipSid 저장
                     site_slug='admin_api',
                     action='login',
@@ -284,7 +289,7 @@ class AdminLoginView(APIView):
             tokens = create_admin_member_jwt_tokens(admin_member)
             
             # 로그인 성공 로그 기록
-            AuditLog.objects.create(
+            record_audit(
                 user_id=str(admin_member.memberShipSid),  # memberShipSid 저장
                 site_slug='admin_api',
                 action='login',
@@ -398,7 +403,7 @@ class TokenRefreshView(APIView):
 
             tokens = create_admin_member_jwt_tokens(user)
 
-            AuditLog.objects.create(
+            record_audit(
                 user_id=str(user.memberShipSid),
                 site_slug='admin_api',
                 action='update',
@@ -472,7 +477,7 @@ class AdminLogoutView(APIView):
                 member_name = request.user.name
             
             # 로그아웃 로그 기록
-            AuditLog.objects.create(
+            record_audit(
                 user_id=resource_id,  # memberShipSid 저장
                 site_slug='admin_api',
                 action='logout',
@@ -615,7 +620,7 @@ class AdminListView(APIView):
                 })
             
             # 조회 로그 기록
-            AuditLog.objects.create(
+            record_audit(
                 user_id=str(request.user.memberShipSid),
                 site_slug='admin_api',
                 action='read',
@@ -744,7 +749,7 @@ class AdminUpdateView(APIView):
             admin_member.save()
             
             # 수정 로그 기록
-            AuditLog.objects.create(
+            record_audit(
                 user_id=str(request.user.memberShipSid),  # 수정한 관리자의 memberShipSid 저장
                 site_slug='admin_api',
                 action='update',
@@ -861,7 +866,7 @@ class AdminDeleteView(APIView):
             admin_member.save(update_fields=['is_active'])
             
             # 삭제 로그 기록
-            AuditLog.objects.create(
+            record_audit(
                 user_id=str(request.user.memberShipSid),  # 삭제한 관리자의 memberShipSid 저장
                 site_slug='admin_api',
                 action='delete',
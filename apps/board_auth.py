@@ -5,8 +5,7 @@ JWT에서 member_sid를 추출해 PublicMemberShip을 로드하고, DRF 권한(I
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed, PermissionDenied
 from rest_framework.permissions import BasePermission
-from sites.public_api.utils import get_token_from_request, verify_jwt_token
-from sites.public_api.models import PublicMemberShip
+from sites.public_api.auth_context import get_auth_context
 
 
 class RequestUser:
@@ -21,25 +20,22 @@ class BoardJWTAuthentication(BaseAuthentication):
     """
     쿠키 또는 Authorization Bearer에서 JWT를 읽어 PublicMemberShip을 로드하고
     RequestUser(member)를 반환합니다.
+    회원은 요청 인증 컨텍스트에서 1회 조회 (방금 읽은 행이므로 is_staff 도 최신 — refresh_from_db 불필요).
     """
     def authenticate(self, request):
-        token = get_token_from_request(request)
+        context = get_auth_context(request)
+        token = context.token
         if not token:
             raise AuthenticationFailed('토큰이 전달되지 않았습니다. 로그인 후 다시 시도하세요.')
-        payload = verify_jwt_token(token, token_type='access')
+        payload = context.payload
         if not payload:
             raise AuthenticationFailed('유효하지 않거나 만료된 토큰입니다. 다시 로그인하세요.')
-        user_id = payload.get('user_id')
-        if not user_id:
+        if not payload.get('user_id'):
             raise AuthenticationFailed('토큰 형식이 올바르지 않습니다.')
-        try:
-            member = PublicMemberShip.objects.get(
-                member_sid=int(user_id), is_active=True
-            )
-            member.refresh_from_db()  # DB에서 최신 is_staff 등 반영
-            return (RequestUser(member), token)
-        except (PublicMemberShip.DoesNotExist, ValueError, TypeError):
+        member = context.member
+        if member is None:
             raise AuthenticationFailed('유효하지 않은 토큰이거나 회원 정보를 찾을 수 없습니다.')
+        return (RequestUser(member), token)
 
 
 class IsStaffOrReadOnly(BasePermission):
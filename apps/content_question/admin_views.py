@@ -5,6 +5,7 @@
 - DELETE /content/questions/{question_id}/  질문 삭제
 - GET /content/questions/?content_type=ARTICLE&content_id=10  목록 조회
 """
+from django.db import transaction
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -15,6 +16,7 @@ from sites.admin_api.authentication import AdminJWTAuthentication
 from sites.admin_api.menu_codes import MenuCodes
 from sites.admin_api.permissions import MenuPermission
 from .models import ContentQuestion, ContentQuestionAnswer
+from .question_counters import refresh_content_question_counts
 from .serializers import (
     ContentQuestionListSerializer,
     ContentQuestionCreateSerializer,
@@ -87,7 +89,9 @@ class AdminContentQuestionListView(APIView):
         created_by = getattr(request.user, 'id', None) or getattr(request.user, 'admin_id', None)
         if created_by is not None:
             serializer.validated_data['created_by'] = created_by
-        question = serializer.save()
+        with transaction.atomic():
+            question = serializer.save()
+            refresh_content_question_counts(question.content_type, question.content_id)
         out = ContentQuestionListSerializer(question).data
         return Response(
             create_success_response(out, '질문이 등록되었습니다.'),
@@ -148,5 +152,8 @@ class AdminContentQuestionDetailView(APIView):
                 create_error_response('질문을 찾을 수 없습니다.', '04'),
                 status=status.HTTP_404_NOT_FOUND,
             )
-        question.delete()
+        with transaction.atomic():
+            # 답변은 FK CASCADE로 함께 삭제 → 두 집계 모두 다시 센다
+            question.delete()
+            refresh_content_question_counts(question.content_type, question.content_id)
         return Response(create_success_response(None, '질문이 삭제되었습니다.'), status=status.HTTP_200_OK)
@@ -7,6 +7,7 @@
 - PATCH /api/content/question-answer/{answer_id}/  답변 수정
 - DELETE /api/content/question-answer/{answer_id}/  답변 삭제
 """
+from django.db import transaction
 from django.db.models import Count, Max, Q
 
 from rest_framework.views import APIView
@@ -21,10 +22,10 @@ from sites.admin_api.articles.models import Article
 from sites.admin_api.articles.utils import get_presigned_thumbnail_url as article_presigned_thumbnail
 from sites.admin_api.video.models import Video
 from sites.admin_api.video.utils import get_presigned_thumbnail_url as video_presigned_thumbnail
+from sites.public_api.auth_context import get_request_member
 from sites.public_api.authentication import PublicJWTAuthentication
-from sites.public_api.models import PublicMemberShip
 
-from apps.content_question.article_list_annotations import refresh_article_answered_question_count
+from apps.content_question.question_counters import refresh_content_question_counts
 from .models import ContentQuestion, ContentQuestionAnswer
 from .serializers import (
     ContentQuestionPublicSerializer,
@@ -34,11 +35,9 @@ from .serializers import (
 
 
 def _get_member_sid(request):
-    try:
-        member = PublicMemberShip.objects.get(email=request.user.email, is_active=True)
-        return member.member_sid
-    except PublicMemberShip.DoesNotExist:
-        return None
+    """인증(PublicJWTAuthentication)에서 이미 조회한 회원의 member_sid"""
+    member = get_request_member(request)
+    return member.member_sid if member else None
 
 
 class ContentQuestionListView(APIView):
@@ -108,19 +107,18 @@ class ContentQuestionAnswerCreateView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        answer = ContentQuestionAnswer.objects.create(
-            question=question,
-            content_type=content_type,
-            content_id=content_id,
-            user_id=user_id,
-            answer_text=answer_text,
-        )
-        # 첫 답변 등록 시 질문 잠금 (수정 불가 표시)
-        if not question.is_locked:
-            ContentQuestion.objects.filter(question_id=question_id).update(is_locked=True)
-
-        if content_type == ContentQuestionAnswer.CONTENT_TYPE_ARTICLE:
-            refresh_article_answered_question_count(content_id)
+        with transaction.atomic():
+            answer = ContentQuestionAnswer.objects.create(
+                question=question,
+                content_type=content_type,
+                content_id=content_id,
+                user_id=user_id,
+                answer_text=answer_text,
+            )
+            # 첫 답변 등록 시 질문 잠금 (수정 불가 표시)
+            if not question.is_locked:
+                ContentQuestion.objects.filter(question_id=question_id).update(is_locked=True)
+            refresh_content_question_counts(content_type, content_id)
 
         return Response(
             create_success_response(
@@ -435,9 +433,9 @@ class ContentQuestionAnswerDetailView(APIView):
         qid = answer.question_id
         ct = answer.content_type
         cid = answer.content_id
-        answer.delete()
-        if ct == ContentQuestionAnswer.CONTENT_TYPE_ARTICLE:
-            refresh_article_answered_question_count(cid)
+        with transaction.atomic():
+            answer.delete()
+            refresh_content_question_counts(ct, cid)
         return Response(
             create_success_response({'question_id': qid}, '답변이 삭제되었습니다.'),
             status=status.HTTP_200_OK,
@@ -0,0 +1,95 @@
+"""
+콘텐츠 질문·답변 집계 컬럼 유지 (Article·Video.questionCount / answeredQuestionCount)
+- questionCount: content_question 등록 질문 수
+- answeredQuestionCount: 답변이 1건 이상인 질문 수(question_id distinct)
+- 질문/답변 등록·삭제와 같은 트랜잭션에서 refresh_content_question_counts 호출
+- 드리프트 보정: reconcile_question_counts (backfill_question_bookmark_counts --only questions)
+관리자 목록은 이 컬럼으로 정렬·페이지네이션한다 (상관 서브쿼리 없음).
+"""
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from apps.content_question.models import ContentQuestion, ContentQuestionAnswer
+
+# content_question.content_type → Video.contentType
+VIDEO_CONTENT_TYPES = {
+    ContentQuestion.CONTENT_TYPE_VIDEO: 'video',
+    ContentQuestion.CONTENT_TYPE_SEMINAR: 'seminar',
+}
+
+
+def _question_count_subquery(content_type: str):
+    return (
+        ContentQuestion.objects.filter(content_type=content_type, content_id=OuterRef('pk'))
+        .values('content_id')
+        .annotate(_cnt=Count('question_id'))
+        .values('_cnt')[:1]
+    )
+
+
+def _answered_question_count_subquery(content_type: str):
+    """질문별로 답변이 1건이라도 있으면 1로만 집계(여러 사용자·여러 행이어도 question_id당 1)."""
+    return (
+        ContentQuestionAnswer.objects.filter(content_type=content_type, content_id=OuterRef('pk'))
+        .values('content_id')
+        .annotate(_cnt=Count('question_id', distinct=True))
+        .values('_cnt')[:1]
+    )
+
+
+def _counter_values(content_type: str) -> dict:
+    return {
+        'questionCount': Coalesce(
+            Subquery(_question_count_subquery(content_type), output_field=IntegerField()), Value(0)
+        ),
+        'answeredQuestionCount': Coalesce(
+            Subquery(_answered_question_count_subquery(content_type), output_field=IntegerField()), Value(0)
+        ),
+    }
+
+
+def _target_queryset(content_type: str):
+    """content_question.content_type에 대응하는 콘텐츠 queryset (ARTICLE → Article, VIDEO/SEMINAR → Video)."""
+    from sites.admin_api.articles.models import Article
+    from sites.admin_api.video.models import Video
+
+    if content_type == ContentQuestion.CONTENT_TYPE_ARTICLE:
+        return Article.objects.all()
+    video_type = VIDEO_CONTENT_TYPES.get(content_type)
+    if video_type is None:
+        return None
+    return Video.objects.filter(contentType=video_type)
+
+
+def refresh_content_question_counts(content_type: str, content_id: int) -> None:
+    """
+    콘텐츠 1건의 questionCount·answeredQuestionCount를 UPDATE 1문으로 다시 센다.
+    호출하는 쪽의 transaction.atomic 안에서 질문/답변 변경과 함께 커밋되도록 사용.
+    """
+    qs = _target_queryset((content_type or '').upper())
+    if qs is None:
+        return
+    qs.filter(pk=content_id).update(**_counter_values(content_type.upper()))
+
+
+def reconcile_question_counts(dry_run: bool = False) -> dict:
+    """
+    전체 콘텐츠 집계 컬럼을 실제 집계와 맞춘다.
+    반환: {'ARTICLE': n, 'VIDEO': n, 'SEMINAR': n} — dry_run이면 불일치 행 수, 아니면 UPDATE 행 수
+    """
+    result = {}
+    for content_type in (
+        ContentQuestion.CONTENT_TYPE_ARTICLE,
+        ContentQuestion.CONTENT_TYPE_VIDEO,
+        ContentQuestion.CONTENT_TYPE_SEMINAR,
+    ):
+        qs = _target_queryset(content_type)
+        values = _counter_values(content_type)
+        if dry_run:
+            drift = qs.annotate(_q=values['questionCount'], _a=values['answeredQuestionCount']).exclude(
+                questionCount=F('_q'), answeredQuestionCount=F('_a')
+            )
+            result[content_type] = drift.count()
+        else:
+            result[content_type] = qs.update(**values)
+    return result
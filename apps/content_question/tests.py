@@ -0,0 +1,40 @@
+from django.test import TestCase
+
+from sites.public_api.models import IndeUser, PublicMemberShip
+from sites.public_api.utils import create_public_jwt_tokens
+
+from .models import ContentQuestion, ContentQuestionAnswer
+
+PUBLIC_HOST = 'localhost:8001'
+
+
+class AnswerMemberResolutionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.question = ContentQuestion.objects.create(content_type='ARTICLE', content_id=1, question_text='질문')
+        cls.member = PublicMemberShip.objects.create(
+            email='reader@example.com', name='회원', nickname='회원', phone='01012345678',
+        )
+
+    def _post(self, member):
+        token = create_public_jwt_tokens(member)['access_token']
+        return self.client.post(
+            '/api/content/question-answer/',
+            {'question_id': self.question.question_id, 'content_type': 'ARTICLE', 'content_id': 1, 'answer_text': '답변'},
+            content_type='application/json', HTTP_HOST=PUBLIC_HOST, HTTP_AUTHORIZATION=f'Bearer {token}',
+        )
+
+    def test_answer_user_id_is_jwt_member_sid(self):
+        # 같은 email 의 IndeUser id 가 아니라 JWT 의 member_sid 로 저장한다
+        IndeUser.objects.create(id='USRTEST00000001', email=self.member.email)
+        response = self._post(self.member)
+        self.assertEqual(response.status_code, 201, response.content)
+        answer = ContentQuestionAnswer.objects.get()
+        self.assertEqual(answer.user_id, self.member.member_sid)
+
+    def test_inactive_member_cannot_answer(self):
+        PublicMemberShip.objects.filter(pk=self.member.pk).update(is_active=False)
+        response = self._post(self.member)
+        # AuthenticationFailed — authenticate_header 가 없어 DRF 는 403 으로 응답
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(ContentQuestionAnswer.objects.exists())
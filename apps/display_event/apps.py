@@ -5,3 +5,7 @@ class DisplayEventConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.display_event"
     verbose_name = "Display Event (Hero 등)"
+
+    def ready(self):
+        # Hero 캐시 무효화 시그널 연결
+        from . import hero_cache  # noqa: F401
@@ -6,7 +6,7 @@ contentTypeCode(sysCodeSid) → 콘텐츠 로더 매핑.
 
 from __future__ import annotations
 
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterable, Optional
 
 from django.db.models import Q
 
@@ -21,9 +21,9 @@ SID_VIDEO = "SYS26320B011"
 SID_SEMINAR = "SYS26320B012"
 
 
-def _article_payload(article: Article) -> dict[str, Any]:
+def _article_payload(article: Article, *, presign: bool = True) -> dict[str, Any]:
     thumb = article.thumbnail
-    if thumb:
+    if thumb and presign:
         try:
             thumb = get_presigned_thumbnail_url(thumb, expires_in=3600)
         except Exception:
@@ -36,9 +36,9 @@ def _article_payload(article: Article) -> dict[str, Any]:
     }
 
 
-def _video_payload(video: Video) -> dict[str, Any]:
+def _video_payload(video: Video, *, presign: bool = True) -> dict[str, Any]:
     thumb = video.thumbnail
-    if thumb:
+    if thumb and presign:
         try:
             thumb = get_presigned_thumbnail_url(thumb, expires_in=3600)
         except Exception:
@@ -51,32 +51,26 @@ def _video_payload(video: Video) -> dict[str, Any]:
     }
 
 
+def _article_qs():
+    return Article.objects.filter(deletedAt__isnull=True).filter(Q(status=STATUS_PUBLISHED))
+
+
+def _video_qs(content_type: str):
+    return Video.objects.filter(deletedAt__isnull=True, contentType=content_type, status=STATUS_PUBLISHED)
+
+
 def _load_article(content_id: int) -> Optional[dict]:
-    a = (
-        Article.objects.filter(id=content_id, deletedAt__isnull=True)
-        .filter(Q(status=STATUS_PUBLISHED))
-        .first()
-    )
+    a = _article_qs().filter(id=content_id).first()
     return _article_payload(a) if a else None
 
 
 def _load_video(content_id: int) -> Optional[dict]:
-    v = Video.objects.filter(
-        id=content_id,
-        deletedAt__isnull=True,
-        contentType="video",
-        status=STATUS_PUBLISHED,
-    ).first()
+    v = _video_qs("video").filter(id=content_id).first()
     return _video_payload(v) if v else None
 
 
 def _load_seminar(content_id: int) -> Optional[dict]:
-    v = Video.objects.filter(
-        id=content_id,
-        deletedAt__isnull=True,
-        contentType="seminar",
-        status=STATUS_PUBLISHED,
-    ).first()
+    v = _video_qs("seminar").filter(id=content_id).first()
     return _video_payload(v) if v else None
 
 
@@ -88,6 +82,38 @@ CONTENT_LOADERS: dict[str, Callable[[int], Optional[dict]]] = {
 }
 
 
+# sid → (queryset, payload) — load_contents_many 일괄 로드용 (CONTENT_LOADERS 와 같은 sid 유지)
+CONTENT_BATCH_SOURCES: dict[str, tuple[Callable[[], Any], Callable[..., dict]]] = {
+    SID_ARTICLE: (_article_qs, _article_payload),
+    SID_VIDEO: (lambda: _video_qs("video"), _video_payload),
+    SID_SEMINAR: (lambda: _video_qs("seminar"), _video_payload),
+}
+
+
+def load_contents_many(
+    refs: Iterable[tuple[str, Optional[int]]],
+    *,
+    presign: bool = True,
+) -> dict[tuple[str, int], dict]:
+    """
+    (contentTypeCode, contentId) 목록을 타입별 id__in 1회씩 로드.
+    presign=False 면 썸네일 원본 URL 그대로 (호출자가 한 번에 presign).
+
+    Returns:
+        {(contentTypeCode, contentId): payload} — 없거나 비공개인 콘텐츠는 빠진다
+    """
+    ids_by_sid: dict[str, set[int]] = {}
+    for sid, content_id in refs:
+        if content_id is not None and sid in CONTENT_BATCH_SOURCES:
+            ids_by_sid.setdefault(sid, set()).add(int(content_id))
+    out: dict[tuple[str, int], dict] = {}
+    for sid, ids in ids_by_sid.items():
+        queryset, payload = CONTENT_BATCH_SOURCES[sid]
+        for obj in queryset().filter(id__in=ids):
+            out[(sid, obj.id)] = payload(obj, presign=presign)
+    return out
+
+
 def load_content(content_type_code: str, content_id: Optional[int]) -> Optional[dict]:
     if content_id is None:
         return None
@@ -0,0 +1,176 @@
+"""
+공개 Hero 목록 (GET /api/events/) 합성·캐시.
+
+- 합성: 노출 중 이벤트 1회 조회 → 연결 콘텐츠 타입별 id__in 1회 → 이미지 presign 한 번에 (같은 URL 은 1회)
+- 캐시: eventTypeCode 별 완성 목록. 만료 = min(다음 start_at/end_at 경계, HERO_CACHE_TTL)
+  (HERO_CACHE_TTL 은 presigned URL 만료(1시간)보다 짧아야 한다)
+- 무효화: DisplayEvent 저장·삭제, 연결된 Article/Video 저장·삭제, 예약 발행(content_published)
+  모든 웹 프로세스에 전달되려면 공유 캐시(REDIS_URL)가 필요하다 (local 외 환경에서 LocMem 이면 core.W001 경고).
+  LocMem 이면 최대 TTL 을 PROCESS_LOCAL_CACHE_MAX_TTL(기본 30초)로 줄여, 관리자 수정·발행 워커의 삭제가
+  전달되지 않는 다른 프로세스도 그 시간 안에 새 목록을 보게 한다.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Min, Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from core.throttling import is_process_local
+from sites.admin_api.articles.models import Article
+from sites.admin_api.articles.utils import get_presigned_thumbnail_url
+from sites.admin_api.scheduled_publish import content_published
+from sites.admin_api.video.models import Video
+
+from .content_resolution import SID_ARTICLE, SID_SEMINAR, SID_VIDEO, load_contents_many
+from .hero_payload import build_hero_item
+from .models import DisplayEvent
+from .s3_utils import presign_event_banner_image_url
+
+CACHE_PREFIX = "hero_events:"
+
+# 콘텐츠 모델 → 그 모델을 가리킬 수 있는 contentTypeCode
+_CONTENT_SIDS = {
+    Article: (SID_ARTICLE,),
+    Video: (SID_VIDEO, SID_SEMINAR),
+}
+_PUBLISHED_SIDS = {"ARTICLE": (SID_ARTICLE,), "VIDEO": (SID_VIDEO,), "SEMINAR": (SID_SEMINAR,)}
+
+
+def _max_ttl() -> int:
+    ttl = int(getattr(settings, "HERO_CACHE_TTL", 300))
+    if is_process_local("default"):
+        ttl = min(ttl, int(getattr(settings, "PROCESS_LOCAL_CACHE_MAX_TTL", 30)))
+    return ttl
+
+
+def _cache_key(event_type: str) -> str:
+    return f"{CACHE_PREFIX}{event_type}"
+
+
+def _active_qs(event_type: str):
+    return DisplayEvent.objects.filter(event_type_code=event_type, is_active=True)
+
+
+def _visible_qs(event_type: str, now: datetime):
+    return (
+        _active_qs(event_type)
+        .filter(Q(start_at__isnull=True) | Q(start_at__lte=now))
+        .filter(Q(end_at__isnull=True) | Q(end_at__gte=now))
+        .order_by("display_order", "id")
+    )
+
+
+def _next_boundary(event_type: str, now: datetime) -> Optional[datetime]:
+    """노출 목록이 바뀌는 다음 시각 — 아직 시작 전 start_at, 아직 안 끝난 end_at 중 가장 이른 값"""
+    agg = _active_qs(event_type).aggregate(
+        next_start=Min("start_at", filter=Q(start_at__gt=now)),
+        next_end=Min("end_at", filter=Q(end_at__gte=now)),
+    )
+    candidates = [v for v in (agg["next_start"], agg["next_end"]) if v is not None]
+    return min(candidates) if candidates else None
+
+
+def _presign_all(items: list[dict[str, Any]]) -> None:
+    """배너·썸네일 presign 을 한 번에 (같은 URL 은 1회만 서명)"""
+    banners: dict[str, Optional[str]] = {}
+    thumbs: dict[str, Optional[str]] = {}
+    for item in items:
+        url = item.get("imageUrl")
+        if url:
+            if url not in banners:
+                banners[url] = presign_event_banner_image_url(url)
+            item["imageUrl"] = banners[url]
+        content = item.get("content")
+        thumb = content.get("thumbnail") if content else None
+        if thumb:
+            if thumb not in thumbs:
+                try:
+                    thumbs[thumb] = get_presigned_thumbnail_url(thumb, expires_in=3600)
+                except Exception:
+                    thumbs[thumb] = thumb
+            # 같은 콘텐츠를 여러 이벤트가 가리킬 수 있으므로 복사본에 반영
+            item["content"] = {**content, "thumbnail": thumbs[thumb]}
+
+
+def build_public_hero_items(event_type: str, now: Optional[datetime] = None) -> list[dict[str, Any]]:
+    """노출 중 Hero 목록 합성 (캐시 없이)"""
+    now = now or timezone.now()
+    events = list(_visible_qs(event_type, now))
+    contents = load_contents_many(((ev.content_type_code, ev.content_id) for ev in events), presign=False)
+    items = [
+        build_hero_item(
+            ev,
+            contents.get((ev.content_type_code, ev.content_id)) if ev.content_id is not None else None,
+        )
+        for ev in events
+    ]
+    _presign_all(items)
+    return items
+
+
+def get_public_hero_items(event_type: str) -> list[dict[str, Any]]:
+    """eventTypeCode 별 캐시된 Hero 목록 (미스면 합성 후 다음 경계까지 캐시)"""
+    key = _cache_key(event_type)
+    items = cache.get(key)
+    if items is not None:
+        return items
+    now = timezone.now()
+    items = build_public_hero_items(event_type, now)
+    ttl = _max_ttl()
+    boundary = _next_boundary(event_type, now)
+    if boundary is not None:
+        ttl = min(ttl, max(1, math.ceil((boundary - now).total_seconds())))
+    if ttl > 0:
+        cache.set(key, items, ttl)
+    return items
+
+
+def invalidate_hero_cache(event_types: Iterable[Optional[str]]) -> None:
+    keys = [_cache_key(et) for et in set(event_types) if et]
+    if keys:
+        cache.delete_many(keys)
+
+
+def invalidate_hero_cache_for_content(content_type_codes: Iterable[str], content_ids: Iterable[int]) -> None:
+    """콘텐츠를 가리키는 이벤트의 eventTypeCode 캐시 삭제"""
+    content_ids = list(content_ids)
+    if not content_ids:
+        return
+    event_types = (
+        DisplayEvent.objects.filter(content_type_code__in=list(content_type_codes), content_id__in=content_ids)
+        .values_list("event_type_code", flat=True)
+        .distinct()
+    )
+    invalidate_hero_cache(list(event_types))
+
+
+@receiver(post_save, sender=DisplayEvent, dispatch_uid="hero_cache.display_event_saved")
+@receiver(post_delete, sender=DisplayEvent, dispatch_uid="hero_cache.display_event_deleted")
+def _on_display_event_change(sender, instance, **kwargs):
+    event_type = instance.event_type_code
+    transaction.on_commit(lambda: invalidate_hero_cache([event_type]))
+
+
+def _on_content_change(sender, instance, **kwargs):
+    sids, pk = _CONTENT_SIDS[sender], instance.pk
+    transaction.on_commit(lambda: invalidate_hero_cache_for_content(sids, [pk]))
+
+
+for _model in _CONTENT_SIDS:
+    post_save.connect(_on_content_change, sender=_model, weak=False, dispatch_uid=f"hero_cache.{_model._meta.label_lower}.saved")
+    post_delete.connect(_on_content_change, sender=_model, weak=False, dispatch_uid=f"hero_cache.{_model._meta.label_lower}.deleted")
+
+
+@receiver(content_published, dispatch_uid="hero_cache.content_published")
+def _on_content_published(sender, content_type, ids, **kwargs):
+    # bulk_update 라 post_save 가 없다 (이미 커밋 후 발송)
+    invalidate_hero_cache_for_content(_PUBLISHED_SIDS.get(content_type, ()), ids)
@@ -3,20 +3,21 @@
 """
 
 from rest_framework import viewsets
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from core.pagination import FastCountPageNumberPagination
 from sites.admin_api.authentication import AdminJWTAuthentication
 from sites.admin_api.menu_codes import MenuCodes
 from sites.admin_api.permissions import MenuPermission
 
+from .hero_cache import invalidate_hero_cache
 from .models import DisplayEvent
 from .serializers import DisplayEventWriteSerializer
 from .s3_utils import presign_event_banner_image_url
 
 
-class AdminDisplayEventPagination(PageNumberPagination):
+class AdminDisplayEventPagination(FastCountPageNumberPagination):
     page_size = 50
     page_size_query_param = "page_size"
     max_page_size = 100
@@ -74,9 +75,13 @@ class AdminDisplayEventViewSet(viewsets.ModelViewSet):
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
         instance = self.get_object()
+        previous_type = instance.event_type_code
         ser = self.get_serializer(instance, data=request.data, partial=partial)
         ser.is_valid(raise_exception=True)
         obj = ser.save()
+        if previous_type != obj.event_type_code:
+            # 새 eventTypeCode 는 post_save 에서 무효화
+            invalidate_hero_cache([previous_type])
         return Response({"IndeAPIResponse": {"ErrorCode": "00", "Message": "ok", "Result": self._detail(obj)}})
 
     def list(self, request, *args, **kwargs):
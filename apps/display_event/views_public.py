@@ -2,18 +2,14 @@
 공개 Hero용 GET /api/events/
 """
 
-from django.db.models import Q
-from django.utils import timezone
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.http_cache import PUBLIC_LIST, conditional_response, make_etag
 from core.utils import create_error_response, create_success_response
 
-from .content_resolution import load_content
-from .hero_payload import build_hero_item
-from .models import DisplayEvent
-from .s3_utils import presign_event_banner_image_url
+from .hero_cache import get_public_hero_items
 
 
 class PublicDisplayEventListView(APIView):
@@ -28,27 +24,13 @@ class PublicDisplayEventListView(APIView):
                 status=400,
             )
 
-        now = timezone.now()
-        qs = (
-            DisplayEvent.objects.filter(
-                event_type_code=event_type,
-                is_active=True,
-            )
-            .filter(Q(start_at__isnull=True) | Q(start_at__lte=now))
-            .filter(Q(end_at__isnull=True) | Q(end_at__gte=now))
-            .order_by("display_order", "id")
-        )
+        # 콘텐츠 일괄 로드·presign 후 다음 노출 경계까지 캐시 (hero_cache)
+        out = get_public_hero_items(event_type)
 
-        out = []
-        for ev in qs:
-            content = load_content(ev.content_type_code, ev.content_id)
-            item = build_hero_item(ev, content)
-            iu = item.get("imageUrl")
-            if iu:
-                item["imageUrl"] = presign_event_banner_image_url(iu)
-            out.append(item)
-
-        return Response(
-            create_success_response(out, "display events"),
-            status=200,
+        # 캐시된 목록(presigned URL 포함)이 같으면 304 — 캐시가 새로 채워지면 서명이 바뀌어 ETag 도 바뀐다
+        return conditional_response(
+            request,
+            make_etag("display_events", event_type, out),
+            PUBLIC_LIST,
+            lambda: Response(create_success_response(out, "display events"), status=200),
         )
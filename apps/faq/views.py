@@ -1,24 +1,27 @@
 from rest_framework import viewsets
 from rest_framework.permissions import IsAdminUser, AllowAny
-from rest_framework.pagination import PageNumberPagination
 
+from core.http_cache import ConditionalListMixin
+from core.pagination import FastCountPageNumberPagination
 from apps.board_auth import BoardJWTAuthentication
 from .models import FAQ
 from .serializers import FAQSerializer, FAQCreateUpdateSerializer
 
 
-class FAQPagination(PageNumberPagination):
+class FAQPagination(FastCountPageNumberPagination):
     page_size = 50
     page_size_query_param = "page_size"
     max_page_size = 100
 
 
-class FAQViewSet(viewsets.ModelViewSet):
+class FAQViewSet(ConditionalListMixin, viewsets.ModelViewSet):
     """
     FAQ ViewSet.
     - 목록/상세: 전체 공개 (인증 없음, AllowAny)
     - 생성/수정/삭제: 관리자만 (BoardJWTAuthentication + IsAdminUser)
+    - 목록 ETag: 수정 일시가 없어 응답 필드 값으로 스탬프 (ConditionalListMixin)
     """
+    etag_stamp_fields = ("id", "question", "answer", "order", "created_at")
     permission_classes = [AllowAny]
     authentication_classes = []
     queryset = FAQ.objects.all()
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.8 on 2026-10-19 01:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('highlight', '0004_alter_articlehighlight_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='articlehighlight',
+            index=models.Index(fields=['article', 'user', 'paragraph_index', 'start_offset'], name='idx_hl_art_user_para_start'),
+        ),
+        migrations.RemoveIndex(
+            model_name='articlehighlight',
+            name='idx_hl_article_user',
+        ),
+    ]
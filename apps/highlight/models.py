@@ -86,7 +86,8 @@ class ArticleHighlight(models.Model):
         verbose_name = '아티클 하이라이트'
         verbose_name_plural = '아티클 하이라이트'
         indexes = [
-            models.Index(fields=['article', 'user'], name='idx_hl_article_user'),
+            # 겹침 검사 범위 조건 (article, user, paragraph_index, start_offset) — (article, user) 조회도 왼쪽 접두사로 사용
+            models.Index(fields=['article', 'user', 'paragraph_index', 'start_offset'], name='idx_hl_art_user_para_start'),
             models.Index(fields=['article'], name='idx_hl_article'),
             models.Index(fields=['highlight_group_id'], name='idx_hl_group'),
         ]
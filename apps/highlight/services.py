@@ -2,6 +2,7 @@
 Article Highlight 비즈니스 로직 (articleHightlightPlan.md 15.4 겹침 검사 등)
 """
 from django.db import transaction
+from django.db.models import Q
 
 from core.models import SysCodeManager
 from sites.admin_api.articles.models import Article
@@ -29,27 +30,44 @@ def get_highlight_max_length() -> int:
     return DEFAULT_HIGHLIGHT_MAX_LENGTH
 
 
-def _check_overlap(user, article_id: int, paragraph_index: int, start_offset: int, end_offset: int) -> bool:
+def _item_range(p: dict) -> tuple[int, int, int]:
+    return p.get('paragraphIndex', 0), p.get('startOffset', 0), p.get('endOffset', 0)
+
+
+def _has_overlap(user, article_id: int, payload_list: list) -> bool:
     """
-    동일 article_id, user, paragraph_index 내 기존 하이라이트와 겹치면 True.
-    [start_offset, end_offset) 과 기존 [s, e) 가 한 칸이라도 겹치면 겹침.
+    동일 article_id, user 의 기존 하이라이트 중 payload 구간과 겹치는 행이 있으면 True (쿼리 1회).
+    [start_offset, end_offset) 과 기존 [s, e) 가 한 칸이라도 겹치면 겹침 — s < end AND e > start.
+    (article, user, paragraph_index, start_offset) 인덱스 범위 조건.
     """
-    existing = ArticleHighlight.objects.filter(
+    cond = Q()
+    for p in payload_list:
+        paragraph_index, start_offset, end_offset = _item_range(p)
+        cond |= Q(paragraph_index=paragraph_index, start_offset__lt=end_offset, end_offset__gt=start_offset)
+    return ArticleHighlight.objects.filter(cond, article_id=article_id, user=user).exists()
+
+
+def _new_highlight(user, article_id: int, p: dict, group_id: int) -> ArticleHighlight:
+    paragraph_index, start_offset, end_offset = _item_range(p)
+    return ArticleHighlight(
         article_id=article_id,
         user=user,
+        highlight_group_id=group_id,
         paragraph_index=paragraph_index,
+        highlight_text=(p.get('highlightText') or '')[:65535],
+        prefix_text=(p.get('prefixText') or '')[:255],
+        suffix_text=(p.get('suffixText') or '')[:255],
+        start_offset=start_offset,
+        end_offset=end_offset,
+        color=p.get('color') or 'yellow',
     )
-    for h in existing:
-        # [start_offset, end_offset) vs [h.start_offset, h.end_offset)
-        if not (end_offset <= h.start_offset or start_offset >= h.end_offset):
-            return True
-    return False
 
 
 def create_highlights(user, payload_list: list, max_highlight_length: int | None = None) -> tuple[list, int | None]:
     """
     문단별 항목 리스트로 하이라이트 생성. 동일 highlight_group_id 부여.
     max_highlight_length: highlight_text 길이 제한 (None이면 검사 생략)
+    문단 수와 관계없이 쿼리 수 일정: 겹침 검사 1회 + 전체 행 bulk_create 1회 + 그룹 id UPDATE 1회
     Returns: (created ArticleHighlight list, highlight_group_id)
     """
     if not payload_list:
@@ -61,56 +79,35 @@ def create_highlights(user, payload_list: list, max_highlight_length: int | None
     if not Article.objects.filter(id=article_id, deletedAt__isnull=True).exists():
         return [], None
 
-    group_id = payload_list[0].get('highlightGroupId')
-    created_list = []
+    items = [p for p in payload_list if p.get('articleId') == article_id]
+    if max_highlight_length is not None:
+        for p in items:
+            if len((p.get('highlightText') or '')[:65535]) > max_highlight_length:
+                raise ValueError(f'하이라이트는 {max_highlight_length}자 까지 가능합니다.')
 
     with transaction.atomic():
-        for p in payload_list:
-            aid = p.get('articleId')
-            if aid != article_id:
-                continue
-            text = (p.get('highlightText') or '')[:65535]
-            if max_highlight_length is not None and len(text) > max_highlight_length:
-                raise ValueError(f'하이라이트는 {max_highlight_length}자 까지 가능합니다.')
-            if _check_overlap(
-                user,
-                aid,
-                p.get('paragraphIndex', 0),
-                p.get('startOffset', 0),
-                p.get('endOffset', 0),
-            ):
-                raise ValueError('해당 구간에 이미 하이라이트가 있습니다.')
-
-        first_id = None
-        for p in payload_list:
-            aid = p.get('articleId')
-            if aid != article_id:
-                continue
-            text = (p.get('highlightText') or '')[:65535]
-            prefix = (p.get('prefixText') or '')[:255]
-            suffix = (p.get('suffixText') or '')[:255]
-            obj = ArticleHighlight(
-                article_id=aid,
-                user=user,
-                highlight_group_id=first_id or 0,  # 첫 레코드는 0으로 저장 후 id로 갱신
-                paragraph_index=p.get('paragraphIndex', 0),
-                highlight_text=text,
-                prefix_text=prefix,
-                suffix_text=suffix,
-                start_offset=p.get('startOffset', 0),
-                end_offset=p.get('endOffset', 0),
-                color=p.get('color') or 'yellow',
+        if _has_overlap(user, article_id, items):
+            raise ValueError('해당 구간에 이미 하이라이트가 있습니다.')
+
+        # 그룹 id = 첫 행 PK (단일 문단이면 본 레코드 id와 동일). 모든 행을 그룹 id 0 으로 한 번에 INSERT 한 뒤
+        # 첫 행 PK 로 그룹 id 를 UPDATE 1회에 채운다.
+        created_list = ArticleHighlight.objects.bulk_create(
+            [_new_highlight(user, article_id, p, 0) for p in items]
+        )
+        if created_list[0].pk is None:
+            # MySQL bulk_create 는 PK 를 돌려주지 않음 — 트랜잭션 안의 그룹 0 행이 방금 넣은 행
+            # (단일 multi-row INSERT 의 AUTO_INCREMENT 는 입력 순서대로 증가)
+            ids = list(
+                ArticleHighlight.objects.filter(article_id=article_id, user=user, highlight_group_id=0)
+                .order_by('id')
+                .values_list('id', flat=True)
             )
-            obj.save()
-            if first_id is None:
-                first_id = obj.id
-                obj.highlight_group_id = obj.id
-                obj.save(update_fields=['highlight_group_id'])
-            else:
-                obj.highlight_group_id = first_id
-                obj.save(update_fields=['highlight_group_id'])
-            created_list.append(obj)
-
-    if article_id:
-        sync_article_highlight_count(int(article_id))
-    return created_list, first_id
+            for obj, pk in zip(created_list, ids):
+                obj.pk = pk
+        group_id = created_list[0].pk
+        ArticleHighlight.objects.filter(pk__in=[h.pk for h in created_list]).update(highlight_group_id=group_id)
+        for h in created_list:
+            h.highlight_group_id = group_id
+
+    sync_article_highlight_count(int(article_id))
+    return created_list, group_id
@@ -0,0 +1,98 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from sites.admin_api.articles.models import Article
+from sites.public_api.models import IndeUser
+
+from .models import ArticleHighlight
+from .services import create_highlights
+
+
+def _item(article_id, paragraph_index, start, end, **extra):
+    return {
+        'articleId': article_id,
+        'paragraphIndex': paragraph_index,
+        'startOffset': start,
+        'endOffset': end,
+        'highlightText': 'x' * (end - start),
+        **extra,
+    }
+
+
+class CreateHighlightsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.article = Article.objects.create(title='하이라이트', content='<p>본문</p>')
+        cls.user = IndeUser.objects.create(id='USRTEST00000001', email='reader@example.com')
+        cls.other = IndeUser.objects.create(id='USRTEST00000002', email='other@example.com')
+
+    def test_overlap_is_half_open_per_paragraph_and_user(self):
+        aid = self.article.id
+        create_highlights(self.user, [_item(aid, 0, 5, 10)])
+
+        for start, end in ((0, 6), (9, 12), (6, 8), (0, 20)):
+            with self.subTest(start=start, end=end), self.assertRaises(ValueError):
+                create_highlights(self.user, [_item(aid, 0, start, end)])
+
+        # 끝점만 맞닿은 구간·다른 문단·다른 회원은 겹침 아님
+        create_highlights(self.user, [_item(aid, 0, 0, 5)])
+        create_highlights(self.user, [_item(aid, 0, 10, 15)])
+        create_highlights(self.user, [_item(aid, 1, 5, 10)])
+        create_highlights(self.other, [_item(aid, 0, 5, 10)])
+        self.assertEqual(ArticleHighlight.objects.filter(user=self.user).count(), 4)
+
+    def test_overlap_in_any_paragraph_rejects_whole_group(self):
+        aid = self.article.id
+        create_highlights(self.user, [_item(aid, 2, 0, 4)])
+        with self.assertRaises(ValueError):
+            create_highlights(self.user, [_item(aid, 0, 0, 4), _item(aid, 1, 0, 4), _item(aid, 2, 3, 8)])
+        self.assertEqual(ArticleHighlight.objects.count(), 1)
+
+    def test_bulk_insert_shares_group_id_and_syncs_count(self):
+        aid = self.article.id
+        created, group_id = create_highlights(
+            self.user, [_item(aid, i, 0, 3, color='green') for i in range(4)]
+        )
+        self.assertEqual(group_id, created[0].pk)
+        self.assertTrue(all(h.pk for h in created))
+        rows = list(ArticleHighlight.objects.order_by('id').values_list('id', 'highlight_group_id', 'paragraph_index', 'color'))
+        self.assertEqual(rows, [(h.pk, group_id, i, 'green') for i, h in enumerate(created)])
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.highlightCount, 4)
+
+    def test_bulk_insert_without_returned_pks(self):
+        # MySQL 처럼 bulk_create 가 PK 를 돌려주지 않을 때 그룹 조회로 PK 를 채운다
+        aid = self.article.id
+        with mock.patch.object(
+            type(connection.features), 'can_return_rows_from_bulk_insert', new_callable=mock.PropertyMock, return_value=False,
+        ):
+            created, group_id = create_highlights(self.user, [_item(aid, i, 0, 3) for i in range(3)])
+        by_paragraph = dict(ArticleHighlight.objects.values_list('paragraph_index', 'id'))
+        self.assertEqual([(h.paragraph_index, h.pk) for h in created], sorted(by_paragraph.items()))
+        self.assertEqual(group_id, by_paragraph[0])
+        self.assertEqual(set(ArticleHighlight.objects.values_list('highlight_group_id', flat=True)), {group_id})
+        self.assertEqual({h.highlight_group_id for h in created}, {group_id})
+
+    def test_query_count_does_not_grow_with_paragraphs(self):
+        aid = self.article.id
+
+        def count(paragraphs, offset):
+            with CaptureQueriesContext(connection) as ctx:
+                create_highlights(self.user, [_item(aid, offset + i, 0, 3) for i in range(paragraphs)])
+            inserts = [q for q in ctx.captured_queries if q['sql'].lstrip().upper().startswith('INSERT')]
+            # 모든 행을 INSERT 1회로
+            self.assertEqual(len(inserts), 1)
+            return len(ctx.captured_queries)
+
+        self.assertEqual(count(1, 0), count(8, 100))
+
+    def test_rejects_too_long_and_missing_article(self):
+        aid = self.article.id
+        with self.assertRaises(ValueError):
+            create_highlights(self.user, [_item(aid, 0, 0, 20)], max_highlight_length=10)
+        deleted = Article.objects.create(title='삭제', content='', deletedAt=self.article.createdAt)
+        self.assertEqual(create_highlights(self.user, [_item(deleted.id, 0, 0, 3)]), ([], None))
+        self.assertFalse(ArticleHighlight.objects.exists())
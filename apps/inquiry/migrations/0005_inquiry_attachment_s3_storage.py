@@ -0,0 +1,19 @@
+# Generated by Django 5.0.8 on 2026-10-19 01:46
+
+import apps.inquiry.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inquiry', '0004_inquiry_answer_email_tracking'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='inquiry',
+            name='attachment',
+            field=models.FileField(blank=True, max_length=512, null=True, storage=apps.inquiry.storage.inquiry_attachment_storage, upload_to='inquiry_attachments/%Y/%m/'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 
+from .storage import inquiry_attachment_storage
+
 
 class Inquiry(models.Model):
     STATUS_CHOICES = (
@@ -16,8 +18,10 @@ class Inquiry(models.Model):
     inquiry_type = models.CharField(max_length=64, default="", blank=True)
     title = models.CharField(max_length=255)
     content = models.TextField()
+    # 저장소는 INQUIRY_ATTACHMENT_STORAGE (기본 로컬, s3 전환 가능 — apps.inquiry.storage)
     attachment = models.FileField(
         upload_to="inquiry_attachments/%Y/%m/",
+        storage=inquiry_attachment_storage,
         blank=True,
         null=True,
         max_length=512,
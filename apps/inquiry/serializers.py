@@ -43,6 +43,7 @@ class InquiryDetailSerializer(serializers.ModelSerializer):
         )
 
     def get_attachment(self, obj: Inquiry):
+        """S3 저장소면 presigned 다운로드 URL(절대 URL 그대로), local 이면 /media/... 를 절대 URL로"""
         if not obj.attachment:
             return None
         request = self.context.get("request")
@@ -0,0 +1,16 @@
+"""
+1:1 문의 첨부 파일 저장소 선택 (Inquiry.attachment 의 storage 콜러블)
+- INQUIRY_ATTACHMENT_STORAGE=local (기본): 기존처럼 MEDIA_ROOT
+- s3: core.storages.S3StreamingStorage — 키는 FileField 이름 그대로 (inquiry_attachments/YYYY/MM/...), 다운로드는 presigned URL
+전환 순서: migrate_inquiry_attachments_to_s3 로 기존 로컬 파일을 같은 키에 복사 (DB 값 변경 없음) → s3 로 배포 → 한 번 더 실행.
+"""
+from django.conf import settings
+from django.core.files.storage import default_storage
+
+from core.storages import S3StreamingStorage
+
+
+def inquiry_attachment_storage():
+    if getattr(settings, "INQUIRY_ATTACHMENT_STORAGE", "local") != "s3":
+        return default_storage
+    return S3StreamingStorage(url_expires_in=int(getattr(settings, "INQUIRY_ATTACHMENT_URL_TTL", 600)))
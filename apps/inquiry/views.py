@@ -1,8 +1,9 @@
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
 from rest_framework import status, viewsets
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
-from rest_framework.pagination import PageNumberPagination
 
+from core.pagination import FastCountPageNumberPagination
 from apps.board_auth import BoardJWTAuthentication
 from .models import Inquiry
 from .serializers import (
@@ -13,7 +14,7 @@ from .serializers import (
 )
 
 
-class InquiryPagination(PageNumberPagination):
+class InquiryPagination(FastCountPageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 50
@@ -31,6 +32,12 @@ class InquiryViewSet(viewsets.ModelViewSet):
     serializer_class = InquiryDetailSerializer
     pagination_class = InquiryPagination
 
+    def initial(self, request, *args, **kwargs):
+        # 첨부는 메모리(FILE_UPLOAD_MAX_MEMORY_SIZE) 대신 임시 파일로 받아 저장소(S3)로 조각 단위 전송
+        if request.method == "POST":
+            request._request.upload_handlers = [TemporaryFileUploadHandler(request._request)]
+        super().initial(request, *args, **kwargs)
+
     def get_queryset(self):
         user = self.request.user
         if not getattr(user, "member", None):
@@ -2,8 +2,9 @@ from rest_framework import viewsets
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework.filters import SearchFilter, OrderingFilter
-from rest_framework.pagination import PageNumberPagination
 
+from core.http_cache import ConditionalListMixin
+from core.pagination import FastCountPageNumberPagination
 from apps.board_auth import BoardJWTAuthentication, IsStaffOrReadOnly
 from .models import Notice
 from .serializers import (
@@ -13,19 +14,21 @@ from .serializers import (
 )
 
 
-class NoticePagination(PageNumberPagination):
+class NoticePagination(FastCountPageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
 
 
-class NoticeViewSet(viewsets.ModelViewSet):
+class NoticeViewSet(ConditionalListMixin, viewsets.ModelViewSet):
     """
     공지사항 ViewSet.
     - 목록/상세: 전체 공개 (인증 없음, AllowAny)
     - 생성/수정/삭제: 관리자만 (BoardJWTAuthentication + IsStaffOrReadOnly)
     - 상세 조회 시 view_count 자동 증가
+    - 목록 ETag: 목록 응답 필드 값으로 스탬프 (ConditionalListMixin)
     """
+    etag_stamp_fields = ("id", "title", "is_pinned", "show_in_gnb", "view_count", "created_at")
     permission_classes = [AllowAny]
     authentication_classes = []  # 기본 인증 없음 → list/retrieve 시 토큰 검사하지 않음
     queryset = Notice.objects.all()
@@ -1,25 +1,91 @@
 """
 CurrentSiteMiddleware: 요청의 Host 헤더를 확인하여 사이트 정보를 request에 주입
 SiteCorsMiddleware: site_meta['cors'] 기준으로 CORS 헤더 추가 (실서버 CORS 보장)
+PublicAuthContextMiddleware: 요청 단위 JWT 인증 컨텍스트(request.auth_context) 주입 — 토큰 검증·회원 조회 요청당 1회
+RequestInstrumentationMiddleware: (opt-in) 요청별 DB/S3/외부 HTTP 계측, Server-Timing, 샘플 프로파일링
 """
+import json
+import logging
+import random
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
 from django.utils.deprecation import MiddlewareMixin
 from django.http import HttpResponse
 from django.http.request import split_domain_port
-from config.site_router import SITE_MAP
+from config.site_router import DEFAULT_SITE, SITE_TABLE
+from core.instrumentation import (
+    QueryBudgetExceeded,
+    collect_request_metrics,
+    install_http_timing,
+    server_timing_header,
+)
+from sites.public_api.auth_context import PublicAuthContext
+
+metrics_logger = logging.getLogger('inde.request_metrics')
 
 # CORS 응답 헤더에 공통으로 쓸 값
 CORS_ALLOW_METHODS = "GET, POST, PUT, PATCH, DELETE, OPTIONS"
 CORS_ALLOW_HEADERS = "accept, accept-encoding, authorization, content-type, origin, x-csrftoken, x-requested-with"
 
+# Origin을 제외한 CORS 헤더 (모든 응답에 동일)
+_CORS_STATIC_HEADERS = (
+    ("Access-Control-Allow-Methods", CORS_ALLOW_METHODS),
+    ("Access-Control-Allow-Headers", CORS_ALLOW_HEADERS),
+    ("Access-Control-Allow-Credentials", "true"),
+    ("Access-Control-Max-Age", "86400"),
+)
+
+# (Host, X-Forwarded-Host 원문) → CompiledSite 해석 결과 캐시 크기.
+# X-Forwarded-Host는 클라이언트가 임의로 보낼 수 있으므로 상한을 둔다.
+_RESOLVE_CACHE_SIZE = 1024
+
+# origin → 프리플라이트 응답 헤더. site.cors 검사를 통과한 origin만 들어오므로 SITE_MAP 크기로 제한된다.
+_preflight_headers = {}
+
 
 def _add_cors_headers(response, origin):
     """응답에 CORS 헤더 추가"""
     if origin:
         response["Access-Control-Allow-Origin"] = origin
-    response["Access-Control-Allow-Methods"] = CORS_ALLOW_METHODS
-    response["Access-Control-Allow-Headers"] = CORS_ALLOW_HEADERS
-    response["Access-Control-Allow-Credentials"] = "true"
-    response["Access-Control-Max-Age"] = "86400"
+    for name, value in _CORS_STATIC_HEADERS:
+        response[name] = value
+
+
+def _get_preflight_headers(origin):
+    headers = _preflight_headers.get(origin)
+    if headers is None:
+        headers = {"Access-Control-Allow-Origin": origin, **dict(_CORS_STATIC_HEADERS)}
+        _preflight_headers[origin] = headers
+    return headers
+
+
+@lru_cache(maxsize=_RESOLVE_CACHE_SIZE)
+def resolve_site(host, forwarded_raw=None):
+    """
+    Host / X-Forwarded-Host → CompiledSite (SITE_TABLE 조회, 결과는 LRU 캐시)
+
+    SITE_TABLE 키는 보통 "host:port" 또는 "api.inde.kr" 형태. X-Forwarded-Host에
+    포트가 없으면 "local.inde.kr:8001" 등과 불일치 → 404가 나므로 요청 Host의 포트를 붙여 한 번 더 찾는다.
+    """
+    site = SITE_TABLE.get(host)
+    if site is not None:
+        return site
+    if forwarded_raw:
+        fh = forwarded_raw.split(",")[0].strip()
+        if fh:
+            site = SITE_TABLE.get(fh)
+            if site is not None:
+                return site
+            _d, port_from_request = split_domain_port(host)
+            if port_from_request and ":" not in fh:
+                site = SITE_TABLE.get(f"{fh}:{port_from_request}")
+                if site is not None:
+                    return site
+    return DEFAULT_SITE
 
 
 class SiteCorsMiddleware(MiddlewareMixin):
@@ -30,20 +96,18 @@ class SiteCorsMiddleware(MiddlewareMixin):
     """
 
     def process_request(self, request):
+        if request.method != "OPTIONS":
+            return None
         origin = request.META.get("HTTP_ORIGIN")
-        site_meta = getattr(request, "site_meta", None)
-        cors_list = site_meta.get("cors", []) if site_meta else []
-        if request.method == "OPTIONS" and origin and origin in cors_list:
-            response = HttpResponse(status=200)
-            _add_cors_headers(response, origin)
-            return response
+        site = getattr(request, "site", None)
+        if origin and site is not None and origin in site.cors:
+            return HttpResponse(status=200, headers=_get_preflight_headers(origin))
         return None
 
     def process_response(self, request, response):
         origin = request.META.get("HTTP_ORIGIN")
-        site_meta = getattr(request, "site_meta", None)
-        cors_list = site_meta.get("cors", []) if site_meta else []
-        if origin and origin in cors_list:
+        site = getattr(request, "site", None)
+        if origin and site is not None and origin in site.cors:
             _add_cors_headers(response, origin)
         return response
 
@@ -51,56 +115,121 @@ class SiteCorsMiddleware(MiddlewareMixin):
 class CurrentSiteMiddleware(MiddlewareMixin):
     """
     Host 헤더를 기반으로 사이트 정보를 request에 주입하는 미들웨어
-    request.site_meta에 다음 정보를 추가:
+    request.site_meta에 다음 정보를 추가 (사이트별 공유 읽기 전용 매핑):
     - slug: 사이트 식별자 (admin_api, public_api 등)
     - urlconf: 해당 사이트의 URLConf 경로
-    - cors: CORS 허용 도메인 리스트
+    - cors: CORS 허용 도메인 집합 (frozenset)
     - media_prefix: 미디어 파일 prefix
+    request.site에는 CompiledSite 객체를 그대로 둔다.
     """
     
     def process_request(self, request):
         # Host 헤더에서 도메인 추출
         # nginx/로드밸런서 뒤에서 실행 시 X-Forwarded-Host 헤더도 확인
         host = request.get_host()
+        site = resolve_site(host, request.META.get("HTTP_X_FORWARDED_HOST"))
 
-        # SITE_MAP 키는 보통 "host:port" 또는 "api.inde.kr" 형태. X-Forwarded-Host에
-        # 포트가 없으면 SITE_MAP.get("local.inde.kr:8001") 등과 불일치 → 404가 난다.
-        candidates = [host]
-        forwarded_raw = request.META.get("HTTP_X_FORWARDED_HOST")
-        if forwarded_raw:
-            fh = forwarded_raw.split(",")[0].strip()
-            if fh:
-                candidates.append(fh)
-                _d, port_from_request = split_domain_port(host)
-                if port_from_request and ":" not in fh:
-                    candidates.append(f"{fh}:{port_from_request}")
-
-        site_info = None
-        for h in candidates:
-            site_info = SITE_MAP.get(h)
-            if site_info:
-                break
-        
-        if site_info:
-            # request에 사이트 메타 정보 주입
-            request.site_meta = {
-                'slug': site_info['slug'],
-                'urlconf': site_info['urlconf'],
-                'cors': site_info.get('cors', []),
-                'media_prefix': site_info.get('media_prefix', ''),
-            }
-            
+        request.site = site
+        request.site_meta = site.meta
+        if site.urlconf:
             # 동적 URLConf 설정
-            request.urlconf = site_info['urlconf']
-        else:
-            # 매칭되는 사이트가 없으면 기본값 설정
-            request.site_meta = {
-                'slug': 'default',
-                'urlconf': None,
-                'cors': [],
-                'media_prefix': '',
-            }
-        
+            request.urlconf = site.urlconf
+        return None
+
+
+class PublicAuthContextMiddleware(MiddlewareMixin):
+    """
+    request.auth_context 에 PublicAuthContext 를 둔다 (지연 계산 — 인증이 필요 없는 요청은 비용 없음).
+    DRF Request 는 속성을 원본 HttpRequest 로 위임하므로 인증 클래스·뷰 모두 같은 컨텍스트를 본다.
+    """
+
+    def process_request(self, request):
+        request.auth_context = PublicAuthContext(request)
+        return None
+
+
+
+class RequestInstrumentationMiddleware:
+    """
+    요청별 계측 미들웨어 (REQUEST_INSTRUMENTATION_ENABLED=True일 때만 로드, admin_api·public_api 공통)
+    - DB 쿼리 수/시간, S3 presign 수, 외부 HTTP 시간, 전체 wall time 기록
+    - Server-Timing 응답 헤더 + inde.request_metrics 로거에 JSON 한 줄
+    - REQUEST_PROFILE_SAMPLE_RATE 비율로 cProfile(.prof) 또는 pyinstrument(.html) 덤프
+    - 뷰 클래스의 query_budget 초과 시 경고, REQUEST_QUERY_BUDGET_ENFORCE=True면 QueryBudgetExceeded
+    MIDDLEWARE 맨 앞에 두어 다른 미들웨어 시간까지 포함한다.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'REQUEST_INSTRUMENTATION_ENABLED', False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.sample_rate = float(getattr(settings, 'REQUEST_PROFILE_SAMPLE_RATE', 0.0) or 0.0)
+        self.profile_dir = Path(getattr(settings, 'REQUEST_PROFILE_DIR', settings.BASE_DIR / 'logs' / 'profiles'))
+        self.enforce_budget = bool(getattr(settings, 'REQUEST_QUERY_BUDGET_ENFORCE', False))
+        install_http_timing()
+
+    def __call__(self, request):
+        with collect_request_metrics() as metrics:
+            if self.sample_rate > 0 and random.random() < self.sample_rate:
+                response = self._profiled(request)
+            else:
+                response = self.get_response(request)
+        response['Server-Timing'] = server_timing_header(metrics)
+        self._log(request, response, metrics)
+        self._check_budget(request, metrics)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # APIView.as_view() 결과는 view_class를 가진다
+        view_class = getattr(view_func, 'view_class', None) or getattr(view_func, 'cls', None)
+        request._query_budget = getattr(view_class, 'query_budget', None)
+        request._view_name = view_class.__name__ if view_class else getattr(view_func, '__name__', '')
         return None
 
+    def _profiled(self, request):
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{time.strftime('%Y%m%d-%H%M%S')}_{request.method}_{request.path.strip('/').replace('/', '_')[:80] or 'root'}"
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            Profiler = None
+        if Profiler is not None:
+            profiler = Profiler()
+            profiler.start()
+            try:
+                return self.get_response(request)
+            finally:
+                profiler.stop()
+                (self.profile_dir / f'{stem}.html').write_text(profiler.output_html(), encoding='utf-8')
+        import cProfile
+
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(self.get_response, request)
+        finally:
+            profiler.dump_stats(str(self.profile_dir / f'{stem}.prof'))
+
+    def _log(self, request, response, metrics):
+        site_meta = getattr(request, 'site_meta', None) or {}
+        metrics_logger.info(json.dumps({
+            'site': site_meta.get('slug'),
+            'method': request.method,
+            'path': request.path,
+            'view': getattr(request, '_view_name', ''),
+            'status': response.status_code,
+            'total_ms': round(metrics.total_ms, 1),
+            'db_count': metrics.db_count,
+            'db_ms': round(metrics.db_ms, 1),
+            's3_presign': metrics.s3_presign_count,
+            'http_count': metrics.http_count,
+            'http_ms': round(metrics.http_ms, 1),
+        }, ensure_ascii=False))
 
+    def _check_budget(self, request, metrics):
+        budget = getattr(request, '_query_budget', None)
+        if budget is None or metrics.db_count <= budget:
+            return
+        msg = f'{getattr(request, "_view_name", "")} {request.method} {request.path}: 쿼리 {metrics.db_count}건 (예산 {budget}건)'
+        if self.enforce_budget:
+            raise QueryBudgetExceeded(msg)
+        metrics_logger.warning(msg)
@@ -63,6 +63,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "config.middleware.RequestInstrumentationMiddleware",  # opt-in (REQUEST_INSTRUMENTATION_ENABLED), 비활성 시 로드 안 됨
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",  # CORS 미들웨어 (가장 위에 위치)
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -73,6 +74,7 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "config.middleware.CurrentSiteMiddleware",
     "config.middleware.SiteCorsMiddleware",  # site_meta['cors'] 기준 CORS (실서버 보장)
+    "config.middleware.PublicAuthContextMiddleware",  # request.auth_context — JWT 검증·회원 조회 요청당 1회
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -112,6 +114,34 @@ DATABASES = {
     }
 }
 
+# 벤치마크·로컬 재현용: DB_ENGINE=sqlite 이면 MySQL 대신 SQLite 파일 사용 (benchmark_public_api)
+if os.getenv("DB_ENGINE", "mysql").strip().lower() == "sqlite":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.getenv("DB_SQLITE_PATH", str(BASE_DIR / "bench.sqlite3")),
+        }
+    }
+
+# 캐시 — REDIS_URL 이 있으면 모든 웹·배치 프로세스가 공유하는 Redis
+# (요청 제한 카운터, 목록 count·통계·Hero 캐시와 그 무효화가 프로세스 간에 일치)
+# 없으면 프로세스별 LocMem: 로컬(ENV_MODE=local) 전용. 다른 프로세스의 무효화는 각 캐시 TTL 만큼 늦게 반영된다
+REDIS_URL = os.getenv("REDIS_URL", "").strip()
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": os.getenv("CACHE_KEY_PREFIX", "inde"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -166,6 +196,31 @@ REST_FRAMEWORK = {
         'rest_framework.filters.OrderingFilter',
     ],
     'EXCEPTION_HANDLER': 'rest_framework.views.exception_handler',
+    # 앞단 프록시(nginx·LB) 수 — X-Forwarded-For 오른쪽에서 이 번째 값을 클라이언트 IP 로 사용, 0 이면 REMOTE_ADDR (core.throttling.client_ip)
+    # 기본: local 0, develop·production 1 (nginx 뒤 — 0 이면 모든 방문자가 프록시 IP 하나로 묶여 한도를 함께 쓴다). LB 가 더 있으면 늘린다
+    'NUM_PROXIES': int(os.getenv("NUM_PROXIES", "0" if ENV_MODE == "local" else "1")),
+    # core.throttling — 뷰 throttle_scope + 종류(ip/account/phone) 별 비율 ('숫자/[배수]단위', 없으면 제한 없음)
+    'DEFAULT_THROTTLE_RATES': {
+        'login.ip': '30/m',
+        'login.account': '10/10m',
+        'admin_login.ip': '20/m',
+        'admin_login.account': '10/10m',
+        'profile_password.ip': '30/m',
+        'profile_password.account': '5/10m',
+        'sms_send.ip': '10/h',
+        'sms_send.phone': '5/h',
+        'sms_profile.ip': '10/h',
+        'sms_profile.phone': '5/h',
+        'find_id_sms.ip': '10/h',
+        'find_id_sms.phone': '5/h',
+        'find_id.ip': '20/10m',
+        'pw_reset_send.ip': '10/h',
+        'pw_reset_send.email': '3/m',  # 초과해도 200 (발송만 생략)
+        'pw_reset_send.phone': '3/m',
+        'pw_reset_verify.ip': '30/10m',
+        'pw_reset_verify.account': '10/10m',
+        'pw_reset.ip': '20/10m',
+    },
 }
 
 # CORS 설정 (env에 있으면 사용, 없으면 기본 목록). Django 4.0+ 요구: scheme 필수.
@@ -297,11 +352,87 @@ SMS_SERVICE_NAME = (os.getenv("SMS_SERVICE_NAME") or "INDE").strip()
 # DEBUG이고 SMS_SKIP_SEND=1 일 때만: SMS 미발송, 검증 로직은 동일(로그에 코드 출력)
 SMS_SKIP_SEND = DEBUG and os.getenv("SMS_SKIP_SEND", "").lower() in ("1", "true", "yes")
 
+# 요청 계측 (config.middleware.RequestInstrumentationMiddleware) — 기본 비활성
+# 활성 시 Server-Timing 헤더 + inde.request_metrics 로그(logs/request_metrics.log)
+REQUEST_INSTRUMENTATION_ENABLED = os.getenv("REQUEST_INSTRUMENTATION_ENABLED", "").lower() in ("1", "true", "yes")
+# 0~1: 이 비율의 요청을 cProfile(.prof) / pyinstrument 설치 시 .html 로 REQUEST_PROFILE_DIR 에 덤프
+REQUEST_PROFILE_SAMPLE_RATE = float(os.getenv("REQUEST_PROFILE_SAMPLE_RATE", "0") or 0)
+REQUEST_PROFILE_DIR = BASE_DIR / "logs" / "profiles"
+# True: 뷰 query_budget 초과 시 QueryBudgetExceeded (테스트/CI), False: 경고 로그만
+REQUEST_QUERY_BUDGET_ENFORCE = os.getenv("REQUEST_QUERY_BUDGET_ENFORCE", "").lower() in ("1", "true", "yes")
+
+# 감사 로그 (core.audit.record_audit) — 큐에 넣고 백그라운드 스레드가 bulk_create
+AUDIT_LOG_ASYNC = os.getenv("AUDIT_LOG_ASYNC", "1").lower() in ("1", "true", "yes")
+# 큐 최대 건수 (초과분은 버리고 dropped 카운트 + 경고 로그)
+AUDIT_LOG_QUEUE_MAX = int(os.getenv("AUDIT_LOG_QUEUE_MAX", "10000"))
+AUDIT_LOG_BATCH_SIZE = int(os.getenv("AUDIT_LOG_BATCH_SIZE", "500"))
+AUDIT_LOG_FLUSH_INTERVAL = float(os.getenv("AUDIT_LOG_FLUSH_INTERVAL", "1.0"))
+# bulk_create 실패 시 재시도 횟수 (그래도 실패하면 행 단위 INSERT로 실패한 행만 버림)
+AUDIT_LOG_BULK_RETRIES = int(os.getenv("AUDIT_LOG_BULK_RETRIES", "1"))
+# user_agent 최대 저장 길이 (0이면 자르지 않음)
+AUDIT_LOG_USER_AGENT_MAX = int(os.getenv("AUDIT_LOG_USER_AGENT_MAX", "512"))
+
+# 관리자 목록 total 캐시 (core.pagination) — 필터 시그니처별 TTL(초)
+LIST_COUNT_CACHE_TTL = int(os.getenv("LIST_COUNT_CACHE_TTL", "30"))
+# 필터 없는 목록: 테이블 추정 행 수가 이 값 이상이면 COUNT(*) 대신 information_schema 추정치
+LIST_COUNT_ESTIMATE_MIN = int(os.getenv("LIST_COUNT_ESTIMATE_MIN", "100000"))
+
+# S3 병렬 업로드/조회 스레드 풀 크기 (core.s3_storage.get_s3_executor)
+S3_MAX_WORKERS = int(os.getenv("S3_MAX_WORKERS", "8"))
+
+# 에디터 이미지 직접 업로드 (sites.admin_api.files.direct_upload) — 이미지 1개 최대 크기, presign 만료(초)
+DIRECT_UPLOAD_IMAGE_MAX_BYTES = int(os.getenv("DIRECT_UPLOAD_IMAGE_MAX_BYTES", str(20 * 1024 * 1024)))
+DIRECT_UPLOAD_EXPIRES = int(os.getenv("DIRECT_UPLOAD_EXPIRES", "600"))
+
+# 본문 이미지 내용 주소 저장소 (core.media_assets) — core/MEDIA_ASSET_CREATE_TABLE.sql 적용 후 켠다
+MEDIA_ASSET_CONTENT_ADDRESSED = os.getenv("MEDIA_ASSET_CONTENT_ADDRESSED", "0").lower() in ("1", "true", "yes")
+# 참조 0 자산을 gc_media_assets 가 삭제하기 전 유예 시간
+MEDIA_ASSET_GC_GRACE_HOURS = int(os.getenv("MEDIA_ASSET_GC_GRACE_HOURS", "24"))
+
+# 배치 상주 워커 (run_workers) — 작업별 GET_LOCK 이름 접두사, 동시 실행 작업 수
+WORKER_LOCK_PREFIX = os.getenv("WORKER_LOCK_PREFIX", "inde:job:")
+WORKER_MAX_CONCURRENCY = int(os.getenv("WORKER_MAX_CONCURRENCY", "2"))
+
+# 라이브러리 콘텐츠 통계(publicContentStats) 캐시 TTL(초) — 조회·공유 수는 이 시간 안에서 늦게 반영될 수 있음
+LIBRARY_STATS_CACHE_TTL = int(os.getenv("LIBRARY_STATS_CACHE_TTL", "30"))
+# 기본 캐시가 프로세스별(REDIS_URL 없음 → LocMem)일 때 무효화 대상 캐시 TTL 상한(초) — 다른 프로세스의 캐시 삭제가 전달되지 않아 이 시간까지 늦게 반영
+PROCESS_LOCAL_CACHE_MAX_TTL = int(os.getenv("PROCESS_LOCAL_CACHE_MAX_TTL", "30"))
+
+# 공개 Hero 목록(/api/events/) 캐시 최대 TTL(초) — 다음 노출 시작/종료 시각이 더 이르면 그때 만료, presigned URL 만료(1시간)보다 짧게
+# (기본 캐시가 LocMem 이면 PROCESS_LOCAL_CACHE_MAX_TTL 로 줄어든다)
+HERO_CACHE_TTL = int(os.getenv("HERO_CACHE_TTL", "300"))
+
+# orjson 으로 응답을 인코딩할 사이트 slug (쉼표 구분, 빈 값이면 전 사이트 stdlib json). orjson 미설치 시 자동으로 stdlib
+FAST_JSON_RENDERER_SITES = [h.strip() for h in os.getenv("FAST_JSON_RENDERER_SITES", "public_api").split(",") if h.strip()]
+
+# 공개 GET 조건부 캐시(core.http_cache) — 공유 캐시(CDN) s-maxage 기본값(초)
+HTTP_CACHE_S_MAXAGE = int(os.getenv("HTTP_CACHE_S_MAXAGE", "60"))
+# presigned URL(1시간 만료)을 담는 응답의 ETag 교체 주기(초) — 304 로 만료된 서명을 재사용하지 않도록 만료보다 짧게
+HTTP_CACHE_PRESIGN_WINDOW = int(os.getenv("HTTP_CACHE_PRESIGN_WINDOW", "1800"))
+
+# JWT 회원(PublicMemberShip) 조회 결과 캐시 TTL(초) — 0 이면 사용 안 함(요청당 1회 조회), 켜면 회원 정보 변경이 이 시간 안에서 늦게 반영될 수 있음
+PUBLIC_AUTH_PRINCIPAL_CACHE_TTL = int(os.getenv("PUBLIC_AUTH_PRINCIPAL_CACHE_TTL", "0"))
+
+# 로그인·비밀번호 확인·SMS 발송 요청 제한(core.throttling) 사용 여부 — 비율은 REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']
+AUTH_THROTTLE_ENABLED = os.getenv("AUTH_THROTTLE_ENABLED", "True").lower() in ("1", "true", "yes")
+# 요청 제한 카운터 캐시 alias — 모든 프로세스가 공유하는 캐시(Redis 등)여야 한도가 서버 전체에 적용됨 (local 외 환경에서 LocMem 이면 시작 거부)
+THROTTLE_CACHE_ALIAS = os.getenv("THROTTLE_CACHE_ALIAS", "default")
+
+# 1:1 문의 첨부 저장소 — local(기본, MEDIA_ROOT) 또는 s3(presigned 다운로드).
+# s3 로 바꾸기 전에 migrate_inquiry_attachments_to_s3 로 기존 파일을 먼저 복사한다 (복사 전 전환하면 기존 첨부 URL 이 없는 객체를 가리킴)
+INQUIRY_ATTACHMENT_STORAGE = os.getenv("INQUIRY_ATTACHMENT_STORAGE", "local").strip().lower()
+# 문의 첨부 presigned 다운로드 URL 만료(초)
+INQUIRY_ATTACHMENT_URL_TTL = int(os.getenv("INQUIRY_ATTACHMENT_URL_TTL", "600"))
+# S3 스트리밍 업로드(core.s3_storage.upload_stream) 멀티파트 기준·조각 크기(MB, S3 최소 5)
+S3_MULTIPART_THRESHOLD_MB = int(os.getenv("S3_MULTIPART_THRESHOLD_MB", "8"))
+S3_MULTIPART_CHUNK_MB = int(os.getenv("S3_MULTIPART_CHUNK_MB", "8"))
+
 # 파일 업로드 크기 제한 설정 (2GB)
 # DATA_UPLOAD_MAX_MEMORY_SIZE: 메모리에 로드할 수 있는 최대 데이터 크기
 # FILE_UPLOAD_MAX_MEMORY_SIZE: 메모리에 로드할 수 있는 최대 파일 크기
 # 큰 파일은 임시 파일로 저장되므로 이 값보다 큰 파일도 업로드 가능
-DATA_UPLOAD_MAX_MEMORY_SIZE = 2 * 1024 * 1024 * 1024  # 2GB
+# 에디터가 직접 업로드(presign)로 전환되면 DATA_UPLOAD_MAX_MEMORY_SIZE env로 낮춘다 (base64 본문 호환용 기본값 유지)
+DATA_UPLOAD_MAX_MEMORY_SIZE = int(os.getenv("DATA_UPLOAD_MAX_MEMORY_SIZE", str(2 * 1024 * 1024 * 1024)))  # 2GB
 FILE_UPLOAD_MAX_MEMORY_SIZE = 2 * 1024 * 1024 * 1024  # 2GB
 
 # 파일 업로드 디렉토리 설정
@@ -364,6 +495,11 @@ LOGGING = {
             'filename': os.path.join(BASE_DIR, 'logs', 'profile_update.log'),
             **_LOG_FILE_COMMON,
         },
+        'request_metrics_file': {
+            'class': 'logging.handlers.TimedRotatingFileHandler',
+            'filename': os.path.join(BASE_DIR, 'logs', 'request_metrics.log'),
+            **_LOG_FILE_COMMON,
+        },
     },
     'root': {
         'handlers': ['console'],
@@ -410,6 +546,12 @@ LOGGING = {
             'level': 'INFO',
             'propagate': False,
         },
+        # RequestInstrumentationMiddleware — 요청당 JSON 한 줄 (파일만, 콘솔 소음 방지)
+        'inde.request_metrics': {
+            'handlers': ['request_metrics_file'],
+            'level': 'INFO',
+            'propagate': False,
+        },
     },
 }
 
@@ -1,146 +1,180 @@
 """
 도메인 기반 라우팅 설정
 각 도메인(Host 헤더)에 따라 URLConf를 동적으로 선택
+
+- SITE_MAP: 사람이 편집하는 원본 설정 (호스트 → slug/urlconf/cors/media_prefix)
+- SITE_TABLE: 서버 기동 시 SITE_MAP을 1회 컴파일한 조회 테이블
+  (호스트 → 공유 CompiledSite, cors는 frozenset). 미들웨어는 이 테이블만 사용한다.
 """
+from types import MappingProxyType
+
+# --- CORS 허용 Origin 묶음 (여러 호스트가 같은 목록을 공유) ---
+_PROD_ADMIN_CORS = ["https://admin.inde.kr", "https://dev.inde.kr", "http://dev.inde.kr"]
+_PROD_PUBLIC_CORS = ["https://www.inde.kr", "https://inde.kr", "https://dev.inde.kr", "http://dev.inde.kr"]
+_LOCAL_ADMIN_CORS = [
+    "http://localhost:3000",
+    "http://localhost:3001",
+    "http://127.0.0.1:3001",
+    "https://dev.inde.kr",
+    "http://dev.inde.kr",
+    "http://adminlocal.inde.kr",
+    "http://local.inde.kr",
+    "http://local.inde.kr:3000",
+    "http://adminlocal.inde.kr:3000",
+]
+_LOCAL_ADMIN_APILOCAL_CORS = _LOCAL_ADMIN_CORS + [
+    "http://admin-apilocal.inde.kr:3000",
+    "http://admin-apilocal.inde.kr",
+]
+_LOCAL_PUBLIC_CORS = [
+    "http://localhost:3000",
+    "http://localhost:3001",
+    "http://127.0.0.1:3000",
+    "http://127.0.0.1:3001",
+    "https://dev.inde.kr",
+    "http://dev.inde.kr",
+    "http://adminlocal.inde.kr",
+    "http://adminlocal.inde.kr:3000",
+    "http://admin-local.inde.kr:3000",
+    "http://local.inde.kr",
+    "http://local.inde.kr:3000",
+    "http://local.inde.kr:3001",
+    "http://apilocal.inde.kr:3001",
+]
+_LOCAL_PUBLIC_HOSTNAME_CORS = [
+    "http://localhost:3000",
+    "http://localhost:3001",
+    "http://127.0.0.1:3001",
+    "https://dev.inde.kr",
+    "http://dev.inde.kr",
+    "http://adminlocal.inde.kr:3000",
+    "http://admin-local.inde.kr:3000",
+    "http://local.inde.kr:3001",
+    "http://apilocal.inde.kr:3001",
+]
+
 SITE_MAP = {
     # 프로덕션 도메인
     "admin-api.inde.kr": {
         "slug": "admin_api",
         "urlconf": "sites.admin_api.urls",
-        "cors": ["https://admin.inde.kr", "https://dev.inde.kr", "http://dev.inde.kr"],
+        "cors": _PROD_ADMIN_CORS,
         "media_prefix": "admin",
     },
     "api.inde.kr": {
         "slug": "public_api",
         "urlconf": "sites.public_api.urls",
-        "cors": ["https://www.inde.kr", "https://inde.kr", "https://dev.inde.kr", "http://dev.inde.kr"],
+        "cors": _PROD_PUBLIC_CORS,
         "media_prefix": "public",
     },
     # Dynamic OG Rendering: nginx가 SNS crawler만 Django로 프록시하면서 원 Host를 보존하는 경우.
     "inde.kr": {
         "slug": "public_api",
         "urlconf": "sites.public_api.urls",
-        "cors": ["https://www.inde.kr", "https://inde.kr", "https://dev.inde.kr", "http://dev.inde.kr"],
+        "cors": _PROD_PUBLIC_CORS,
         "media_prefix": "public",
     },
     "www.inde.kr": {
         "slug": "public_api",
         "urlconf": "sites.public_api.urls",
-        "cors": ["https://www.inde.kr", "https://inde.kr", "https://dev.inde.kr", "http://dev.inde.kr"],
+        "cors": _PROD_PUBLIC_CORS,
         "media_prefix": "public",
     },
-    
+
     # 로컬 개발 환경: 포트별로 사이트 분리
     "localhost:8000": {
         "slug": "admin_api",
         "urlconf": "sites.admin_api.urls",
-        "cors": ["http://localhost:3000", "http://localhost:3001", "http://127.0.0.1:3001", "https://dev.inde.kr", "http://dev.inde.kr","http://adminlocal.inde.kr","http://local.inde.kr","http://local.inde.kr:3000","http://adminlocal.inde.kr:3000"],
+        "cors": _LOCAL_ADMIN_CORS,
         "media_prefix": "local",
     },
     "localhost:8001": {
         "slug": "public_api",
         "urlconf": "sites.public_api.urls",
-        "cors": [
-            "http://localhost:3000",
-            "http://localhost:3001",
-            "http://127.0.0.1:3000",
-            "http://127.0.0.1:3001",
-            "https://dev.inde.kr",
-            "http://dev.inde.kr",
-            "http://adminlocal.inde.kr",
-            "http://adminlocal.inde.kr:3000",
-            "http://admin-local.inde.kr:3000",
-            "http://local.inde.kr",
-            "http://local.inde.kr:3000",
-            "http://local.inde.kr:3001",
-            "http://apilocal.inde.kr:3001",
-        ],
+        "cors": _LOCAL_PUBLIC_CORS,
         "media_prefix": "local",
     },
     "127.0.0.1:8000": {
         "slug": "admin_api",
         "urlconf": "sites.admin_api.urls",
-        "cors": ["http://localhost:3000", "http://localhost:3001", "http://127.0.0.1:3001", "https://dev.inde.kr", "http://dev.inde.kr","http://adminlocal.inde.kr","http://local.inde.kr","http://local.inde.kr:3000","http://adminlocal.inde.kr:3000"],
+        "cors": _LOCAL_ADMIN_CORS,
         "media_prefix": "local",
     },
     "127.0.0.1:8001": {
         "slug": "public_api",
         "urlconf": "sites.public_api.urls",
-        "cors": [
-            "http://localhost:3000",
-            "http://localhost:3001",
-            "http://127.0.0.1:3000",
-            "http://127.0.0.1:3001",
-            "https://dev.inde.kr",
-            "http://dev.inde.kr",
-            "http://adminlocal.inde.kr",
-            "http://adminlocal.inde.kr:3000",
-            "http://admin-local.inde.kr:3000",
-            "http://local.inde.kr",
-            "http://local.inde.kr:3000",
-            "http://local.inde.kr:3001",
-            "http://apilocal.inde.kr:3001",
-        ],
+        "cors": _LOCAL_PUBLIC_CORS,
         "media_prefix": "local",
     },
     "admin-local.inde.kr:8000": {
         "slug": "admin_api",
         "urlconf": "sites.admin_api.urls",
-        "cors": ["http://localhost:3000", "http://localhost:3001", "http://127.0.0.1:3001", "https://dev.inde.kr", "http://dev.inde.kr","http://adminlocal.inde.kr","http://local.inde.kr","http://local.inde.kr:3000","http://adminlocal.inde.kr:3000"],
+        "cors": _LOCAL_ADMIN_CORS,
         "media_prefix": "local",
     },
     # /etc/hosts — admin API 로컬 호스트 (localhost:8000 과 동일 사이트)
     "admin-apilocal.inde.kr:8000": {
         "slug": "admin_api",
         "urlconf": "sites.admin_api.urls",
-        "cors": [
-            "http://localhost:3000",
-            "http://localhost:3001",
-            "http://127.0.0.1:3001",
-            "https://dev.inde.kr",
-            "http://dev.inde.kr",
-            "http://adminlocal.inde.kr",
-            "http://local.inde.kr",
-            "http://local.inde.kr:3000",
-            "http://adminlocal.inde.kr:3000",
-            "http://admin-apilocal.inde.kr:3000",
-            "http://admin-apilocal.inde.kr",
-        ],
+        "cors": _LOCAL_ADMIN_APILOCAL_CORS,
         "media_prefix": "local",
     },
     "local.inde.kr:8001": {
         "slug": "public_api",
         "urlconf": "sites.public_api.urls",
-        "cors": [
-            "http://localhost:3000",
-            "http://localhost:3001",
-            "http://127.0.0.1:3001",
-            "https://dev.inde.kr",
-            "http://dev.inde.kr",
-            "http://adminlocal.inde.kr:3000",
-            "http://admin-local.inde.kr:3000",
-            "http://local.inde.kr:3001",
-            "http://apilocal.inde.kr:3001",
-        ],
+        "cors": _LOCAL_PUBLIC_HOSTNAME_CORS,
         "media_prefix": "local",
     },
     # /etc/hosts 등에서 apilocal 로 쓰는 경우(Host 헤더가 apilocal.inde.kr:8001)
     "apilocal.inde.kr:8001": {
         "slug": "public_api",
         "urlconf": "sites.public_api.urls",
-        "cors": [
-            "http://localhost:3000",
-            "http://localhost:3001",
-            "http://127.0.0.1:3001",
-            "https://dev.inde.kr",
-            "http://dev.inde.kr",
-            "http://adminlocal.inde.kr:3000",
-            "http://admin-local.inde.kr:3000",
-            "http://local.inde.kr:3001",
-            "http://apilocal.inde.kr:3001",
-        ],
+        "cors": _LOCAL_PUBLIC_HOSTNAME_CORS,
         "media_prefix": "local",
     },
 }
 
 
+class CompiledSite:
+    """
+    컴파일된 사이트 항목 (동일 설정의 호스트들은 하나의 인스턴스를 공유)
+    - cors: frozenset (Origin 포함 여부 O(1))
+    - meta: request.site_meta로 그대로 주입하는 읽기 전용 매핑 (요청마다 dict를 만들지 않음)
+    """
+    __slots__ = ('slug', 'urlconf', 'cors', 'media_prefix', 'meta')
+
+    def __init__(self, slug, urlconf, cors, media_prefix):
+        self.slug = slug
+        self.urlconf = urlconf
+        self.cors = frozenset(cors)
+        self.media_prefix = media_prefix
+        self.meta = MappingProxyType({
+            'slug': slug,
+            'urlconf': urlconf,
+            'cors': self.cors,
+            'media_prefix': media_prefix,
+        })
+
+
+# 매칭되는 사이트가 없을 때
+DEFAULT_SITE = CompiledSite('default', None, (), '')
+
+
+def compile_site_map(site_map):
+    """
+    SITE_MAP → {host: CompiledSite}. (slug, urlconf, cors, media_prefix)가 같은 항목은 인스턴스를 공유한다.
+    """
+    interned = {}
+    table = {}
+    for host, info in site_map.items():
+        cors = frozenset(info.get('cors', ()))
+        key = (info['slug'], info['urlconf'], cors, info.get('media_prefix', ''))
+        site = interned.get(key)
+        if site is None:
+            site = CompiledSite(info['slug'], info['urlconf'], cors, info.get('media_prefix', ''))
+            interned[key] = site
+        table[host] = site
+    return table
+
+
+SITE_TABLE = compile_site_map(SITE_MAP)
@@ -0,0 +1,33 @@
+-- ============================================
+-- audit_log 월별 RANGE 파티셔닝 + 아카이브 테이블
+-- ============================================
+-- 목적: 오래된 감사 로그를 DELETE 대신 파티션 단위로 떼어내 (DROP PARTITION) 보관·삭제 비용을 줄인다.
+-- 이후 파티션 추가/아카이브는 `python manage.py archive_audit_log` 가 수행한다.
+--
+-- 주의
+-- 1. MySQL 파티션 테이블은 모든 UNIQUE/PK에 파티션 키가 포함되어야 하므로 PK를 (id, created_at)로 바꾼다.
+--    id는 AUTO_INCREMENT 그대로이며 애플리케이션은 id 단독 조회만 하므로 동작은 같다.
+-- 2. 대용량 테이블이면 점검 시간에 실행 (ALTER ... PARTITION BY 는 테이블 재작성).
+-- 3. 아래 경계 날짜는 예시. 실행 시점 기준으로 과거 월 몇 개 + 향후 3개월 정도로 조정.
+
+ALTER TABLE `audit_log`
+    DROP PRIMARY KEY,
+    ADD PRIMARY KEY (`id`, `created_at`);
+
+ALTER TABLE `audit_log`
+PARTITION BY RANGE (TO_DAYS(`created_at`)) (
+    PARTITION p202608 VALUES LESS THAN (TO_DAYS('2026-09-01')),
+    PARTITION p202609 VALUES LESS THAN (TO_DAYS('2026-10-01')),
+    PARTITION p202610 VALUES LESS THAN (TO_DAYS('2026-11-01')),
+    PARTITION p202611 VALUES LESS THAN (TO_DAYS('2026-12-01')),
+    PARTITION p202612 VALUES LESS THAN (TO_DAYS('2027-01-01')),
+    PARTITION pmax VALUES LESS THAN MAXVALUE
+);
+
+-- 아카이브 테이블 (보존 기간이 지난 행을 옮겨 둔다. archive_audit_log 가 없으면 자동 생성)
+CREATE TABLE IF NOT EXISTS `audit_log_archive` LIKE `audit_log`;
+
+-- 확인
+-- SELECT PARTITION_NAME, PARTITION_DESCRIPTION, TABLE_ROWS
+--   FROM information_schema.PARTITIONS
+--  WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'audit_log';
@@ -0,0 +1,50 @@
+-- ============================================
+-- media_asset / media_asset_ref 테이블 생성 스크립트
+-- ============================================
+-- 데이터베이스: MariaDB / MySQL
+-- 설명: 내용 주소(SHA-256) 기반 이미지 저장소 인덱스 (core.media_assets)
+--   - media_asset: 해시당 1행, S3 키 assets/{hash[:2]}/{hash}.{ext}, 참조 수
+--   - media_asset_ref: (참조 주체, 자산) 1행 — ref_count 는 이 행 수로 다시 센다
+--   - 참조 0 자산은 `python manage.py gc_media_assets` 가 유예 기간 후 S3·DB에서 삭제
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS `media_asset` (
+    `hash` VARCHAR(64) NOT NULL COMMENT 'SHA-256 (hex)',
+    `key` VARCHAR(255) NOT NULL COMMENT 'S3 키',
+    `content_type` VARCHAR(100) NOT NULL DEFAULT '' COMMENT 'Content-Type',
+    `size` BIGINT NOT NULL DEFAULT 0 COMMENT '크기(bytes)',
+    `ref_count` INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '참조 수',
+    `orphaned_at` DATETIME(6) NULL DEFAULT NULL COMMENT '참조 0이 된 시각',
+    `created_at` DATETIME(6) NOT NULL COMMENT '생성일시',
+
+    PRIMARY KEY (`hash`),
+    UNIQUE KEY `media_asset_key_uniq` (`key`),
+    KEY `idx_media_asset_gc` (`ref_count`, `orphaned_at`)
+
+) ENGINE=InnoDB
+  DEFAULT CHARSET=utf8mb4
+  COLLATE=utf8mb4_unicode_ci
+  COMMENT='내용 주소 기반 이미지 자산';
+
+CREATE TABLE IF NOT EXISTS `media_asset_ref` (
+    `id` BIGINT NOT NULL AUTO_INCREMENT,
+    `asset_hash` VARCHAR(64) NOT NULL COMMENT 'media_asset.hash',
+    `owner_type` VARCHAR(32) NOT NULL COMMENT '참조 주체 종류 (article, homepage_doc)',
+    `owner_id` VARCHAR(64) NOT NULL COMMENT '참조 주체 ID',
+    `created_at` DATETIME(6) NOT NULL COMMENT '생성일시',
+
+    PRIMARY KEY (`id`),
+    UNIQUE KEY `uq_media_asset_ref_owner` (`owner_type`, `owner_id`, `asset_hash`),
+    KEY `media_asset_ref_asset_hash` (`asset_hash`),
+    CONSTRAINT `media_asset_ref_asset_fk` FOREIGN KEY (`asset_hash`) REFERENCES `media_asset` (`hash`) ON DELETE CASCADE
+
+) ENGINE=InnoDB
+  DEFAULT CHARSET=utf8mb4
+  COLLATE=utf8mb4_unicode_ci
+  COMMENT='미디어 자산 참조';
+
+-- ============================================
+-- 확인
+-- ============================================
+-- SELECT COUNT(*), SUM(ref_count = 0) FROM media_asset;
+-- SELECT owner_type, COUNT(*) FROM media_asset_ref GROUP BY owner_type;
@@ -5,6 +5,9 @@ class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
 
+    def ready(self):
+        from core import checks  # noqa: F401  시스템 체크 등록
+
 
 
 
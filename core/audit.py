@@ -0,0 +1,209 @@
+"""
+AuditLog 비동기 배치 기록기
+
+요청 처리 중 AuditLog.objects.create(...)를 직접 호출하면 로그인 실패 등이 그대로 DB 쓰기로 이어진다.
+record_audit(...)는 AuditLog 인스턴스를 메모리 큐에 넣기만 하고, 백그라운드 스레드가
+AUDIT_LOG_BATCH_SIZE 건 또는 AUDIT_LOG_FLUSH_INTERVAL 초마다 bulk_create로 적재한다.
+
+- 큐는 AUDIT_LOG_QUEUE_MAX 건으로 제한. 가득 차면 버리고 dropped 카운트 + 경고 로그(간격 제한)
+- created_at은 큐에 넣은 시각 (모델 default=timezone.now, bulk_create 시 그대로 저장)
+- 프로세스 종료 시(atexit) 남은 큐를 한 번 더 적재
+- bulk_create 실패 시 연결을 닫고 AUDIT_LOG_BULK_RETRIES 번 다시 시도, 그래도 실패하면 행 단위 INSERT로
+  나눠 넣어 실패한 행만 버린다 (bulk_create 는 한 트랜잭션이라 실패 시 배치 전체가 들어가지 않은 상태)
+- AUDIT_LOG_ASYNC=False 이면 기존처럼 즉시 INSERT (관리 커맨드·디버깅용)
+- 지표: get_audit_writer().stats() → enqueued/written/dropped/failed(버린 행)/retried/queue_size
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+logger = logging.getLogger(__name__)
+
+# 큐 가득 참 경고 로그 최소 간격(초)
+_OVERFLOW_LOG_INTERVAL = 60.0
+# bulk_create 재시도 간 대기(초) — 재시도마다 2배
+_RETRY_BACKOFF = 0.5
+
+
+class AuditLogWriter:
+    """AuditLog 큐 + 백그라운드 bulk_create 스레드 (프로세스당 1개, fork 후 자동 재시작)"""
+
+    def __init__(self, max_queue=10000, batch_size=500, flush_interval=1.0, bulk_retries=1):
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.bulk_retries = bulk_retries
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = None
+        self._pid = None
+        self._last_overflow_log = 0.0
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.retried = 0
+
+    def enqueue(self, entry):
+        """AuditLog 인스턴스(미저장)를 큐에 넣는다. 큐가 가득 차면 False."""
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+            now = time.monotonic()
+            if now - self._last_overflow_log >= _OVERFLOW_LOG_INTERVAL:
+                self._last_overflow_log = now
+                logger.warning(
+                    'audit_log 큐 가득 참(%s건) — 감사 로그 버림 (누적 dropped=%s)',
+                    self.max_queue,
+                    self.dropped,
+                )
+            return False
+        self.enqueued += 1
+        return True
+
+    def flush(self):
+        """큐에 쌓인 항목을 모두 적재 (atexit·테스트·관리 커맨드용). 적재 건수 반환."""
+        total = 0
+        while True:
+            batch = self._drain(block=False)
+            if not batch:
+                return total
+            total += self._write(batch)
+
+    def stats(self):
+        return {
+            'enqueued': self.enqueued,
+            'written': self.written,
+            'dropped': self.dropped,
+            'failed': self.failed,
+            'retried': self.retried,
+            'queue_size': self._queue.qsize(),
+            'max_queue': self.max_queue,
+        }
+
+    def _ensure_thread(self):
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == pid and self._thread.is_alive():
+                return
+            if self._pid is not None and self._pid != pid:
+                # gunicorn prefork 등: 부모에서 복사된 큐/락은 버리고 새로 만든다
+                self._queue = queue.Queue(maxsize=self.max_queue)
+            self._pid = pid
+            self._thread = threading.Thread(target=self._run, name='audit-log-writer', daemon=True)
+            self._thread.start()
+
+    def _drain(self, block):
+        batch = []
+        try:
+            if block:
+                batch.append(self._queue.get(timeout=self.flush_interval))
+            while len(batch) < self.batch_size:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._drain(block=True)
+            if not batch:
+                continue
+            if len(batch) < self.batch_size:
+                # 다음 항목이 곧 들어올 가능성이 높으므로 잠깐 더 모은다
+                time.sleep(min(self.flush_interval, 0.2))
+                batch.extend(self._drain(block=False)[: self.batch_size - len(batch)])
+            self._write(batch)
+            close_old_connections()
+
+    def _write(self, batch):
+        from core.models import AuditLog
+
+        for attempt in range(self.bulk_retries + 1):
+            try:
+                # 바깥 트랜잭션 안(flush)에서도 실패가 그 트랜잭션을 깨지 않도록 savepoint
+                with transaction.atomic():
+                    AuditLog.objects.bulk_create(batch, batch_size=self.batch_size)
+            except Exception:
+                logger.exception(
+                    'audit_log bulk_create 실패 (%s건, 시도 %s/%s)', len(batch), attempt + 1, self.bulk_retries + 1
+                )
+                # 끊긴 연결이면 다음 시도에서 새로 연결 (flush 가 트랜잭션 안에서 불렸으면 닫지 않는다)
+                if not connection.in_atomic_block:
+                    connection.close()
+                if attempt < self.bulk_retries:
+                    self.retried += 1
+                    time.sleep(_RETRY_BACKOFF * (2 ** attempt))
+                continue
+            self.written += len(batch)
+            return len(batch)
+        return self._write_rows(batch)
+
+    def _write_rows(self, batch):
+        """행 단위 INSERT — 문제 있는 행(너무 긴 값 등)만 버린다"""
+        written = 0
+        failed = 0
+        for entry in batch:
+            try:
+                with transaction.atomic():
+                    entry.save(force_insert=True)
+            except Exception as exc:
+                failed += 1
+                if failed == 1:
+                    logger.warning('audit_log 행 INSERT 실패 — 버림 (action=%s): %s', entry.action, exc)
+                continue
+            written += 1
+        self.written += written
+        self.failed += failed
+        if failed:
+            logger.error('audit_log 행 단위 적재: %s건 성공, %s건 버림', written, failed)
+        return written
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_audit_writer():
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = AuditLogWriter(
+                    max_queue=int(getattr(settings, 'AUDIT_LOG_QUEUE_MAX', 10000)),
+                    batch_size=int(getattr(settings, 'AUDIT_LOG_BATCH_SIZE', 500)),
+                    flush_interval=float(getattr(settings, 'AUDIT_LOG_FLUSH_INTERVAL', 1.0)),
+                    bulk_retries=int(getattr(settings, 'AUDIT_LOG_BULK_RETRIES', 1)),
+                )
+                atexit.register(_writer.flush)
+    return _writer
+
+
+def record_audit(**fields):
+    """
+    AuditLog.objects.create(...)와 같은 인자로 감사 로그를 기록한다.
+    AUDIT_LOG_ASYNC(기본 True)이면 큐에 넣고 즉시 반환, 아니면 동기 INSERT.
+    user_agent는 AUDIT_LOG_USER_AGENT_MAX 자로 자른다.
+    """
+    from core.models import AuditLog
+
+    ua_max = int(getattr(settings, 'AUDIT_LOG_USER_AGENT_MAX', 512))
+    ua = fields.get('user_agent')
+    if ua and ua_max and len(ua) > ua_max:
+        fields['user_agent'] = ua[:ua_max]
+    entry = AuditLog(**fields)
+    if not getattr(settings, 'AUDIT_LOG_ASYNC', True):
+        entry.save(force_insert=True)
+        return entry
+    get_audit_writer().enqueue(entry)
+    return entry
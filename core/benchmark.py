@@ -0,0 +1,182 @@
+"""
+public_api 핫 엔드포인트 벤치마크 하네스 (benchmark_public_api 커맨드에서 사용)
+- 엔드포인트 정의: PUBLIC_API_ENDPOINTS
+- 측정: 지연시간 p50/p95, 요청당 SQL 쿼리 수, tracemalloc 기준 할당 피크
+- 기준선(JSON) 저장·비교로 회귀 검출
+- SQLite 실행 시 마이그레이션(MySQL 전용 SQL 포함) 대신 모델 기준으로 테이블 생성
+- 렌더러 마이크로벤치마크: RENDER_BENCH_ENDPOINTS 응답 데이터를 stdlib json / orjson 으로 인코딩 시간 비교
+"""
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from django.apps import apps
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@dataclass(frozen=True)
+class BenchEndpoint:
+    """
+    벤치마크 대상 GET 엔드포인트
+    - path: {article_id} 플레이스홀더 사용 가능 (데이터셋에서 댓글이 가장 많은 발행 아티클)
+    - auth: True면 더미 회원 access JWT를 Authorization 헤더로 전송
+    """
+    name: str
+    path: str
+    auth: bool = False
+
+
+PUBLIC_API_ENDPOINTS = (
+    BenchEndpoint('article_list', '/api/articles/?page=1&pageSize=20'),
+    BenchEndpoint('article_list_popular', '/api/articles/?sort=popular&page=1&pageSize=20'),
+    BenchEndpoint('article_detail_guest', '/api/articles/{article_id}'),
+    BenchEndpoint('article_detail_member', '/api/articles/{article_id}', auth=True),
+    BenchEndpoint('search', '/api/search/?q=%EB%8D%94%EB%AF%B8'),
+    BenchEndpoint('ranking_hot', '/api/library/ranking/hot'),
+    BenchEndpoint('ranking_share', '/api/library/ranking/share'),
+    BenchEndpoint('curation_list', '/api/curation/list'),
+    BenchEndpoint('stats_view_count', '/api/library/stats/view-count?contentType=ARTICLE&contentCode={article_id}'),
+    BenchEndpoint('stats_rating', '/api/library/stats/rating?contentType=ARTICLE&contentCode={article_id}'),
+    BenchEndpoint('stats_bookmark', '/api/library/stats/bookmark?contentType=ARTICLE&contentCode={article_id}'),
+    BenchEndpoint('me_views', '/api/library/useractivity/me/views?page=1&pageSize=10', auth=True),
+    BenchEndpoint('me_bookmarks', '/api/library/useractivity/me/bookmarks?page=1&pageSize=10', auth=True),
+    BenchEndpoint('me_ratings', '/api/library/useractivity/me/ratings?page=1&pageSize=10', auth=True),
+    BenchEndpoint('comments', '/api/comments?type=ARTICLE&id={article_id}'),
+)
+
+
+def percentile(values, pct):
+    """정렬된 값 목록의 pct(0~100) 백분위수 (선형 보간)."""
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return float(values[0])
+    k = (len(values) - 1) * (pct / 100.0)
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return float(values[lo] + (values[hi] - values[lo]) * (k - lo))
+
+
+def measure_endpoint(client, path, headers=None, iterations=30, warmup=3):
+    """
+    한 엔드포인트를 반복 호출해 통계 반환
+
+    Args:
+        client: django.test.Client
+        path: 요청 경로(쿼리 포함)
+        headers: client.get에 넘길 META 키워드 (HTTP_HOST, HTTP_AUTHORIZATION 등)
+        iterations: 측정 반복 횟수
+        warmup: 측정 전 예열 호출 횟수 (URL resolve·쿼리셋 컴파일 캐시 등)
+
+    Returns:
+        dict: status, p50_ms, p95_ms, mean_ms, queries, alloc_peak_kib
+    """
+    headers = headers or {}
+    for _ in range(warmup):
+        client.get(path, **headers)
+
+    durations = []
+    query_counts = []
+    status_code = None
+    for _ in range(iterations):
+        with CaptureQueriesContext(connection) as ctx:
+            t0 = time.perf_counter()
+            resp = client.get(path, **headers)
+            durations.append((time.perf_counter() - t0) * 1000.0)
+        query_counts.append(len(ctx.captured_queries))
+        status_code = resp.status_code
+
+    # 할당 측정은 tracemalloc 오버헤드가 지연시간에 섞이지 않도록 별도 1회 호출
+    tracemalloc.start()
+    try:
+        client.get(path, **headers)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    durations.sort()
+    return {
+        'status': status_code,
+        'p50_ms': round(percentile(durations, 50), 3),
+        'p95_ms': round(percentile(durations, 95), 3),
+        'mean_ms': round(statistics.fmean(durations), 3) if durations else 0.0,
+        'queries': max(query_counts) if query_counts else 0,
+        'alloc_peak_kib': round(peak / 1024.0, 1),
+    }
+
+
+def compare_to_baseline(results, baseline, tolerance=0.2):
+    """
+    측정 결과와 기준선 비교
+
+    - 쿼리 수: 기준선보다 1개라도 늘면 회귀 (N+1 검출)
+    - p95 지연·할당 피크: 기준선 × (1 + tolerance) 초과 시 회귀
+
+    Returns:
+        list[str]: 회귀 설명 메시지 목록 (없으면 빈 리스트)
+    """
+    regressions = []
+    base_endpoints = (baseline or {}).get('endpoints', {})
+    for name, cur in results.items():
+        base = base_endpoints.get(name)
+        if not base:
+            continue
+        if cur['queries'] > base.get('queries', cur['queries']):
+            regressions.append(f"{name}: queries {base['queries']} -> {cur['queries']}")
+        for key in ('p95_ms', 'alloc_peak_kib'):
+            b = base.get(key)
+            if b and cur[key] > b * (1 + tolerance):
+                regressions.append(f'{name}: {key} {b} -> {cur[key]} (+{(cur[key] / b - 1) * 100:.0f}%)')
+    return regressions
+
+
+def ensure_sqlite_schema(stdout=None):
+    """
+    SQLite 벤치마크 DB에 누락된 테이블을 모델 정의로 생성.
+    마이그레이션에 information_schema 등 MySQL 전용 SQL이 있어 SQLite에서는 migrate 불가.
+    managed=False(sysCodeManager 등) 모델도 조회 대상이므로 함께 생성한다.
+
+    Returns:
+        int: 생성한 테이블 수
+    """
+    if connection.vendor != 'sqlite':
+        return 0
+    existing = set(connection.introspection.table_names())
+    created = 0
+    with connection.schema_editor() as editor:
+        for model in apps.get_models():
+            if model._meta.proxy or model._meta.db_table in existing:
+                continue
+            editor.create_model(model)
+            existing.add(model._meta.db_table)
+            created += 1
+            if stdout is not None:
+                stdout.write(f'  create table {model._meta.db_table}')
+    return created
+
+
+# 렌더러 마이크로벤치마크 대상 — 응답 본문이 큰 엔드포인트
+RENDER_BENCH_ENDPOINTS = ('search', 'article_list', 'article_list_popular', 'comments', 'curation_list', 'me_views')
+
+
+def measure_render(renderer, data, iterations=200, renderer_context=None):
+    """
+    renderer.render(data) 반복 시간 (DB·뷰 제외 순수 인코딩)
+
+    Returns:
+        dict: p50_us, p95_us, bytes
+    """
+    body = renderer.render(data, 'application/json', renderer_context)
+    durations = []
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        renderer.render(data, 'application/json', renderer_context)
+        durations.append((time.perf_counter() - t0) * 1_000_000.0)
+    durations.sort()
+    return {
+        'p50_us': round(percentile(durations, 50), 1),
+        'p95_us': round(percentile(durations, 95), 1),
+        'bytes': len(body),
+    }
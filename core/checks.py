@@ -0,0 +1,54 @@
+"""
+시스템 체크 (manage.py check / runserver / migrate 시 실행)
+"""
+from django.conf import settings
+from django.core.checks import Warning, register
+
+from core.throttling import is_process_local, throttle_enabled
+
+
+@register()
+def check_shared_default_cache(app_configs, **kwargs):
+    """
+    local 외 환경에서 기본 캐시가 프로세스별(LocMem)이면 경고.
+    발행 워커·관리 커맨드·다른 웹 프로세스가 지운 캐시(목록 count, Hero, 라이브러리 통계 등)가
+    각 프로세스에서는 TTL 이 끝날 때까지 남는다.
+    """
+    if getattr(settings, 'ENV_MODE', 'local') == 'local' or not is_process_local('default'):
+        return []
+    return [
+        Warning(
+            "CACHES['default'] 가 프로세스별 캐시입니다 — 캐시 무효화가 다른 프로세스에 전달되지 않습니다.",
+            hint='REDIS_URL 을 설정해 공유 캐시를 사용하세요.',
+            id='core.W001',
+        )
+    ]
+
+
+@register()
+def check_shared_throttle_cache(app_configs, **kwargs):
+    """
+    local 외 환경에서 요청 제한 캐시(THROTTLE_CACHE_ALIAS)가 프로세스별이면 경고.
+    워커마다 따로 세므로 로그인·SMS 한도가 워커 수만큼 늘어난다.
+    시작을 막지는 않는다 (REDIS_URL 없이도 migrate 등 관리 커맨드는 실행되어야 한다).
+    """
+    if not throttle_enabled() or getattr(settings, 'ENV_MODE', 'local') == 'local':
+        return []
+    alias = getattr(settings, 'THROTTLE_CACHE_ALIAS', 'default')
+    if alias not in settings.CACHES:
+        return [
+            Warning(
+                f"THROTTLE_CACHE_ALIAS={alias!r} 캐시가 CACHES 에 없습니다.",
+                hint='CACHES 에 있는 공유 캐시 별칭을 지정하세요.',
+                id='core.W002',
+            )
+        ]
+    if is_process_local(alias):
+        return [
+            Warning(
+                f"요청 제한 캐시({alias!r})가 프로세스별 캐시입니다 — 한도가 워커 수만큼 늘어납니다.",
+                hint='REDIS_URL 을 설정하거나 AUTH_THROTTLE_ENABLED=0 으로 끄세요.',
+                id='core.W002',
+            )
+        ]
+    return []
@@ -0,0 +1,148 @@
+"""
+공개 GET 응답 HTTP 조건부 캐시 (ETag / Cache-Control)
+
+- ETag: 뷰가 직렬화·presign 전에 모은 버전 스탬프(updatedAt·카운터·랭킹 base_date·코드 행 등)의 해시 (약한 ETag)
+  If-None-Match 가 일치하면 본문 없이 304 — 직렬화·presign·JSON 인코딩·전송을 건너뛴다
+- presigned URL 을 담는 응답은 presign_window() 를 스탬프에 넣는다: 창(HTTP_CACHE_PRESIGN_WINDOW)이 바뀌면
+  ETag 도 바뀌어, 304 로 오래된(만료 1시간) 서명을 계속 쓰게 되지 않는다. 스탬프에 빠진 변경도 창 길이 안에서 반영된다.
+- Cache-Control: 뷰별 CachePolicy. 회원/비회원 본문이 다른 응답은 Vary(Authorization, Cookie) + 회원은 private
+"""
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+from django.conf import settings
+from django.http import HttpResponseNotModified
+from django.utils.http import parse_etags
+from rest_framework.response import Response
+
+# 회원(JWT)·share_access 쿠키에 따라 본문이 달라지는 응답
+VARY_MEMBER = ('Authorization', 'Cookie')
+
+
+def _shared_max_age() -> int:
+    return int(getattr(settings, 'HTTP_CACHE_S_MAXAGE', 60))
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Cache-Control 정책
+    - max_age: 브라우저 보관(초). 0 이면 매번 ETag 로 재검증
+    - s_maxage: 공유 캐시(CDN) 보관(초). None 이면 HTTP_CACHE_S_MAXAGE, 0 이면 CDN 도 매번 재검증
+    - private: 회원 전용 본문 (CDN 저장 금지)
+    """
+    max_age: int = 0
+    s_maxage: Optional[int] = None
+    private: bool = False
+
+    def header(self) -> str:
+        if self.private:
+            return f'private, max-age={self.max_age}, must-revalidate' if self.max_age else 'private, no-cache'
+        s_maxage = _shared_max_age() if self.s_maxage is None else self.s_maxage
+        if not self.max_age and not s_maxage:
+            return 'public, no-cache'
+        return f'public, max-age={self.max_age}, s-maxage={s_maxage}'
+
+
+# 목록·랭킹·큐레이션·이벤트: 브라우저는 매번 재검증, CDN 은 짧게
+PUBLIC_LIST = CachePolicy()
+# 시스템 코드: 거의 바뀌지 않음
+PUBLIC_REFERENCE = CachePolicy(max_age=60, s_maxage=300)
+# 관리자 저장 직후 바로 보여야 하는 문서·조회수가 오르는 상세: 캐시는 보관하되 항상 재검증 (304 로 본문 절약)
+PUBLIC_REVALIDATE = CachePolicy(max_age=0, s_maxage=0)
+# 회원 본문
+MEMBER_PRIVATE = CachePolicy(private=True)
+# share_access 쿠키로 열린 본문 — 저장 금지 (ETag 없음)
+NO_STORE = 'private, no-store'
+
+
+def presign_window() -> int:
+    """presigned URL 포함 응답의 ETag 창 번호"""
+    window = max(1, int(getattr(settings, 'HTTP_CACHE_PRESIGN_WINDOW', 1800)))
+    return int(time.time() // window)
+
+
+def make_etag(*parts) -> str:
+    """버전 스탬프 → 약한 ETag (repr 기반: dict·list·datetime 등 그대로 전달)"""
+    digest = hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def model_stamp(obj, fields: Iterable[str]) -> tuple:
+    """모델 인스턴스의 버전 필드 값 (직렬화 없이)"""
+    return tuple(getattr(obj, name, None) for name in fields)
+
+
+def _opaque(tag: str) -> str:
+    return tag[2:] if tag.startswith('W/') else tag
+
+
+def etag_matches(request, etag: str) -> bool:
+    """If-None-Match 약한 비교 (RFC 9110 §13.1.2)"""
+    header = request.META.get('HTTP_IF_NONE_MATCH')
+    if not header:
+        return False
+    tags = parse_etags(header)
+    if tags == ['*']:
+        return True
+    target = _opaque(etag)
+    return any(_opaque(tag) == target for tag in tags)
+
+
+def apply_cache_headers(response, etag: Optional[str], policy, vary: Iterable[str] = ()):
+    """ETag·Cache-Control·Vary 설정 (오류 응답은 no-store, ETag 없음)"""
+    if response.status_code >= 400:
+        response['Cache-Control'] = 'no-store'
+        return response
+    if etag:
+        response['ETag'] = etag
+    response['Cache-Control'] = policy if isinstance(policy, str) else policy.header()
+    vary = list(vary)
+    if vary:
+        existing = [v.strip() for v in response.get('Vary', '').split(',') if v.strip()]
+        response['Vary'] = ', '.join(dict.fromkeys(existing + vary))
+    return response
+
+
+def conditional_response(request, etag: str, policy, build: Callable, vary: Iterable[str] = ()):
+    """
+    ETag 가 일치하면 304, 아니면 build() 로 응답을 만들어 캐시 헤더를 붙인다.
+    build 는 직렬화·presign 등 비싼 작업을 담은 콜백 (304 면 호출하지 않음).
+    """
+    vary = tuple(vary)
+    if request.method in ('GET', 'HEAD') and etag_matches(request, etag):
+        return apply_cache_headers(HttpResponseNotModified(), etag, policy, vary)
+    return apply_cache_headers(build(), etag, policy, vary)
+
+
+class ConditionalListMixin:
+    """
+    ModelViewSet.list 에 ETag 적용 — 페이지 행의 etag_stamp_fields 값(+ 전체 건수·페이지)으로 ETag,
+    일치하면 직렬화 없이 304. 행에 수정 일시가 없는 모델은 응답 필드 자체를 스탬프로 둔다.
+    """
+    etag_stamp_fields: tuple = ('pk',)
+    list_cache_policy = PUBLIC_LIST
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        rows = list(page if page is not None else queryset)
+        paging = None
+        if page is not None:
+            django_page = self.paginator.page
+            paging = (django_page.number, django_page.paginator.per_page, django_page.paginator.count)
+        etag = make_etag(
+            self.__class__.__name__,
+            paging,
+            [model_stamp(row, self.etag_stamp_fields) for row in rows],
+        )
+
+        def build():
+            serializer = self.get_serializer(rows, many=True)
+            if page is not None:
+                return self.get_paginated_response(serializer.data)
+            return Response(serializer.data)
+
+        return conditional_response(request, etag, self.list_cache_policy, build)
@@ -0,0 +1,247 @@
+"""
+publicUserActivityLog 접근 경로 인덱스 점검 (index_advisor 커맨드)
+- 라이브러리(library_useractivity_views)·관리자 회원 활동(public_members/views) 조회는 뷰와 같은 조건의 queryset 으로
+  (최근 본 목록은 publicRecentView 프로젝션을 읽으므로 대상 아님),
+  랭킹 배치(content_ranking_batch)는 집계 함수를 실제로 실행해 발행된 SQL 을 캡처해서 EXPLAIN
+- 풀 스캔(type=ALL / SCAN ... 인덱스 없음)·filesort·임시 테이블을 보고
+- RECOMMENDED_INDEXES 가 이미 있는지(기존 인덱스의 왼쪽 접두사 포함) 확인
+EXPLAIN 은 MySQL(EXPLAIN)·SQLite(EXPLAIN QUERY PLAN)만 지원.
+"""
+import re
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional
+
+from django.db import connection
+from django.db.models import Avg
+from django.utils import timezone
+
+from core.instrumentation import capture_queries
+from sites.public_api.models import PublicUserActivityLog
+
+TABLE = 'publicUserActivityLog'
+
+# (인덱스 이름, 컬럼, 사용하는 조회) — sites/public_api/migrations/0026 과 같은 정의
+RECOMMENDED_INDEXES = [
+    ('idx_ual_user_act_time', ['userId', 'activityType', 'regDateTime'], '마이페이지·관리자 회원 활동 목록 (user + 유형, 최신순)'),
+    ('idx_ual_type_act_time', ['contentType', 'activityType', 'regDateTime'], '랭킹 배치 기간 집계 (타입 + 유형 + 기간)'),
+    ('idx_ual_content_act', ['contentType', 'contentCode', 'activityType'], '콘텐츠별 통계·북마크 여부 (uniq_view 왼쪽 접두사로 충족)'),
+]
+
+# EXPLAIN 용 대표 값
+_SAMPLE_USER_ID = 1
+_SAMPLE_CONTENT_TYPE = 'ARTICLE'
+_SAMPLE_CONTENT_CODE = '1'
+
+
+def _log():
+    return PublicUserActivityLog.objects
+
+
+def _orm_cases() -> List[dict]:
+    """뷰와 같은 조건의 queryset (source: 출처 뷰)"""
+    uid = _SAMPLE_USER_ID
+    ct, cc = _SAMPLE_CONTENT_TYPE, _SAMPLE_CONTENT_CODE
+    return [
+        {
+            'name': 'me_bookmarks',
+            'source': 'library_useractivity_views.LibraryMeBookmarks / public_members activity_bookmarks',
+            'qs': _log().filter(user_id=uid, activity_type='BOOKMARK').order_by('-reg_date_time')[:10],
+        },
+        {
+            'name': 'me_ratings',
+            'source': 'library_useractivity_views.LibraryMeRatings / public_members activity_ratings',
+            'qs': _log().filter(user_id=uid, activity_type='RATING').order_by('-reg_date_time')[:10],
+        },
+        {
+            'name': 'me_ratings_summary',
+            'source': 'library_useractivity_views.LibraryMeRatings / public_members activity_ratings',
+            'qs': _log().filter(user_id=uid, activity_type='RATING', rating_value__isnull=False)
+            .values('user_id')
+            .annotate(avg=Avg('rating_value')),
+        },
+        {
+            'name': 'bookmark_exists',
+            'source': 'library_useractivity_views.LibraryUserActivityBookmark.get',
+            'qs': _log().filter(user_id=uid, content_type=ct, content_code=cc, activity_type='BOOKMARK')[:1],
+        },
+        {
+            'name': 'stats_view_count',
+            'source': 'library_useractivity_views.LibraryStatsViewCount',
+            'qs': _log().filter(content_type=ct, content_code=cc, activity_type='VIEW').values('content_code'),
+        },
+        {
+            'name': 'stats_rating',
+            'source': 'library_useractivity_views.LibraryStatsRating',
+            'qs': _log().filter(
+                content_type=ct, content_code=cc, activity_type='RATING', rating_value__isnull=False
+            ).values('rating_value'),
+        },
+        {
+            'name': 'stats_bookmark',
+            'source': 'library_useractivity_views.LibraryStatsBookmark',
+            'qs': _log().filter(content_type=ct, content_code=cc, activity_type='BOOKMARK').values('pk'),
+        },
+    ]
+
+
+def _ranking_calls() -> List[dict]:
+    """랭킹 배치 집계 함수 (읽기 전용 SELECT) — 실행해서 발행 SQL 캡처"""
+    from sites.public_api import content_ranking_batch as batch
+
+    since = timezone.now() - timedelta(days=7)
+    return [
+        {'name': 'ranking_hot', 'source': 'content_ranking_batch._fetch_hot_scores', 'call': lambda: batch._fetch_hot_scores(since)},
+        {
+            'name': 'ranking_weekly_cross',
+            'source': 'content_ranking_batch._fetch_weekly_cross_view_scores',
+            'call': lambda: batch._fetch_weekly_cross_view_scores(since),
+        },
+        {'name': 'ranking_share', 'source': 'content_ranking_batch._fetch_share_scores', 'call': lambda: batch._fetch_share_scores(since)},
+        {
+            'name': 'ranking_share_video',
+            'source': 'content_ranking_batch._fetch_share_scores_for_type',
+            'call': lambda: batch._fetch_share_scores_for_type('VIDEO', since),
+        },
+        {
+            'name': 'ranking_category_hot',
+            'source': 'content_ranking_batch._fetch_category_hot_ranked_rows',
+            'call': lambda: batch._fetch_category_hot_ranked_rows(since),
+        },
+    ]
+
+
+def _capture_sql(call: Callable) -> List[tuple]:
+    """call() 이 실행한 대상 테이블 SELECT 의 (sql, params)"""
+    with capture_queries() as captured:
+        call()
+    return [
+        (q['sql'], q['params'])
+        for q in captured
+        if not q['many'] and TABLE in q['sql'] and q['sql'].lstrip().upper().startswith(('SELECT', 'WITH'))
+    ]
+
+
+_TABLE_REF_RE = re.compile(r'\b(?:FROM|JOIN)\s+[`"]?(\w+)[`"]?(?:\s+(?:AS\s+)?[`"]?(\w+)[`"]?)?', re.IGNORECASE)
+
+
+def _base_table_names(sql: str) -> set:
+    """SQL 이 참조하는 실제 테이블 이름·별칭 (파생 테이블 SCAN 은 풀 스캔으로 보지 않기 위해)"""
+    tables = set(connection.introspection.table_names())
+    names = set()
+    for table, alias in _TABLE_REF_RE.findall(sql):
+        if table in tables:
+            names.add(table)
+            if alias and alias.upper() not in ('WHERE', 'ON', 'INNER', 'LEFT', 'JOIN', 'GROUP', 'ORDER', 'LIMIT'):
+                names.add(alias)
+    return names
+
+
+def _explain_mysql(sql: str, params) -> dict:
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN {sql}', params)
+        cols = [c[0] for c in cursor.description]
+        rows = [dict(zip(cols, r)) for r in cursor.fetchall()]
+    base_tables = _base_table_names(sql)
+    issues = []
+    for row in rows:
+        table = str(row.get('table') or '')
+        extra = str(row.get('Extra') or '')
+        if table not in base_tables:
+            # <derived2> 등 파생 테이블
+            continue
+        if row.get('type') == 'ALL':
+            issues.append(f'full scan ({table}, rows≈{row.get("rows")})')
+        elif row.get('type') == 'index':
+            issues.append(f'full index scan ({table}, key={row.get("key")})')
+        if 'Using filesort' in extra:
+            issues.append(f'filesort ({table})')
+        if 'Using temporary' in extra:
+            issues.append(f'temporary ({table})')
+    plan = [
+        f"{r.get('table')}: type={r.get('type')} key={r.get('key')} rows={r.get('rows')} {r.get('Extra') or ''}".rstrip()
+        for r in rows
+    ]
+    return {'plan': plan, 'issues': issues}
+
+
+def _explain_sqlite(sql: str, params) -> dict:
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        details = [str(r[-1]) for r in cursor.fetchall()]
+    base_tables = _base_table_names(sql)
+    issues = []
+    for detail in details:
+        if detail.startswith('SCAN ') and detail[5:].split(' ', 1)[0] in base_tables:
+            if ' USING ' not in detail:
+                issues.append(f'full scan ({detail[5:]})')
+            elif 'COVERING INDEX' not in detail:
+                issues.append(f'full index scan ({detail[5:]})')
+        if 'TEMP B-TREE' in detail:
+            issues.append(f'temporary sort ({detail})')
+    return {'plan': details, 'issues': issues}
+
+
+def explain(sql: str, params=None) -> Optional[dict]:
+    """EXPLAIN 결과 {'plan': [...], 'issues': [...]} (지원하지 않는 DB면 None)"""
+    if connection.vendor == 'mysql':
+        return _explain_mysql(sql, params or [])
+    if connection.vendor == 'sqlite':
+        return _explain_sqlite(sql, params or [])
+    return None
+
+
+def analyze_queries(only=None) -> List[dict]:
+    """
+    대상 조회를 EXPLAIN 해 결과 목록 반환
+
+    Returns:
+        [{'name', 'source', 'sql', 'plan', 'issues'}]
+    """
+    results = []
+    for case in _orm_cases():
+        if only and case['name'] not in only:
+            continue
+        sql, params = case['qs'].query.sql_with_params()
+        result = explain(sql, params)
+        if result is None:
+            continue
+        results.append({'name': case['name'], 'source': case['source'], 'sql': sql, **result})
+    for case in _ranking_calls():
+        if only and case['name'] not in only:
+            continue
+        for i, (sql, params) in enumerate(_capture_sql(case['call'])):
+            result = explain(sql, params)
+            if result is None:
+                continue
+            name = case['name'] if i == 0 else f"{case['name']}#{i + 1}"
+            results.append({'name': name, 'source': case['source'], 'sql': sql, **result})
+    return results
+
+
+def existing_indexes() -> Dict[str, List[str]]:
+    """publicUserActivityLog 의 현재 인덱스 {이름: 컬럼 목록} (PK 제외)"""
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, TABLE)
+    return {
+        name: list(info['columns'])
+        for name, info in constraints.items()
+        if (info.get('index') or info.get('unique')) and not info.get('primary_key') and info.get('columns')
+    }
+
+
+def check_recommended_indexes() -> List[dict]:
+    """
+    권장 인덱스별 충족 여부 — 같은 컬럼으로 시작하는 기존 인덱스가 있으면 충족
+
+    Returns:
+        [{'name', 'columns', 'purpose', 'covered_by'}] (covered_by: 충족하는 인덱스 이름 또는 None)
+    """
+    current = existing_indexes()
+    out = []
+    for name, columns, purpose in RECOMMENDED_INDEXES:
+        covered_by = next(
+            (idx for idx, cols in current.items() if [c.lower() for c in cols[: len(columns)]] == [c.lower() for c in columns]),
+            None,
+        )
+        out.append({'name': name, 'columns': columns, 'purpose': purpose, 'covered_by': covered_by})
+    return out
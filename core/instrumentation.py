@@ -0,0 +1,146 @@
+"""
+요청 단위 계측 (config.middleware.RequestInstrumentationMiddleware에서 사용)
+- DB 쿼리 수·시간: connection.execute_wrapper
+- S3 presign 횟수: S3Storage.get_file_url에서 record_s3_presign 호출
+- 외부 HTTP 시간: requests.Session.send 래핑 (계측 활성 시 1회 설치)
+- 쿼리 예산: 뷰 클래스의 query_budget 속성(요청당 최대 쿼리 수) / 테스트용 assert_max_queries
+- capture_queries: 블록의 SQL·파라미터 수집 (django.test 없이 execute_wrapper 로)
+"""
+import contextvars
+import time
+from contextlib import contextmanager
+
+from django.db import connection, connections
+
+_current_metrics = contextvars.ContextVar('inde_request_metrics', default=None)
+_http_timing_installed = False
+
+
+class RequestMetrics:
+    """요청 1건의 누적 계측 값"""
+    __slots__ = ('db_count', 'db_ms', 's3_presign_count', 'http_count', 'http_ms', 'started')
+
+    def __init__(self):
+        self.db_count = 0
+        self.db_ms = 0.0
+        self.s3_presign_count = 0
+        self.http_count = 0
+        self.http_ms = 0.0
+        self.started = time.perf_counter()
+
+    @property
+    def total_ms(self):
+        return (time.perf_counter() - self.started) * 1000.0
+
+
+class QueryBudgetExceeded(AssertionError):
+    """뷰/블록의 SQL 쿼리 수가 예산을 넘었을 때 (테스트·CI에서 N+1 회귀 검출용)"""
+
+
+def current_metrics():
+    """현재 요청의 RequestMetrics (계측 비활성 또는 요청 밖이면 None)."""
+    return _current_metrics.get()
+
+
+@contextmanager
+def collect_request_metrics():
+    """블록 동안 RequestMetrics를 활성화하고 DB 실행을 계측한다."""
+    metrics = RequestMetrics()
+    token = _current_metrics.set(metrics)
+    try:
+        with connection.execute_wrapper(_db_execute_wrapper):
+            yield metrics
+    finally:
+        _current_metrics.reset(token)
+
+
+def _db_execute_wrapper(execute, sql, params, many, context):
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    t0 = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_count += 1
+        metrics.db_ms += (time.perf_counter() - t0) * 1000.0
+
+
+def record_s3_presign():
+    """presigned URL 1건 생성 기록 (계측 비활성 시 no-op)."""
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.s3_presign_count += 1
+
+
+def install_http_timing():
+    """
+    requests.Session.send를 감싸 외부 HTTP 호출 시간을 현재 요청 계측에 누적.
+    requests.get/post 모두 Session.send를 거치므로 Aligo·OAuth·Cloudflare 호출이 포함된다.
+    """
+    global _http_timing_installed
+    if _http_timing_installed:
+        return
+    try:
+        import requests
+    except ImportError:
+        return
+    original_send = requests.Session.send
+
+    def timed_send(self, request, **kwargs):
+        metrics = _current_metrics.get()
+        if metrics is None:
+            return original_send(self, request, **kwargs)
+        t0 = time.perf_counter()
+        try:
+            return original_send(self, request, **kwargs)
+        finally:
+            metrics.http_count += 1
+            metrics.http_ms += (time.perf_counter() - t0) * 1000.0
+
+    requests.Session.send = timed_send
+    _http_timing_installed = True
+
+
+def server_timing_header(metrics):
+    """Server-Timing 응답 헤더 값 (브라우저 DevTools Timing 탭에 표시)."""
+    return ', '.join([
+        f'db;dur={metrics.db_ms:.1f};desc="{metrics.db_count} queries"',
+        f'http;dur={metrics.http_ms:.1f};desc="{metrics.http_count} calls"',
+        f's3;desc="{metrics.s3_presign_count} presign"',
+        f'total;dur={metrics.total_ms:.1f}',
+    ])
+
+
+@contextmanager
+def capture_queries(using=None):
+    """
+    블록 안에서 실행된 SQL 을 [{'sql', 'params', 'many'}] 로 수집 (파라미터는 치환하지 않음)
+    DEBUG 커서를 강제하지 않으므로 운영 코드(관리 커맨드 등)에서도 쓸 수 있다.
+    """
+    conn = connections[using] if using else connection
+    captured = []
+
+    def wrapper(execute, sql, params, many, context):
+        captured.append({'sql': sql, 'params': params, 'many': many})
+        return execute(sql, params, many, context)
+
+    with conn.execute_wrapper(wrapper):
+        yield captured
+
+
+@contextmanager
+def assert_max_queries(max_queries, using=None):
+    """
+    테스트용: 블록 안의 쿼리 수가 max_queries를 넘으면 QueryBudgetExceeded
+
+    사용 예:
+        with assert_max_queries(3):
+            client.get('/api/articles/', HTTP_HOST='127.0.0.1:8001')
+    """
+    with capture_queries(using) as captured:
+        yield captured
+    n = len(captured)
+    if n > max_queries:
+        sqls = '\n'.join(f"  {i}. {q['sql']}" for i, q in enumerate(captured, start=1))
+        raise QueryBudgetExceeded(f'쿼리 {n}건 실행 (예산 {max_queries}건)\n{sqls}')
@@ -0,0 +1,149 @@
+"""
+audit_log 보존 기간 관리 (cron 하루 1회 권장)
+- 보존 기간(--retain-days)이 지난 행을 audit_log_archive 로 옮기고 audit_log 에서 삭제
+- audit_log 가 월별 RANGE 파티션(core/AUDIT_LOG_PARTITION.sql)이면
+  · 통째로 지난 파티션은 INSERT ... SELECT PARTITION 후 DROP PARTITION (행 단위 DELETE 없음)
+  · pmax 를 쪼개 향후 --ahead 개월 파티션을 미리 만든다
+- 파티션이 없으면 id 순으로 --batch-size 건씩 옮기고 삭제 (idx_created_at 사용)
+
+사용법:
+  python manage.py archive_audit_log                   # 180일 보존
+  python manage.py archive_audit_log --retain-days 90 --dry-run
+  python manage.py archive_audit_log --no-archive      # 아카이브 없이 삭제만
+"""
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.models import AuditLog
+
+TABLE = AuditLog._meta.db_table
+ARCHIVE_TABLE = f'{TABLE}_archive'
+# MySQL TO_DAYS(d) == d.toordinal() + 365
+_TO_DAYS_OFFSET = 365
+
+
+def _month_start(d):
+    return d.replace(day=1)
+
+
+def _next_month(d):
+    return (d.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+class Command(BaseCommand):
+    help = 'audit_log 보존 기간 지난 행 아카이브/삭제 및 월별 파티션 유지'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retain-days', type=int, default=180, help='audit_log 에 남길 기간(일)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='파티션 없을 때 1회 이동 건수')
+        parser.add_argument('--ahead', type=int, default=3, help='미리 만들어 둘 향후 월 파티션 수')
+        parser.add_argument('--no-archive', action='store_true', help='아카이브 테이블로 옮기지 않고 삭제만')
+        parser.add_argument('--dry-run', action='store_true', help='대상만 출력')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'mysql':
+            self.stderr.write(self.style.ERROR('MySQL 전용 커맨드입니다.'))
+            return
+
+        cutoff = timezone.now() - timedelta(days=options['retain_days'])
+        archive = not options['no_archive']
+        dry_run = options['dry_run']
+        self.stdout.write(f'cutoff={cutoff.isoformat()} archive={archive} dry_run={dry_run}')
+
+        if archive and not dry_run:
+            with connection.cursor() as cursor:
+                cursor.execute(f'CREATE TABLE IF NOT EXISTS `{ARCHIVE_TABLE}` LIKE `{TABLE}`')
+
+        partitions = self._partitions()
+        if partitions:
+            self._drop_expired_partitions(partitions, cutoff, archive, dry_run)
+        moved = self._move_rows(cutoff, options['batch_size'], archive, dry_run)
+        self.stdout.write(f'행 단위 {"이동" if archive else "삭제"}: {moved}건')
+        if partitions:
+            self._add_future_partitions(self._partitions(), options['ahead'], dry_run)
+
+    def _partitions(self):
+        """[(name, upper_bound_date | None(MAXVALUE))] — 파티션이 없으면 []"""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT PARTITION_NAME, PARTITION_DESCRIPTION
+                  FROM information_schema.PARTITIONS
+                 WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL
+                 ORDER BY PARTITION_ORDINAL_POSITION
+                """,
+                [TABLE],
+            )
+            rows = cursor.fetchall()
+        result = []
+        for name, desc in rows:
+            if desc is None or str(desc).upper() == 'MAXVALUE':
+                result.append((name, None))
+            else:
+                result.append((name, date.fromordinal(int(desc) - _TO_DAYS_OFFSET)))
+        return result
+
+    def _drop_expired_partitions(self, partitions, cutoff, archive, dry_run):
+        cutoff_date = timezone.localtime(cutoff).date()
+        for name, upper in partitions:
+            if upper is None or upper > cutoff_date:
+                continue
+            self.stdout.write(f'파티션 {name} (< {upper}) {"아카이브 후 " if archive else ""}DROP')
+            if dry_run:
+                continue
+            with connection.cursor() as cursor:
+                if archive:
+                    cursor.execute(f'INSERT INTO `{ARCHIVE_TABLE}` SELECT * FROM `{TABLE}` PARTITION (`{name}`)')
+                cursor.execute(f'ALTER TABLE `{TABLE}` DROP PARTITION `{name}`')
+
+    def _move_rows(self, cutoff, batch_size, archive, dry_run):
+        qs = AuditLog.objects.filter(created_at__lt=cutoff)
+        if dry_run:
+            return qs.count()
+        moved = 0
+        while True:
+            ids = list(qs.order_by('id').values_list('id', flat=True)[:batch_size])
+            if not ids:
+                return moved
+            placeholders = ', '.join(['%s'] * len(ids))
+            with transaction.atomic(), connection.cursor() as cursor:
+                if archive:
+                    cursor.execute(
+                        f'INSERT INTO `{ARCHIVE_TABLE}` SELECT * FROM `{TABLE}` WHERE id IN ({placeholders})',
+                        ids,
+                    )
+                cursor.execute(f'DELETE FROM `{TABLE}` WHERE id IN ({placeholders})', ids)
+            moved += len(ids)
+
+    def _add_future_partitions(self, partitions, ahead, dry_run):
+        if not partitions or partitions[-1][1] is not None:
+            return
+        bounded = [upper for _name, upper in partitions if upper is not None]
+        start = max(bounded) if bounded else _month_start(timezone.localdate())
+        target = _month_start(timezone.localdate())
+        for _ in range(ahead + 1):
+            target = _next_month(target)
+        new_parts = []
+        upper = start
+        while upper < target:
+            lower, upper = upper, _next_month(upper)
+            new_parts.append(
+                f"PARTITION p{lower:%Y%m} VALUES LESS THAN (TO_DAYS('{upper.isoformat()}'))"
+            )
+        if not new_parts:
+            return
+        pmax = partitions[-1][0]
+        sql = (
+            f'ALTER TABLE `{TABLE}` REORGANIZE PARTITION `{pmax}` INTO ('
+            + ', '.join(new_parts)
+            + f', PARTITION `{pmax}` VALUES LESS THAN MAXVALUE)'
+        )
+        self.stdout.write(f'파티션 추가 {len(new_parts)}개 (~ {upper})')
+        if dry_run:
+            self.stdout.write(sql)
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
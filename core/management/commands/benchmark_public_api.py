@@ -0,0 +1,232 @@
+"""
+public_api 핫 엔드포인트 벤치마크 (아티클 목록/상세, 검색, 랭킹, 큐레이션, 라이브러리, 댓글)
+- 각 엔드포인트를 django.test.Client로 반복 호출해 p50/p95 지연, 쿼리 수, 할당 피크를 측정
+- --save-baseline 으로 JSON 기준선 저장, 이후 실행은 기준선과 비교해 회귀를 보고
+- DB: 기본 설정(MySQL) 또는 DB_ENGINE=sqlite (테이블은 모델 기준 자동 생성)
+
+사용법:
+  # SQLite에 데이터셋 생성 후 기준선 저장
+  DB_ENGINE=sqlite python manage.py benchmark_public_api --seed small --save-baseline
+  # 코드 변경 후 회귀 확인 (회귀 시 exit 1)
+  DB_ENGINE=sqlite python manage.py benchmark_public_api --fail-on-regression
+  # 특정 엔드포인트만
+  python manage.py benchmark_public_api --only article_list,search --iterations 50
+  # 응답 인코딩(IndeJSONRenderer) stdlib json vs orjson 비교 — 본문이 큰 엔드포인트
+  DB_ENGINE=sqlite python manage.py benchmark_public_api --render
+"""
+import json
+import platform
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.utils import timezone
+
+from core.benchmark import (
+    PUBLIC_API_ENDPOINTS,
+    RENDER_BENCH_ENDPOINTS,
+    compare_to_baseline,
+    ensure_sqlite_schema,
+    measure_endpoint,
+    measure_render,
+)
+from core.renderers import JSON_BACKEND_ORJSON, JSON_BACKEND_STDLIB, IndeJSONRenderer, orjson_available
+
+DEFAULT_BASELINE_PATH = Path(settings.BASE_DIR) / 'benchmarks' / 'public_api_baseline.json'
+# SITE_MAP에서 public_api로 라우팅되고 기본 ALLOWED_HOSTS에 포함된 호스트
+DEFAULT_HOST = '127.0.0.1:8001'
+
+# seed_dummy_data 인자 프리셋
+SEED_SCALES = {
+    'small': {'article': 200, 'members': 50, 'activity': 5000, 'comments': 500, 'highlights': 500},
+    'medium': {'article': 2000, 'members': 500, 'activity': 50000, 'comments': 5000, 'highlights': 5000},
+    'large': {'article': 10000, 'members': 5000, 'activity': 500000, 'comments': 50000, 'highlights': 50000},
+}
+
+
+class Command(BaseCommand):
+    help = 'public_api 핫 엔드포인트 p50/p95·쿼리 수·할당 측정 및 JSON 기준선 비교'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=30, help='엔드포인트당 측정 반복 횟수')
+        parser.add_argument('--warmup', type=int, default=3, help='측정 전 예열 호출 횟수')
+        parser.add_argument('--only', type=str, default='', help='쉼표로 구분한 엔드포인트 이름만 실행')
+        parser.add_argument('--host', type=str, default=DEFAULT_HOST, help='요청 Host 헤더 (public_api 사이트)')
+        parser.add_argument(
+            '--seed',
+            choices=sorted(SEED_SCALES),
+            default=None,
+            help='측정 전 seed_dummy_data로 데이터셋 재생성 (small/medium/large)',
+        )
+        parser.add_argument('--baseline', type=str, default=str(DEFAULT_BASELINE_PATH), help='기준선 JSON 경로')
+        parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준선으로 저장')
+        parser.add_argument('--tolerance', type=float, default=0.2, help='p95·할당 허용 증가율 (0.2 = 20%%)')
+        parser.add_argument('--fail-on-regression', action='store_true', help='회귀가 있으면 exit 1')
+        parser.add_argument(
+            '--render',
+            action='store_true',
+            help='지연 측정 대신 응답 인코딩 시간 비교 (stdlib json vs orjson, --only 없으면 본문이 큰 엔드포인트)',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor == 'sqlite':
+            n = ensure_sqlite_schema(self.stdout)
+            if n:
+                self.stdout.write(self.style.WARNING(f'SQLite 테이블 {n}개 생성'))
+
+        scale = options.get('seed')
+        if scale:
+            call_command(
+                'seed_dummy_data',
+                no_thumbnail=True,
+                random_seed=42,
+                stdout=self.stdout,
+                stderr=self.stderr,
+                **SEED_SCALES[scale],
+            )
+
+        article_id = self._pick_article_id()
+        if article_id is None:
+            raise CommandError('발행된 아티클이 없습니다. --seed small 등으로 데이터셋을 먼저 생성하세요.')
+        token = self._member_access_token()
+
+        only = {x.strip() for x in (options.get('only') or '').split(',') if x.strip()}
+        if options['render']:
+            only = only or set(RENDER_BENCH_ENDPOINTS)
+        endpoints = [e for e in PUBLIC_API_ENDPOINTS if not only or e.name in only]
+        if options['render']:
+            self._benchmark_render(endpoints, article_id, token, options)
+            return
+
+        client = Client()
+        results = {}
+        self.stdout.write(f"{'endpoint':<24}{'status':>7}{'p50 ms':>10}{'p95 ms':>10}{'queries':>9}{'alloc KiB':>11}")
+        for ep in endpoints:
+            headers = {'HTTP_HOST': options['host']}
+            if ep.auth:
+                if not token:
+                    self.stdout.write(self.style.WARNING(f'{ep.name:<24} skip (더미 회원 없음)'))
+                    continue
+                headers['HTTP_AUTHORIZATION'] = f'Bearer {token}'
+            path = ep.path.format(article_id=article_id)
+            r = measure_endpoint(
+                client,
+                path,
+                headers=headers,
+                iterations=options['iterations'],
+                warmup=options['warmup'],
+            )
+            results[ep.name] = r
+            line = (
+                f"{ep.name:<24}{r['status']:>7}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}"
+                f"{r['queries']:>9}{r['alloc_peak_kib']:>11.1f}"
+            )
+            self.stdout.write(line if r['status'] == 200 else self.style.WARNING(line))
+
+        baseline_path = Path(options['baseline'])
+        if options['save_baseline']:
+            baseline_path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {
+                'meta': {
+                    'created_at': timezone.now().isoformat(),
+                    'db_vendor': connection.vendor,
+                    'python': platform.python_version(),
+                    'iterations': options['iterations'],
+                    'article_id': article_id,
+                },
+                'endpoints': results,
+            }
+            baseline_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding='utf-8')
+            self.stdout.write(self.style.SUCCESS(f'기준선 저장: {baseline_path}'))
+            return
+
+        if not baseline_path.exists():
+            self.stdout.write(self.style.WARNING(f'기준선 없음: {baseline_path} (--save-baseline 으로 생성)'))
+            return
+        baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+        if baseline.get('meta', {}).get('db_vendor') not in (None, connection.vendor):
+            self.stdout.write(self.style.WARNING('기준선과 DB 종류가 달라 지연 비교 결과는 참고용입니다.'))
+        regressions = compare_to_baseline(results, baseline, tolerance=options['tolerance'])
+        if not regressions:
+            self.stdout.write(self.style.SUCCESS('기준선 대비 회귀 없음'))
+            return
+        for msg in regressions:
+            self.stdout.write(self.style.ERROR(f'REGRESSION {msg}'))
+        if options['fail_on_regression']:
+            raise CommandError(f'회귀 {len(regressions)}건')
+
+    def _benchmark_render(self, endpoints, article_id, token, options):
+        """엔드포인트 응답 데이터(Response.data)를 1회 받아 렌더러 백엔드별 인코딩 시간 비교"""
+        if not orjson_available():
+            self.stdout.write(self.style.WARNING('orjson 미설치 — orjson 열은 stdlib 경로로 측정됩니다.'))
+        renderers = {}
+        for backend in (JSON_BACKEND_STDLIB, JSON_BACKEND_ORJSON):
+            renderers[backend] = IndeJSONRenderer()
+            renderers[backend].json_backend = backend
+        iterations = max(options['iterations'], 1) * 10
+
+        client = Client()
+        self.stdout.write(f"{'endpoint':<24}{'KiB':>9}{'json p50 us':>13}{'orjson p50 us':>15}{'speedup':>9}")
+        for ep in endpoints:
+            headers = {'HTTP_HOST': options['host']}
+            if ep.auth:
+                if not token:
+                    self.stdout.write(self.style.WARNING(f'{ep.name:<24} skip (더미 회원 없음)'))
+                    continue
+                headers['HTTP_AUTHORIZATION'] = f'Bearer {token}'
+            resp = client.get(ep.path.format(article_id=article_id), **headers)
+            data = getattr(resp, 'data', None)
+            if resp.status_code != 200 or data is None:
+                self.stdout.write(self.style.WARNING(f'{ep.name:<24} skip (status {resp.status_code})'))
+                continue
+            stdlib = measure_render(renderers[JSON_BACKEND_STDLIB], data, iterations)
+            fast = measure_render(renderers[JSON_BACKEND_ORJSON], data, iterations)
+            speedup = stdlib['p50_us'] / fast['p50_us'] if fast['p50_us'] else 0.0
+            self.stdout.write(
+                f"{ep.name:<24}{stdlib['bytes'] / 1024.0:>9.1f}{stdlib['p50_us']:>13.1f}"
+                f"{fast['p50_us']:>15.1f}{speedup:>8.1f}x"
+            )
+
+    def _pick_article_id(self):
+        """상세·댓글·통계 측정용: 댓글이 가장 많은 발행 아티클."""
+        from sites.admin_api.articles.models import Article
+        from sites.admin_api.content_publish_syscodes import STATUS_PUBLISHED
+
+        return (
+            Article.objects.filter(deletedAt__isnull=True, status=STATUS_PUBLISHED)
+            .order_by('-commentCount', 'id')
+            .values_list('id', flat=True)
+            .first()
+        )
+
+    def _member_access_token(self):
+        """활동 로그가 가장 많은 더미 회원의 access JWT (마이페이지 엔드포인트용)."""
+        from django.db.models import Count
+
+        from core.management.commands.seed_dummy_data import DUMMY_MEMBER_EMAIL_DOMAIN
+        from sites.public_api.models import PublicMemberShip, PublicUserActivityLog
+        from sites.public_api.utils import create_public_jwt_tokens
+
+        member_ids = PublicMemberShip.objects.filter(
+            email__endswith=f'@{DUMMY_MEMBER_EMAIL_DOMAIN}', is_active=True
+        ).values_list('member_sid', flat=True)
+        top = (
+            PublicUserActivityLog.objects.filter(user_id__in=list(member_ids))
+            .values('user_id')
+            .annotate(n=Count('public_user_activity_log_id'))
+            .order_by('-n')
+            .first()
+        )
+        member = None
+        if top:
+            member = PublicMemberShip.objects.filter(member_sid=top['user_id']).first()
+        if member is None:
+            member = PublicMemberShip.objects.filter(
+                email__endswith=f'@{DUMMY_MEMBER_EMAIL_DOMAIN}', is_active=True
+            ).first()
+        if member is None:
+            return None
+        return create_public_jwt_tokens(member)['access_token']
@@ -0,0 +1,40 @@
+"""
+참조가 0이 된 내용 주소 자산(assets/) 정리 (cron 하루 1회 또는 run_workers)
+- ref_count=0 상태로 --grace-hours 가 지난 media_asset 행을 잠그고 S3 DeleteObjects 로 일괄 삭제 후 행 삭제
+- --reconcile: media_asset_ref 기준으로 전체 ref_count 를 다시 센다 (드리프트 보정)
+
+  python manage.py gc_media_assets
+  python manage.py gc_media_assets --grace-hours 72 --dry-run
+"""
+from django.core.management.base import BaseCommand
+
+from core.media_assets import gc_orphaned_assets, media_assets_enabled, reconcile_asset_ref_counts
+
+
+class Command(BaseCommand):
+    help = '참조 0 내용 주소 자산 S3·인덱스 정리'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace-hours', type=int, default=None, help='참조 0 이후 보존 시간 (기본 MEDIA_ASSET_GC_GRACE_HOURS)')
+        parser.add_argument('--batch-size', type=int, default=1000, help='1회 삭제 건수 (DeleteObjects 최대 1000)')
+        parser.add_argument('--reconcile', action='store_true', help='삭제 전에 ref_count 재계산')
+        parser.add_argument('--dry-run', action='store_true', help='대상 건수만 출력')
+
+    def handle(self, *args, **options):
+        if not media_assets_enabled():
+            self.stdout.write('MEDIA_ASSET_CONTENT_ADDRESSED 가 꺼져 있어 건너뜁니다.')
+            return
+        if options['reconcile'] and not options['dry_run']:
+            updated = reconcile_asset_ref_counts()
+            self.stdout.write(f'ref_count 재계산 {updated}건')
+        result = gc_orphaned_assets(
+            grace_hours=options['grace_hours'],
+            batch_size=min(max(1, options['batch_size']), 1000),
+            dry_run=options['dry_run'],
+        )
+        if options['dry_run']:
+            self.stdout.write(f"삭제 대상 {result['candidates']}건")
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f"자산 {result['deleted']}/{result['candidates']}건 삭제 (S3 실패 {result['errors']}건)"
+        ))
@@ -0,0 +1,63 @@
+"""
+publicUserActivityLog 인덱스 점검 (core.index_advisor)
+- 라이브러리·관리자 회원 활동·랭킹 배치 조회를 EXPLAIN 해 풀 스캔·filesort·임시 테이블 보고
+- 권장 복합 인덱스(public_api 0026 마이그레이션) 적용 여부 확인
+
+사용법:
+  python manage.py index_advisor
+  python manage.py index_advisor --verbose                 # 실행 계획 전체 출력
+  python manage.py index_advisor --only me_bookmarks,ranking_hot
+  python manage.py index_advisor --fail-on-full-scan       # 풀 스캔이 있으면 exit 1 (CI)
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from core.index_advisor import analyze_queries, check_recommended_indexes
+
+
+class Command(BaseCommand):
+    help = 'publicUserActivityLog 조회 EXPLAIN 점검 및 권장 복합 인덱스 확인'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--only', type=str, default='', help='쉼표로 구분한 조회 이름만 점검')
+        parser.add_argument('--verbose', action='store_true', help='실행 계획·SQL 전체 출력')
+        parser.add_argument('--fail-on-full-scan', action='store_true', help='풀 스캔이 있으면 오류로 종료')
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ('mysql', 'sqlite'):
+            raise CommandError(f'EXPLAIN 미지원 DB: {connection.vendor}')
+        only = {n.strip() for n in options['only'].split(',') if n.strip()}
+        verbose = options['verbose']
+
+        self.stdout.write('[권장 인덱스]')
+        missing = []
+        for rec in check_recommended_indexes():
+            cols = ', '.join(rec['columns'])
+            if rec['covered_by']:
+                self.stdout.write(f"  OK   {rec['name']} ({cols}) ← {rec['covered_by']}")
+            else:
+                missing.append(rec)
+                self.stdout.write(self.style.WARNING(f"  없음 {rec['name']} ({cols}) — {rec['purpose']}"))
+
+        self.stdout.write('[조회 실행 계획]')
+        full_scans = 0
+        for result in analyze_queries(only or None):
+            issues = result['issues']
+            full_scans += sum(1 for i in issues if i.startswith('full scan'))
+            line = f"  {result['name']:28} {result['source']}"
+            if issues:
+                self.stdout.write(self.style.WARNING(f"{line}\n      ⚠ {'; '.join(issues)}"))
+            else:
+                self.stdout.write(f"{line}\n      ok")
+            if verbose:
+                for step in result['plan']:
+                    self.stdout.write(f"      | {step}")
+                self.stdout.write(f"      SQL: {result['sql']}")
+
+        if missing:
+            self.stdout.write(self.style.WARNING(
+                f"권장 인덱스 {len(missing)}개 없음 — python manage.py migrate public_api 로 0026 적용"
+            ))
+        if full_scans and options['fail_on_full_scan']:
+            raise CommandError(f'풀 스캔 {full_scans}건')
+        self.stdout.write(self.style.SUCCESS(f'완료: 풀 스캔 {full_scans}건'))
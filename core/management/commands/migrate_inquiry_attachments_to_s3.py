@@ -0,0 +1,115 @@
+"""
+1:1 문의 첨부 파일 로컬(MEDIA_ROOT) → S3 이전
+- Inquiry.attachment 이름을 그대로 S3 키로 복사 (DB 값 변경 없음) — INQUIRY_ATTACHMENT_STORAGE 와 무관하게 로컬 파일을 읽는다
+- 배치마다 head_many 로 이미 같은 크기로 올라간 키는 건너뛰고, 나머지를 공유 스레드 풀(S3_MAX_WORKERS)로 병렬 업로드
+- 파일은 upload_stream 으로 조각 단위 전송 (큰 파일은 멀티파트, 전체를 메모리에 올리지 않음)
+- 다시 실행해도 안전 (이미 올라간 파일은 건너뜀). 권장 순서: 이 커맨드 → INQUIRY_ATTACHMENT_STORAGE=s3 배포 → 한 번 더 실행
+
+사용법:
+  python manage.py migrate_inquiry_attachments_to_s3 --dry-run
+  python manage.py migrate_inquiry_attachments_to_s3
+  python manage.py migrate_inquiry_attachments_to_s3 --delete-local    # S3 크기 확인 후 로컬 파일 삭제
+"""
+import mimetypes
+import os
+from itertools import islice
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.inquiry.models import Inquiry
+from core.s3_storage import get_s3_storage
+from core.storages import S3StreamingStorage
+
+
+def _batched(iterable, size):
+    it = iter(iterable)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+class Command(BaseCommand):
+    help = '1:1 문의 첨부 파일을 로컬 MEDIA_ROOT 에서 S3 로 병렬 복사'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=200, help='한 번에 확인·업로드할 파일 수')
+        parser.add_argument('--dry-run', action='store_true', help='업로드하지 않고 대상만 집계')
+        parser.add_argument('--force', action='store_true', help='S3 에 같은 크기 객체가 있어도 다시 업로드')
+        parser.add_argument('--delete-local', action='store_true', help='S3 크기 확인 후 로컬 파일 삭제')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size 는 1 이상이어야 합니다.')
+        dry_run = options['dry_run']
+        media_root = str(settings.MEDIA_ROOT)
+        s3 = get_s3_storage()
+        keys = S3StreamingStorage()
+
+        def _upload(item):
+            name, path = item
+            with open(path, 'rb') as f:
+                s3.upload_stream(f, keys.key_for(name), content_type=mimetypes.guess_type(name)[0])
+            return name
+
+        names = (
+            Inquiry.objects.exclude(attachment__isnull=True)
+            .exclude(attachment='')
+            .order_by('id')
+            .values_list('attachment', flat=True)
+            .iterator(chunk_size=batch_size)
+        )
+        stats = {'rows': 0, 'missing': 0, 'skipped': 0, 'uploaded': 0, 'failed': 0, 'deleted_local': 0}
+        for batch in _batched(names, batch_size):
+            stats['rows'] += len(batch)
+            batch = list(dict.fromkeys(batch))
+            remote = s3.head_many([keys.key_for(name) for name in batch])
+            local = {}
+            for name in batch:
+                path = os.path.join(media_root, name)
+                if os.path.isfile(path):
+                    local[name] = (path, os.path.getsize(path))
+                elif remote.get(keys.key_for(name)) is not None:
+                    # 이미 S3 에만 있음 (이전 실행에서 로컬 삭제, 또는 S3 저장소로 새로 올라온 첨부)
+                    stats['skipped'] += 1
+                else:
+                    stats['missing'] += 1
+                    self.stderr.write(f'  파일 없음 {name}')
+
+            def _same_size(name):
+                info = remote.get(keys.key_for(name))
+                return info is not None and info.get('size') == local[name][1]
+
+            todo = [(name, path) for name, (path, _) in local.items() if options['force'] or not _same_size(name)]
+            stats['skipped'] += len(local) - len(todo)
+            if dry_run:
+                stats['uploaded'] += len(todo)
+                continue
+
+            for (name, _), result in zip(todo, s3.map_concurrent(_upload, todo)):
+                if isinstance(result, Exception):
+                    stats['failed'] += 1
+                    self.stderr.write(f'  실패 {name}: {result}')
+                else:
+                    stats['uploaded'] += 1
+
+            if options['delete_local']:
+                verified = s3.head_many([keys.key_for(name) for name in local])
+                for name, (path, size) in local.items():
+                    info = verified.get(keys.key_for(name))
+                    if info is not None and info.get('size') == size:
+                        os.remove(path)
+                        stats['deleted_local'] += 1
+
+        self.stdout.write(
+            f"첨부 {stats['rows']}건 / 이미 S3 {stats['skipped']} / 로컬·S3 모두 없음 {stats['missing']} / "
+            f"{'업로드 대상' if dry_run else '업로드'} {stats['uploaded']} / 실패 {stats['failed']}"
+            + (f" / 로컬 삭제 {stats['deleted_local']}" if options['delete_local'] and not dry_run else '')
+        )
+        if dry_run:
+            self.stdout.write('업로드하지 않았습니다 (--dry-run).')
+        elif stats['failed']:
+            raise CommandError(f"{stats['failed']}건 업로드 실패 — 다시 실행하면 실패분만 올린다.")
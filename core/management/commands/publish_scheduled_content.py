@@ -1,28 +1,24 @@
 """
 예약 발행 시각이 지난 아티클·비디오·세미나를 공개(즉시발행/공개 SID)로 전환한다.
-cron 등에서 1분 간격 실행을 전제로 한다.
+- 1회 실행: cron 등에서 주기 실행 (기존 방식)
+- --watch: 상주 워커. 다음 예약 시각(MIN(scheduledAt))까지 잠들었다가 도래 즉시 발행하고,
+  새로 등록·변경된 예약을 놓치지 않도록 최대 --max-sleep 초마다 다시 조회한다
+발행 후 content_published 시그널로 하위 캐시를 갱신한다 (sites.admin_api.scheduled_publish).
 
   python manage.py publish_scheduled_content
   python manage.py publish_scheduled_content --dry-run
+  python manage.py publish_scheduled_content --watch --max-sleep 15
 """
 from __future__ import annotations
 
+import signal
+import threading
+
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.db import close_old_connections
 from django.utils import timezone
 
-from sites.admin_api.articles.models import Article
-from sites.admin_api.content_publish_syscodes import STATUS_PUBLISHED, STATUS_SCHEDULED
-from sites.admin_api.video.models import Video
-
-
-def _due_filter(now):
-    return dict(
-        deletedAt__isnull=True,
-        status=STATUS_SCHEDULED,
-        scheduledAt__isnull=False,
-        scheduledAt__lte=now,
-    )
+from sites.admin_api.scheduled_publish import due_ids, next_due_at, publish_due
 
 
 class Command(BaseCommand):
@@ -37,60 +33,83 @@ class Command(BaseCommand):
             action="store_true",
             help="DB를 갱신하지 않고 대상 id만 출력합니다.",
         )
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            help="상주하며 예약 시각 도래 즉시 발행합니다.",
+        )
+        parser.add_argument(
+            "--max-sleep",
+            type=float,
+            default=15.0,
+            help="--watch: 다음 예약 재조회 최대 간격(초)",
+        )
 
     def handle(self, *args, **options):
-        dry_run: bool = options["dry_run"]
-        now = timezone.now()
-        flt = _due_filter(now)
-
-        article_qs = Article.objects.filter(**flt).order_by("scheduledAt", "id")
-        video_qs = Video.objects.filter(**flt).order_by("scheduledAt", "id")
-
-        article_ids = list(article_qs.values_list("id", flat=True))
-        video_rows = list(video_qs.values_list("id", "contentType"))
+        if options["dry_run"]:
+            self._dry_run()
+            return
+        if options["watch"]:
+            self._watch(max(1.0, options["max_sleep"]))
+            return
+        self._publish_once()
 
-        if not article_ids and not video_rows:
+    def _dry_run(self):
+        due = due_ids()
+        if not due["article"] and not due["video"]:
             self.stdout.write(self.style.SUCCESS("처리할 예약 발행 도래 건이 없습니다."))
             return
-
         self.stdout.write(
-            f"예약 도래: 아티클 {len(article_ids)}건, 비디오·세미나 {len(video_rows)}건"
-            + (" (dry-run)" if dry_run else "")
+            f"예약 도래: 아티클 {len(due['article'])}건, 비디오·세미나 {len(due['video'])}건 (dry-run)"
         )
-        if article_ids:
-            self.stdout.write(f"  article ids: {article_ids}")
-        if video_rows:
-            self.stdout.write(f"  video rows (id, contentType): {video_rows}")
-
-        if dry_run:
-            self.stdout.write(self.style.WARNING("dry-run 이므로 저장하지 않았습니다."))
-            return
-
-        video_ids = [r[0] for r in video_rows]
-        with transaction.atomic():
-            articles_to_save = list(Article.objects.filter(pk__in=article_ids))
-            for a in articles_to_save:
-                a.status = STATUS_PUBLISHED
-                a.publishedAt = a.scheduledAt or now
-                a.updatedAt = now
-            n_art = len(articles_to_save)
-            if n_art:
-                Article.objects.bulk_update(
-                    articles_to_save, ['status', 'publishedAt', 'updatedAt']
-                )
-
-            videos_to_save = list(Video.objects.filter(pk__in=video_ids))
-            for v in videos_to_save:
-                v.status = STATUS_PUBLISHED
-                v.publishedAt = v.scheduledAt or now
-                v.updatedAt = now
-            n_vid = len(videos_to_save)
-            if n_vid:
-                Video.objects.bulk_update(
-                    videos_to_save, ['status', 'publishedAt', 'updatedAt']
-                )
+        if due["article"]:
+            self.stdout.write(f"  article ids: {due['article']}")
+        if due["video"]:
+            self.stdout.write(f"  video rows (id, contentType): {due['video']}")
+        self.stdout.write(self.style.WARNING("dry-run 이므로 저장하지 않았습니다."))
+
+    def _publish_once(self):
+        published = publish_due()
+        n_art = len(published["ARTICLE"])
+        n_vid = len(published["VIDEO"]) + len(published["SEMINAR"])
+        if not n_art and not n_vid:
+            self.stdout.write(self.style.SUCCESS("처리할 예약 발행 도래 건이 없습니다."))
+            return 0
         self.stdout.write(
             self.style.SUCCESS(
                 f"완료: article {n_art}행, video {n_vid}행을 공개(SYS26209B021)로 갱신했습니다."
             )
         )
+        return n_art + n_vid
+
+    def _watch(self, max_sleep):
+        stop = threading.Event()
+
+        def _stop(signum, frame):
+            stop.set()
+
+        signal.signal(signal.SIGTERM, _stop)
+        signal.signal(signal.SIGINT, _stop)
+        self.stdout.write(f"예약 발행 워커 시작 (max_sleep={max_sleep}s)")
+
+        while not stop.is_set():
+            close_old_connections()
+            try:
+                published = publish_due()
+                if any(published.values()):
+                    self.stdout.write(
+                        f"{timezone.localtime():%Y-%m-%d %H:%M:%S} 발행: "
+                        + ", ".join(f"{k} {v}" for k, v in published.items() if v)
+                    )
+                    # 발행하는 동안 새로 도래한 건이 있을 수 있으므로 바로 다시 확인
+                    continue
+                due = next_due_at()
+            except Exception as e:
+                self.stderr.write(f"예약 발행 실패: {e}")
+                due = None
+            wait = max_sleep
+            if due is not None:
+                wait = min(max_sleep, max(0.2, (due - timezone.now()).total_seconds()))
+            stop.wait(wait)
+        close_old_connections()
+        self.stdout.write("예약 발행 워커 종료")
@@ -0,0 +1,77 @@
+"""
+배치 작업 상주 워커 — cron 으로 띄우던 관리 커맨드들을 한 프로세스에서 스케줄 실행 (core.workers)
+- 작업별 MySQL GET_LOCK 으로 여러 노드에서 띄워도 한 노드만 실행
+- 작업 목록: core.workers.DEFAULT_JOBS (settings.WORKER_JOBS 로 교체)
+
+사용법:
+  python manage.py run_workers                       # 전체 작업 상주 실행
+  python manage.py run_workers --only publish_scheduled_content,send_scheduled_admin_emails
+  python manage.py run_workers --list                # 작업·다음 실행 시각 확인
+  python manage.py run_workers --run-once refresh_content_ranking_cache
+"""
+import signal
+import time
+from datetime import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.workers import Job, WorkerRuntime, get_jobs
+
+
+class Command(BaseCommand):
+    help = '배치 관리 커맨드를 한 프로세스에서 스케줄 실행 (GET_LOCK 잠금, 작업별 계측, jitter)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--only', default='', help='실행할 작업 이름 (쉼표 구분)')
+        parser.add_argument('--exclude', default='', help='제외할 작업 이름 (쉼표 구분)')
+        parser.add_argument('--max-concurrency', type=int, default=None, help='동시에 실행할 작업 수 (기본 WORKER_MAX_CONCURRENCY)')
+        parser.add_argument('--report-interval', type=float, default=3600.0, help='작업 통계 로그 간격(초)')
+        parser.add_argument('--list', action='store_true', help='작업 목록과 다음 실행 시각만 출력')
+        parser.add_argument('--run-once', metavar='NAME', help='지정 작업을 잠금을 잡고 1회 실행 후 종료')
+
+    def handle(self, *args, **options):
+        jobs = [Job(spec) for spec in get_jobs()]
+        names = {job.name for job in jobs}
+        only = {n.strip() for n in options['only'].split(',') if n.strip()}
+        exclude = {n.strip() for n in options['exclude'].split(',') if n.strip()}
+        unknown = (only | exclude) - names
+        if unknown:
+            raise CommandError(f"알 수 없는 작업: {', '.join(sorted(unknown))}")
+        if only:
+            jobs = [job for job in jobs if job.name in only]
+        jobs = [job for job in jobs if job.name not in exclude]
+
+        if options['list']:
+            now = time.time()
+            for job in jobs:
+                when = datetime.fromtimestamp(job.first_run_at(now), tz=timezone.get_current_timezone())
+                schedule = f"every {job.every}s" if job.every else f"daily {job.daily}"
+                self.stdout.write(f"{job.name:40} {schedule:16} jitter={job.jitter:g}s next≈{when:%Y-%m-%d %H:%M:%S}")
+            return
+
+        if options['run_once']:
+            job = next((j for j in jobs if j.name == options['run_once']), None)
+            if job is None:
+                raise CommandError(f"알 수 없는 작업: {options['run_once']}")
+            job.running.set()
+            status = job.run()
+            self.stdout.write(f"{job.name}: {status} {job.metrics.as_dict()}")
+            return
+
+        if not jobs:
+            raise CommandError('실행할 작업이 없습니다.')
+
+        max_concurrency = options['max_concurrency'] or getattr(settings, 'WORKER_MAX_CONCURRENCY', 2)
+        runtime = WorkerRuntime(jobs, max_concurrency=max_concurrency)
+
+        def _stop(signum, frame):
+            self.stdout.write('종료 신호 수신 — 실행 중 작업 완료 후 종료')
+            runtime.stop()
+
+        signal.signal(signal.SIGTERM, _stop)
+        signal.signal(signal.SIGINT, _stop)
+        self.stdout.write(f"run_workers 시작: {', '.join(job.name for job in jobs)}")
+        runtime.run_forever(report_interval=max(60.0, options['report_interval']))
+        self.stdout.write('run_workers 종료')
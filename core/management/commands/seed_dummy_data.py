@@ -1,13 +1,18 @@
 """
-더미 데이터 삽입 (아티클 · 비디오 · 세미나)
+더미 데이터 삽입 (아티클 · 비디오 · 세미나 · 회원 · 활동 로그 · 댓글 · 하이라이트)
 규칙: _docsRules/backend/DummyData.me
 
 - 다시 실행하면 기존 더미 데이터는 삭제 후 지정한 개수만큼 새로 생성합니다.
 - 썸네일: §6.2 C에 따라 더미 이미지를 S3에 업로드 후 반환 URL을 thumbnail에 저장합니다.
+  (--no-thumbnail 이면 S3·네트워크 없이 thumbnail=null)
 - status/visibility: _docsRules/backend/article/articleDbPlan.me §2.3 (sysCodeSid) 기준.
+- 회원/활동 로그/댓글/하이라이트는 더미 아티클을 대상으로 생성 (benchmark_public_api 데이터셋).
+  회원 이메일은 DUMMY_MEMBER_EMAIL_DOMAIN 도메인으로 구분해 재실행 시 함께 삭제합니다.
 
 사용법:
   python manage.py seed_dummy_data --article 50
+  python manage.py seed_dummy_data --article 2000 --members 500 --activity 50000 \
+      --comments 5000 --highlights 5000 --no-thumbnail
 """
 import base64
 import random
@@ -16,11 +21,24 @@ from pathlib import Path
 from typing import Optional
 from urllib.request import urlopen
 
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
-from django.db import connection
+from django.db import connection, transaction
+from django.utils import timezone
 
+from apps.content_comments.models import ContentComment
+from apps.highlight.models import ArticleHighlight
 from sites.admin_api.articles.models import Article
 from sites.admin_api.articles.utils import upload_thumbnail_to_s3
+from sites.public_api.models import (
+    ContentRankingCache,
+    IndeUser,
+    PublicMemberShip,
+    PublicRecentView,
+    PublicUserActivityLog,
+)
+from sites.public_api.content_stats import rebuild_content_stats
+from sites.public_api.recent_views import rebuild_recent_views
 
 # sysCode 테이블 없을 때 사용할 기본 카테고리
 DEFAULT_CATEGORY_IDS = ['category_article_01']
@@ -40,6 +58,13 @@ COMMAND_DIR = Path(__file__).resolve().parent
 DUMMY_MEDIA_DIR = COMMAND_DIR / "dummy_media"
 PLACEHOLDER_IMAGE_URL = f"https://placehold.co/{THUMBNAIL_WIDTH}x{THUMBNAIL_HEIGHT}/jpeg?text=Article"
 
+# 더미 회원 식별용 이메일 도메인 (재실행 시 이 도메인 회원과 연관 데이터 삭제)
+DUMMY_MEMBER_EMAIL_DOMAIN = 'dummy.inde.kr'
+DUMMY_MEMBER_PASSWORD = 'dummy-password-1!'
+# 활동 로그 유형 비율 (VIEW 위주, userPublicActiviteLog.md)
+ACTIVITY_TYPE_WEIGHTS = (('VIEW', 70), ('BOOKMARK', 12), ('RATING', 12), ('SHARE', 6))
+BULK_BATCH_SIZE = 1000
+
 # 캐시: 한 번만 읽거나 다운로드
 _dummy_thumbnail_base64_cache = None
 
@@ -129,13 +154,83 @@ class Command(BaseCommand):
             metavar='N',
             help='삽입할 아티클 더미 개수 (0이면 아티클 미실행). 실행 시 기존 더미는 삭제 후 새로 생성.',
         )
+        parser.add_argument(
+            '--members',
+            type=int,
+            default=0,
+            metavar='N',
+            help='더미 공개 회원 수 (0이면 미실행). 활동 로그·댓글·하이라이트 작성자로 사용.',
+        )
+        parser.add_argument(
+            '--activity',
+            type=int,
+            default=0,
+            metavar='N',
+            help='더미 publicUserActivityLog 행 수 (VIEW/BOOKMARK/RATING/SHARE). 당일 HOT/SHARE 랭킹도 적재.',
+        )
+        parser.add_argument(
+            '--comments',
+            type=int,
+            default=0,
+            metavar='N',
+            help='더미 댓글 수 (약 20%는 대댓글).',
+        )
+        parser.add_argument(
+            '--highlights',
+            type=int,
+            default=0,
+            metavar='N',
+            help='더미 아티클 하이라이트 수.',
+        )
+        parser.add_argument(
+            '--no-thumbnail',
+            action='store_true',
+            help='썸네일 S3 업로드를 건너뜀 (벤치마크·오프라인 환경).',
+        )
+        parser.add_argument(
+            '--random-seed',
+            type=int,
+            default=None,
+            help='random 시드 (동일 값이면 동일 데이터셋 재현).',
+        )
 
     def handle(self, *args, **options):
+        if options.get('random_seed') is not None:
+            random.seed(options['random_seed'])
         article_count = options.get('article', 0)
         if article_count > 0:
-            self._seed_articles(article_count)
-
-    def _seed_articles(self, count: int):
+            self._seed_articles(article_count, with_thumbnail=not options.get('no_thumbnail'))
+
+        member_count = options.get('members', 0)
+        activity_count = options.get('activity', 0)
+        comment_count = options.get('comments', 0)
+        highlight_count = options.get('highlights', 0)
+        if member_count > 0:
+            self._seed_members(member_count)
+        if activity_count > 0 or comment_count > 0 or highlight_count > 0:
+            members = list(
+                PublicMemberShip.objects.filter(
+                    email__endswith=f'@{DUMMY_MEMBER_EMAIL_DOMAIN}'
+                ).order_by('member_sid')
+            )
+            article_ids = list(
+                Article.objects.filter(
+                    title__startswith='더미 아티클 제목', status=STATUS_PUBLISHED
+                ).values_list('id', flat=True)
+            )
+            if not members or not article_ids:
+                self.stdout.write(
+                    self.style.ERROR('더미 회원(--members)과 발행된 더미 아티클(--article)이 먼저 필요합니다.')
+                )
+                return
+            if activity_count > 0:
+                self._seed_activity_logs(activity_count, members, article_ids)
+            if comment_count > 0:
+                self._seed_comments(comment_count, members, article_ids)
+            if highlight_count > 0:
+                self._seed_highlights(highlight_count, members, article_ids)
+
+    def _seed_articles(self, count: int, with_thumbnail: bool = True):
         # 기존 더미 아티클 삭제 후 새로 생성
         deleted, _ = Article.objects.filter(title__startswith='더미 아티클 제목').delete()
         if deleted:
@@ -147,8 +242,8 @@ class Command(BaseCommand):
         statuses = [STATUS_PUBLISHED] * 8 + [STATUS_DRAFT] * 2
 
         # §6.2 C: S3 업로드용 더미 이미지 base64 (1회만 로드/다운로드)
-        thumbnail_base64 = get_dummy_thumbnail_base64()
-        if not thumbnail_base64:
+        thumbnail_base64 = get_dummy_thumbnail_base64() if with_thumbnail else None
+        if with_thumbnail and not thumbnail_base64:
             self.stdout.write(
                 self.style.WARNING(
                     "더미 썸네일 이미지를 찾을 수 없습니다. "
@@ -177,7 +272,6 @@ class Command(BaseCommand):
                 viewCount=random.randint(0, 500),
                 commentCount=random.randint(0, 20),
                 tags=['태그1', '태그2'] if n % 2 == 0 else [],
-                questions=['Q1?', 'Q2?'] if n % 4 == 0 else [],
             )
             created_ids.append(article.id)
 
@@ -190,7 +284,212 @@ class Command(BaseCommand):
 
         # createdAt, updatedAt 을 2026년 1~3월 랜덤으로 설정 (update()로 auto_now 우회)
         for pk in created_ids:
-            dt = random_datetime_2026_jan_mar()
+            dt = timezone.make_aware(random_datetime_2026_jan_mar())
             Article.objects.filter(pk=pk).update(createdAt=dt, updatedAt=dt)
 
         self.stdout.write(self.style.SUCCESS(f'아티클 더미 {count}건 삽입 완료 (ID: {min(created_ids)} ~ {max(created_ids)})'))
+
+    def _delete_dummy_members(self):
+        """더미 회원과 그 회원이 남긴 활동 로그·댓글·하이라이트(IndeUser CASCADE) 삭제."""
+        member_ids = list(
+            PublicMemberShip.objects.filter(
+                email__endswith=f'@{DUMMY_MEMBER_EMAIL_DOMAIN}'
+            ).values_list('member_sid', flat=True)
+        )
+        if not member_ids:
+            return
+        with transaction.atomic():
+            PublicUserActivityLog.objects.filter(user_id__in=member_ids).delete()
+            PublicRecentView.objects.filter(user_id__in=member_ids).delete()
+            # 대댓글(PROTECT parent) → 댓글 순으로 삭제
+            ContentComment.objects.filter(user_id__in=member_ids, depth=2).delete()
+            ContentComment.objects.filter(parent__user_id__in=member_ids).delete()
+            ContentComment.objects.filter(user_id__in=member_ids).delete()
+            IndeUser.objects.filter(email__endswith=f'@{DUMMY_MEMBER_EMAIL_DOMAIN}').delete()
+            PublicMemberShip.objects.filter(member_sid__in=member_ids).delete()
+        self.stdout.write(self.style.WARNING(f'기존 더미 회원 {len(member_ids)}명 및 연관 데이터 삭제됨.'))
+
+    def _seed_members(self, count: int):
+        self._delete_dummy_members()
+        # PBKDF2는 1회만 계산해 모든 더미 회원이 공유 (로그인 벤치마크용 동일 비밀번호)
+        password_hash = make_password(DUMMY_MEMBER_PASSWORD)
+        members = [
+            PublicMemberShip(
+                email=f'member{n}@{DUMMY_MEMBER_EMAIL_DOMAIN}',
+                password=password_hash,
+                name=f'더미 회원 {n}',
+                nickname=f'더미닉네임{n}',
+                phone=f'010{n:08d}'[:11],
+                joined_via='LOCAL',
+                email_verified=True,
+                is_staff=(n == 1),
+            )
+            for n in range(1, count + 1)
+        ]
+        PublicMemberShip.objects.bulk_create(members, batch_size=BULK_BATCH_SIZE)
+        self.stdout.write(self.style.SUCCESS(f'더미 회원 {count}명 삽입 완료 (비밀번호: {DUMMY_MEMBER_PASSWORD})'))
+
+    def _seed_activity_logs(self, count: int, members: list, article_ids: list):
+        PublicUserActivityLog.objects.filter(
+            user_id__in=[m.member_sid for m in members]
+        ).delete()
+        types = [t for t, w in ACTIVITY_TYPE_WEIGHTS for _ in range(w)]
+        today = timezone.localdate()
+        seen = set()
+        rows = []
+        # uniq_view (content_type, content_code, activity_type, user_id, reg_date) 충돌 회피
+        attempts = 0
+        while len(rows) < count and attempts < count * 5:
+            attempts += 1
+            activity = random.choice(types)
+            member = random.choice(members)
+            code = str(random.choice(article_ids))
+            reg_date = today - timedelta(days=random.randint(0, 29))
+            if activity in ('BOOKMARK', 'RATING'):
+                # 북마크·별점은 회원×콘텐츠당 1행
+                key = (code, activity, member.member_sid)
+            else:
+                key = (code, activity, member.member_sid, reg_date)
+            if key in seen:
+                continue
+            seen.add(key)
+            rows.append(
+                PublicUserActivityLog(
+                    content_type='ARTICLE',
+                    content_code=code,
+                    user_id=member.member_sid,
+                    activity_type=activity,
+                    rating_value=random.randint(1, 5) if activity == 'RATING' else None,
+                    view_count=random.randint(1, 5) if activity in ('VIEW', 'SHARE') else 1,
+                    reg_date=reg_date,
+                    ip_address='127.0.0.1',
+                    user_agent='seed_dummy_data',
+                )
+            )
+        PublicUserActivityLog.objects.bulk_create(rows, batch_size=BULK_BATCH_SIZE)
+        # 최근 본 프로젝션 (마이페이지 최근 본 목록)
+        rebuild_recent_views([m.member_sid for m in members])
+        rebuild_content_stats()
+
+        # 당일 HOT/SHARE 랭킹 캐시 (content_ranking_cache) — 조회·공유 합계 상위 30
+        view_score = {}
+        share_score = {}
+        for r in rows:
+            if r.activity_type == 'VIEW':
+                view_score[r.content_code] = view_score.get(r.content_code, 0) + r.view_count
+            elif r.activity_type == 'SHARE':
+                share_score[r.content_code] = share_score.get(r.content_code, 0) + r.view_count
+        ContentRankingCache.objects.filter(
+            base_date=today,
+            ranking_type__in=[ContentRankingCache.RANKING_HOT, ContentRankingCache.RANKING_SHARE],
+        ).delete()
+        ranking_rows = []
+        for ranking_type, scores in (
+            (ContentRankingCache.RANKING_HOT, view_score),
+            (ContentRankingCache.RANKING_SHARE, share_score),
+        ):
+            top = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))[:30]
+            for order, (code, score) in enumerate(top, start=1):
+                ranking_rows.append(
+                    ContentRankingCache(
+                        ranking_type=ranking_type,
+                        content_type='ARTICLE',
+                        content_code=code,
+                        score=float(score),
+                        rank_order=order,
+                        base_date=today,
+                    )
+                )
+        ContentRankingCache.objects.bulk_create(ranking_rows, batch_size=BULK_BATCH_SIZE)
+        self.stdout.write(
+            self.style.SUCCESS(f'활동 로그 더미 {len(rows)}건, 랭킹 캐시 {len(ranking_rows)}건 삽입 완료')
+        )
+
+    def _seed_comments(self, count: int, members: list, article_ids: list):
+        root_count = max(1, int(count * 0.8))
+        roots = [
+            ContentComment(
+                content_type=ContentComment.CONTENT_TYPE_ARTICLE,
+                content_id=random.choice(article_ids),
+                user=random.choice(members),
+                depth=1,
+                comment_text=f'더미 댓글 {n}',
+            )
+            for n in range(1, root_count + 1)
+        ]
+        ContentComment.objects.bulk_create(roots, batch_size=BULK_BATCH_SIZE)
+        # bulk_create가 PK를 돌려주지 않는 백엔드(MySQL) 대비 재조회
+        root_rows = list(
+            ContentComment.objects.filter(
+                user__in=members, depth=1
+            ).values_list('id', 'content_type', 'content_id')
+        )
+        replies = []
+        for n in range(1, count - root_count + 1):
+            parent_id, ct, cid = random.choice(root_rows)
+            replies.append(
+                ContentComment(
+                    content_type=ct,
+                    content_id=cid,
+                    user=random.choice(members),
+                    parent_id=parent_id,
+                    depth=2,
+                    comment_text=f'더미 대댓글 {n}',
+                )
+            )
+        ContentComment.objects.bulk_create(replies, batch_size=BULK_BATCH_SIZE)
+
+        # 루트 댓글 수를 article.commentCount에 반영 (bump_comment_count와 동일 기준)
+        per_article = {}
+        for _, ct, cid in root_rows:
+            per_article[cid] = per_article.get(cid, 0) + 1
+        for cid, n in per_article.items():
+            Article.objects.filter(pk=cid).update(commentCount=n)
+        self.stdout.write(self.style.SUCCESS(f'댓글 더미 {len(roots)}건, 대댓글 {len(replies)}건 삽입 완료'))
+
+    def _seed_highlights(self, count: int, members: list, article_ids: list):
+        # ArticleHighlight.user는 IndeUser FK — 더미 회원과 동일 email의 IndeUser를 준비
+        existing = set(
+            IndeUser.objects.filter(
+                email__endswith=f'@{DUMMY_MEMBER_EMAIL_DOMAIN}'
+            ).values_list('email', flat=True)
+        )
+        new_users = [
+            IndeUser(
+                id=f'DMU{m.member_sid:012d}',
+                email=m.email,
+                name=m.name,
+                phone=f'sync-{m.member_sid}',
+                joined_via='LOCAL',
+                profile_completed=True,
+                is_active=True,
+            )
+            for m in members
+            if m.email not in existing
+        ]
+        # IndeUser.save()는 full_clean을 호출하므로 bulk_create로 일괄 삽입
+        IndeUser.objects.bulk_create(new_users, batch_size=BULK_BATCH_SIZE)
+        users = list(IndeUser.objects.filter(email__endswith=f'@{DUMMY_MEMBER_EMAIL_DOMAIN}'))
+
+        rows = []
+        for n in range(1, count + 1):
+            start = random.randint(0, 150)
+            rows.append(
+                ArticleHighlight(
+                    article_id=random.choice(article_ids),
+                    user=random.choice(users),
+                    highlight_group_id=n,
+                    paragraph_index=random.randint(0, 1),
+                    highlight_text='더미 하이라이트',
+                    start_offset=start,
+                    end_offset=start + random.randint(5, 40),
+                    color=random.choice(['yellow', 'green', 'blue', 'pink']),
+                )
+            )
+        ArticleHighlight.objects.bulk_create(rows, batch_size=BULK_BATCH_SIZE)
+        per_article = {}
+        for r in rows:
+            per_article[r.article_id] = per_article.get(r.article_id, 0) + 1
+        for aid, n in per_article.items():
+            Article.objects.filter(pk=aid).update(highlightCount=n)
+        self.stdout.write(self.style.SUCCESS(f'하이라이트 더미 {len(rows)}건 삽입 완료'))
@@ -0,0 +1,57 @@
+"""
+S3 고아 객체 정리 (주 1회 cron 또는 run_workers 권장)
+- 검사 접두사(--prefix, 기본 article/ video/ homepage-doc/ event-banner/) 목록을 병렬로 끝까지 읽고
+  DB가 참조하는 키(core.s3_sweep.iter_referenced_keys)와 디스크 정렬 병합으로 비교
+- 참조 없는 객체를 DeleteObjects 1000건 단위로 삭제 (기본은 --dry-run 과 같은 집계만, 삭제는 --delete)
+- --min-age-hours 안에 올라온 객체는 제외 (직접 업로드 후 저장 전 등)
+
+사용법:
+  python manage.py sweep_orphaned_s3_objects                      # 집계만
+  python manage.py sweep_orphaned_s3_objects --output /tmp/orphans.txt
+  python manage.py sweep_orphaned_s3_objects --delete --prefix article/ --prefix video/
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from core.s3_sweep import DEFAULT_PREFIXES, sweep_orphans
+
+
+class Command(BaseCommand):
+    help = 'DB에서 참조하지 않는 S3 객체 탐색/삭제 (스트리밍 목록 + 디스크 정렬 병합)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--prefix', action='append', dest='prefixes', help='검사할 접두사 (여러 번 지정 가능)')
+        parser.add_argument('--min-age-hours', type=int, default=24, help='최근 수정 객체 제외 기준(시간)')
+        parser.add_argument('--chunk-size', type=int, default=200000, help='정렬 청크 크기 (메모리 상한)')
+        parser.add_argument('--output', help='고아 키 목록을 쓸 파일 경로')
+        parser.add_argument('--delete', action='store_true', help='실제로 삭제 (없으면 집계만)')
+
+    def handle(self, *args, **options):
+        prefixes = tuple(options['prefixes'] or DEFAULT_PREFIXES)
+        for prefix in prefixes:
+            if not prefix or not prefix.endswith('/'):
+                raise CommandError(f'접두사는 비어 있지 않고 / 로 끝나야 합니다: {prefix!r}')
+        dry_run = not options['delete']
+        self.stdout.write(
+            f"prefixes={', '.join(prefixes)} min_age_hours={options['min_age_hours']} dry_run={dry_run}"
+        )
+
+        out = open(options['output'], 'w', encoding='utf-8') if options['output'] else None
+        try:
+            stats = sweep_orphans(
+                prefixes=prefixes,
+                min_age_hours=options['min_age_hours'],
+                chunk_size=max(1000, options['chunk_size']),
+                dry_run=dry_run,
+                on_orphan=(lambda key: out.write(key + '\n')) if out else None,
+            )
+        finally:
+            if out:
+                out.close()
+
+        self.stdout.write(
+            f"목록 {stats['listed']}건 / 참조 {stats['referenced']}건 / 고아 {stats['orphans']}건"
+        )
+        if dry_run:
+            self.stdout.write('삭제하지 않았습니다 (--delete 로 실행 시 삭제).')
+            return
+        self.stdout.write(self.style.SUCCESS(f"삭제 {stats['deleted']}건 (실패 {stats['errors']}건)"))
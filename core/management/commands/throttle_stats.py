@@ -0,0 +1,42 @@
+"""
+요청 제한(core.throttling) 버킷별 거절 수 조회
+
+사용법:
+  python manage.py throttle_stats                  # 최근 24시간, 비율이 설정된 모든 버킷
+  python manage.py throttle_stats --hours 3 --hourly
+  python manage.py throttle_stats --bucket login.ip,login.account
+
+THROTTLE_CACHE_ALIAS 가 공유 캐시(Redis 등)일 때 서버 전체 값이 보인다 (LocMem 이면 이 프로세스 값뿐이라 항상 0).
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from core.throttling import configured_buckets, rejection_counts
+
+
+class Command(BaseCommand):
+    help = '요청 제한 버킷별 거절 수 조회'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, default=24, help='조회 시간 범위 (기본 24)')
+        parser.add_argument('--bucket', type=str, default='', help='쉼표로 구분한 버킷만 조회 (예: login.ip)')
+        parser.add_argument('--hourly', action='store_true', help='시간대별 값도 출력')
+
+    def handle(self, *args, **options):
+        hours = options['hours']
+        if hours < 1:
+            raise CommandError('--hours 는 1 이상이어야 합니다.')
+        buckets = [b.strip() for b in options['bucket'].split(',') if b.strip()] or configured_buckets()
+        counts = rejection_counts(buckets, hours)
+
+        self.stdout.write(f'[최근 {hours}시간 거절 수]')
+        total = 0
+        for bucket in buckets:
+            by_hour = counts.get(bucket, {})
+            n = sum(by_hour.values())
+            total += n
+            line = f'  {bucket:28} {n:>8}'
+            self.stdout.write(self.style.WARNING(line) if n else line)
+            if options['hourly']:
+                for slot in sorted(by_hour):
+                    self.stdout.write(f'      {slot[:8]} {slot[8:]}시  {by_hour[slot]}')
+        self.stdout.write(f'합계 {total}')
@@ -0,0 +1,230 @@
+"""
+내용 주소(SHA-256) 기반 이미지 저장소
+- store_image_bytes: 바이트 해시로 assets/{hash[:2]}/{hash}.{ext} 키를 정하고, 인덱스(media_asset)에 있으면 업로드 생략
+- sync_asset_refs: 콘텐츠 저장 시 본문이 참조하는 자산 집합으로 media_asset_ref 를 맞추고 ref_count 재계산
+- release_asset_refs: 콘텐츠 삭제 시 참조 해제
+- reconcile_asset_ref_counts: 전체 ref_count 재계산 (드리프트 보정)
+- gc_orphaned_assets: ref_count=0 이 된 지 유예 기간이 지난 자산을 DeleteObjects 로 일괄 삭제 (gc_media_assets 커맨드)
+같은 이미지를 다시 저장해도 업로드·삭제가 일어나지 않는다.
+"""
+import hashlib
+import logging
+from datetime import timedelta
+from io import BytesIO
+from typing import Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from core.models import MediaAsset, MediaAssetRef
+from core.s3_storage import get_s3_storage
+
+logger = logging.getLogger(__name__)
+
+ASSET_PREFIX = 'assets/'
+
+EXT_CONTENT_TYPE = {
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'gif': 'image/gif',
+    'webp': 'image/webp',
+}
+
+
+def media_assets_enabled() -> bool:
+    """MEDIA_ASSET_CONTENT_ADDRESSED (media_asset 테이블 생성 후 켠다)"""
+    return bool(getattr(settings, 'MEDIA_ASSET_CONTENT_ADDRESSED', False))
+
+
+def asset_key(digest: str, extension: str) -> str:
+    """assets/{hash[:2]}/{hash}.{ext}"""
+    ext = (extension or 'bin').lower().lstrip('.')
+    if ext == 'jpeg':
+        ext = 'jpg'
+    return f"{ASSET_PREFIX}{digest[:2]}/{digest}.{ext}"
+
+
+def hash_from_key(key: str) -> Optional[str]:
+    """자산 키에서 해시 추출 (자산 경로가 아니면 None)"""
+    if not key or not key.startswith(ASSET_PREFIX):
+        return None
+    name = key.rsplit('/', 1)[-1]
+    digest = name.split('.', 1)[0]
+    if len(digest) != 64:
+        return None
+    return digest
+
+
+def store_image_bytes(data: bytes, extension: str, content_type: Optional[str] = None) -> Tuple[str, str]:
+    """
+    이미지 바이트를 내용 주소 키로 저장 (이미 있으면 업로드 생략)
+
+    Args:
+        data: 이미지 바이트
+        extension: 확장자 (jpeg, png ...)
+        content_type: MIME 타입 (없으면 확장자로 추정)
+
+    Returns:
+        (S3 키, URL)
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    s3_storage = get_s3_storage()
+
+    existing = MediaAsset.objects.filter(hash=digest).values_list('key', 'ref_count').first()
+    if existing:
+        key, ref_count = existing
+        if ref_count > 0:
+            return key, s3_storage.object_url(key)
+        # 고아 자산 재사용: orphaned_at 을 갱신해 GC 유예를 다시 시작한다.
+        # GC 가 같은 행을 잠그고 삭제 중이면 이 UPDATE 가 기다렸다가 0행이 되므로 아래에서 다시 올린다.
+        touched = MediaAsset.objects.filter(hash=digest, ref_count=0).update(orphaned_at=timezone.now())
+        if touched or MediaAsset.objects.filter(hash=digest).exists():
+            return key, s3_storage.object_url(key)
+
+    if not content_type:
+        content_type = EXT_CONTENT_TYPE.get((extension or '').lower(), 'image/jpeg')
+    key = asset_key(digest, extension)
+    url = s3_storage.upload_file(
+        file_obj=BytesIO(data),
+        key=key,
+        content_type=content_type,
+        metadata={'sha256': digest},
+    )
+    try:
+        # 참조가 붙기 전까지는 고아 상태 (gc 유예 기간 안에 sync_asset_refs 가 참조를 단다)
+        MediaAsset.objects.create(
+            hash=digest,
+            key=key,
+            content_type=content_type,
+            size=len(data),
+            ref_count=0,
+            orphaned_at=timezone.now(),
+        )
+    except IntegrityError:
+        # 동시에 같은 이미지를 올린 다른 요청이 먼저 등록 — 같은 키이므로 그대로 사용
+        pass
+    return key, url
+
+
+def _recount(hashes: Iterable[str]) -> None:
+    """지정 자산의 ref_count 를 media_asset_ref 행 수로 다시 세고, 0이 된 자산에 orphaned_at 기록."""
+    hashes = list(set(hashes))
+    if not hashes:
+        return
+    MediaAsset.objects.filter(hash__in=hashes).update(ref_count=_ref_count_expression())
+    now = timezone.now()
+    MediaAsset.objects.filter(hash__in=hashes, ref_count=0, orphaned_at__isnull=True).update(orphaned_at=now)
+    MediaAsset.objects.filter(hash__in=hashes, ref_count__gt=0).exclude(orphaned_at=None).update(orphaned_at=None)
+
+
+def _ref_count_expression():
+    return Coalesce(
+        Subquery(
+            MediaAssetRef.objects.filter(asset_id=OuterRef('pk'))
+            .values('asset_id')
+            .annotate(_cnt=Count('id'))
+            .values('_cnt')[:1],
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def sync_asset_refs(owner_type: str, owner_id, keys: Iterable[str]) -> dict:
+    """
+    콘텐츠 1건이 참조하는 자산을 keys(본문·썸네일 S3 키) 기준으로 맞춘다.
+    자산 경로가 아닌 키는 무시. 인덱스에 없는 해시도 무시(외부 복사 등).
+
+    Returns:
+        {'added': n, 'removed': n}
+    """
+    if not media_assets_enabled():
+        return {'added': 0, 'removed': 0}
+    owner_id = str(owner_id)
+    wanted = {h for h in (hash_from_key(k) for k in keys) if h}
+    with transaction.atomic():
+        current = set(
+            MediaAssetRef.objects.filter(owner_type=owner_type, owner_id=owner_id).values_list('asset_id', flat=True)
+        )
+        to_add = wanted - current
+        if to_add:
+            to_add = set(MediaAsset.objects.filter(hash__in=to_add).values_list('hash', flat=True))
+        to_remove = current - wanted
+        if to_remove:
+            MediaAssetRef.objects.filter(
+                owner_type=owner_type, owner_id=owner_id, asset_id__in=to_remove
+            ).delete()
+        if to_add:
+            MediaAssetRef.objects.bulk_create(
+                [MediaAssetRef(asset_id=h, owner_type=owner_type, owner_id=owner_id) for h in to_add],
+                ignore_conflicts=True,
+            )
+        _recount(to_add | to_remove)
+    return {'added': len(to_add), 'removed': len(to_remove)}
+
+
+def release_asset_refs(owner_type: str, owner_ids: Iterable) -> int:
+    """콘텐츠 삭제 시 해당 주체들의 자산 참조를 모두 해제. 반환: 해제한 참조 수"""
+    owner_ids = [str(i) for i in owner_ids]
+    if not owner_ids or not media_assets_enabled():
+        return 0
+    with transaction.atomic():
+        refs = MediaAssetRef.objects.filter(owner_type=owner_type, owner_id__in=owner_ids)
+        hashes = set(refs.values_list('asset_id', flat=True))
+        removed, _ = refs.delete()
+        _recount(hashes)
+    return removed
+
+
+def reconcile_asset_ref_counts() -> int:
+    """전체 자산 ref_count 를 media_asset_ref 행 수로 다시 센다. 반환: UPDATE 행 수"""
+    with transaction.atomic():
+        updated = MediaAsset.objects.update(ref_count=_ref_count_expression())
+        now = timezone.now()
+        MediaAsset.objects.filter(ref_count=0, orphaned_at__isnull=True).update(orphaned_at=now)
+        MediaAsset.objects.filter(ref_count__gt=0).exclude(orphaned_at=None).update(orphaned_at=None)
+    return updated
+
+
+def gc_orphaned_assets(grace_hours: Optional[int] = None, batch_size: int = 1000, dry_run: bool = False) -> dict:
+    """
+    참조 0 상태가 grace_hours 이상 지난 자산을 S3·인덱스에서 삭제
+
+    Returns:
+        {'candidates': n, 'deleted': n, 'errors': n}
+    """
+    if grace_hours is None:
+        grace_hours = int(getattr(settings, 'MEDIA_ASSET_GC_GRACE_HOURS', 24))
+    cutoff = timezone.now() - timedelta(hours=grace_hours)
+    qs = MediaAsset.objects.filter(ref_count=0, orphaned_at__lt=cutoff).order_by('orphaned_at')
+    if dry_run:
+        return {'candidates': qs.count(), 'deleted': 0, 'errors': 0}
+
+    s3_storage = get_s3_storage()
+    candidates = deleted = errors = 0
+    last_hash = ''
+    while True:
+        # 행을 잠근 채 S3 삭제 → 행 삭제. 그 사이 store_image_bytes 의 재사용(orphaned_at 갱신)은 잠금에서 기다린다.
+        with transaction.atomic():
+            rows = list(
+                qs.filter(hash__gt=last_hash)
+                .order_by('hash')
+                .select_for_update()
+                .values_list('hash', 'key')[:batch_size]
+            )
+            if not rows:
+                break
+            last_hash = rows[-1][0]
+            candidates += len(rows)
+            result = s3_storage.delete_many(key for _h, key in rows)
+            failed_keys = {e['key'] for e in result['errors']}
+            errors += len(failed_keys)
+            done = [h for h, key in rows if key not in failed_keys]
+            deleted += MediaAsset.objects.filter(hash__in=done).delete()[0]
+    if errors:
+        logger.warning(f"미디어 자산 GC: S3 삭제 실패 {errors}건")
+    return {'candidates': candidates, 'deleted': deleted, 'errors': errors}
@@ -1,10 +1,12 @@
 """
 공통 모델 정의
 - Account: 확장된 사용자 모델 (UUID, 전화번호, 생년월일, 이메일 인증 등)
-- AuditLog: 사용자 활동 자동 로깅
+- AuditLog: 사용자 활동 자동 로깅 (기록은 core.audit.record_audit — 비동기 배치)
+- MediaAsset / MediaAssetRef: 내용 주소(해시) 기반 이미지 저장소 인덱스 (core.media_assets)
 """
 import uuid
 from django.db import models
+from django.utils import timezone
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 
 
@@ -93,7 +95,8 @@ class AuditLog(models.Model):
     ip_address = models.GenericIPAddressField(blank=True, null=True, verbose_name='IP 주소')
     user_agent = models.TextField(blank=True, verbose_name='User Agent')
     details = models.JSONField(blank=True, null=True, verbose_name='상세 정보')
-    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
+    # auto_now_add 대신 default: core.audit 비동기 bulk_create 시에도 큐에 넣은 시각이 저장되도록
+    created_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name='생성일시')
     
     class Meta:
         db_table = 'audit_log'
@@ -176,3 +179,54 @@ class SysCodeManager(models.Model):
         return f"{self.sysCodeSid} - {self.sysCodeName}"
 
 
+class MediaAsset(models.Model):
+    """
+    내용 주소 기반 이미지 자산 (S3 키: assets/{hash[:2]}/{hash}.{ext})
+    - 같은 바이트는 한 번만 업로드 (hash로 존재 확인)
+    - ref_count: MediaAssetRef 행 수. 0이 되면 orphaned_at 기록 → gc_media_assets 가 유예 후 삭제
+    테이블 생성: core/MEDIA_ASSET_CREATE_TABLE.sql
+    """
+    hash = models.CharField(max_length=64, primary_key=True, verbose_name='SHA-256')
+    key = models.CharField(max_length=255, unique=True, verbose_name='S3 키')
+    content_type = models.CharField(max_length=100, blank=True, verbose_name='Content-Type')
+    size = models.BigIntegerField(default=0, verbose_name='크기(bytes)')
+    ref_count = models.PositiveIntegerField(default=0, verbose_name='참조 수')
+    orphaned_at = models.DateTimeField(null=True, blank=True, verbose_name='참조 0이 된 시각')
+    created_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name='생성일시')
+
+    class Meta:
+        db_table = 'media_asset'
+        verbose_name = '미디어 자산'
+        verbose_name_plural = '미디어 자산'
+        indexes = [
+            models.Index(fields=['ref_count', 'orphaned_at'], name='idx_media_asset_gc'),
+        ]
+
+    def __str__(self):
+        return self.key
+
+
+class MediaAssetRef(models.Model):
+    """
+    자산 참조 (콘텐츠 1건이 자산 1개를 쓰면 1행)
+    owner_type: article / homepage_doc 등, owner_id: 아티클 ID·doc_type 등 문자열
+    """
+    id = models.BigAutoField(primary_key=True)
+    asset = models.ForeignKey(
+        MediaAsset,
+        on_delete=models.CASCADE,
+        db_column='asset_hash',
+        related_name='refs',
+        verbose_name='자산',
+    )
+    owner_type = models.CharField(max_length=32, verbose_name='참조 주체 종류')
+    owner_id = models.CharField(max_length=64, verbose_name='참조 주체 ID')
+    created_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name='생성일시')
+
+    class Meta:
+        db_table = 'media_asset_ref'
+        verbose_name = '미디어 자산 참조'
+        verbose_name_plural = '미디어 자산 참조'
+        constraints = [
+            models.UniqueConstraint(fields=['owner_type', 'owner_id', 'asset'], name='uq_media_asset_ref_owner'),
+        ]
@@ -0,0 +1,231 @@
+"""
+관리자 목록 페이지네이션 — 페이지 이동마다 전체 COUNT(*)를 다시 하지 않도록
+
+- cached_count: 정렬을 뺀 쿼리 SQL(= 정규화된 필터 시그니처) 기준으로 total을 LIST_COUNT_CACHE_TTL초 캐시.
+  모델 save/delete 시 모델별 버전을 올려 무효화 (queryset.update 등 시그널 없는 변경은 invalidate_list_counts 호출, 없으면 TTL 내 지연)
+- 필터 없는 대형 테이블(MySQL)은 information_schema.TABLES.TABLE_ROWS 추정치 사용
+  (LIST_COUNT_ESTIMATE_MIN 행 이상일 때만, 응답에 totalEstimated=True)
+- keyset: 정렬 컬럼 + id 기준 cursor로 다음 페이지 (total 없음, nextCursor 반환)
+- FastCountPaginator (django Paginator 대체) / FastCountPageNumberPagination (DRF ViewSet용)
+"""
+import base64
+import hashlib
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.db.models.query import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+_watched_models = set()
+
+
+def _count_ttl():
+    return int(getattr(settings, 'LIST_COUNT_CACHE_TTL', 30))
+
+
+def _version_key(model):
+    return f'list_count_ver:{model._meta.label_lower}'
+
+
+def _bump_version(sender, **kwargs):
+    key = _version_key(sender)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 2, None)
+
+
+def invalidate_list_counts(model):
+    """시그널 없는 대량 변경(queryset.update·bulk_update) 후 호출해 count 캐시를 바로 무효화."""
+    _bump_version(model)
+
+
+def _watch(model):
+    """모델 save/delete 시 count 캐시 버전 증가 (모델당 1회 연결)."""
+    if model in _watched_models:
+        return
+    uid = f'list_count_ver:{model._meta.label_lower}'
+    post_save.connect(_bump_version, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(_bump_version, sender=model, weak=False, dispatch_uid=uid)
+    _watched_models.add(model)
+
+
+def _estimated_total(queryset):
+    """WHERE 없는 단일 테이블 조회면 TABLE_ROWS 추정치 (임계값 미만·비 MySQL이면 None)."""
+    query = queryset.query
+    if query.where or query.distinct or query.combinator or query.group_by is not None:
+        return None
+    connection = connections[queryset.db]
+    if connection.vendor != 'mysql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s',
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    if not row or row[0] is None:
+        return None
+    rows = int(row[0])
+    if rows < int(getattr(settings, 'LIST_COUNT_ESTIMATE_MIN', 100000)):
+        return None
+    return rows
+
+
+def cached_count(queryset):
+    """
+    queryset.count()를 필터 시그니처별로 캐시한다.
+    반환: (total, estimated)
+    """
+    if queryset.query.is_empty():
+        return 0, False
+    qs = queryset.order_by()
+    estimated = _estimated_total(qs)
+    if estimated is not None:
+        return estimated, True
+
+    model = qs.model
+    _watch(model)
+    version = cache.get_or_set(_version_key(model), 1, None)
+    try:
+        sql, params = qs.query.sql_with_params()
+    except EmptyResultSet:
+        # filter(id__in=[]) 등 — is_empty()로 안 잡히지만 SQL 컴파일 단계에서 빈 결과로 확정
+        return 0, False
+    digest = hashlib.sha1(f'{qs.db}|{sql}|{params!r}'.encode('utf-8')).hexdigest()
+    key = f'list_count:{model._meta.label_lower}:{version}:{digest}'
+    total = cache.get(key)
+    if total is None:
+        total = qs.count()
+        cache.set(key, total, _count_ttl())
+    return total, False
+
+
+class FastCountPaginator(Paginator):
+    """count만 cached_count로 바꾼 Paginator (estimated: 추정치 사용 여부)."""
+
+    estimated = False
+
+    @cached_property
+    def count(self):
+        if isinstance(self.object_list, QuerySet):
+            total, self.estimated = cached_count(self.object_list)
+            return total
+        return super().count
+
+
+class FastCountPageNumberPagination(PageNumberPagination):
+    """DRF PageNumberPagination + FastCountPaginator (응답 형태 동일)."""
+
+    django_paginator_class = FastCountPaginator
+
+
+def _encode_cursor(value, pk):
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    elif isinstance(value, Decimal):
+        value = str(value)
+    raw = json.dumps([value, pk], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def _decode_cursor(cursor, model_field, pk_field):
+    padded = cursor + '=' * (-len(cursor) % 4)
+    value, pk = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    return model_field.to_python(value), pk_field.to_python(pk)
+
+
+def supports_keyset(model, field_name):
+    """NULL 허용 컬럼은 (값, id) 비교가 깨지므로 keyset 불가."""
+    try:
+        field = model._meta.get_field(field_name)
+    except Exception:
+        return False
+    return getattr(field, 'concrete', False) and not field.null
+
+
+def keyset_page(queryset, field_name, descending, cursor, page_size):
+    """
+    (field_name, pk) 순으로 정렬된 queryset의 cursor 다음 page_size건.
+    반환: (rows, next_cursor | None). cursor가 잘못되면 ValueError.
+    """
+    model = queryset.model
+    pk_name = model._meta.pk.name
+    if cursor:
+        try:
+            value, last_pk = _decode_cursor(cursor, model._meta.get_field(field_name), model._meta.pk)
+        except Exception as exc:
+            raise ValueError('cursor 형식이 올바르지 않습니다.') from exc
+        op = 'lt' if descending else 'gt'
+        queryset = queryset.filter(
+            Q(**{f'{field_name}__{op}': value}) | Q(**{field_name: value, f'{pk_name}__{op}': last_pk})
+        )
+    rows = list(queryset[: page_size + 1])
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    last = rows[-1]
+    return rows, _encode_cursor(getattr(last, field_name), last.pk)
+
+
+def paginate_list(queryset, page, page_size, *, cursor=None, sort_field=None, descending=True, with_total=True):
+    """
+    관리자 목록 공통 페이지네이션.
+    - cursor 지정 + sort_field keyset 가능: keyset (total 없음)
+    - with_total=False: page_size+1건 조회로 hasNext만 판단 (COUNT 없음)
+    - 그 외: FastCountPaginator (캐시·추정 total)
+    반환: (rows, meta) — meta: page, total, totalEstimated, hasNext, nextCursor
+    """
+    if cursor and sort_field and supports_keyset(queryset.model, sort_field):
+        try:
+            rows, next_cursor = keyset_page(queryset, sort_field, descending, cursor, page_size)
+        except ValueError:
+            # 손상된 cursor → 첫 페이지
+            rows, next_cursor = keyset_page(queryset, sort_field, descending, None, page_size)
+        return rows, {
+            'page': None,
+            'total': None,
+            'totalEstimated': False,
+            'hasNext': next_cursor is not None,
+            'nextCursor': next_cursor,
+        }
+
+    if not with_total:
+        page = max(1, page)
+        start = (page - 1) * page_size
+        rows = list(queryset[start : start + page_size + 1])
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        next_cursor = None
+        if has_next and rows and sort_field and supports_keyset(queryset.model, sort_field):
+            next_cursor = _encode_cursor(getattr(rows[-1], sort_field), rows[-1].pk)
+        return rows, {
+            'page': page,
+            'total': None,
+            'totalEstimated': False,
+            'hasNext': has_next,
+            'nextCursor': next_cursor,
+        }
+
+    paginator = FastCountPaginator(queryset, page_size)
+    page_obj = paginator.get_page(page)
+    rows = list(page_obj.object_list)
+    next_cursor = None
+    if page_obj.has_next() and rows and sort_field and supports_keyset(queryset.model, sort_field):
+        next_cursor = _encode_cursor(getattr(rows[-1], sort_field), rows[-1].pk)
+    return rows, {
+        'page': page_obj.number,
+        'total': paginator.count,
+        'totalEstimated': paginator.estimated,
+        'hasNext': page_obj.has_next(),
+        'nextCursor': next_cursor,
+    }
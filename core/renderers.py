@@ -1,15 +1,42 @@
 """
 IndeJSONRenderer
 모든 API 응답을 IndeAPIResponse 형식으로 자동 변환
+
+- JSON 인코딩: 사이트별로 orjson(FAST_JSON_RENDERER_SITES) 또는 DRF 기본(stdlib json)
+  orjson 이 설치되지 않았거나 orjson 이 처리하지 못하는 값이면 stdlib 경로로 렌더링
+- 이미 IndeAPIResponse 로 감싼 응답(create_success_response 등)은 그대로 인코딩 (dict 재구성 없음)
 """
-from rest_framework.renderers import JSONRenderer
+from django.conf import settings
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
+
+JSON_BACKEND_STDLIB = 'json'
+JSON_BACKEND_ORJSON = 'orjson'
+
+# datetime·date·UUID 는 orjson 이 직접 처리 (UTC 는 DRF 와 같이 'Z'), dict 의 int 키 허용 (json.dumps 와 동일)
+_ORJSON_OPTIONS = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+# Decimal·lazy 문자열·QuerySet·timedelta 등은 DRF 인코더 규칙 그대로
+_drf_default = JSONEncoder().default
+
+
+def _fast_json_sites():
+    return set(getattr(settings, 'FAST_JSON_RENDERER_SITES', ()) or ())
+
+
+def orjson_available():
+    return orjson is not None
 
 
 class IndeJSONRenderer(JSONRenderer):
     """
     Inde API 응답 형식으로 자동 변환하는 렌더러
-    
+
     응답 형식:
     {
         "IndeAPIResponse": {
@@ -19,69 +46,97 @@ class IndeJSONRenderer(JSONRenderer):
         }
     }
     """
-    
+
+    # None 이면 요청 사이트(request.site_meta['slug'])로 결정. 벤치마크 등에서 'json' / 'orjson' 고정 가능
+    json_backend = None
+
     def render(self, data, accepted_media_type=None, renderer_context=None):
         """
         응답 데이터를 IndeAPIResponse 형식으로 변환
-        
+
         Args:
             data: 원본 응답 데이터
             accepted_media_type: 미디어 타입
             renderer_context: 렌더러 컨텍스트 (status_code 포함)
-        
+
         Returns:
             bytes: JSON 인코딩된 응답
         """
         response = renderer_context.get('response') if renderer_context else None
         status_code = response.status_code if response else status.HTTP_200_OK
-        
-        # 이미 최종 래핑 형식이면 그대로 반환 (newsLetterModelPlan.md §2-4 b2n2027ApiResponse)
-        if isinstance(data, dict) and (
-            'IndeAPIResponse' in data or 'b2n2027ApiResponse' in data
+        return self._encode(wrap_inde_response(data, status_code), accepted_media_type, renderer_context)
+
+    def get_json_backend(self, renderer_context=None):
+        if self.json_backend:
+            return self.json_backend
+        request = (renderer_context or {}).get('request')
+        site_meta = getattr(request, 'site_meta', None) if request is not None else None
+        slug = site_meta.get('slug') if site_meta else None
+        return JSON_BACKEND_ORJSON if slug in _fast_json_sites() else JSON_BACKEND_STDLIB
+
+    def _encode(self, data, accepted_media_type=None, renderer_context=None):
+        renderer_context = renderer_context or {}
+        if (
+            orjson is not None
+            and self.get_json_backend(renderer_context) == JSON_BACKEND_ORJSON
+            # 들여쓰기 요청(?indent 등)은 드문 디버깅 경로이므로 stdlib 로
+            and not self.get_indent(accepted_media_type or '', renderer_context)
         ):
-            return super().render(data, accepted_media_type, renderer_context)
-        
-        # 상태 코드에 따라 ErrorCode와 Message 결정
-        if 200 <= status_code < 300:
-            error_code = '00'
-            message = '정상적으로 처리되었습니다.'
-        elif 400 <= status_code < 500:
-            error_code = '40'
-            message = '요청이 올바르지 않습니다.'
-            # 오류 메시지가 있으면 사용
-            if isinstance(data, dict) and 'error' in data:
-                message = data.get('error', message)
-            elif isinstance(data, dict) and 'detail' in data:
-                message = data.get('detail', message)
-        else:
-            error_code = '50'
-            message = '서버 오류가 발생했습니다.'
-            # 오류 메시지가 있으면 사용
-            if isinstance(data, dict) and 'error' in data:
-                message = data.get('error', message)
-            elif isinstance(data, dict) and 'detail' in data:
-                message = data.get('detail', message)
-        
-        # IndeAPIResponse 형식으로 변환
-        formatted_data = {
-            "IndeAPIResponse": {
-                "ErrorCode": error_code,
-                "Message": message,
-            }
-        }
-        
-        # 데이터가 있으면 Result에 포함
-        if data is not None:
-            # 오류 응답인 경우 error 필드 제거
-            if isinstance(data, dict):
-                result_data = {k: v for k, v in data.items() if k not in ['error', 'detail']}
-                if result_data:
-                    formatted_data["IndeAPIResponse"]["Result"] = result_data
-            else:
-                formatted_data["IndeAPIResponse"]["Result"] = data
-        
-        return super().render(formatted_data, accepted_media_type, renderer_context)
+            try:
+                return orjson.dumps(data, default=_drf_default, option=_ORJSON_OPTIONS)
+            except TypeError:
+                # 64비트 초과 정수·str 이 아닌 키 조합 등 — stdlib 경로로 (결과 동일)
+                pass
+        return super().render(data, accepted_media_type, renderer_context)
 
 
+def wrap_inde_response(data, status_code=status.HTTP_200_OK):
+    """
+    응답 데이터를 IndeAPIResponse 봉투로 감싼다.
+    이미 최종 래핑 형식이면 그대로 반환 (newsLetterModelPlan.md §2-4 b2n2027ApiResponse)
+    """
+    if isinstance(data, dict) and (
+        'IndeAPIResponse' in data or 'b2n2027ApiResponse' in data
+    ):
+        return data
+
+    # 상태 코드에 따라 ErrorCode와 Message 결정
+    if 200 <= status_code < 300:
+        error_code = '00'
+        message = '정상적으로 처리되었습니다.'
+    elif 400 <= status_code < 500:
+        error_code = '40'
+        message = '요청이 올바르지 않습니다.'
+        # 오류 메시지가 있으면 사용
+        if isinstance(data, dict) and 'error' in data:
+            message = data.get('error', message)
+        elif isinstance(data, dict) and 'detail' in data:
+            message = data.get('detail', message)
+    else:
+        error_code = '50'
+        message = '서버 오류가 발생했습니다.'
+        # 오류 메시지가 있으면 사용
+        if isinstance(data, dict) and 'error' in data:
+            message = data.get('error', message)
+        elif isinstance(data, dict) and 'detail' in data:
+            message = data.get('detail', message)
 
+    # IndeAPIResponse 형식으로 변환
+    envelope = {
+        "ErrorCode": error_code,
+        "Message": message,
+    }
+
+    # 데이터가 있으면 Result에 포함
+    if data is not None:
+        if isinstance(data, dict):
+            # 오류 응답인 경우 error 필드 제거 (없으면 원본 dict 그대로 — 복사하지 않음)
+            result_data = data
+            if 'error' in data or 'detail' in data:
+                result_data = {k: v for k, v in data.items() if k not in ('error', 'detail')}
+            if result_data:
+                envelope["Result"] = result_data
+        else:
+            envelope["Result"] = data
 
+    return {"IndeAPIResponse": envelope}
@@ -3,15 +3,57 @@ AWS S3 파일 저장소 유틸리티
 등록, 수정, 삭제, 보기 기능 제공
 """
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from django.conf import settings
-from typing import Optional, BinaryIO
+from typing import Callable, Iterable, Iterator, Optional, BinaryIO
 from urllib.parse import urlparse
 import logging
 
+from core.instrumentation import record_s3_presign
+
 logger = logging.getLogger(__name__)
 
+# DeleteObjects 1회 최대 키 수 (S3 제한)
+DELETE_BATCH_MAX = 1000
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _max_workers() -> int:
+    try:
+        return max(1, int(getattr(settings, 'S3_MAX_WORKERS', 8)))
+    except Exception:
+        return 8
+
+
+def _transfer_config():
+    """
+    upload_fileobj 관리 전송 설정 — S3_MULTIPART_THRESHOLD_MB 이상이면 멀티파트,
+    파일을 S3_MULTIPART_CHUNK_MB 단위로 읽어 올리므로 메모리는 (조각 크기 × 동시 전송 수)로 제한된다.
+    """
+    from boto3.s3.transfer import TransferConfig
+
+    mb = 1024 * 1024
+    return TransferConfig(
+        multipart_threshold=max(5, int(getattr(settings, 'S3_MULTIPART_THRESHOLD_MB', 8))) * mb,
+        multipart_chunksize=max(5, int(getattr(settings, 'S3_MULTIPART_CHUNK_MB', 8))) * mb,
+        max_concurrency=min(4, _max_workers()),
+    )
+
+
+def get_s3_executor() -> ThreadPoolExecutor:
+    """S3 병렬 작업용 공유 스레드 풀 (S3_MAX_WORKERS 개로 제한)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=_max_workers(), thread_name_prefix='s3')
+    return _executor
+
 
 class S3Storage:
     """AWS S3 파일 저장소 클래스"""
@@ -57,7 +99,9 @@ class S3Storage:
             signature_version='s3v4',
             # Presigned URL을 regional endpoint + path style로 고정해
             # 글로벌 endpoint 리다이렉트로 인한 서명 불일치를 방지한다.
-            s3={'addressing_style': 'path'}
+            s3={'addressing_style': 'path'},
+            # 병렬 업로드/조회 시 커넥션 풀이 스레드 수보다 작으면 대기가 생긴다
+            max_pool_connections=max(10, _max_workers()),
         )
         
         # 명시적으로 Regional Endpoint URL 설정
@@ -128,6 +172,10 @@ class S3Storage:
         # 기본 S3 URL
         return f"https://{self.bucket_name}.s3.{self.aws_region}.amazonaws.com/{key}"
     
+    def object_url(self, key: str) -> str:
+        """본문·DB에 저장하는 S3 객체 URL (upload_file 반환값과 같은 형식)"""
+        return self._get_s3_url(key)
+    
     def upload_file(
         self,
         file_obj: BinaryIO,
@@ -212,6 +260,25 @@ class S3Storage:
             logger.error(traceback.format_exc())
             raise Exception(f"파일 업로드 실패 (버킷: {self.bucket_name}, 키: {key}): {error_code} - {error_message}")
     
+    def upload_stream(self, file_obj: BinaryIO, key: str, content_type: Optional[str] = None) -> None:
+        """
+        파일 객체를 조각 단위로 읽어 업로드 (큰 파일은 멀티파트, 전체를 메모리에 올리지 않음)
+
+        Args:
+            file_obj: 읽기 가능한 바이너리 파일 객체 (임시 파일·로컬 파일 등)
+            key: S3 키
+            content_type: MIME 타입
+        """
+        if hasattr(file_obj, 'seek'):
+            file_obj.seek(0)
+        self.s3_client.upload_fileobj(
+            file_obj,
+            self.bucket_name,
+            key,
+            ExtraArgs={'ContentType': content_type} if content_type else None,
+            Config=_transfer_config(),
+        )
+
     def upload_file_from_path(
         self,
         file_path: str,
@@ -258,7 +325,13 @@ class S3Storage:
             logger.error(f"S3 다운로드 실패: {e}")
             return False
     
-    def get_file_url(self, key: str, expires_in: int = 3600, force_presigned: bool = False) -> str:
+    def get_file_url(
+        self,
+        key: str,
+        expires_in: int = 3600,
+        force_presigned: bool = False,
+        response_params: Optional[dict] = None,
+    ) -> str:
         """
         파일 URL 가져오기 (Presigned URL 또는 공개 URL)
         
@@ -266,16 +339,19 @@ class S3Storage:
             key: S3 파일 경로/이름
             expires_in: Presigned URL 만료 시간 (초, 기본 1시간)
             force_presigned: True인 경우 항상 Presigned URL 생성 (기본: False)
+            response_params: 응답 헤더 재정의 (예: {'ResponseContentDisposition': 'attachment; ...'})
         
         Returns:
             파일 URL
         """
+        record_s3_presign()
+        params = {'Bucket': self.bucket_name, 'Key': key, **(response_params or {})}
         try:
             # force_presigned가 True인 경우 항상 Presigned URL 생성
             if force_presigned:
                 url = self.s3_client.generate_presigned_url(
                     'get_object',
-                    Params={'Bucket': self.bucket_name, 'Key': key},
+                    Params=params,
                     ExpiresIn=expires_in
                 )
                 return url
@@ -284,7 +360,7 @@ class S3Storage:
             # (버킷이 비공개로 설정되어 있을 수 있으므로)
             url = self.s3_client.generate_presigned_url(
                 'get_object',
-                Params={'Bucket': self.bucket_name, 'Key': key},
+                Params=params,
                 ExpiresIn=expires_in
             )
             return url
@@ -294,6 +370,49 @@ class S3Storage:
             logger.error(traceback.format_exc())
             raise
     
+    def generate_presigned_post(
+        self,
+        key: str,
+        content_type: str,
+        max_bytes: int,
+        expires_in: int = 600
+    ) -> dict:
+        """
+        브라우저 직접 업로드용 Presigned POST 폼 생성 (Content-Type 고정, 크기 상한은 S3가 검증)
+        
+        Args:
+            key: 업로드될 S3 키
+            content_type: 허용할 MIME 타입
+            max_bytes: 최대 업로드 크기 (bytes)
+            expires_in: 만료 시간 (초)
+        
+        Returns:
+            {'url': 폼 action URL, 'fields': 폼에 함께 보낼 필드 dict}
+        """
+        record_s3_presign()
+        return self.s3_client.generate_presigned_post(
+            Bucket=self.bucket_name,
+            Key=key,
+            Fields={'Content-Type': content_type},
+            Conditions=[
+                {'Content-Type': content_type},
+                ['content-length-range', 1, max_bytes],
+            ],
+            ExpiresIn=expires_in
+        )
+    
+    def generate_presigned_put(self, key: str, content_type: str, expires_in: int = 600) -> str:
+        """
+        브라우저 직접 업로드용 Presigned PUT URL 생성 (요청 Content-Type이 서명 값과 같아야 함)
+        크기 상한은 서명으로 강제되지 않으므로 업로드 후 head_many로 확인한다.
+        """
+        record_s3_presign()
+        return self.s3_client.generate_presigned_url(
+            'put_object',
+            Params={'Bucket': self.bucket_name, 'Key': key, 'ContentType': content_type},
+            ExpiresIn=expires_in
+        )
+    
     def delete_file(self, key: str) -> bool:
         """
         S3에서 파일 삭제
@@ -311,6 +430,24 @@ class S3Storage:
             logger.error(f"S3 삭제 실패: {e}")
             return False
     
+    def copy_file(self, source_key: str, dest_key: str) -> bool:
+        """
+        같은 버킷 안에서 객체 복사 (서버 측 copy_object — 내려받지 않음, 5GB 이하)
+        
+        Returns:
+            성공 여부 (bool)
+        """
+        try:
+            self.s3_client.copy_object(
+                Bucket=self.bucket_name,
+                Key=dest_key,
+                CopySource={'Bucket': self.bucket_name, 'Key': source_key},
+            )
+            return True
+        except ClientError as e:
+            logger.error(f"S3 복사 실패: {source_key} → {dest_key} - {e}")
+            return False
+    
     def file_exists(self, key: str) -> bool:
         """
         파일 존재 여부 확인
@@ -349,29 +486,155 @@ class S3Storage:
         except ClientError:
             return None
     
+    def iter_objects(self, prefix: str = '', page_size: int = 1000) -> Iterator[dict]:
+        """
+        접두사 아래 객체를 페이지 단위(list_objects_v2 ContinuationToken)로 끝까지 순회
+
+        Args:
+            prefix: 파일 경로 접두사
+            page_size: 요청 1회당 키 수 (최대 1000)
+
+        Yields:
+            list_objects_v2 Contents 항목 (Key, Size, LastModified, ETag ...)
+        """
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=prefix,
+            PaginationConfig={'PageSize': min(max(1, page_size), 1000)},
+        )
+        for page in pages:
+            for obj in page.get('Contents', ()):
+                yield obj
+
+    def iter_keys(self, prefix: str = '', page_size: int = 1000) -> Iterator[str]:
+        """접두사 아래 파일 키를 끝까지 순회 (iter_objects의 Key만)"""
+        for obj in self.iter_objects(prefix=prefix, page_size=page_size):
+            yield obj['Key']
+
     def list_files(self, prefix: str = '', max_keys: int = 1000) -> list:
         """
         특정 경로의 파일 목록 가져오기
         
         Args:
             prefix: 파일 경로 접두사 (예: 'images/')
-            max_keys: 최대 반환 개수
+            max_keys: 최대 반환 개수 (1000 초과 시 여러 페이지를 이어서 조회, None이면 전체)
         
         Returns:
             파일 키 목록 (list)
         """
         try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix,
-                MaxKeys=max_keys
-            )
-            if 'Contents' in response:
-                return [obj['Key'] for obj in response['Contents']]
-            return []
+            keys = []
+            page_size = 1000 if max_keys is None else min(max_keys, 1000)
+            for key in self.iter_keys(prefix=prefix, page_size=page_size):
+                keys.append(key)
+                if max_keys is not None and len(keys) >= max_keys:
+                    break
+            return keys
         except ClientError as e:
             logger.error(f"파일 목록 조회 실패: {e}")
             return []
+
+    def delete_many(self, keys: Iterable[str]) -> dict:
+        """
+        여러 파일을 DeleteObjects로 일괄 삭제 (1000개 단위 요청)
+
+        Args:
+            keys: 삭제할 S3 키 목록 (중복·빈 값은 제외)
+
+        Returns:
+            {'deleted': 삭제 요청 성공 키 수, 'errors': [{'key', 'code', 'message'}, ...]}
+        """
+        deleted = 0
+        errors = []
+        seen = set()
+        chunk = []
+
+        def _flush():
+            nonlocal deleted
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': k} for k in chunk], 'Quiet': True},
+                )
+            except ClientError as e:
+                logger.error(f"S3 일괄 삭제 실패 ({len(chunk)}건): {e}")
+                errors.extend({'key': k, 'code': 'ClientError', 'message': str(e)} for k in chunk)
+                return
+            failed = response.get('Errors', [])
+            for err in failed:
+                errors.append({'key': err.get('Key'), 'code': err.get('Code'), 'message': err.get('Message')})
+            deleted += len(chunk) - len(failed)
+
+        for key in keys:
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            chunk.append(key)
+            if len(chunk) >= DELETE_BATCH_MAX:
+                _flush()
+                # 중복 제거는 요청 단위로만 (대량 스트림에서도 메모리 일정)
+                chunk = []
+                seen = set()
+        if chunk:
+            _flush()
+        if errors:
+            logger.warning(f"S3 일괄 삭제 중 {len(errors)}건 실패 (예: {errors[0]})")
+        return {'deleted': deleted, 'errors': errors}
+
+    def delete_prefix(self, prefix: str) -> dict:
+        """접두사 아래 모든 파일 삭제 (페이지 순회 + DeleteObjects). 빈 접두사는 거부."""
+        if not prefix:
+            raise ValueError("빈 접두사로는 삭제할 수 없습니다.")
+        return self.delete_many(self.iter_keys(prefix=prefix))
+
+    def map_concurrent(self, func: Callable, items: Iterable) -> list:
+        """
+        공유 스레드 풀(S3_MAX_WORKERS)로 func(item)을 병렬 실행, 입력 순서대로 결과 반환.
+        개별 실패는 예외 객체를 결과 자리에 담아 돌려준다 (나머지 작업은 계속).
+        """
+        items = list(items)
+        if len(items) <= 1:
+            results = []
+            for item in items:
+                try:
+                    results.append(func(item))
+                except Exception as e:
+                    results.append(e)
+            return results
+        futures = [get_s3_executor().submit(func, item) for item in items]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def upload_many(self, uploads: Iterable[dict]) -> list:
+        """
+        여러 파일 병렬 업로드
+
+        Args:
+            uploads: upload_file 인자 dict 목록 (file_obj, key, content_type, metadata)
+
+        Returns:
+            입력 순서대로 업로드 URL 또는 실패 시 None
+        """
+        def _upload(kwargs):
+            try:
+                return self.upload_file(**kwargs)
+            except Exception as e:
+                logger.error(f"병렬 업로드 실패: {kwargs.get('key')} - {e}")
+                return None
+
+        return self.map_concurrent(_upload, uploads)
+
+    def head_many(self, keys: Iterable[str]) -> dict:
+        """여러 파일 head_object 병렬 조회 → {key: get_file_info 결과 또는 None}"""
+        keys = list(dict.fromkeys(k for k in keys if k))
+        results = self.map_concurrent(self.get_file_info, keys)
+        return {key: (None if isinstance(info, Exception) else info) for key, info in zip(keys, results)}
     
     @staticmethod
     def extract_key_from_url(url: str) -> Optional[str]:
@@ -0,0 +1,231 @@
+"""
+S3 고아 객체 정리 (sweep_orphaned_s3_objects 커맨드)
+- 버킷 목록: 접두사별 병렬 페이지 순회 → 정렬 청크 파일로 기록 (최근 수정 객체는 제외)
+- 참조 키: article 본문·썸네일, video 본문·썸네일·출연자 프로필·첨부, homepage_doc 본문, 이벤트 배너·링크,
+  저자 프로필, 공지·FAQ 본문(공용 업로드 folder 는 자유라 article/ 등에 올라갈 수 있음), media_asset
+  DB 행을 iterator()로 흘려 정렬 청크 파일로 기록
+  새 URL·본문 컬럼을 추가하면 iter_referenced_keys 에도 넣어야 한다 (빠지면 그 컬럼이 가리키는 객체가 고아로 삭제됨)
+- 두 정렬 스트림을 병합 비교해 목록에만 있는 키 = 고아 → DeleteObjects 1000건 단위 삭제
+메모리는 청크 크기(chunk_size)만큼만 쓴다 (버킷 크기와 무관).
+"""
+import heapq
+import logging
+import os
+import re
+import tempfile
+from datetime import timedelta
+from typing import Iterable, Iterator, List, Optional
+
+from django.utils import timezone
+
+from core.s3_storage import S3Storage, get_s3_storage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREFIXES = ('article/', 'video/', 'homepage-doc/', 'event-banner/')
+
+# 본문 안의 모든 URL (img src 뿐 아니라 a href·style url 등도 참조로 본다 — 삭제 도구이므로 보수적으로)
+_URL_RE = re.compile(r'https?://[^\s"\'<>()]+', re.IGNORECASE)
+
+
+def _write_sorted_chunks(keys: Iterable[str], tmpdir: str, chunk_size: int, tag: str) -> List[str]:
+    """키 스트림을 chunk_size 단위로 정렬해 파일로 쓰고 경로 목록 반환"""
+    paths = []
+    buf = []
+
+    def _flush():
+        fd, path = tempfile.mkstemp(prefix=f'{tag}-', suffix='.txt', dir=tmpdir)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            for key in sorted(set(buf)):
+                f.write(key)
+                f.write('\n')
+        paths.append(path)
+
+    for key in keys:
+        if not key or '\n' in key:
+            continue
+        buf.append(key)
+        if len(buf) >= chunk_size:
+            _flush()
+            buf = []
+    if buf:
+        _flush()
+    return paths
+
+
+def _iter_file(path: str) -> Iterator[str]:
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            yield line.rstrip('\n')
+
+
+def merge_sorted_chunks(paths: List[str]) -> Iterator[str]:
+    """정렬 청크 파일들을 병합해 중복 없는 정렬 스트림으로"""
+    last = None
+    for key in heapq.merge(*(_iter_file(p) for p in paths)):
+        if key != last:
+            yield key
+            last = key
+
+
+def diff_sorted(listed: Iterator[str], referenced: Iterator[str]) -> Iterator[str]:
+    """정렬된 두 스트림에서 listed 에만 있는 키"""
+    ref = next(referenced, None)
+    for key in listed:
+        while ref is not None and ref < key:
+            ref = next(referenced, None)
+        if ref == key:
+            continue
+        yield key
+
+
+def _keys_from_url(url) -> Optional[str]:
+    if not url or not isinstance(url, str) or url.startswith('data:'):
+        return None
+    return S3Storage.extract_key_from_url(url)
+
+
+def _keys_from_html(html: Optional[str], prefixes: tuple) -> Iterator[str]:
+    if not html:
+        return
+    for match in _URL_RE.finditer(html):
+        key = S3Storage.extract_key_from_url(match.group(0))
+        if key and key.startswith(prefixes):
+            yield key
+
+
+def _keys_from_attachment(item) -> Iterator[str]:
+    """video.attachments 항목 (URL 문자열 또는 {'url': ..., 'key': ...})"""
+    if isinstance(item, dict):
+        for field in ('url', 'key'):
+            key = _keys_from_url(item.get(field))
+            if key:
+                yield key
+    else:
+        key = _keys_from_url(item)
+        if key:
+            yield key
+
+
+def iter_referenced_keys(prefixes, batch_size: int = 2000) -> Iterator[str]:
+    """DB에서 참조 중인 S3 키 스트림 (소프트 삭제 행도 포함 — 보수적으로 남긴다)"""
+    from apps.display_event.models import DisplayEvent
+    from apps.faq.models import FAQ
+    from apps.notice.models import Notice
+    from core.media_assets import media_assets_enabled
+    from core.models import MediaAsset
+    from sites.admin_api.articles.models import Article
+    from sites.admin_api.content_author.models import ContentAuthor
+    from sites.admin_api.homepage_doc.models import HomepageDocInfo
+    from sites.admin_api.video.models import Video
+
+    prefixes = tuple(prefixes)
+
+    def _url_keys(*urls):
+        for url in urls:
+            key = _keys_from_url(url)
+            if key:
+                yield key
+
+    for content, thumbnail in Article.objects.values_list('content', 'thumbnail').iterator(chunk_size=batch_size):
+        yield from _keys_from_html(content, prefixes=prefixes)
+        yield from _url_keys(thumbnail)
+
+    video_rows = Video.objects.values_list('body', 'thumbnail', 'speakerProfileImage', 'attachments')
+    for body, thumbnail, speaker_image, attachments in video_rows.iterator(chunk_size=batch_size):
+        yield from _keys_from_html(body, prefixes=prefixes)
+        yield from _url_keys(thumbnail, speaker_image)
+        for item in attachments or []:
+            yield from _keys_from_attachment(item)
+
+    for body_html in HomepageDocInfo.objects.values_list('body_html', flat=True).iterator(chunk_size=batch_size):
+        yield from _keys_from_html(body_html, prefixes=prefixes)
+
+    for image_url, link_url in DisplayEvent.objects.values_list('image_url', 'link_url').iterator(chunk_size=batch_size):
+        yield from _url_keys(image_url)
+        yield from _keys_from_html(link_url, prefixes=prefixes)
+
+    for profile_image in ContentAuthor.objects.values_list('profile_image', flat=True).iterator(chunk_size=batch_size):
+        yield from _url_keys(profile_image)
+
+    for content in Notice.objects.values_list('content', flat=True).iterator(chunk_size=batch_size):
+        yield from _keys_from_html(content, prefixes=prefixes)
+
+    for answer in FAQ.objects.values_list('answer', flat=True).iterator(chunk_size=batch_size):
+        yield from _keys_from_html(answer, prefixes=prefixes)
+
+    # 내용 주소 자산은 gc_media_assets 가 ref_count 로 관리 — 인덱스에 있는 키는 모두 참조로 본다
+    if media_assets_enabled():
+        yield from MediaAsset.objects.values_list('key', flat=True).iterator(chunk_size=batch_size)
+
+
+def sweep_orphans(
+    prefixes=DEFAULT_PREFIXES,
+    min_age_hours: int = 24,
+    chunk_size: int = 200000,
+    dry_run: bool = True,
+    on_orphan=None,
+) -> dict:
+    """
+    고아 객체 탐색·삭제
+
+    Args:
+        prefixes: 검사할 S3 접두사 (참조 출처를 모두 아는 경로만)
+        min_age_hours: 이 시간 안에 수정된 객체는 제외 (업로드 직후·저장 전 객체 보호)
+        chunk_size: 정렬 청크 크기 (메모리 상한)
+        dry_run: True면 삭제하지 않고 집계만
+        on_orphan: 고아 키마다 호출할 콜백 (목록 출력 등)
+
+    Returns:
+        {'listed', 'referenced', 'orphans', 'deleted', 'errors'}
+    """
+    s3_storage = get_s3_storage()
+    cutoff = timezone.now() - timedelta(hours=min_age_hours)
+    stats = {'listed': 0, 'referenced': 0, 'orphans': 0, 'deleted': 0, 'errors': 0}
+
+    with tempfile.TemporaryDirectory(prefix='s3-sweep-') as tmpdir:
+        def _list_prefix(prefix):
+            count = 0
+
+            def _keys():
+                nonlocal count
+                for obj in s3_storage.iter_objects(prefix=prefix):
+                    count += 1
+                    if obj.get('LastModified') and obj['LastModified'] >= cutoff:
+                        continue
+                    yield obj['Key']
+
+            paths = _write_sorted_chunks(_keys(), tmpdir, chunk_size, 'listed')
+            return paths, count
+
+        listed_paths = []
+        for prefix, result in zip(prefixes, s3_storage.map_concurrent(_list_prefix, prefixes)):
+            if isinstance(result, Exception):
+                # 목록을 끝까지 못 읽은 접두사는 고아 판정을 할 수 없으므로 중단
+                raise RuntimeError(f'S3 목록 조회 실패: {prefix} - {result}') from result
+            paths, count = result
+            listed_paths.extend(paths)
+            stats['listed'] += count
+
+        def _referenced():
+            for key in iter_referenced_keys(prefixes):
+                stats['referenced'] += 1
+                yield key
+
+        referenced_paths = _write_sorted_chunks(_referenced(), tmpdir, chunk_size, 'referenced')
+
+        def _orphans():
+            for key in diff_sorted(merge_sorted_chunks(listed_paths), merge_sorted_chunks(referenced_paths)):
+                stats['orphans'] += 1
+                if on_orphan is not None:
+                    on_orphan(key)
+                yield key
+
+        if dry_run:
+            for _key in _orphans():
+                pass
+        else:
+            result = s3_storage.delete_many(_orphans())
+            stats['deleted'] = result['deleted']
+            stats['errors'] = len(result['errors'])
+    return stats
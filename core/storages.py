@@ -0,0 +1,84 @@
+"""
+Django Storage 백엔드 — FileField 파일을 로컬 MEDIA_ROOT 대신 S3 에 저장
+
+- 저장: core.s3_storage.S3Storage.upload_stream (조각 단위 스트리밍, 큰 파일은 멀티파트)
+- URL: 비공개 객체의 presigned GET URL (Content-Disposition: attachment — 브라우저에서 바로 열지 않음)
+- S3 키 = location + FileField 에 저장된 이름 (DB 값은 로컬 저장 때와 같은 형식)
+- S3 클라이언트는 처음 사용할 때 만든다 (모델 import 시 AWS 설정이 없어도 됨)
+"""
+import mimetypes
+import posixpath
+from urllib.parse import quote
+
+from django.core.files.base import File
+from django.core.files.storage import Storage
+from django.utils.deconstruct import deconstructible
+
+from core.s3_storage import get_s3_storage
+
+
+@deconstructible
+class S3StreamingStorage(Storage):
+    """
+    Args:
+        location: S3 키 접두사 (빈 값이면 이름 그대로)
+        url_expires_in: presigned URL 만료(초)
+        as_attachment: True 면 다운로드 응답에 Content-Disposition: attachment (원본 파일명)
+    """
+
+    def __init__(self, location='', url_expires_in=3600, as_attachment=True):
+        self.location = location.strip('/')
+        self.url_expires_in = url_expires_in
+        self.as_attachment = as_attachment
+
+    @property
+    def s3(self):
+        return get_s3_storage()
+
+    def key_for(self, name):
+        """FileField 이름 → S3 키"""
+        name = name.replace('\\', '/').lstrip('/')
+        return posixpath.join(self.location, name) if self.location else name
+
+    def _open(self, name, mode='rb'):
+        if 'w' in mode or 'a' in mode:
+            raise ValueError('S3StreamingStorage 파일은 읽기 전용으로만 열 수 있습니다.')
+        response = self.s3.s3_client.get_object(Bucket=self.s3.bucket_name, Key=self.key_for(name))
+        # StreamingBody — read()/chunks() 가 네트워크에서 바로 읽는다 (전체 버퍼링 없음)
+        file = File(response['Body'], name=name)
+        file.size = response.get('ContentLength')
+        return file
+
+    def _save(self, name, content):
+        content_type = getattr(content, 'content_type', None) or mimetypes.guess_type(name)[0]
+        file_obj = getattr(content, 'file', content)
+        self.s3.upload_stream(file_obj, self.key_for(name), content_type=content_type)
+        return name
+
+    def delete(self, name):
+        if name:
+            self.s3.delete_file(self.key_for(name))
+
+    def exists(self, name):
+        return self.s3.file_exists(self.key_for(name))
+
+    def size(self, name):
+        info = self.s3.get_file_info(self.key_for(name))
+        if info is None:
+            raise FileNotFoundError(name)
+        return info['size']
+
+    def get_modified_time(self, name):
+        info = self.s3.get_file_info(self.key_for(name))
+        if info is None:
+            raise FileNotFoundError(name)
+        return info['last_modified']
+
+    def url(self, name):
+        params = None
+        if self.as_attachment:
+            filename = posixpath.basename(name)
+            params = {'ResponseContentDisposition': f"attachment; filename*=UTF-8''{quote(filename)}"}
+        return self.s3.get_file_url(
+            self.key_for(name), expires_in=self.url_expires_in, force_presigned=True, response_params=params
+        )
@@ -1,7 +1,192 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
 
-# Create your tests here.
+from core.http_cache import MEMBER_PRIVATE, PUBLIC_REVALIDATE, apply_cache_headers, etag_matches, make_etag
+from core.instrumentation import QueryBudgetExceeded, assert_max_queries, capture_queries
+from core.pagination import cached_count
+from core.checks import check_shared_throttle_cache
+from core.throttling import SlidingWindowLimiter, client_ip
+from sites.admin_api.articles.models import Article
 
 
+class CachedCountTests(TestCase):
+    def setUp(self):
+        cache.clear()
 
+    def test_empty_in_filter_returns_zero(self):
+        # filter(id__in=[]) 는 is_empty() 로 안 잡히고 SQL 컴파일 때 EmptyResultSet
+        self.assertEqual(cached_count(Article.objects.filter(id__in=[])), (0, False))
 
+    def test_none_queryset_returns_zero(self):
+        self.assertEqual(cached_count(Article.objects.none()), (0, False))
+
+
+class QueryCaptureTests(TestCase):
+    def test_capture_queries_keeps_sql_and_params(self):
+        with capture_queries() as captured:
+            list(Article.objects.filter(id=42))
+        self.assertEqual(len(captured), 1)
+        self.assertIn('%s', captured[0]['sql'])
+        self.assertEqual(list(captured[0]['params']), [42])
+
+    def test_assert_max_queries_raises_over_budget(self):
+        with assert_max_queries(1):
+            Article.objects.exists()
+        with self.assertRaises(QueryBudgetExceeded):
+            with assert_max_queries(1):
+                Article.objects.exists()
+                Article.objects.count()
+
+
+def _rest_framework(**overrides):
+    from django.conf import settings
+
+    return {**settings.REST_FRAMEWORK, **overrides}
+
+
+class ClientIpTests(SimpleTestCase):
+    def _request(self, xff=None):
+        extra = {'REMOTE_ADDR': '10.0.0.5'}
+        if xff is not None:
+            extra['HTTP_X_FORWARDED_FOR'] = xff
+        return RequestFactory().post('/login/', **extra)
+
+    def test_forwarded_for_ignored_without_trusted_proxies(self):
+        with override_settings(REST_FRAMEWORK=_rest_framework(NUM_PROXIES=0)):
+            self.assertEqual(client_ip(self._request('1.2.3.4')), '10.0.0.5')
+            self.assertEqual(client_ip(self._request()), '10.0.0.5')
+
+    def test_counts_trusted_proxies_from_the_right(self):
+        # 클라이언트가 보낸 '1.2.3.4' 뒤에 nginx 가 실제 접속 IP 를 덧붙인다
+        with override_settings(REST_FRAMEWORK=_rest_framework(NUM_PROXIES=1)):
+            self.assertEqual(client_ip(self._request('1.2.3.4, 203.0.113.7')), '203.0.113.7')
+        with override_settings(REST_FRAMEWORK=_rest_framework(NUM_PROXIES=2)):
+            self.assertEqual(client_ip(self._request('1.2.3.4, 203.0.113.7, 10.0.0.9')), '203.0.113.7')
+            self.assertEqual(client_ip(self._request('203.0.113.7')), '203.0.113.7')
+
+
+class HttpCacheTests(SimpleTestCase):
+    def _request(self, if_none_match=None):
+        extra = {} if if_none_match is None else {'HTTP_IF_NONE_MATCH': if_none_match}
+        return RequestFactory().get('/', **extra)
+
+    def test_etag_weak_comparison_and_wildcard(self):
+        etag = make_etag('detail', 1)
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertNotEqual(etag, make_etag('detail', 2))
+        self.assertTrue(etag_matches(self._request(etag), etag))
+        self.assertTrue(etag_matches(self._request(etag[2:]), etag))
+        self.assertTrue(etag_matches(self._request(f'W/"other", {etag}'), etag))
+        self.assertTrue(etag_matches(self._request('*'), etag))
+        self.assertFalse(etag_matches(self._request('W/"other"'), etag))
+        self.assertFalse(etag_matches(self._request(), etag))
+
+    def test_policy_headers_and_vary_merge(self):
+        response = HttpResponse()
+        response['Vary'] = 'Accept-Language'
+        apply_cache_headers(response, 'W/"a"', MEMBER_PRIVATE, ('Authorization', 'Cookie', 'Accept-Language'))
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+        self.assertEqual(response['ETag'], 'W/"a"')
+        self.assertEqual(response['Vary'], 'Accept-Language, Authorization, Cookie')
+        self.assertEqual(apply_cache_headers(HttpResponse(), None, PUBLIC_REVALIDATE)['Cache-Control'], 'public, no-cache')
+
+    def test_error_response_is_no_store_without_etag(self):
+        response = apply_cache_headers(HttpResponse(status=404), 'W/"a"', PUBLIC_REVALIDATE)
+        self.assertEqual(response['Cache-Control'], 'no-store')
+        self.assertFalse(response.has_header('ETag'))
+
+
+class SlidingWindowLimiterTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_rejects_after_limit_within_window(self):
+        limiter = SlidingWindowLimiter('test.ip', limit=3, window=60)
+        results = [limiter.hit('1.1.1.1', now=1000.0)[0] for _ in range(4)]
+        self.assertEqual(results, [True, True, True, False])
+        # 다른 ident 는 별도 카운터
+        self.assertTrue(limiter.hit('2.2.2.2', now=1000.0)[0])
+
+    def test_previous_window_is_weighted(self):
+        limiter = SlidingWindowLimiter('test.ip', limit=3, window=60)
+        for _ in range(3):
+            limiter.hit('1.1.1.1', now=1019.0)
+        # 직전 창 3건 × 가중치(1 - 10/60) + 1 > 3
+        self.assertFalse(limiter.hit('1.1.1.1', now=1030.0)[0])
+        # 직전 창 가중치가 충분히 줄어든 뒤
+        self.assertTrue(limiter.hit('1.1.1.1', now=1075.0)[0])
+
+
+class SharedCacheCheckTests(SimpleTestCase):
+    locmem = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    redis = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://127.0.0.1:6379'}}
+
+    def _ids(self):
+        return [w.id for w in check_shared_throttle_cache(None)]
+
+    def test_warns_on_process_local_cache_outside_local(self):
+        with override_settings(ENV_MODE='production', AUTH_THROTTLE_ENABLED=True, CACHES=self.locmem):
+            self.assertEqual(self._ids(), ['core.W002'])
+
+    def test_allows_shared_cache_or_local_mode(self):
+        with override_settings(ENV_MODE='production', AUTH_THROTTLE_ENABLED=True, CACHES=self.redis):
+            self.assertEqual(self._ids(), [])
+        with override_settings(ENV_MODE='local', AUTH_THROTTLE_ENABLED=True, CACHES=self.locmem):
+            self.assertEqual(self._ids(), [])
+        with override_settings(ENV_MODE='production', AUTH_THROTTLE_ENABLED=False, CACHES=self.locmem):
+            self.assertEqual(self._ids(), [])
+
+
+class SweepReferencedKeysTests(TestCase):
+    def test_video_speaker_image_and_attachments_are_referenced(self):
+        from core.s3_sweep import iter_referenced_keys
+        from sites.admin_api.video.models import Video
+
+        Video.objects.create(
+            title='세미나',
+            thumbnail='video/2026/10/1/thumb.jpg',
+            speakerProfileImage='https://bucket.s3.ap-northeast-2.amazonaws.com/video/2026/10/1/speaker.png?X-Amz-Signature=x',
+            attachments=[{'url': 'video/2026/10/1/attachments/a.pdf', 'name': 'a.pdf'}],
+        )
+        keys = set(iter_referenced_keys(('video/',)))
+        self.assertTrue({
+            'video/2026/10/1/thumb.jpg',
+            'video/2026/10/1/speaker.png',
+            'video/2026/10/1/attachments/a.pdf',
+        } <= keys)
+
+    def test_notice_and_faq_bodies_are_referenced(self):
+        from apps.faq.models import FAQ
+        from apps.notice.models import Notice
+        from core.s3_sweep import iter_referenced_keys
+
+        url = 'https://bucket.s3.ap-northeast-2.amazonaws.com/article/2026/10/n.png'
+        Notice.objects.create(title='공지', content=f'<p><img src="{url}"></p>')
+        FAQ.objects.create(question='질문', answer=f'<img src="{url.replace("n.png", "f.png")}">')
+        keys = set(iter_referenced_keys(('article/',)))
+        self.assertTrue({'article/2026/10/n.png', 'article/2026/10/f.png'} <= keys)
+
+
+class AuditLogWriterTests(TestCase):
+    def test_failed_batch_falls_back_to_row_inserts(self):
+        from core.audit import AuditLogWriter
+        from core.models import AuditLog
+
+        writer = AuditLogWriter(batch_size=10, bulk_retries=1)
+        entries = [AuditLog(action='login', resource='r', site_slug='public_api') for _ in range(4)]
+        entries.insert(2, AuditLog(action=None, resource='bad'))  # NOT NULL 위반 — 배치 전체 bulk_create 실패
+        with self.assertLogs('core.audit', level='WARNING'):
+            written = writer._write(entries)
+        self.assertEqual(written, 4)
+        self.assertEqual(AuditLog.objects.count(), 4)
+        self.assertEqual((writer.written, writer.failed, writer.retried), (4, 1, 1))
+
+    def test_successful_batch_is_written_once(self):
+        from core.audit import AuditLogWriter
+        from core.models import AuditLog
+
+        writer = AuditLogWriter(batch_size=10)
+        self.assertEqual(writer._write([AuditLog(action='read') for _ in range(3)]), 3)
+        self.assertEqual(AuditLog.objects.count(), 3)
+        self.assertEqual((writer.failed, writer.retried), (0, 0))
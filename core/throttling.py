@@ -0,0 +1,264 @@
+"""
+로그인·비밀번호 확인·SMS 발송 엔드포인트 요청 제한 (공용 캐시 기반 슬라이딩 윈도우)
+
+- SlidingWindowLimiter: 현재·직전 고정 창 카운터 2개를 경과 비율로 가중 합산 (키당 정수 2개)
+  증가는 cache.add / cache.incr (원자) 후 판정 — 동시 요청이 한도를 함께 넘지 않는다. 거절된 요청도 센다.
+- DRF 스로틀: 뷰의 throttle_scope + 종류(ip / account / phone) → REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] 의
+  '{scope}.{kind}' 비율 ('10/m', '5/10m', '20/h' — 숫자/[배수]단위 s·m·h·d). 비율이 없으면 제한 없음.
+  APIView.initial 에서 핸들러 전에 실행되므로 거절 시 비밀번호 해시·DB·외부 API 호출 없음 (캐시 왕복만)
+- 거절 지표: 버킷(scope.kind)별 시간 단위 카운터 (throttle_stats 커맨드) + inde.throttle 로거 경고
+- THROTTLE_CACHE_ALIAS 캐시는 모든 프로세스가 공유해야 한다 (LocMem 이면 프로세스별로 따로 센다)
+  ENV_MODE 가 local 이 아니면 시스템 체크가 경고 (core.checks — core.W002)
+- IP 는 REMOTE_ADDR, 프록시 뒤에서는 REST_FRAMEWORK['NUM_PROXIES'] 로 X-Forwarded-For 오른쪽부터 센다 (client_ip)
+  NUM_PROXIES 기본값: local 0, 그 외 1 (nginx 뒤 배포 — 0 이면 모든 방문자가 프록시 IP 하나로 묶인다)
+"""
+import hashlib
+import logging
+import math
+import re
+import time
+from datetime import timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from sites.public_api.phone_normalize import normalize_phone_kr
+
+logger = logging.getLogger('inde.throttle')
+
+CACHE_PREFIX = 'rl:'
+REJECT_PREFIX = 'rl_reject:'
+# 거절 지표 보관(초)
+REJECT_METRIC_TTL = 7 * 24 * 3600
+
+_RATE_RE = re.compile(r'^\s*(\d+)\s*/\s*(\d*)\s*([smhd])[a-z]*\s*$')
+_UNIT_SECONDS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def _cache():
+    return caches[getattr(settings, 'THROTTLE_CACHE_ALIAS', 'default')]
+
+
+def throttle_enabled() -> bool:
+    return bool(getattr(settings, 'AUTH_THROTTLE_ENABLED', True))
+
+
+def parse_rate(rate: str) -> Tuple[int, int]:
+    """'10/m' → (10, 60), '5/10m' → (5, 600)"""
+    match = _RATE_RE.match(rate or '')
+    if not match:
+        raise ValueError(f"요청 제한 비율 형식 오류: {rate!r} (예: '10/m', '5/10m')")
+    limit, multiplier, unit = match.groups()
+    return int(limit), int(multiplier or 1) * _UNIT_SECONDS[unit]
+
+
+def _ident_key(ident: str) -> str:
+    # 이메일·전화번호를 캐시 키에 그대로 두지 않고, memcached 키 길이 제한도 피한다
+    return hashlib.sha1(ident.encode('utf-8')).hexdigest()[:20]
+
+
+class SlidingWindowLimiter:
+    """
+    name(버킷) · ident 별 요청 수 제한
+
+    Args:
+        name: 버킷 이름 (캐시 키·지표에 사용)
+        limit: 창(window) 안 최대 요청 수
+        window: 창 길이(초)
+    """
+
+    def __init__(self, name: str, limit: int, window: int):
+        self.name = name
+        self.limit = limit
+        self.window = window
+
+    @classmethod
+    def from_rate(cls, name: str, rate: str) -> 'SlidingWindowLimiter':
+        return cls(name, *parse_rate(rate))
+
+    def _key(self, ident: str, slot: int) -> str:
+        return f"{CACHE_PREFIX}{self.name}:{_ident_key(ident)}:{slot}"
+
+    def hit(self, ident: str, now: Optional[float] = None) -> Tuple[bool, float]:
+        """
+        요청 1건 기록 후 허용 여부 판정
+
+        Returns:
+            (허용 여부, 거절 시 재시도까지 대기 초)
+        """
+        now = time.time() if now is None else now
+        cache = _cache()
+        slot = int(now // self.window)
+        elapsed = now - slot * self.window
+        curr_key = self._key(ident, slot)
+        # 창 2개 길이만큼 보관: 다음 창에서 '직전 창'으로 읽힌다
+        if cache.add(curr_key, 1, self.window * 2):
+            current = 1
+        else:
+            try:
+                current = cache.incr(curr_key)
+            except ValueError:
+                # add 와 incr 사이에 만료된 경우
+                cache.set(curr_key, 1, self.window * 2)
+                current = 1
+        previous = cache.get(self._key(ident, slot - 1)) or 0
+        weight = 1.0 - elapsed / self.window
+        if previous * weight + current <= self.limit:
+            return True, 0.0
+        return False, self._wait(previous, current, elapsed)
+
+    def _wait(self, previous: int, current: int, elapsed: float) -> float:
+        """가중 합이 한도 아래로 내려갈 때까지 남은 시간(초, 근사)"""
+        if current > self.limit:
+            # 다음 창으로 넘어가 현재 카운터가 '직전 창'으로 줄어들 때까지
+            remaining = self.window - elapsed
+            return max(1.0, remaining + self.window * (1.0 - self.limit / current))
+        # 직전 창 카운터의 가중치가 줄어들 때까지
+        needed = self.window * (1.0 - (self.limit - current) / previous) - elapsed
+        return max(1.0, needed)
+
+
+def _reject_key(bucket: str, hour: str) -> str:
+    return f"{REJECT_PREFIX}{bucket}:{hour}"
+
+
+def record_rejection(bucket: str, ident: str = '') -> None:
+    """버킷별 시간 단위 거절 카운터 증가 + 로그"""
+    cache = _cache()
+    key = _reject_key(bucket, timezone.localtime().strftime('%Y%m%d%H'))
+    if not cache.add(key, 1, REJECT_METRIC_TTL):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, REJECT_METRIC_TTL)
+    logger.warning('throttled bucket=%s ident=%s', bucket, _ident_key(ident) if ident else '-')
+
+
+def rejection_counts(buckets: Iterable[str], hours: int = 24) -> Dict[str, Dict[str, int]]:
+    """
+    최근 hours 시간의 버킷별 거절 수 (get_many 1회)
+
+    Returns:
+        {bucket: {'YYYYmmddHH': n}} — 거절이 없는 시간은 빠짐
+    """
+    now = timezone.localtime()
+    slots = [(now - timedelta(hours=h)).strftime('%Y%m%d%H') for h in range(hours)]
+    keys = {_reject_key(b, s): (b, s) for b in buckets for s in slots}
+    out: Dict[str, Dict[str, int]] = {b: {} for b in buckets}
+    for key, value in _cache().get_many(list(keys)).items():
+        bucket, slot = keys[key]
+        out[bucket][slot] = int(value)
+    return out
+
+
+def limiter_for(bucket: str) -> Optional[SlidingWindowLimiter]:
+    """DEFAULT_THROTTLE_RATES[bucket] 의 제한기 (비율이 없거나 비활성이면 None)"""
+    if not throttle_enabled():
+        return None
+    rate = (api_settings.DEFAULT_THROTTLE_RATES or {}).get(bucket)
+    return SlidingWindowLimiter.from_rate(bucket, rate) if rate else None
+
+
+def configured_buckets() -> list:
+    """DEFAULT_THROTTLE_RATES 에 비율이 있는 '{scope}.{kind}' 버킷"""
+    return sorted(k for k, v in (api_settings.DEFAULT_THROTTLE_RATES or {}).items() if v and '.' in k)
+
+
+def client_ip(request) -> str:
+    """
+    요청 제한 키로 쓸 클라이언트 IP (DRF NUM_PROXIES 방식)
+
+    X-Forwarded-For 의 왼쪽 값은 클라이언트가 임의로 채울 수 있으므로, 앞단 프록시가 덧붙인 오른쪽에서
+    NUM_PROXIES 번째 값만 믿는다. NUM_PROXIES 가 0(기본)·None 이거나 헤더가 없으면 REMOTE_ADDR.
+    """
+    remote_addr = request.META.get('REMOTE_ADDR', '') or ''
+    num_proxies = api_settings.NUM_PROXIES
+    xff = request.META.get('HTTP_X_FORWARDED_FOR')
+    if not num_proxies or not xff:
+        return remote_addr
+    addrs = [a.strip() for a in xff.split(',')]
+    return addrs[-min(num_proxies, len(addrs))] or remote_addr
+
+
+def is_process_local(alias: str) -> bool:
+    """프로세스마다 따로 세는 캐시 백엔드(LocMem·Dummy)면 True"""
+    backend = settings.CACHES.get(alias, {}).get('BACKEND', '')
+    return backend.endswith(('.LocMemCache', '.DummyCache'))
+
+
+class ScopedCacheThrottle(BaseThrottle):
+    """
+    view.throttle_scope + kind 버킷으로 SlidingWindowLimiter 적용 (하위 클래스가 get_bucket_ident 구현).
+    ident 를 알 수 없으면(입력 없음 등) 이 종류의 제한은 건너뛴다 — 다른 종류(ip)가 막는다.
+    """
+    kind = ''
+
+    def __init__(self):
+        self._wait = None
+
+    def get_bucket_ident(self, request, view) -> Optional[str]:
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        scope = getattr(view, 'throttle_scope', None)
+        limiter = limiter_for(f"{scope}.{self.kind}") if scope else None
+        if limiter is None:
+            return True
+        ident = self.get_bucket_ident(request, view)
+        if not ident:
+            return True
+        bucket = limiter.name
+        allowed, wait = limiter.hit(ident)
+        if not allowed:
+            self._wait = wait
+            record_rejection(bucket, ident)
+        return allowed
+
+    def wait(self):
+        return math.ceil(self._wait) if self._wait else None
+
+
+def _data_value(request, field: str) -> str:
+    data = request.data
+    value = data.get(field) if hasattr(data, 'get') else None
+    return value.strip() if isinstance(value, str) else ''
+
+
+class IPRateThrottle(ScopedCacheThrottle):
+    """클라이언트 IP 별 ('{scope}.ip')"""
+    kind = 'ip'
+
+    def get_bucket_ident(self, request, view):
+        return client_ip(request)
+
+
+class AccountRateThrottle(ScopedCacheThrottle):
+    """
+    계정 별 ('{scope}.account')
+    view.get_throttle_account(request) 가 있으면 그 값, 없으면 요청 본문의 throttle_account_fields 중 첫 값 (소문자)
+    """
+    kind = 'account'
+    default_fields = ('email', 'memberShipId')
+
+    def get_bucket_ident(self, request, view):
+        getter = getattr(view, 'get_throttle_account', None)
+        if getter is not None:
+            value = getter(request)
+            return str(value) if value not in (None, '') else None
+        for field in getattr(view, 'throttle_account_fields', self.default_fields):
+            value = _data_value(request, field)
+            if value:
+                return value.lower()
+        return None
+
+
+class PhoneRateThrottle(ScopedCacheThrottle):
+    """휴대폰 번호 별 ('{scope}.phone') — 요청 본문 phone 을 정규화 (+82 / 하이픈 차이로 우회 불가)"""
+    kind = 'phone'
+
+    def get_bucket_ident(self, request, view):
+        return normalize_phone_kr(_data_value(request, 'phone')) or None
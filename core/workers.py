@@ -0,0 +1,214 @@
+"""
+배치 작업 상주 런타임 (run_workers 커맨드)
+- 기존 관리 커맨드(예약 발행·예약 메일·랭킹 갱신·집계 보정 등)를 한 프로세스에서 call_command 로 실행
+  (실행마다 Django 기동·설정 import·DB 연결 비용 없음)
+- 스케줄: every(초 간격) 또는 daily('HH:MM', TIME_ZONE 기준) + jitter(초, 노드 간 동시 시작 분산)
+- 노드 간 중복 실행 방지: MySQL GET_LOCK(이름, 0) — 못 잡으면 이번 회차는 건너뜀 (그 외 DB는 프로세스 내 잠금만)
+- 작업별 계측: 실행/실패/잠금 건너뜀 횟수, 마지막·평균·최대 소요 시간
+작업 목록은 DEFAULT_JOBS, settings.WORKER_JOBS 로 교체 가능.
+"""
+import heapq
+import io
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import close_old_connections, connection
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# name: 작업 이름(잠금 이름), command: 관리 커맨드, args: 인자 목록
+# every: 실행 간격(초) 또는 daily: 'HH:MM' / jitter: 0~jitter 초 무작위 지연
+DEFAULT_JOBS = [
+    {'name': 'publish_scheduled_content', 'command': 'publish_scheduled_content', 'every': 15, 'jitter': 3},
+    {'name': 'send_scheduled_admin_emails', 'command': 'send_scheduled_admin_emails', 'every': 60, 'jitter': 10},
+    {'name': 'refresh_content_ranking_cache', 'command': 'refresh_content_ranking_cache', 'daily': '00:10', 'jitter': 120},
+    {'name': 'purge_expired_share_links', 'command': 'purge_expired_share_links', 'daily': '03:00', 'jitter': 300},
+    {'name': 'archive_audit_log', 'command': 'archive_audit_log', 'daily': '03:30', 'jitter': 300},
+    {'name': 'gc_media_assets', 'command': 'gc_media_assets', 'daily': '04:00', 'jitter': 300},
+    {'name': 'backfill_question_bookmark_counts', 'command': 'backfill_question_bookmark_counts', 'daily': '04:30', 'jitter': 300},
+    {'name': 'backfill_comment_and_highlight_counts', 'command': 'backfill_comment_and_highlight_counts', 'daily': '04:45', 'jitter': 300},
+    {'name': 'backfill_content_ratings_from_logs', 'command': 'backfill_content_ratings_from_logs', 'daily': '05:00', 'jitter': 300},
+]
+
+
+def get_jobs():
+    return list(getattr(settings, 'WORKER_JOBS', None) or DEFAULT_JOBS)
+
+
+class JobMetrics:
+    """작업 1개의 누적 계측 값"""
+    __slots__ = ('runs', 'failures', 'skipped_locked', 'skipped_running', 'last_ms', 'total_ms', 'max_ms',
+                 'last_started', 'last_status')
+
+    def __init__(self):
+        self.runs = 0
+        self.failures = 0
+        self.skipped_locked = 0
+        self.skipped_running = 0
+        self.last_ms = 0.0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_started = None
+        self.last_status = None
+
+    def as_dict(self):
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data['avg_ms'] = round(self.total_ms / self.runs, 1) if self.runs else 0.0
+        return data
+
+
+class AdvisoryLock:
+    """MySQL GET_LOCK 기반 노드 간 잠금 (현재 스레드의 DB 연결에 묶임). MySQL 이 아니면 항상 성공."""
+
+    def __init__(self, name):
+        prefix = getattr(settings, 'WORKER_LOCK_PREFIX', 'inde:job:')
+        # GET_LOCK 이름은 64자 제한
+        self.name = f'{prefix}{name}'[:64]
+        self.acquired = False
+
+    def acquire(self):
+        if connection.vendor != 'mysql':
+            self.acquired = True
+            return True
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT GET_LOCK(%s, 0)', [self.name])
+            row = cursor.fetchone()
+        self.acquired = bool(row and row[0] == 1)
+        return self.acquired
+
+    def release(self):
+        if not self.acquired:
+            return
+        self.acquired = False
+        if connection.vendor != 'mysql':
+            return
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT RELEASE_LOCK(%s)', [self.name])
+        except Exception:
+            # 연결이 끊겼으면 MySQL 이 잠금을 이미 해제했다
+            logger.warning('RELEASE_LOCK 실패: %s', self.name, exc_info=True)
+
+
+class Job:
+    def __init__(self, spec):
+        self.name = spec['name']
+        self.command = spec.get('command', self.name)
+        self.args = list(spec.get('args', []))
+        self.every = spec.get('every')
+        self.daily = spec.get('daily')
+        self.jitter = float(spec.get('jitter', 0))
+        if not self.every and not self.daily:
+            raise ValueError(f'작업 {self.name}: every 또는 daily 가 필요합니다.')
+        self.metrics = JobMetrics()
+        self.running = threading.Event()
+
+    def _jitter(self):
+        return random.uniform(0, self.jitter) if self.jitter > 0 else 0.0
+
+    def first_run_at(self, now):
+        if self.every:
+            return now + self._jitter()
+        return self._next_daily(now)
+
+    def next_run_at(self, now):
+        if self.every:
+            return now + float(self.every) + self._jitter()
+        return self._next_daily(now)
+
+    def _next_daily(self, now):
+        hour, minute = (int(x) for x in self.daily.split(':'))
+        local_now = timezone.localtime(datetime.fromtimestamp(now, tz=dt_timezone.utc))
+        target = local_now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if target.timestamp() <= now:
+            target += timedelta(days=1)
+        return target.timestamp() + self._jitter()
+
+    def run(self):
+        """작업 1회 실행 (워커 스레드). 반환: 'ok' | 'failed' | 'locked'"""
+        metrics = self.metrics
+        close_old_connections()
+        lock = AdvisoryLock(self.name)
+        try:
+            if not lock.acquire():
+                metrics.skipped_locked += 1
+                return 'locked'
+            metrics.last_started = timezone.now()
+            out = io.StringIO()
+            started = time.perf_counter()
+            status = 'ok'
+            try:
+                call_command(self.command, *self.args, stdout=out, stderr=out)
+            except (Exception, SystemExit) as e:  # CommandError·SystemExit 포함
+                status = 'failed'
+                metrics.failures += 1
+                logger.error('작업 실패 %s: %s\n%s', self.name, e, out.getvalue()[-2000:], exc_info=True)
+            elapsed = (time.perf_counter() - started) * 1000.0
+            metrics.runs += 1
+            metrics.last_ms = elapsed
+            metrics.total_ms += elapsed
+            metrics.max_ms = max(metrics.max_ms, elapsed)
+            metrics.last_status = status
+            logger.info('작업 %s %s (%.0fms)', self.name, status, elapsed)
+            return status
+        finally:
+            lock.release()
+            close_old_connections()
+            self.running.clear()
+
+
+class WorkerRuntime:
+    """작업 스케줄러: 다음 실행 시각 힙 + 스레드 풀. 같은 작업은 겹쳐 실행하지 않는다."""
+
+    def __init__(self, jobs, max_concurrency=2):
+        self.jobs = jobs
+        self.stop_event = threading.Event()
+        self.executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix='job')
+
+    def metrics(self):
+        return {job.name: job.metrics.as_dict() for job in self.jobs}
+
+    def submit(self, job):
+        if job.running.is_set():
+            job.metrics.skipped_running += 1
+            return None
+        job.running.set()
+        return self.executor.submit(job.run)
+
+    def run_forever(self, report_interval=3600.0):
+        now = time.time()
+        heap = [(job.first_run_at(now), index) for index, job in enumerate(self.jobs)]
+        heapq.heapify(heap)
+        next_report = now + report_interval
+        try:
+            while not self.stop_event.is_set() and heap:
+                due, index = heap[0]
+                now = time.time()
+                if due > now:
+                    self.stop_event.wait(min(due - now, max(0.0, next_report - now), 60.0) or 0.05)
+                    if time.time() >= next_report:
+                        self.report()
+                        next_report = time.time() + report_interval
+                    continue
+                heapq.heappop(heap)
+                job = self.jobs[index]
+                self.submit(job)
+                heapq.heappush(heap, (job.next_run_at(time.time()), index))
+        finally:
+            self.executor.shutdown(wait=True)
+            self.report()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def report(self):
+        for name, data in self.metrics().items():
+            if data['runs'] or data['skipped_locked'] or data['skipped_running']:
+                logger.info('작업 통계 %s: %s', name, data)
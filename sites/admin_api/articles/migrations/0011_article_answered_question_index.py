@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """관리자 목록 sortBy=answeredQuestionCount 정렬을 집계 컬럼 인덱스로 처리."""
+
+    dependencies = [
+        ("articles", "0010_article_published_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(fields=["answeredQuestionCount", "id"], name="idx_article_answered_q"),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """예약 발행 도래 조회(status=예약 AND scheduledAt<=now, MIN(scheduledAt))를 복합 인덱스 범위 스캔으로."""
+
+    dependencies = [
+        ("articles", "0011_article_answered_question_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(fields=["status", "scheduledAt"], name="idx_article_status_sched"),
+        ),
+    ]
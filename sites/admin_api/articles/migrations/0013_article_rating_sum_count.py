@@ -0,0 +1,47 @@
+from django.db import migrations, models
+
+
+def backfill_rating_sum_count(apps, schema_editor):
+    """RATING 로그 합계·건수로 ratingSum·ratingCount·rating 채움 (0/0 으로 시작하면 첫 별점이 평균을 덮어쓴다)"""
+    Article = apps.get_model("articles", "Article")
+    Log = apps.get_model("public_api", "PublicUserActivityLog")
+    groups = (
+        Log.objects.filter(content_type="ARTICLE", activity_type="RATING", rating_value__isnull=False)
+        .values("content_code")
+        .annotate(total=models.Sum("rating_value"), cnt=models.Count("pk"))
+    )
+    for row in groups.iterator():
+        try:
+            pk = int(str(row["content_code"]).strip(), 10)
+        except ValueError:
+            continue
+        Article.objects.filter(pk=pk).update(
+            ratingSum=row["total"], ratingCount=row["cnt"], rating=round(row["total"] / row["cnt"], 2)
+        )
+
+
+class Migration(migrations.Migration):
+    """별점 합계·건수 컬럼 — 별점 등록 시 증분 갱신. 기존 RATING 로그로 채운다 (이후 드리프트 보정은 backfill_content_ratings_from_logs)."""
+
+    dependencies = [
+        ("articles", "0012_article_status_scheduled_index"),
+        ("public_api", "0008_publicuseractivitylog"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="ratingSum",
+            field=models.IntegerField(
+                default=0,
+                verbose_name="별점 합계",
+                db_comment="RATING 로그 ratingValue 합 (rating = ratingSum / ratingCount)",
+            ),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="ratingCount",
+            field=models.IntegerField(default=0, verbose_name="별점 수", db_comment="RATING 로그 건수"),
+        ),
+        migrations.RunPython(backfill_rating_sum_count, migrations.RunPython.noop),
+    ]
@@ -55,6 +55,8 @@ class Article(models.Model):
     # 통계 정보
     viewCount = models.IntegerField(default=0, verbose_name='조회수')
     rating = models.FloatField(null=True, blank=True, verbose_name='평점')
+    ratingSum = models.IntegerField(default=0, verbose_name='별점 합계', db_comment='RATING 로그 ratingValue 합 (rating = ratingSum / ratingCount)')
+    ratingCount = models.IntegerField(default=0, verbose_name='별점 수', db_comment='RATING 로그 건수')
     allowComment = models.BooleanField(default=True, verbose_name='댓글 허용', db_comment='댓글 허용 여부 (true=표시/작성 가능)')
     commentCount = models.IntegerField(default=0, verbose_name='댓글 수')
     highlightCount = models.IntegerField(default=0, verbose_name='하이라이트 수')
@@ -97,6 +99,8 @@ class Article(models.Model):
             models.Index(fields=['createdAt'], name='idx_article_created'),
             models.Index(fields=['deletedAt'], name='idx_article_deleted'),
             models.Index(fields=['author'], name='idx_article_author'),
+            models.Index(fields=['answeredQuestionCount', 'id'], name='idx_article_answered_q'),
+            models.Index(fields=['status', 'scheduledAt'], name='idx_article_status_sched'),
         ]
     
     def __str__(self):
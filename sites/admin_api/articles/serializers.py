@@ -111,15 +111,11 @@ class ArticleListSerializer(serializers.ModelSerializer):
     answeredQuestionCount = serializers.SerializerMethodField()
 
     def get_questionCount(self, obj):
-        """content_question 기준 등록 질문 수(annotate 미적용 시 DB 컬럼)."""
-        if hasattr(obj, 'applied_question_count'):
-            return int(obj.applied_question_count)
+        """content_question 기준 등록 질문 수(집계 컬럼)."""
         return int(obj.questionCount or 0)
 
     def get_answeredQuestionCount(self, obj):
-        """답변이 1건 이상인 질문 수(question_id distinct). annotate 없으면 DB 백필 컬럼."""
-        if hasattr(obj, 'answered_question_count'):
-            return int(obj.answered_question_count)
+        """답변이 1건 이상인 질문 수(question_id distinct, 집계 컬럼)."""
         return int(getattr(obj, 'answeredQuestionCount', 0) or 0)
 
     def get_authorProfileImage(self, obj):
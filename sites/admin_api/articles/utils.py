@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import Tuple, List, Optional
 from core.s3_storage import get_s3_storage
 from core.s3_storage import S3Storage
+from core.media_assets import ASSET_PREFIX, media_assets_enabled, release_asset_refs, store_image_bytes
 import logging
 
 logger = logging.getLogger(__name__)
@@ -90,6 +91,12 @@ def upload_base64_image_to_s3(
         # base64 디코딩
         image_bytes = base64.b64decode(base64_data)
         
+        # 본문 이미지는 내용 주소 저장소 사용 시 assets/{hash[:2]}/{hash}.{ext} (같은 이미지는 재업로드 없음)
+        if image_type != 'thumbnail' and media_assets_enabled():
+            s3_key, url = store_image_bytes(image_bytes, extension)
+            logger.info(f"이미지 저장(내용 주소) - article_id: {article_id}, s3_key: {s3_key}")
+            return url
+        
         # 파일명 생성
         if image_type == 'thumbnail':
             filename = f"thumbnail.{extension}"
@@ -157,15 +164,22 @@ def replace_base64_images_with_s3_urls(html_content: str, article_id: int) -> Tu
     uploaded_keys = []
     new_content = html_content
     
-    for index, (full_tag, base64_data, extension) in enumerate(images):
-        # S3에 업로드
-        s3_url = upload_base64_image_to_s3(
+    # 이미지별 업로드는 서로 독립이므로 S3 스레드 풀로 병렬 처리 (결과는 입력 순서 유지)
+    def _upload(indexed):
+        index, (_full_tag, base64_data, extension) = indexed
+        return upload_base64_image_to_s3(
             base64_data=base64_data,
             extension=extension,
             article_id=article_id,
             image_type='content',
             image_index=index
         )
+    
+    s3_urls = get_s3_storage().map_concurrent(_upload, enumerate(images))
+    
+    for (full_tag, _base64_data, _extension), s3_url in zip(images, s3_urls):
+        if isinstance(s3_url, Exception):
+            s3_url = None
         
         if s3_url:
             # S3 키 추출 (나중에 삭제하기 위해)
@@ -253,37 +267,72 @@ def delete_article_images(article_id: int) -> bool:
     Returns:
         성공 여부
     """
+    return delete_articles_images([article_id])
+
+
+def _article_owned_keys(article_ids: List[int]) -> List[str]:
+    """아티클 본문·썸네일이 가리키는 키 중 해당 아티클 경로(article/YYYY/MM/{id}/...)의 키"""
+    from sites.admin_api.articles.models import Article
+    
+    keys = []
+    rows = Article.objects.filter(id__in=article_ids).values_list('id', 'content', 'thumbnail')
+    for article_id, content, thumbnail in rows:
+        candidates = extract_s3_keys_from_content(content)
+        if thumbnail:
+            candidates.append(S3Storage.extract_key_from_url(thumbnail))
+        for key in candidates:
+            parts = (key or '').split('/')
+            if len(parts) > 4 and parts[0] == 'article' and parts[3] == str(article_id):
+                keys.append(key)
+    return keys
+
+
+def delete_articles_images(article_ids: List[int]) -> bool:
+    """
+    여러 아티클의 이미지를 한 번에 삭제
+    - 아티클별 접두사 목록 조회는 병렬(페이지 끝까지), 삭제는 DeleteObjects 1000건 단위
+    
+    Args:
+        article_ids: 아티클 ID 목록
+    
+    Returns:
+        성공 여부 (일부 키 삭제 실패 시 False)
+    """
+    if not article_ids:
+        return True
     try:
         s3_storage = get_s3_storage()
+        prefixes = [get_article_image_path(article_id) + '/' for article_id in article_ids]
+        listed = s3_storage.map_concurrent(lambda prefix: list(s3_storage.iter_keys(prefix)), prefixes)
         
-        # 아티클 이미지 경로
-        prefix = get_article_image_path(article_id)
+        keys = []
+        for prefix, result in zip(prefixes, listed):
+            if isinstance(result, Exception):
+                logger.warning(f"이미지 목록 조회 실패: {prefix} - {result}")
+                continue
+            keys.extend(result)
         
-        # 해당 경로의 모든 파일 목록 조회
-        files = s3_storage.list_files(prefix=prefix)
+        # 경로가 등록 월 기준이므로 이전 달에 올린 이미지는 위 접두사에 없다 → 본문·썸네일이 가리키는 자기 키도 포함
+        keys.extend(_article_owned_keys(article_ids))
         
-        # 모든 파일 삭제
-        success_count = 0
-        for file_key in files:
-            if s3_storage.delete_file(file_key):
-                success_count += 1
-            else:
-                logger.warning(f"파일 삭제 실패: {file_key}")
-        
-        logger.info(f"아티클 {article_id}의 이미지 {success_count}/{len(files)}개 삭제 완료")
-        return True
+        result = s3_storage.delete_many(keys)
+        logger.info(f"아티클 {len(article_ids)}건의 이미지 {result['deleted']}/{len(keys)}개 삭제 완료")
+        # 공유 자산(assets/)은 지우지 않고 참조만 해제 → 참조 0이면 gc_media_assets 가 정리
+        release_asset_refs('article', article_ids)
+        return not result['errors']
         
     except Exception as e:
         logger.error(f"아티클 이미지 삭제 실패: {e}")
         return False
 
 
-def extract_s3_keys_from_content(html_content: str) -> List[str]:
+def extract_s3_keys_from_content(html_content: str, prefixes: Tuple[str, ...] = ('article/',)) -> List[str]:
     """
     HTML 본문에서 S3 이미지 키 추출
     
     Args:
         html_content: HTML 본문 내용
+        prefixes: 추출할 키 접두사 (기본: 아티클 이미지)
     
     Returns:
         S3 키 리스트
@@ -302,7 +351,7 @@ def extract_s3_keys_from_content(html_content: str) -> List[str]:
         if url and not url.startswith('data:image'):
             key = S3Storage.extract_key_from_url(url)
             # key가 None이거나 비어있을 수 있음
-            if key and key.startswith('article/'):
+            if key and key.startswith(prefixes):
                 keys.append(key)
     
     return keys
@@ -355,8 +404,8 @@ def convert_s3_urls_to_presigned(html_content: str, expires_in: int = 3600) -> s
         key = S3Storage.extract_key_from_url(url)
         # logger.info(f"추출된 S3 키: {key}")
         
-        # article 본문 + 홈페이지 정적 문서(회사소개·약관 등) 이미지 키
-        if key and (key.startswith('article/') or key.startswith('homepage-doc/')):
+        # article 본문 + 홈페이지 정적 문서(회사소개·약관 등) + 내용 주소 자산 이미지 키
+        if key and key.startswith(('article/', 'homepage-doc/', ASSET_PREFIX)):
             try:
                 s3_storage = get_s3_storage()
                 # force_presigned=True로 항상 Presigned URL 생성
@@ -413,7 +462,7 @@ def get_presigned_thumbnail_url(thumbnail_url: str, expires_in: int = 3600) -> O
     
     # S3 URL인 경우 Presigned URL로 변환
     key = S3Storage.extract_key_from_url(thumbnail_url)
-    if key and key.startswith('article/'):
+    if key and key.startswith(('article/', ASSET_PREFIX)):
         try:
             s3_storage = get_s3_storage()
             # force_presigned=True로 항상 Presigned URL 생성
@@ -9,8 +9,7 @@ from django.db.models import Q, F
 from django.utils import timezone
 from openpyxl import Workbook
 
-from apps.content_question.article_list_annotations import annotate_article_question_counts
-from django.core.paginator import Paginator
+from core.pagination import paginate_list
 from datetime import datetime
 import logging
 
@@ -37,11 +36,19 @@ from sites.admin_api.articles.utils import (
     replace_base64_images_with_s3_urls,
     upload_thumbnail_to_s3,
     delete_article_images,
+    delete_articles_images,
     extract_s3_keys_from_content,
     convert_s3_urls_to_presigned,
     get_presigned_thumbnail_url,
 )
 from sites.admin_api.authentication import AdminJWTAuthentication
+from sites.admin_api.files.direct_upload import (
+    adopt_pending_uploads,
+    describe_rejected,
+    find_invalid_uploads,
+    is_owned_key,
+)
+from core.media_assets import ASSET_PREFIX, sync_asset_refs
 from sites.admin_api.menu_codes import MenuCodes
 from sites.admin_api.permissions import MenuPermission
 from core.utils import create_success_response, create_error_response, create_api_response
@@ -67,7 +74,7 @@ ARTICLE_LIST_SORT_FIELDS = {
     'rating': 'rating',
     'commentCount': 'commentCount',
     'highlightCount': 'highlightCount',
-    'answeredQuestionCount': 'answered_question_count',
+    'answeredQuestionCount': 'answeredQuestionCount',
     'bookmarkCount': 'bookmarkCount',
     'publishedAt': 'publishedAt',
 }
@@ -76,7 +83,7 @@ ARTICLE_LIST_SORT_FIELDS = {
 def apply_article_list_sort(queryset, sort_by, sort_order):
     """
     관리자 아티클 목록·엑셀 공통 정렬.
-    annotate_article_question_counts 적용 후 호출할 것.
+    answeredQuestionCount 등은 Article 집계 컬럼(apps.content_question.question_counters)으로 정렬.
     Query: sortBy (camelCase), sortOrder (asc|desc). 기본: createdAt desc.
     """
     sort_by = (sort_by or 'createdAt').strip()
@@ -122,6 +129,8 @@ class ArticleListView(APIView):
         - search: 검색어 (제목, 본문, 작성자)
         - sortBy: 정렬 필드 (viewCount, rating, commentCount, highlightCount,
           answeredQuestionCount, bookmarkCount, publishedAt, createdAt)
+        - cursor: 이전 응답의 nextCursor — keyset 다음 페이지 (total 생략, NULL 허용 정렬 컬럼은 무시)
+        - countMode: none 이면 total 계산 생략 (hasNext만)
         - sortOrder: asc | desc (기본 desc; createdAt 기본도 desc)
         """
         try:
@@ -136,6 +145,8 @@ class ArticleListView(APIView):
             search = request.query_params.get('search')
             sort_by = request.query_params.get('sortBy')
             sort_order = request.query_params.get('sortOrder')
+            cursor = (request.query_params.get('cursor') or '').strip() or None
+            with_total = (request.query_params.get('countMode') or '').strip().lower() != 'none'
             
             # 기본 쿼리셋 (휴지통: status=삭제 SID 또는 레거시 'deleted' 쿼리)
             if is_trash_status_filter(status_filter):
@@ -181,15 +192,22 @@ class ArticleListView(APIView):
                     Q(subtitle__icontains=search)
                 )
             
-            queryset = annotate_article_question_counts(queryset)
             queryset = apply_article_list_sort(queryset, sort_by, sort_order)
 
-            # 페이지네이션
-            paginator = Paginator(queryset, page_size)
-            page_obj = paginator.get_page(page)
+            # 페이지네이션 (total은 필터 시그니처별 캐시, cursor 지정 시 keyset)
+            sort_field = ARTICLE_LIST_SORT_FIELDS.get((sort_by or 'createdAt').strip(), 'createdAt')
+            rows, page_meta = paginate_list(
+                queryset,
+                page,
+                page_size,
+                cursor=cursor,
+                sort_field=sort_field,
+                descending=(sort_order or 'desc').strip().lower() != 'asc',
+                with_total=with_total,
+            )
             
             # 시리얼라이저
-            serializer = ArticleListSerializer(page_obj.object_list, many=True)
+            serializer = ArticleListSerializer(rows, many=True)
             articles_data = serializer.data
             
             # 각 아티클의 썸네일을 Presigned URL로 변환
@@ -203,7 +221,10 @@ class ArticleListView(APIView):
             # 응답 데이터 구성
             result = {
                 'articles': articles_data,
-                'total': paginator.count,
+                'total': page_meta['total'],
+                'totalEstimated': page_meta['totalEstimated'],
+                'hasNext': page_meta['hasNext'],
+                'nextCursor': page_meta['nextCursor'],
                 'page': page,
                 'pageSize': page_size,
             }
@@ -343,24 +364,47 @@ class ArticleDetailView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
+            # 직접 업로드(presign)로 본문에 새로 들어온 이미지가 S3에 있고 presign 정책(형식·크기)과 맞는지 일괄 확인
+            new_content = update_data.get('content', '')
+            if new_content and new_content != old_content:
+                added_keys = set(extract_s3_keys_from_content(new_content)) - set(old_content_keys)
+                rejected = find_invalid_uploads(added_keys)
+                if rejected:
+                    return Response(
+                        create_error_response(describe_rejected(rejected), '01'),
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+            
             # 시리얼라이저로 저장
             serializer.save()
             
-            # 본문의 base64 이미지를 S3 URL로 교체
-            new_content = update_data.get('content', '')
+            # 본문의 base64 이미지를 S3 URL로 교체 (구버전 에디터)
             if new_content and new_content != old_content:
                 # base64 이미지가 있는지 확인
                 if 'data:image' in new_content:
                     new_content_with_urls, uploaded_keys = replace_base64_images_with_s3_urls(new_content, article.id)
                     article.content = new_content_with_urls
                     article.save(update_fields=['content'])
-                    
-                    # 기존 이미지 중 사용되지 않는 것 삭제
-                    new_content_keys = extract_s3_keys_from_content(article.content)
-                    keys_to_delete = set(old_content_keys) - set(new_content_keys)
-                    s3_storage = get_s3_storage()
-                    for key in keys_to_delete:
-                        s3_storage.delete_file(key)
+
+                # ownerId 없이 올린 new/ 이미지 → article/YYYY/MM/{id}/ (삭제 시 함께 정리되도록)
+                adopted_content, adopted_keys = adopt_pending_uploads(article.content, article.id)
+                if adopted_keys:
+                    article.content = adopted_content
+                    article.save(update_fields=['content'])
+                
+                # 기존 이미지 중 사용되지 않는 것 삭제 — 이 아티클 경로(article/YYYY/MM/{id}/)의 키만
+                # (다른 아티클에서 붙여 넣은 이미지는 그 아티클이 아직 쓰고 있을 수 있다)
+                new_content_keys = extract_s3_keys_from_content(article.content)
+                keys_to_delete = {
+                    key for key in set(old_content_keys) - set(new_content_keys)
+                    if is_owned_key(key, 'article', article.id)
+                }
+                if keys_to_delete:
+                    get_s3_storage().delete_many(keys_to_delete)
+            
+            # 내용 주소 자산(assets/) 참조 갱신 — 빠진 자산은 참조 0이 되면 gc_media_assets 가 정리
+            if 'content' in update_data and article.content != old_content:
+                sync_asset_refs('article', article.id, extract_s3_keys_from_content(article.content, prefixes=(ASSET_PREFIX,)))
             
             # 썸네일을 S3에 업로드 (변경된 경우에만)
             # request.data에서 원본 thumbnail 값 가져오기 (base64 데이터일 수 있음)
@@ -566,6 +610,14 @@ class ArticleCreateView(APIView):
                 scheduled_at=validated_data.get('scheduledAt'),
             )
 
+            # 직접 업로드(presign)한 본문 이미지가 S3에 있고 presign 정책(형식·크기)과 맞는지 일괄 확인
+            rejected = find_invalid_uploads(extract_s3_keys_from_content(content))
+            if rejected:
+                return Response(
+                    create_error_response(describe_rejected(rejected), '01'),
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
             # 아티클 생성
             article = Article.objects.create(**validated_data)
             logger.info(f"아티클 생성 완료. ID: {article.id}")
@@ -578,6 +630,12 @@ class ArticleCreateView(APIView):
                     article.content = new_content
                     article.save(update_fields=['content'])
                     logger.info(f"본문 이미지 업로드 완료. 업로드된 이미지 수: {len(uploaded_keys)}")
+                # 신규 작성 중 올린 new/ 이미지 → article/YYYY/MM/{id}/ (삭제 시 함께 정리되도록)
+                adopted_content, adopted_keys = adopt_pending_uploads(article.content, article.id)
+                if adopted_keys:
+                    article.content = adopted_content
+                    article.save(update_fields=['content'])
+                sync_asset_refs('article', article.id, extract_s3_keys_from_content(article.content, prefixes=(ASSET_PREFIX,)))
             
             # 썸네일을 S3에 업로드 (원본 request.data에서 가져옴)
             if thumbnail_data_from_request:
@@ -746,10 +804,12 @@ class ArticleBatchDeleteView(APIView):
             articles = Article.objects.filter(id__in=ids, deletedAt__isnull=True)
             count = articles.count()
             
+            deleted_ids = []
             for article in articles:
                 article.soft_delete(deleted_by=deleted_by)
-                # 관련 이미지 삭제 (S3에서)
-                delete_article_images(article.id)
+                deleted_ids.append(article.id)
+            # 관련 이미지 삭제 (S3에서) — 전체 아티클 키를 모아 DeleteObjects로 일괄 삭제
+            delete_articles_images(deleted_ids)
             
             return Response(
                 create_success_response(
@@ -992,7 +1052,6 @@ class ArticleExportView(APIView):
                     | Q(subtitle__icontains=search)
                 )
 
-            queryset = annotate_article_question_counts(queryset)
             queryset = apply_article_list_sort(queryset, sort_by, sort_order)
 
             wb = Workbook()
@@ -1001,8 +1060,8 @@ class ArticleExportView(APIView):
             ws.append(list(self._HEADERS))
 
             for a in queryset.iterator(chunk_size=500):
-                total_q = int(getattr(a, 'applied_question_count', 0) or 0)
-                answered_q = int(getattr(a, 'answered_question_count', 0) or 0)
+                total_q = int(a.questionCount or 0)
+                answered_q = int(a.answeredQuestionCount or 0)
                 rating_cell = '' if a.rating is None else f'{float(a.rating):.1f}'
                 ws.append(
                     [
@@ -5,9 +5,9 @@
 from rest_framework import viewsets
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.filters import SearchFilter, OrderingFilter
 
+from core.pagination import FastCountPageNumberPagination
 from sites.admin_api.authentication import AdminJWTAuthentication
 from sites.admin_api.menu_codes import MenuCodes
 from sites.admin_api.permissions import MenuPermission
@@ -27,7 +27,7 @@ from .serializers import (
 )
 
 
-class NoticePagination(PageNumberPagination):
+class NoticePagination(FastCountPageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
@@ -62,7 +62,7 @@ class AdminNoticeViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class FAQPagination(PageNumberPagination):
+class FAQPagination(FastCountPageNumberPagination):
     page_size = 50
     page_size_query_param = "page_size"
     max_page_size = 100
@@ -83,7 +83,7 @@ class AdminFAQViewSet(viewsets.ModelViewSet):
         return FAQCreateUpdateSerializer
 
 
-class InquiryPagination(PageNumberPagination):
+class InquiryPagination(FastCountPageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 50
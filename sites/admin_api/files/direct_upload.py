@@ -0,0 +1,267 @@
+"""
+에디터 이미지 S3 직접 업로드 (presigned POST/PUT)
+- 클라이언트가 이미지마다 서명된 폼/URL을 받아 S3에 직접 올리고, 본문에는 S3 URL(키)만 넣어 저장한다
+  (본문 JSON에 base64를 싣지 않으므로 저장 요청이 수 KB로 줄어든다)
+- confirm: head_object 병렬 조회로 업로드 완료·Content-Type·크기를 한 번에 확인
+- 저장 시 본문에 새로 들어온 키도 같은 확인을 거친다 (find_invalid_uploads — ContentLength·ContentType 을 presign 정책과 비교)
+  presign 이 발급한 이름 형식(is_issued_upload_key)만 대상 — base64 업로드(image_0_<uuid>.jpeg)·/files/upload 키 등 기존 키는 검사하지 않는다
+- 신규 작성 중(ownerId 없음) 올린 new/ 키는 저장 후 소유 경로로 옮긴다 (adopt_pending_uploads) — 삭제 시 함께 지워지도록
+- 기존 base64 본문은 replace_base64_images_* 경로로 계속 처리 (구버전 클라이언트 호환)
+"""
+import os
+import re
+import uuid
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from django.conf import settings
+
+from core.s3_storage import get_s3_storage
+
+# purpose → 키 접두사 (convert_s3_urls_to_presigned / extract_s3_keys_from_content 대상 경로와 동일)
+UPLOAD_PURPOSES = {
+    'article': 'article',
+    'video': 'video',
+    'homepage-doc': 'homepage-doc',
+}
+
+ALLOWED_IMAGE_TYPES = {
+    'image/jpeg': 'jpg',
+    'image/jpg': 'jpg',
+    'image/png': 'png',
+    'image/gif': 'gif',
+    'image/webp': 'webp',
+}
+
+# 1회 presign 요청 최대 파일 수
+MAX_FILES_PER_REQUEST = 50
+
+# ownerId 없이 발급한 키의 소유자 자리 (article/YYYY/MM/new/...)
+PENDING_OWNER = 'new'
+
+# build_upload_key 가 발급하는 키 전체 형식 (저장 시 정책 검사 대상)
+_ISSUED_KEY_RE = re.compile(
+    r'^(?:(?:article|video)/\d{4}/\d{2}/(?:\d+|' + PENDING_OWNER + r')/image_[0-9a-f]{32}'
+    r'|homepage-doc/\d{4}/\d{2}/[0-9a-f]{32})\.[a-z0-9]+$'
+)
+
+# 본문 안의 new/ 키 (build_upload_key 형식)
+_PENDING_KEY_RE = re.compile(
+    r'\b(?P<root>article|video)/(?P<ym>\d{4}/\d{2})/' + PENDING_OWNER + r'/(?P<name>image_[0-9a-f]{32}\.[a-z0-9]+)'
+)
+
+
+def _max_bytes() -> int:
+    return int(getattr(settings, 'DIRECT_UPLOAD_IMAGE_MAX_BYTES', 20 * 1024 * 1024))
+
+
+def _expires_in() -> int:
+    return int(getattr(settings, 'DIRECT_UPLOAD_EXPIRES', 600))
+
+
+def build_upload_key(purpose: str, owner_id: Optional[int], content_type: str, filename: str = '') -> str:
+    """
+    업로드 키 생성
+    - article: article/YYYY/MM/{id}/image_{uuid}.{ext} (id 없으면 new/ 아래 — 신규 작성 중)
+    - video: video/YYYY/MM/{id}/image_{uuid}.{ext}
+    - homepage-doc: homepage-doc/YYYY/MM/{uuid}.{ext}
+    """
+    root = UPLOAD_PURPOSES[purpose]
+    ext = ALLOWED_IMAGE_TYPES.get(content_type)
+    if not ext:
+        ext = os.path.splitext(filename or '')[1].lstrip('.').lower() or 'jpg'
+    now = datetime.now()
+    if purpose == 'homepage-doc':
+        return f"{root}/{now:%Y/%m}/{uuid.uuid4().hex}.{ext}"
+    owner = str(owner_id) if owner_id else PENDING_OWNER
+    return f"{root}/{now:%Y/%m}/{owner}/image_{uuid.uuid4().hex}.{ext}"
+
+
+def is_direct_upload_key(key: str) -> bool:
+    """presign으로 발급될 수 있는 경로인지 (confirm 대상 제한)"""
+    if not key or '..' in key:
+        return False
+    return purpose_for_key(key) is not None
+
+
+def is_issued_upload_key(key: str) -> bool:
+    """build_upload_key 형식의 키인지 (presign 으로 발급된 이름만 — 다른 경로로 올라간 기존 키는 False)"""
+    return bool(key) and _ISSUED_KEY_RE.match(key) is not None
+
+
+def is_owned_key(key: str, purpose: str, owner_id) -> bool:
+    """{root}/YYYY/MM/{owner_id}/ 아래 키인지 (다른 콘텐츠에서 복사해 온 이미지는 False — 본문에서 빠져도 지우면 안 된다)"""
+    root = UPLOAD_PURPOSES[purpose]
+    return re.match(rf'{re.escape(root)}/\d{{4}}/\d{{2}}/{re.escape(str(owner_id))}/', key or '') is not None
+
+
+def _normalize_ext(ext: str) -> str:
+    ext = ext.lstrip('.').lower()
+    return 'jpg' if ext == 'jpeg' else ext
+
+
+def purpose_for_key(key: str) -> Optional[str]:
+    """키 접두사 → UPLOAD_PURPOSES 키 (해당 없으면 None)"""
+    for purpose, root in UPLOAD_PURPOSES.items():
+        if (key or '').startswith(f"{root}/"):
+            return purpose
+    return None
+
+
+def create_upload_targets(purpose: str, owner_id: Optional[int], files: List[dict], method: str = 'post') -> List[dict]:
+    """
+    파일별 presigned 업로드 대상 생성
+
+    Args:
+        purpose: UPLOAD_PURPOSES 키
+        owner_id: 아티클/비디오 ID (신규 작성 중이면 None)
+        files: [{'filename', 'contentType', 'size'}, ...]
+        method: 'post' (폼 업로드, 크기 제한을 S3가 검증) 또는 'put'
+
+    Returns:
+        [{'key', 'url', 'fileUrl', 'method', 'fields'|'headers', 'expiresIn', 'maxBytes'}, ...]
+
+    Raises:
+        ValueError: 허용되지 않은 형식·크기
+    """
+    s3_storage = get_s3_storage()
+    max_bytes = _max_bytes()
+    expires_in = _expires_in()
+    targets = []
+    for item in files:
+        content_type = (item.get('contentType') or '').split(';')[0].strip().lower()
+        if content_type not in ALLOWED_IMAGE_TYPES:
+            raise ValueError(f"허용되지 않은 이미지 형식입니다: {content_type or '(없음)'}")
+        size = item.get('size')
+        if size is not None and (int(size) <= 0 or int(size) > max_bytes):
+            raise ValueError(f"이미지는 {max_bytes // (1024 * 1024)}MB 이하만 업로드할 수 있습니다.")
+
+        key = build_upload_key(purpose, owner_id, content_type, item.get('filename') or '')
+        target = {
+            'key': key,
+            'fileUrl': s3_storage.object_url(key),
+            'method': method.upper(),
+            'expiresIn': expires_in,
+            'maxBytes': max_bytes,
+        }
+        if method == 'put':
+            target['url'] = s3_storage.generate_presigned_put(key, content_type, expires_in=expires_in)
+            target['headers'] = {'Content-Type': content_type}
+        else:
+            presigned = s3_storage.generate_presigned_post(
+                key, content_type, max_bytes=max_bytes, expires_in=expires_in
+            )
+            target['url'] = presigned['url']
+            target['fields'] = presigned['fields']
+        targets.append(target)
+    return targets
+
+
+def _policy_violation(key: str, info: Optional[dict], max_bytes: int) -> Optional[str]:
+    """
+    head_object 결과를 presign 정책(허용 이미지 형식, 키 확장자와 같은 형식, 1 ~ max_bytes)과 비교
+
+    Returns:
+        위반 사유 (missing / invalid_type / type_mismatch / empty / too_large) 또는 None
+    """
+    if not info:
+        return 'missing'
+    content_type = (info.get('content_type') or '').split(';')[0].strip().lower()
+    if content_type not in ALLOWED_IMAGE_TYPES:
+        return 'invalid_type'
+    if _normalize_ext(os.path.splitext(key)[1]) != ALLOWED_IMAGE_TYPES[content_type]:
+        return 'type_mismatch'
+    size = info.get('size') or 0
+    if size <= 0:
+        return 'empty'
+    if size > max_bytes:
+        return 'too_large'
+    return None
+
+
+def confirm_uploaded_keys(keys: Iterable[str]) -> Tuple[List[dict], List[dict]]:
+    """
+    업로드된 키를 head_object 병렬 조회로 일괄 확인
+
+    Returns:
+        (confirmed, rejected)
+        confirmed: [{'key', 'url', 'size', 'contentType'}]
+        rejected: [{'key', 'reason'}] — reason: invalid_key / _policy_violation 사유
+    """
+    keys = list(dict.fromkeys(k for k in keys if k))
+    confirmed, rejected = [], []
+    valid = []
+    for key in keys:
+        if is_direct_upload_key(key):
+            valid.append(key)
+        else:
+            rejected.append({'key': key, 'reason': 'invalid_key'})
+    if not valid:
+        return confirmed, rejected
+
+    s3_storage = get_s3_storage()
+    max_bytes = _max_bytes()
+    infos = s3_storage.head_many(valid)
+    for key in valid:
+        info = infos.get(key)
+        reason = _policy_violation(key, info, max_bytes)
+        if reason:
+            rejected.append({'key': key, 'reason': reason})
+            continue
+        confirmed.append({
+            'key': key,
+            'url': s3_storage.object_url(key),
+            'size': info.get('size'),
+            'contentType': (info.get('content_type') or '').split(';')[0].strip().lower(),
+        })
+    return confirmed, rejected
+
+
+def find_invalid_uploads(new_keys: Iterable[str]) -> List[dict]:
+    """
+    저장 직전 확인: 본문의 직접 업로드 키(is_issued_upload_key) 중 S3에 없거나 presign 정책과 다른 키
+    발급 형식이 아닌 키(base64 업로드·/files/upload·다른 콘텐츠에서 복사한 기존 이미지)는 검사하지 않는다.
+
+    Returns:
+        [{'key', 'reason'}]
+    """
+    keys = [k for k in dict.fromkeys(new_keys) if is_issued_upload_key(k)]
+    if not keys:
+        return []
+    _confirmed, rejected = confirm_uploaded_keys(keys)
+    return rejected
+
+
+def describe_rejected(rejected: List[dict]) -> str:
+    """저장 거절 응답 메시지"""
+    return '업로드가 완료되지 않았거나 허용되지 않는 이미지가 있습니다: ' + ', '.join(
+        f"{item['key']}({item['reason']})" for item in rejected
+    )
+
+
+def adopt_pending_uploads(html: Optional[str], owner_id: int) -> Tuple[Optional[str], List[str]]:
+    """
+    신규 작성 중 올린 이미지({root}/YYYY/MM/new/...)를 소유 경로({root}/YYYY/MM/{owner_id}/...)로 옮기고 본문 URL 교체
+    - copy_object 병렬 → 복사된 키만 본문에서 교체 → new/ 원본 일괄 삭제
+    - 복사 실패한 키는 new/ 그대로 둔다 (본문 참조는 유지, 다음 저장 때 다시 시도)
+
+    Returns:
+        (교체된 본문, 옮긴 new/ 키 목록)
+    """
+    if not html or f'/{PENDING_OWNER}/' not in html:
+        return html, []
+    moves = {}
+    for match in _PENDING_KEY_RE.finditer(html):
+        moves[match.group(0)] = f"{match.group('root')}/{match.group('ym')}/{owner_id}/{match.group('name')}"
+    if not moves:
+        return html, []
+
+    s3_storage = get_s3_storage()
+    pending = list(moves)
+    results = s3_storage.map_concurrent(lambda key: s3_storage.copy_file(key, moves[key]), pending)
+    moved = [key for key, ok in zip(pending, results) if ok is True]
+    for key in moved:
+        html = html.replace(key, moves[key])
+    if moved:
+        s3_storage.delete_many(moved)
+    return html, moved
@@ -15,5 +15,9 @@ urlpatterns = [
     path('info/', views.FileInfoView.as_view(), name='file_info_slash'),
     path('list', views.FileListView.as_view(), name='file_list'),
     path('list/', views.FileListView.as_view(), name='file_list_slash'),
+    path('presign', views.DirectUploadPresignView.as_view(), name='file_presign'),
+    path('presign/', views.DirectUploadPresignView.as_view(), name='file_presign_slash'),
+    path('confirm', views.DirectUploadConfirmView.as_view(), name='file_confirm'),
+    path('confirm/', views.DirectUploadConfirmView.as_view(), name='file_confirm_slash'),
 ]
 
@@ -10,7 +10,14 @@ from django.core.files.uploadedfile import InMemoryUploadedFile
 from core.s3_storage import get_s3_storage
 from core.utils import create_success_response, create_error_response
 from sites.admin_api.authentication import AdminJWTAuthentication
-from sites.admin_api.menu_codes import MenuCodes
+from sites.admin_api.menu_codes import MenuCodes, VIDEO_SEMINAR_CODES
+from sites.admin_api.files.direct_upload import (
+    MAX_FILES_PER_REQUEST,
+    UPLOAD_PURPOSES,
+    confirm_uploaded_keys,
+    create_upload_targets,
+    purpose_for_key,
+)
 from sites.admin_api.permissions import MenuPermission
 from rest_framework.permissions import IsAuthenticated
 import os
@@ -367,3 +374,167 @@ class FileListView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+
+
+# 직접 업로드 purpose별 편집 메뉴 권한 (presign·confirm 공통)
+_PURPOSE_MENU_CODES = {
+    'article': MenuCodes.ARTICLE,
+    'video': VIDEO_SEMINAR_CODES,
+    'homepage-doc': MenuCodes.HOMEPAGE_DOC,
+}
+
+
+class DirectUploadPresignView(APIView):
+    """
+    에디터 이미지 S3 직접 업로드용 presigned 폼/URL 발급 API
+    POST /admin-api/files/presign/
+    """
+    authentication_classes = [AdminJWTAuthentication]
+    permission_classes = [IsAuthenticated, MenuPermission]
+
+    def get_menu_code(self, request):
+        """purpose별 편집 메뉴 권한 (알 수 없는 purpose는 공통 파일 권한)"""
+        data = request.data if isinstance(request.data, dict) else {}
+        purpose = data.get('purpose')
+        return _PURPOSE_MENU_CODES.get(purpose, MenuCodes.FILES_COMMON)
+
+    def post(self, request):
+        """
+        요청:
+        {
+            "purpose": "article" | "video" | "homepage-doc",
+            "ownerId": 123,            # 아티클/비디오 ID (신규 작성 중이면 생략)
+            "method": "post" | "put",  # 기본 post (크기 상한을 S3가 검증)
+            "files": [{"filename": "a.png", "contentType": "image/png", "size": 12345}]
+        }
+
+        응답 Result:
+        {
+            "uploads": [
+                {"key": "...", "fileUrl": "...", "method": "POST", "url": "...", "fields": {...},
+                 "expiresIn": 600, "maxBytes": 20971520}
+            ]
+        }
+        클라이언트는 url로 직접 업로드한 뒤 본문 img src에 fileUrl을 넣고 /files/confirm 으로 확인한다.
+        """
+        try:
+            purpose = request.data.get('purpose')
+            files = request.data.get('files')
+            method = (request.data.get('method') or 'post').lower()
+
+            if purpose not in UPLOAD_PURPOSES:
+                return Response(
+                    create_error_response('purpose는 article, video, homepage-doc 중 하나여야 합니다.', '01'),
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if method not in ('post', 'put'):
+                return Response(
+                    create_error_response('method는 post 또는 put만 허용됩니다.', '01'),
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if not files or not isinstance(files, list) or not all(isinstance(f, dict) for f in files):
+                return Response(
+                    create_error_response('files 목록이 필요합니다.', '01'),
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if len(files) > MAX_FILES_PER_REQUEST:
+                return Response(
+                    create_error_response(f'한 번에 최대 {MAX_FILES_PER_REQUEST}개까지 요청할 수 있습니다.', '01'),
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            owner_id = request.data.get('ownerId')
+            if owner_id not in (None, ''):
+                try:
+                    owner_id = int(owner_id)
+                except (TypeError, ValueError):
+                    return Response(
+                        create_error_response('ownerId가 올바르지 않습니다.', '01'),
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+            else:
+                owner_id = None
+
+            try:
+                uploads = create_upload_targets(purpose, owner_id, files, method=method)
+            except ValueError as e:
+                return Response(
+                    create_error_response(str(e), '01'),
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            return Response(
+                create_success_response({'uploads': uploads}, '업로드 URL 발급 성공'),
+                status=status.HTTP_200_OK
+            )
+
+        except Exception as e:
+            return Response(
+                create_error_response(f'업로드 URL 발급 실패: {str(e)}', '99'),
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class DirectUploadConfirmView(APIView):
+    """
+    직접 업로드 완료 확인 API (head_object 병렬 일괄 조회)
+    POST /admin-api/files/confirm/
+    """
+    authentication_classes = [AdminJWTAuthentication]
+    permission_classes = [IsAuthenticated, MenuPermission]
+
+    def get_menu_code(self, request):
+        """
+        presign 과 같은 purpose별 편집 메뉴 권한 — keys 의 경로로 purpose 를 정한다.
+        여러 purpose 가 섞였거나 직접 업로드 경로가 아니면 공통 파일 권한 (post 에서 400)
+        """
+        data = request.data if isinstance(request.data, dict) else {}
+        keys = data.get('keys')
+        purposes = {purpose_for_key(str(k)) for k in keys} if isinstance(keys, list) and keys else set()
+        if len(purposes) == 1 and None not in purposes:
+            return _PURPOSE_MENU_CODES[purposes.pop()]
+        return MenuCodes.FILES_COMMON
+
+    def post(self, request):
+        """
+        요청: {"keys": ["article/2026/10/12/image_....png", ...]}  — 한 purpose 경로의 키만
+
+        응답 Result:
+        {
+            "confirmed": [{"key", "url", "size", "contentType"}],
+            "rejected": [{"key", "reason"}]   # invalid_key / missing / invalid_type / type_mismatch / empty / too_large
+        }
+        """
+        try:
+            keys = request.data.get('keys')
+            if not keys or not isinstance(keys, list):
+                return Response(
+                    create_error_response('keys 목록이 필요합니다.', '01'),
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if len(keys) > MAX_FILES_PER_REQUEST:
+                return Response(
+                    create_error_response(f'한 번에 최대 {MAX_FILES_PER_REQUEST}개까지 확인할 수 있습니다.', '01'),
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if len({purpose_for_key(str(k)) for k in keys}) != 1:
+                # 권한은 purpose 하나 기준으로 확인하므로 섞인 요청은 받지 않는다
+                return Response(
+                    create_error_response('keys는 한 purpose(article, video, homepage-doc) 경로만 보낼 수 있습니다.', '01'),
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            confirmed, rejected = confirm_uploaded_keys(str(k) for k in keys)
+            return Response(
+                create_success_response(
+                    {'confirmed': confirmed, 'rejected': rejected},
+                    '업로드 확인 완료'
+                ),
+                status=status.HTTP_200_OK
+            )
+
+        except Exception as e:
+            return Response(
+                create_error_response(f'업로드 확인 실패: {str(e)}', '99'),
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
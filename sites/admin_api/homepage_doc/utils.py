@@ -9,6 +9,7 @@ from io import BytesIO
 from datetime import datetime
 from typing import Optional
 
+from core.media_assets import media_assets_enabled, store_image_bytes
 from core.s3_storage import get_s3_storage
 from sites.admin_api.articles.utils import extract_base64_images
 
@@ -24,6 +25,10 @@ def _homepage_doc_s3_key(extension: str) -> str:
 def _upload_base64_homepage_image(base64_data: str, extension: str) -> Optional[str]:
     try:
         image_bytes = base64.b64decode(base64_data)
+        if media_assets_enabled():
+            # 내용 주소 저장소: 같은 이미지는 재업로드 없이 기존 자산 URL 사용
+            _key, url = store_image_bytes(image_bytes, extension)
+            return url
         s3_key = _homepage_doc_s3_key(extension)
         content_type_map = {
             'jpeg': 'image/jpeg',
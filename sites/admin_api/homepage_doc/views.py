@@ -15,7 +15,9 @@ from .constants import HOMEPAGE_DOC_TYPES, HOMEPAGE_DOC_TYPES_ORDERED
 from .models import HomepageDocInfo
 from .serializers import HomepageDocReadSerializer, HomepageDocPutSerializer
 from .utils import replace_base64_images_in_homepage_html
-from sites.admin_api.articles.utils import convert_s3_urls_to_presigned
+from sites.admin_api.articles.utils import convert_s3_urls_to_presigned, extract_s3_keys_from_content
+from sites.admin_api.files.direct_upload import describe_rejected, find_invalid_uploads
+from core.media_assets import ASSET_PREFIX, sync_asset_refs
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +120,17 @@ class AdminHomepageDocDetailView(APIView):
         else:
             is_published = existing.is_published if existing else True
 
+        # 직접 업로드(presign)로 새로 들어온 이미지가 S3에 있고 presign 정책(형식·크기)과 맞는지 일괄 확인
+        if 'bodyHtml' in body:
+            old_keys = set(extract_s3_keys_from_content(existing.body_html, prefixes=('homepage-doc/',))) if existing else set()
+            added_keys = set(extract_s3_keys_from_content(body_html, prefixes=('homepage-doc/',))) - old_keys
+            rejected = find_invalid_uploads(added_keys)
+            if rejected:
+                return Response(
+                    create_error_response(describe_rejected(rejected), '01'),
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
         body_html = replace_base64_images_in_homepage_html(body_html or '')
 
         try:
@@ -138,6 +151,7 @@ class AdminHomepageDocDetailView(APIView):
                     obj.is_published = is_published
                     obj.save()
             obj = HomepageDocInfo.objects.get(doc_type=doc_type)
+            sync_asset_refs('homepage_doc', doc_type, extract_s3_keys_from_content(obj.body_html, prefixes=(ASSET_PREFIX,)))
         except Exception as e:
             logger.exception('homepage_doc put')
             return Response(
@@ -13,6 +13,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 
+from core.pagination import cached_count
 from core.utils import create_error_response, create_success_response
 from sites.admin_api.authentication import AdminJWTAuthentication
 from sites.public_api.models import NewsletterSubscriber
@@ -129,7 +130,7 @@ class NewsletterSubscribersListView(APIView):
         page_size = min(int(request.query_params.get('page_size') or 20), 100)
         if page < 1:
             page = 1
-        total = q.count()
+        total, total_estimated = cached_count(q)
         start = (page - 1) * page_size
         items = []
         for o in q[start : start + page_size]:
@@ -146,7 +147,15 @@ class NewsletterSubscribersListView(APIView):
                 }
             )
         return Response(
-            create_success_response({'list': items, 'total': total, 'page': page, 'page_size': page_size}),
+            create_success_response(
+                {
+                    'list': items,
+                    'total': total,
+                    'total_estimated': total_estimated,
+                    'page': page,
+                    'page_size': page_size,
+                }
+            ),
             status=status.HTTP_200_OK,
         )
 
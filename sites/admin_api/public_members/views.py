@@ -5,19 +5,23 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.filters import SearchFilter, OrderingFilter
 from datetime import datetime, time, timedelta
 
+from django.db import transaction
 from django.utils import timezone
-from django.db.models import Avg, Count, Max, Q
+from django.db.models import Count, Max, Q
 
-from core.models import AuditLog
+from core.pagination import FastCountPageNumberPagination
+from core.audit import record_audit
 from core.utils import create_success_response, create_error_response
 from sites.admin_api.authentication import AdminJWTAuthentication
 from sites.admin_api.menu_codes import MenuCodes
 from sites.admin_api.permissions import MenuPermission
 from sites.public_api.models import PublicMemberShip, PublicUserActivityLog, IndeUser
+from sites.public_api.content_rating_sync import member_rating_summary
+from sites.public_api.content_stats import bump_content_stats
+from sites.public_api.recent_views import recent_views_page
 from sites.admin_api.articles.models import Article
 from sites.admin_api.articles.utils import get_presigned_thumbnail_url as article_presigned_thumbnail
 from sites.admin_api.content_publish_syscodes import STATUS_PUBLISHED
@@ -32,7 +36,7 @@ from .serializers import (
 )
 
 
-class PublicMemberPagination(PageNumberPagination):
+class PublicMemberPagination(FastCountPageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 250
@@ -256,7 +260,7 @@ class AdminPublicMemberViewSet(viewsets.ModelViewSet):
             "withdraw_reason", "withdraw_detail_reason",
             "withdraw_ip", "withdraw_user_agent", "updated_at",
         ])
-        AuditLog.objects.create(
+        record_audit(
             user_id=str(request.user.memberShipSid) if getattr(request.user, "memberShipSid", None) else "admin",
             site_slug="admin_api",
             action="update",
@@ -294,7 +298,7 @@ class AdminPublicMemberViewSet(viewsets.ModelViewSet):
             "withdraw_requested_at", "withdraw_completed_at",
             "withdraw_ip", "withdraw_user_agent", "updated_at",
         ])
-        AuditLog.objects.create(
+        record_audit(
             user_id=str(request.user.memberShipSid) if getattr(request.user, "memberShipSid", None) else "admin",
             site_slug="admin_api",
             action="update",
@@ -336,38 +340,9 @@ class AdminPublicMemberViewSet(viewsets.ModelViewSet):
         member = self.get_object()
         page, page_size = self._parse_page(request, default_size=9)
 
-        grouped = (
-            PublicUserActivityLog.objects.filter(user_id=member.pk, activity_type=self.ACTIVITY_VIEW)
-            .values('content_type', 'content_code')
-            .annotate(max_time=Max('reg_date_time'))
-            .order_by('-max_time')
-        )
-        total = grouped.count()
-        total_pages = max(1, (total + page_size - 1) // page_size) if total > 0 else 1
-        if total > 0 and page > total_pages:
-            page = total_pages
-        if total == 0:
-            page = 1
-
-        start = (page - 1) * page_size
-        page_slice = list(grouped[start : start + page_size])
-
-        logs = []
-        for g in page_slice:
-            ct = g['content_type']
-            cc = str(g['content_code']).strip()
-            log = (
-                PublicUserActivityLog.objects.filter(
-                    user_id=member.pk,
-                    activity_type=self.ACTIVITY_VIEW,
-                    content_type=ct,
-                    content_code=cc,
-                )
-                .order_by('-reg_date_time', '-public_user_activity_log_id')
-                .first()
-            )
-            if log:
-                logs.append(log)
+        # 최근 본 프로젝션 (contentType, contentCode 당 최신 VIEW 1건) — 인덱스 순서 페이지 1회
+        rows, total, page = recent_views_page(member.pk, page, page_size)
+        logs = [r.as_activity_log() for r in rows]
 
         list_data = self._attach_content_master_to_logs(logs)
         return Response(
@@ -407,12 +382,15 @@ class AdminPublicMemberViewSet(viewsets.ModelViewSet):
                 create_error_response('contentType, contentCode가 필요합니다.'),
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        PublicUserActivityLog.objects.filter(
-            user_id=member.pk,
-            content_type=content_type,
-            content_code=content_code,
-            activity_type=self.ACTIVITY_BOOKMARK,
-        ).delete()
+        with transaction.atomic():
+            deleted, _ = PublicUserActivityLog.objects.filter(
+                user_id=member.pk,
+                content_type=content_type,
+                content_code=content_code,
+                activity_type=self.ACTIVITY_BOOKMARK,
+            ).delete()
+            if deleted:
+                bump_content_stats(content_type, content_code, invalidate=True, bookmarks=-deleted)
         return Response(create_success_response({'result': 'ok'}), status=status.HTTP_200_OK)
 
     @action(detail=True, methods=["get"], url_path="activity/ratings")
@@ -430,23 +408,10 @@ class AdminPublicMemberViewSet(viewsets.ModelViewSet):
             qs = qs.order_by('rating_value', '-reg_date_time')
         else:
             qs = qs.order_by('-reg_date_time')
-        total = qs.count()
-
-        summary_qs = PublicUserActivityLog.objects.filter(
-            user_id=member.pk,
-            activity_type=self.ACTIVITY_RATING,
-            rating_value__isnull=False,
-        )
-        avg_rating = summary_qs.aggregate(avg=Avg('rating_value'))['avg']
-        summary_count = summary_qs.count()
-        distribution = {}
-        for r in range(1, 6):
-            distribution[str(r)] = summary_qs.filter(rating_value=r).count()
-        summary = {
-            'avgRating': round(float(avg_rating), 1) if avg_rating is not None else 0,
-            'totalCount': summary_count,
-            'distribution': distribution,
-        }
+        # 요약(평균·총 개수·분포)과 목록 total 을 조건부 집계 1회로
+        stats = member_rating_summary(member.pk)
+        total = stats['total']
+        summary = stats['summary']
 
         start = (page - 1) * page_size
         items = list(qs[start : start + page_size])
@@ -0,0 +1,139 @@
+"""
+예약 발행 (아티클 + 비디오/세미나 video 테이블)
+- publish_due: status=예약 AND scheduledAt<=now 행을 공개로 전환 ((status, scheduledAt) 복합 인덱스 범위 스캔)
+  batch_size 건씩 트랜잭션을 나눠 도래 건이 없을 때까지 반복 (cron 1회 실행으로 밀린 예약을 모두 처리)
+  동시에 여러 워커가 돌아도 같은 행을 두 번 처리하지 않도록 SKIP LOCKED 로 잠근다 (지원 DB)
+- next_due_at: 다음 예약 시각 (MIN(scheduledAt)) — publish_scheduled_content --watch 가 그 시각까지 잠든다
+- content_published 시그널: 배치 커밋 후 발송. 하위 캐시·인덱스 갱신은 receiver 로 연결한다
+  - 관리자 목록 count 캐시 무효화 (bulk_update 는 post_save 가 없으므로)
+  - 당일 랭킹 캐시(content_ranking_cache) 재적재 — '최신 발행으로 채움' 순위에 새 글이 바로 들어가도록 (배치당 1회)
+  - Hero 캐시: apps.display_event.hero_cache
+  캐시 무효화는 공유 캐시(REDIS_URL)여야 웹 프로세스에 반영된다 (LocMem 이면 발행 워커 프로세스만 지워짐)
+  큐레이션 목록 ETag 는 참조 콘텐츠 updatedAt(발행 시 갱신)으로 만들고, 검색은 캐시 없이 테이블을 읽으므로 별도 무효화가 없다
+"""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from django.db import connection, transaction
+from django.db.models import Min
+from django.dispatch import Signal, receiver
+from django.utils import timezone
+
+from sites.admin_api.articles.models import Article
+from sites.admin_api.content_publish_syscodes import STATUS_PUBLISHED, STATUS_SCHEDULED
+from sites.admin_api.video.models import Video
+
+logger = logging.getLogger(__name__)
+
+# kwargs: content_type('ARTICLE'|'VIDEO'|'SEMINAR'), ids(list[int]), published_at(datetime),
+#         batch_types(tuple — 같은 배치에서 알림이 가는 content_type 순서, 배치당 1회 작업용)
+content_published = Signal()
+
+
+def _scheduled_qs(model):
+    return model.objects.filter(status=STATUS_SCHEDULED, scheduledAt__isnull=False, deletedAt__isnull=True)
+
+
+def due_ids(now=None) -> Dict[str, list]:
+    """도래한 예약 건 (잠금 없이 조회 — dry-run 용)"""
+    now = now or timezone.now()
+    return {
+        'article': list(_scheduled_qs(Article).filter(scheduledAt__lte=now).order_by('scheduledAt', 'id').values_list('id', flat=True)),
+        'video': list(_scheduled_qs(Video).filter(scheduledAt__lte=now).order_by('scheduledAt', 'id').values_list('id', 'contentType')),
+    }
+
+
+def next_due_at() -> Optional[datetime]:
+    """가장 이른 예약 발행 시각 (없으면 None)"""
+    candidates = [
+        _scheduled_qs(model).aggregate(m=Min('scheduledAt'))['m']
+        for model in (Article, Video)
+    ]
+    candidates = [c for c in candidates if c is not None]
+    return min(candidates) if candidates else None
+
+
+def _lock_due(model, now, batch_size):
+    qs = _scheduled_qs(model).filter(scheduledAt__lte=now).order_by('scheduledAt', 'id')
+    if connection.features.has_select_for_update_skip_locked:
+        qs = qs.select_for_update(skip_locked=True)
+    elif connection.features.has_select_for_update:
+        qs = qs.select_for_update()
+    return list(qs[:batch_size])
+
+
+def _publish_batch(now, batch_size: int) -> Dict[str, List[int]]:
+    """도래 건 최대 batch_size 건(유형별)을 한 트랜잭션에서 공개로 전환, 커밋 후 content_published 발송"""
+    published: Dict[str, List[int]] = {'ARTICLE': [], 'VIDEO': [], 'SEMINAR': []}
+    with transaction.atomic():
+        articles = _lock_due(Article, now, batch_size)
+        for a in articles:
+            a.status = STATUS_PUBLISHED
+            a.publishedAt = a.scheduledAt or now
+            a.updatedAt = now
+        if articles:
+            Article.objects.bulk_update(articles, ['status', 'publishedAt', 'updatedAt'])
+            published['ARTICLE'] = [a.id for a in articles]
+
+        videos = _lock_due(Video, now, batch_size)
+        for v in videos:
+            v.status = STATUS_PUBLISHED
+            v.publishedAt = v.scheduledAt or now
+            v.updatedAt = now
+        if videos:
+            Video.objects.bulk_update(videos, ['status', 'publishedAt', 'updatedAt'])
+            for v in videos:
+                published['SEMINAR' if v.contentType == 'seminar' else 'VIDEO'].append(v.id)
+
+        def _notify():
+            batch_types = tuple(ct for ct, ids in published.items() if ids)
+            for content_type in batch_types:
+                results = content_published.send_robust(
+                    sender=publish_due,
+                    content_type=content_type,
+                    ids=published[content_type],
+                    published_at=now,
+                    batch_types=batch_types,
+                )
+                for func, result in results:
+                    if isinstance(result, Exception):
+                        logger.error('content_published receiver 실패 (%s, %s): %s', content_type, func, result)
+
+        transaction.on_commit(_notify)
+    return published
+
+
+def publish_due(now=None, batch_size: int = 500) -> Dict[str, List[int]]:
+    """
+    도래한 예약 건을 모두 공개로 전환 (batch_size 건씩 트랜잭션을 나눠 남은 건이 없을 때까지).
+    반환: {'ARTICLE': [ids], 'VIDEO': [ids], 'SEMINAR': [ids]} — 배치마다 커밋 후 content_published 발송
+    """
+    now = now or timezone.now()
+    published: Dict[str, List[int]] = {'ARTICLE': [], 'VIDEO': [], 'SEMINAR': []}
+    while True:
+        batch = _publish_batch(now, batch_size)
+        for content_type, ids in batch.items():
+            published[content_type].extend(ids)
+        # 유형별로 batch_size 를 다 채운 경우에만 남은 건이 있을 수 있다
+        if len(batch['ARTICLE']) < batch_size and len(batch['VIDEO']) + len(batch['SEMINAR']) < batch_size:
+            return published
+
+
+@receiver(content_published, dispatch_uid='scheduled_publish.invalidate_list_counts')
+def _invalidate_list_counts(sender, content_type, **kwargs):
+    from core.pagination import invalidate_list_counts
+
+    invalidate_list_counts(Article if content_type == 'ARTICLE' else Video)
+
+
+@receiver(content_published, dispatch_uid='scheduled_publish.refresh_content_ranking')
+def _refresh_content_ranking(sender, content_type, batch_types=(), **kwargs):
+    """배치의 첫 알림에서만 당일 랭킹 재적재 (RECOMMENDED 는 당일 뽑은 3건 유지)"""
+    if batch_types and content_type != batch_types[0]:
+        return
+    from sites.public_api.content_ranking_batch import run_content_ranking_refresh
+
+    run_content_ranking_refresh(keep_recommended=True)
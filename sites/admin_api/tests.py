@@ -0,0 +1,193 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from sites.admin_api.files import direct_upload
+from sites.admin_api.files.views import DirectUploadConfirmView
+from sites.admin_api.menu_codes import MenuCodes, VIDEO_SEMINAR_CODES
+
+
+class _FakeS3:
+    def __init__(self, objects):
+        self.objects = dict(objects)
+        self.copied = []
+        self.deleted = []
+
+    def head_many(self, keys):
+        return {k: self.objects.get(k) for k in keys}
+
+    def object_url(self, key):
+        return f'https://bucket.s3.ap-northeast-2.amazonaws.com/{key}'
+
+    def map_concurrent(self, func, items):
+        return [func(item) for item in items]
+
+    def copy_file(self, source_key, dest_key):
+        if source_key not in self.objects:
+            return False
+        self.objects[dest_key] = self.objects[source_key]
+        self.copied.append((source_key, dest_key))
+        return True
+
+    def delete_many(self, keys):
+        keys = list(keys)
+        self.deleted.extend(keys)
+        return {'deleted': len(keys), 'errors': []}
+
+
+PNG = 'article/2026/10/new/image_' + 'a' * 32 + '.png'
+
+
+class DirectUploadPolicyTests(SimpleTestCase):
+    def _invalid(self, objects, keys):
+        with mock.patch.object(direct_upload, 'get_s3_storage', return_value=_FakeS3(objects)):
+            return {item['key']: item['reason'] for item in direct_upload.find_invalid_uploads(keys)}
+
+    def test_head_object_compared_to_presign_policy(self):
+        big = 'article/2026/10/1/image_' + 'b' * 32 + '.png'
+        html = 'article/2026/10/1/image_' + 'c' * 32 + '.png'
+        jpg_as_png = 'article/2026/10/1/image_' + 'd' * 32 + '.png'
+        missing = 'article/2026/10/1/image_' + 'e' * 32 + '.png'
+        objects = {
+            PNG: {'size': 1024, 'content_type': 'image/png'},
+            big: {'size': 10 ** 9, 'content_type': 'image/png'},
+            html: {'size': 10, 'content_type': 'text/html'},
+            jpg_as_png: {'size': 10, 'content_type': 'image/jpeg'},
+        }
+        self.assertEqual(
+            self._invalid(objects, [PNG, big, html, jpg_as_png, missing, 'other/x.png']),
+            {big: 'too_large', html: 'invalid_type', jpg_as_png: 'type_mismatch', missing: 'missing'},
+        )
+
+    def test_only_presign_issued_keys_are_checked(self):
+        legacy = 'article/2026/10/1/image_0_' + 'f' * 32 + '.jpeg'
+        generic = 'article/2026/10/20261019110000.pdf'
+        doc_generic = 'homepage-doc/2026/10/20261019110000.png'
+        issued_jpeg = 'video/2026/10/3/image_' + 'a' * 32 + '.jpeg'
+        doc_issued = 'homepage-doc/2026/10/' + 'b' * 32 + '.png'
+        objects = {
+            legacy: {'size': 10, 'content_type': 'image/jpeg'},
+            generic: {'size': 10, 'content_type': 'application/pdf'},
+            doc_generic: {'size': 10, 'content_type': 'application/octet-stream'},
+            issued_jpeg: {'size': 10, 'content_type': 'image/jpeg'},
+        }
+        # 기존 base64·/files/upload 키는 검사 제외, 발급 키의 .jpeg 는 image/jpeg 와 같은 형식
+        self.assertEqual(
+            self._invalid(objects, [legacy, generic, doc_generic, issued_jpeg, doc_issued]),
+            {doc_issued: 'missing'},
+        )
+
+    def test_owned_key_matches_only_own_prefix(self):
+        self.assertTrue(direct_upload.is_owned_key('article/2026/10/42/image_0_x.png', 'article', 42))
+        self.assertFalse(direct_upload.is_owned_key('article/2026/10/421/image_x.png', 'article', 42))
+        self.assertFalse(direct_upload.is_owned_key('article/2026/10/7/image_x.png', 'article', 42))
+        self.assertFalse(direct_upload.is_owned_key('video/2026/10/42/image_x.png', 'article', 42))
+
+    def test_pending_uploads_are_moved_under_owner(self):
+        fake = _FakeS3({PNG: {'size': 1, 'content_type': 'image/png'}})
+        body = f'<p><img src="https://bucket.s3.ap-northeast-2.amazonaws.com/{PNG}"></p>'
+        with mock.patch.object(direct_upload, 'get_s3_storage', return_value=fake):
+            new_body, moved = direct_upload.adopt_pending_uploads(body, 42)
+        owned = PNG.replace('/new/', '/42/')
+        self.assertEqual(moved, [PNG])
+        self.assertIn(owned, new_body)
+        self.assertNotIn('/new/', new_body)
+        self.assertEqual(fake.copied, [(PNG, owned)])
+        self.assertEqual(fake.deleted, [PNG])
+
+    def test_failed_copy_keeps_pending_reference(self):
+        fake = _FakeS3({})
+        body = f'<img src="{PNG}">'
+        with mock.patch.object(direct_upload, 'get_s3_storage', return_value=fake):
+            self.assertEqual(direct_upload.adopt_pending_uploads(body, 42), (body, []))
+        self.assertEqual(fake.deleted, [])
+
+
+class DirectUploadConfirmPermissionTests(SimpleTestCase):
+    def _menu_code(self, keys):
+        request = mock.Mock(data={'keys': keys})
+        return DirectUploadConfirmView().get_menu_code(request)
+
+    def test_menu_code_follows_key_purpose(self):
+        self.assertEqual(self._menu_code([PNG]), MenuCodes.ARTICLE)
+        self.assertEqual(self._menu_code(['video/2026/10/3/image_x.png']), VIDEO_SEMINAR_CODES)
+        self.assertEqual(self._menu_code(['homepage-doc/2026/10/x.png']), MenuCodes.HOMEPAGE_DOC)
+
+    def test_mixed_or_unknown_keys_fall_back_to_common_files(self):
+        self.assertEqual(self._menu_code([PNG, 'video/2026/10/3/image_x.png']), MenuCodes.FILES_COMMON)
+        self.assertEqual(self._menu_code(['uploads/x.png']), MenuCodes.FILES_COMMON)
+
+
+class PublishDueTests(TestCase):
+    def _scheduled_article(self, minutes_ago):
+        from sites.admin_api.articles.models import Article
+        from sites.admin_api.content_publish_syscodes import STATUS_SCHEDULED
+
+        return Article.objects.create(
+            title='예약', content='<p>본문</p>', status=STATUS_SCHEDULED,
+            scheduledAt=timezone.now() - timedelta(minutes=minutes_ago),
+        )
+
+    def test_publishes_every_due_row_in_batches(self):
+        from sites.admin_api import scheduled_publish
+        from sites.admin_api.articles.models import Article
+        from sites.admin_api.content_publish_syscodes import STATUS_PUBLISHED
+
+        due = [self._scheduled_article(m) for m in range(1, 6)]
+        future = self._scheduled_article(-60)
+        with mock.patch(
+            'sites.public_api.content_ranking_batch.run_content_ranking_refresh'
+        ) as refresh, self.captureOnCommitCallbacks(execute=True):
+            published = scheduled_publish.publish_due(batch_size=2)
+
+        self.assertEqual(sorted(published['ARTICLE']), sorted(a.id for a in due))
+        self.assertEqual(
+            set(Article.objects.filter(status=STATUS_PUBLISHED).values_list('id', flat=True)),
+            {a.id for a in due},
+        )
+        self.assertNotEqual(Article.objects.get(id=future.id).status, STATUS_PUBLISHED)
+        # 배치 3개(2+2+1) — 랭킹 재적재는 배치마다 1회, 당일 추천은 유지
+        self.assertEqual(refresh.call_count, 3)
+        refresh.assert_called_with(keep_recommended=True)
+
+
+class VideoThumbnailAssetTests(TestCase):
+    PNG_DATA = 'data:image/png;base64,iVBORw0KGgo='
+
+    def setUp(self):
+        self.s3 = mock.Mock()
+        self.s3.upload_file.side_effect = lambda file_obj, key, **kw: f'https://bucket.s3.amazonaws.com/{key}'
+        self.s3.object_url.side_effect = lambda key: f'https://bucket.s3.amazonaws.com/{key}'
+        self.s3.delete_prefix.return_value = {'deleted': 0, 'errors': []}
+        for target in ('core.media_assets.get_s3_storage', 'sites.admin_api.video.utils.get_s3_storage'):
+            patcher = mock.patch(target, return_value=self.s3)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_thumbnail_is_shared_asset_with_refs(self):
+        from types import SimpleNamespace
+
+        from core.models import MediaAsset
+        from sites.admin_api.video import utils
+
+        with self.settings(MEDIA_ASSET_CONTENT_ADDRESSED=True):
+            first = utils.upload_thumbnail_to_s3(self.PNG_DATA, 1)
+            second = utils.upload_thumbnail_to_s3(self.PNG_DATA, 2)
+            self.assertEqual(first, second)
+            self.assertIn('/assets/', first)
+            self.assertTrue(utils.is_shared_asset_url(first))
+            self.assertEqual(self.s3.upload_file.call_count, 1)
+
+            utils.sync_video_asset_refs(SimpleNamespace(id=1, thumbnail=first))
+            utils.sync_video_asset_refs(SimpleNamespace(id=2, thumbnail=second))
+            self.assertEqual(MediaAsset.objects.get().ref_count, 2)
+
+            # 영구 삭제: 공유 자산은 지우지 않고 참조만 해제
+            utils.delete_video_images(1)
+            self.assertEqual(MediaAsset.objects.get().ref_count, 1)
+            utils.sync_video_asset_refs(SimpleNamespace(id=2, thumbnail=None))
+            asset = MediaAsset.objects.get()
+            self.assertEqual(asset.ref_count, 0)
+            self.assertIsNotNone(asset.orphaned_at)
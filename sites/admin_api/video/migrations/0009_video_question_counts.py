@@ -0,0 +1,60 @@
+# Generated manually — 비디오/세미나 질문·답변 집계 컬럼 (Article.questionCount 패턴)
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+VIDEO_CONTENT_TYPES = {"video": "VIDEO", "seminar": "SEMINAR"}
+
+
+def backfill_question_counts(apps, schema_editor):
+    Video = apps.get_model("video", "Video")
+    ContentQuestion = apps.get_model("content_question", "ContentQuestion")
+    ContentQuestionAnswer = apps.get_model("content_question", "ContentQuestionAnswer")
+    for video_type, question_type in VIDEO_CONTENT_TYPES.items():
+        registered = (
+            ContentQuestion.objects.filter(content_type=question_type, content_id=OuterRef("pk"))
+            .values("content_id")
+            .annotate(_cnt=Count("question_id"))
+            .values("_cnt")[:1]
+        )
+        answered = (
+            ContentQuestionAnswer.objects.filter(content_type=question_type, content_id=OuterRef("pk"))
+            .values("content_id")
+            .annotate(_cnt=Count("question_id", distinct=True))
+            .values("_cnt")[:1]
+        )
+        Video.objects.filter(contentType=video_type).update(
+            questionCount=Coalesce(Subquery(registered, output_field=IntegerField()), Value(0)),
+            answeredQuestionCount=Coalesce(Subquery(answered, output_field=IntegerField()), Value(0)),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video", "0008_video_highlight_count"),
+        ("content_question", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="video",
+            name="questionCount",
+            field=models.IntegerField(default=0, verbose_name="질문 수"),
+        ),
+        migrations.AddField(
+            model_name="video",
+            name="answeredQuestionCount",
+            field=models.IntegerField(
+                db_comment="답변이 1건 이상인 질문 수(question_id distinct). 질문당 여러 사용자 답변이 있어도 1로만 집계.",
+                default=0,
+                verbose_name="답변 완료 질문 수",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(fields=["answeredQuestionCount", "id"], name="idx_video_answered_q"),
+        ),
+        migrations.RunPython(backfill_question_counts, migrations.RunPython.noop),
+    ]
@@ -84,8 +84,16 @@ class Video(models.Model):
     # 통계 정보
     viewCount = models.IntegerField(default=0, verbose_name='조회수')
     rating = models.FloatField(null=True, blank=True, verbose_name='평점')
+    ratingSum = models.IntegerField(default=0, verbose_name='별점 합계', db_comment='RATING 로그 ratingValue 합 (rating = ratingSum / ratingCount)')
+    ratingCount = models.IntegerField(default=0, verbose_name='별점 수', db_comment='RATING 로그 건수')
     commentCount = models.IntegerField(default=0, verbose_name='댓글 수')
     bookmarkCount = models.IntegerField(default=0, verbose_name='북마크 수')
+    questionCount = models.IntegerField(default=0, verbose_name='질문 수')
+    answeredQuestionCount = models.IntegerField(
+        default=0,
+        verbose_name='답변 완료 질문 수',
+        db_comment='답변이 1건 이상인 질문 수(question_id distinct). 질문당 여러 사용자 답변이 있어도 1로만 집계.',
+    )
     
     # 추가 정보
     tags = models.JSONField(default=list, blank=True, verbose_name='태그 목록')
@@ -124,6 +132,8 @@ class Video(models.Model):
             models.Index(fields=['speaker'], name='idx_video_speaker'),
             models.Index(fields=['speaker_id'], name='idx_video_speaker_id'),
             models.Index(fields=['editor'], name='idx_video_editor'),
+            models.Index(fields=['answeredQuestionCount', 'id'], name='idx_video_answered_q'),
+            models.Index(fields=['status', 'scheduledAt'], name='idx_video_status_sched'),
         ]
     
     def __str__(self):
@@ -148,14 +148,10 @@ class VideoListSerializer(serializers.ModelSerializer):
     answeredQuestionCount = serializers.SerializerMethodField()
 
     def get_questionCount(self, obj):
-        if hasattr(obj, 'applied_question_count'):
-            return int(obj.applied_question_count)
-        return 0
+        return int(getattr(obj, 'questionCount', 0) or 0)
 
     def get_answeredQuestionCount(self, obj):
-        if hasattr(obj, 'answered_question_count'):
-            return int(obj.answered_question_count)
-        return 0
+        return int(getattr(obj, 'answeredQuestionCount', 0) or 0)
 
     class Meta:
         model = Video
@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import Optional, List
 from core.s3_storage import get_s3_storage
 from core.s3_storage import S3Storage
+from core.media_assets import ASSET_PREFIX, media_assets_enabled, release_asset_refs, store_image_bytes, sync_asset_refs
 import logging
 
 logger = logging.getLogger(__name__)
@@ -75,6 +76,12 @@ def upload_thumbnail_to_s3(thumbnail_data: str, video_id: int) -> Optional[str]:
         # base64 디코딩
         image_bytes = base64.b64decode(base64_data)
         
+        # 내용 주소 저장소 사용 시 assets/{hash[:2]}/{hash}.{ext} (같은 이미지는 재업로드 없음, 참조는 sync_video_asset_refs)
+        if media_assets_enabled():
+            s3_key, url = store_image_bytes(image_bytes, extension)
+            logger.info(f"썸네일 저장(내용 주소) - video_id: {video_id}, s3_key: {s3_key}")
+            return url
+        
         # 파일명 생성
         filename = f"thumbnail.{extension}"
         
@@ -131,19 +138,13 @@ def delete_video_images(video_id: int) -> bool:
         # 비디오 이미지 경로
         prefix = get_video_image_path(video_id)
         
-        # 해당 경로의 모든 파일 목록 조회
-        files = s3_storage.list_files(prefix=prefix)
-        
-        # 모든 파일 삭제
-        success_count = 0
-        for file_key in files:
-            if s3_storage.delete_file(file_key):
-                success_count += 1
-            else:
-                logger.warning(f"파일 삭제 실패: {file_key}")
+        # 해당 경로의 모든 파일을 페이지 단위로 조회해 DeleteObjects로 일괄 삭제
+        result = s3_storage.delete_prefix(prefix + '/')
         
-        logger.info(f"비디오 {video_id}의 이미지 {success_count}/{len(files)}개 삭제 완료")
-        return True
+        logger.info(f"비디오 {video_id}의 이미지 {result['deleted']}개 삭제 완료 (실패 {len(result['errors'])}개)")
+        # 공유 자산(assets/) 썸네일은 지우지 않고 참조만 해제 → 참조 0이면 gc_media_assets 가 정리
+        release_asset_refs('video', [video_id])
+        return not result['errors']
         
     except Exception as e:
         logger.error(f"비디오 이미지 삭제 실패: {e}")
@@ -170,7 +171,7 @@ def get_presigned_thumbnail_url(thumbnail_url: str, expires_in: int = 3600) -> O
     
     # S3 URL인 경우 Presigned URL로 변환
     key = S3Storage.extract_key_from_url(thumbnail_url)
-    if key and key.startswith('video/'):
+    if key and key.startswith(('video/', ASSET_PREFIX)):
         try:
             s3_storage = get_s3_storage()
             # force_presigned=True로 항상 Presigned URL 생성
@@ -182,6 +183,18 @@ def get_presigned_thumbnail_url(thumbnail_url: str, expires_in: int = 3600) -> O
     return thumbnail_url  # S3 URL이 아니면 그대로 반환
 
 
+def is_shared_asset_url(url: Optional[str]) -> bool:
+    """내용 주소 자산(assets/) URL 이면 True — 다른 콘텐츠와 공유될 수 있어 직접 삭제하지 않는다"""
+    key = S3Storage.extract_key_from_url(url) if url else None
+    return bool(key and key.startswith(ASSET_PREFIX))
+
+
+def sync_video_asset_refs(video) -> dict:
+    """비디오 썸네일이 가리키는 내용 주소 자산으로 media_asset_ref 를 맞춘다 (썸네일이 바뀐 뒤 호출)"""
+    key = S3Storage.extract_key_from_url(video.thumbnail) if video.thumbnail else None
+    return sync_asset_refs('video', video.id, [key] if key else [])
+
+
 def presign_video_asset_url(url: Optional[str], expires_in: int = 3600) -> Optional[str]:
     """
     `video/` 접두사 S3 객체 URL을 Presigned로 변환 (썸네일·첨부파일·기타 동일 규칙).
@@ -9,7 +9,7 @@ from django.db.models import Q, F
 from django.utils import timezone
 from django.core.cache import cache
 from openpyxl import Workbook
-from django.core.paginator import Paginator
+from core.pagination import paginate_list
 from datetime import datetime
 import logging
 
@@ -23,8 +23,6 @@ from sites.admin_api.content_publish_syscodes import (
 from sites.admin_api.content_publish_dates import published_at_for_create
 from sites.admin_api.admin_export_xlsx import format_excel_datetime, xlsx_http_response
 from sites.admin_api.curation.curation_resolve import category_label
-from apps.content_question.video_export_stats import video_seminar_question_answer_pairs
-from apps.content_question.video_list_annotations import annotate_video_question_counts
 from sites.admin_api.video.serializers import (
     VideoSerializer,
     VideoListSerializer,
@@ -35,8 +33,12 @@ from sites.admin_api.video.utils import (
     upload_thumbnail_to_s3,
     delete_video_images,
     get_presigned_thumbnail_url,
+    is_shared_asset_url,
+    sync_video_asset_refs,
 )
+from sites.admin_api.articles.utils import extract_s3_keys_from_content
 from sites.admin_api.authentication import AdminJWTAuthentication
+from sites.admin_api.files.direct_upload import adopt_pending_uploads, describe_rejected, find_invalid_uploads
 from sites.admin_api.menu_codes import VIDEO_SEMINAR_CODES
 from sites.admin_api.permissions import MenuPermission
 from core.utils import create_success_response, create_error_response
@@ -52,7 +54,7 @@ VIDEO_LIST_SORT_FIELDS = {
     "viewCount": "viewCount",
     "rating": "rating",
     "commentCount": "commentCount",
-    "answeredQuestionCount": "answered_question_count",
+    "answeredQuestionCount": "answeredQuestionCount",
     "bookmarkCount": "bookmarkCount",
     "publishedAt": "publishedAt",
 }
@@ -60,7 +62,7 @@ VIDEO_LIST_SORT_FIELDS = {
 
 def apply_video_list_sort(queryset, sort_by, sort_order):
     """
-    annotate_video_question_counts 적용 후 호출.
+    answeredQuestionCount 등은 Video 집계 컬럼(apps.content_question.question_counters)으로 정렬.
     Query: sortBy (camelCase), sortOrder (asc|desc). 기본: createdAt desc.
     레거시 sort=viewCount|rating|createdAt 만 넘기면 sortBy로 간주.
     """
@@ -118,6 +120,8 @@ class VideoListView(APIView):
         - searchType: 검색 타입 (title, speaker, keyword)
         - sortBy: 정렬 필드 (createdAt, viewCount, rating, commentCount,
           answeredQuestionCount, bookmarkCount, publishedAt)
+        - cursor: 이전 응답의 nextCursor — keyset 다음 페이지 (total 생략, NULL 허용 정렬 컬럼은 무시)
+        - countMode: none 이면 total 계산 생략 (hasNext만)
         - sortOrder: asc | desc (기본 desc)
         - sort: 레거시 — sortBy 없을 때만 사용 (createdAt, viewCount, rating)
         """
@@ -135,6 +139,8 @@ class VideoListView(APIView):
             search_type = request.query_params.get('searchType', 'all')  # all, title, speaker, keyword
             sort_by = (request.query_params.get('sortBy') or '').strip()
             sort_order = request.query_params.get('sortOrder')
+            cursor = (request.query_params.get('cursor') or '').strip() or None
+            with_total = (request.query_params.get('countMode') or '').strip().lower() != 'none'
             legacy_sort = request.query_params.get('sort', 'createdAt')
             if not sort_by and legacy_sort in ('createdAt', 'viewCount', 'rating'):
                 sort_by = legacy_sort
@@ -198,15 +204,22 @@ class VideoListView(APIView):
                         Q(tags__icontains=search)
                     )
             
-            queryset = annotate_video_question_counts(queryset)
             queryset = apply_video_list_sort(queryset, sort_by, sort_order)
 
-            # 페이지네이션
-            paginator = Paginator(queryset, page_size)
-            page_obj = paginator.get_page(page)
+            # 페이지네이션 (total은 필터 시그니처별 캐시, cursor 지정 시 keyset)
+            sort_field = VIDEO_LIST_SORT_FIELDS.get((sort_by or 'createdAt').strip(), 'createdAt')
+            rows, page_meta = paginate_list(
+                queryset,
+                page,
+                page_size,
+                cursor=cursor,
+                sort_field=sort_field,
+                descending=(sort_order or 'desc').strip().lower() != 'asc',
+                with_total=with_total,
+            )
             
             # 시리얼라이저
-            serializer = VideoListSerializer(page_obj.object_list, many=True)
+            serializer = VideoListSerializer(rows, many=True)
             videos_data = serializer.data
             
             # 각 비디오의 썸네일을 Presigned URL로 변환
@@ -225,7 +238,10 @@ class VideoListView(APIView):
             # 응답 데이터 구성
             result = {
                 'videos': videos_data,
-                'total': paginator.count,
+                'total': page_meta['total'],
+                'totalEstimated': page_meta['totalEstimated'],
+                'hasNext': page_meta['hasNext'],
+                'nextCursor': page_meta['nextCursor'],
                 'page': page,
                 'pageSize': page_size,
             }
@@ -335,7 +351,6 @@ class VideoExportView(APIView):
                         | Q(tags__icontains=search)
                     )
 
-            queryset = annotate_video_question_counts(queryset)
             queryset = apply_video_list_sort(queryset, sort_by, sort_order)
 
             rows = list(queryset.only(
@@ -350,9 +365,10 @@ class VideoExportView(APIView):
                 'viewCount',
                 'commentCount',
                 'bookmarkCount',
+                'questionCount',
+                'answeredQuestionCount',
                 'createdAt',
             ))
-            stats = video_seminar_question_answer_pairs(rows)
 
             wb = Workbook()
             ws = wb.active
@@ -360,7 +376,7 @@ class VideoExportView(APIView):
             ws.append(list(self._HEADERS))
 
             for v in rows:
-                answered_q, total_q = stats.get(v.id, (0, 0))
+                answered_q, total_q = int(v.answeredQuestionCount or 0), int(v.questionCount or 0)
                 rating_cell = '' if v.rating is None else f'{float(v.rating):.1f}'
                 ws.append(
                     [
@@ -513,10 +529,29 @@ class VideoDetailView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
+            # 직접 업로드(presign, purpose=video)로 본문에 새로 들어온 이미지가 S3에 있고 presign 정책과 맞는지 일괄 확인
+            new_body = serializer.validated_data.get('body')
+            if new_body and new_body != video.body:
+                added_keys = set(extract_s3_keys_from_content(new_body, prefixes=('video/',))) - set(
+                    extract_s3_keys_from_content(video.body, prefixes=('video/',))
+                )
+                rejected = find_invalid_uploads(added_keys)
+                if rejected:
+                    return Response(
+                        create_error_response(describe_rejected(rejected), '01'),
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+
             # 시리얼라이저로 저장
             serializer.save()
             video.refresh_from_db()
 
+            # ownerId 없이 올린 new/ 이미지 → video/YYYY/MM/{id}/
+            adopted_body, adopted_keys = adopt_pending_uploads(video.body, video.id)
+            if adopted_keys:
+                video.body = adopted_body
+                video.save(update_fields=['body'])
+
             # Stream ID가 바뀌거나 외부 URL로 전환되어 제거된 경우 기존 Cloudflare 자산 삭제
             if old_video_stream_id and video.videoStreamId != old_video_stream_id:
                 try:
@@ -530,11 +565,13 @@ class VideoDetailView(APIView):
             if 'thumbnail' in request.data:
                 original_thumbnail = request.data.get('thumbnail')
                 
+                # 공유 자산(assets/) 썸네일은 직접 지우지 않는다 — 참조 해제 후 gc_media_assets 가 정리
+                delete_old_key = old_thumbnail_key if not is_shared_asset_url(old_thumbnail) else None
                 if original_thumbnail is None or original_thumbnail == '':
                     # 썸네일 삭제
-                    if old_thumbnail_key:
+                    if delete_old_key:
                         s3_storage = get_s3_storage()
-                        s3_storage.delete_file(old_thumbnail_key)
+                        s3_storage.delete_file(delete_old_key)
                     video.thumbnail = None
                     video.save(update_fields=['thumbnail'])
                 else:
@@ -547,13 +584,15 @@ class VideoDetailView(APIView):
                             
                             # 기존 썸네일 삭제 (새 썸네일과 키가 다른 경우)
                             new_thumbnail_key = S3Storage.extract_key_from_url(new_thumbnail_url)
-                            if old_thumbnail_key and old_thumbnail_key != new_thumbnail_key:
+                            if delete_old_key and delete_old_key != new_thumbnail_key:
                                 s3_storage = get_s3_storage()
-                                s3_storage.delete_file(old_thumbnail_key)
+                                s3_storage.delete_file(delete_old_key)
                     elif original_thumbnail != old_thumbnail:
                         # URL이 변경된 경우
                         video.thumbnail = original_thumbnail
                         video.save(update_fields=['thumbnail'])
+                if video.thumbnail != old_thumbnail:
+                    sync_video_asset_refs(video)
             
             # 응답 데이터 생성
             serializer = VideoSerializer(video)
@@ -667,7 +706,24 @@ class VideoCreateView(APIView):
                 status=validated_data.get('status'),
                 scheduled_at=validated_data.get('scheduledAt'),
             )
+
+            # 직접 업로드(presign, purpose=video)한 본문 이미지가 S3에 있고 presign 정책과 맞는지 일괄 확인
+            rejected = find_invalid_uploads(
+                extract_s3_keys_from_content(validated_data.get('body'), prefixes=('video/',))
+            )
+            if rejected:
+                return Response(
+                    create_error_response(describe_rejected(rejected), '01'),
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
             video = Video.objects.create(**validated_data)
+
+            # 신규 작성 중 올린 new/ 이미지 → video/YYYY/MM/{id}/ (영구 삭제 시 함께 정리되도록)
+            adopted_body, adopted_keys = adopt_pending_uploads(video.body, video.id)
+            if adopted_keys:
+                video.body = adopted_body
+                video.save(update_fields=['body'])
             
             # 썸네일이 base64인 경우 S3에 업로드
             if is_base64_thumbnail:
@@ -675,6 +731,8 @@ class VideoCreateView(APIView):
                 if thumbnail_url:
                     video.thumbnail = thumbnail_url
                     video.save(update_fields=['thumbnail'])
+            if video.thumbnail:
+                sync_video_asset_refs(video)
             
             # 응답 데이터 생성
             serializer = VideoSerializer(video)
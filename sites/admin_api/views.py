@@ -9,7 +9,9 @@ from django.contrib.auth import authenticate
 from sites.admin_api.serializers import LoginSerializer, RefreshTokenSerializer
 from sites.admin_api.utils import create_admin_jwt_tokens
 from sites.admin_api.authentication import AdminJWTAuthentication
-from core.models import Account, AuditLog
+from core.audit import record_audit
+from core.throttling import AccountRateThrottle, IPRateThrottle
+from core.models import Account
 
 
 class LoginView(APIView):
@@ -18,6 +20,10 @@ class LoginView(APIView):
     이메일과 비밀번호로 로그인하여 JWT 토큰을 발급받습니다.
     """
     permission_classes = [AllowAny]  # 로그인은 인증 불필요
+    # IP·이메일별 요청 제한 (비밀번호 해시 검증 전)
+    throttle_classes = [IPRateThrottle, AccountRateThrottle]
+    throttle_scope = 'admin_login'
+    throttle_account_fields = ('email',)
     
     def post(self, request):
         """
@@ -61,7 +67,7 @@ class LoginView(APIView):
             # 비밀번호 확인
             if not user.check_password(password):
                 # 로그인 실패 로그 기록
-                AuditLog.objects.create(
+                record_audit(
                     user_id=str(user.id),  # Account의 id 저장
                     site_slug='admin_api',
                     action='login',
@@ -79,7 +85,7 @@ class LoginView(APIView):
             tokens = create_admin_jwt_tokens(user)
             
             # 로그인 성공 로그 기록
-            AuditLog.objects.create(
+            record_audit(
                 user_id=str(user.id),  # Account의 id 저장
                 site_slug='admin_api',
                 action='login',
@@ -211,7 +217,7 @@ class LogoutView(APIView):
             # request.user가 Account 또는 AdminMemberShip일 수 있음
             user_id_value = str(request.user.id) if hasattr(request.user, 'id') else str(request.user.memberShipSid) if hasattr(request.user, 'memberShipSid') else None
             
-            AuditLog.objects.create(
+            record_audit(
                 user_id=user_id_value,  # Account의 id 또는 AdminMemberShip의 memberShipSid 저장
                 site_slug='admin_api',
                 action='logout',
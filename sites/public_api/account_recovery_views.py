@@ -2,11 +2,11 @@
 아이디 찾기·비밀번호 재설정 API.
 
 - SMS는 모두 `aligo_client.send_sms` (phoneVerificationAligo.md).
+- 요청 제한: core.throttling (IP·번호·계정별, 핸들러 전에 거절). 이메일·번호별 발송 한도는 초과해도 200 (가입 여부 노출 방지).
 - 상세 플로우: userIdPwFindPlan.md
 """
 import logging
 import random
-import time
 from datetime import timedelta
 
 from django.conf import settings
@@ -19,6 +19,13 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from core.mail import send_email
+from core.throttling import (
+    AccountRateThrottle,
+    IPRateThrottle,
+    PhoneRateThrottle,
+    limiter_for,
+    record_rejection,
+)
 from sites.public_api.account_recovery import (
     create_password_reset_jwt,
     new_password_reset_nonce,
@@ -74,26 +81,25 @@ def _active_member_by_phone_any(norm: str):
     return None
 
 
+def _rate_limit_send(bucket: str, ident: str) -> bool:
+    """이메일·번호별 발송 한도 (DEFAULT_THROTTLE_RATES[bucket]). 초과 시 False."""
+    limiter = limiter_for(bucket)
+    if limiter is None:
+        return True
+    allowed, _ = limiter.hit(ident)
+    if not allowed:
+        record_rejection(bucket, ident)
+    return allowed
+
+
 def _rate_limit_pw_reset_send(email_norm: str) -> bool:
     """1분당 최대 3회 발송 허용. 초과 시 False."""
-    bucket = int(time.time() // 60)
-    k = f'pw_reset_rl:{email_norm}:{bucket}'
-    n = cache.get(k) or 0
-    if n >= 3:
-        return False
-    cache.set(k, n + 1, 120)
-    return True
+    return _rate_limit_send('pw_reset_send.email', email_norm)
 
 
 def _rate_limit_pw_reset_send_phone(phone_norm: str) -> bool:
     """휴대폰 경로 — 1분당 최대 3회 SMS 발송 허용."""
-    bucket = int(time.time() // 60)
-    k = f'pw_reset_rl_phone:{phone_norm}:{bucket}'
-    n = cache.get(k) or 0
-    if n >= 3:
-        return False
-    cache.set(k, n + 1, 120)
-    return True
+    return _rate_limit_send('pw_reset_send.phone', phone_norm)
 
 
 def _password_policy_ok(raw: str) -> bool:
@@ -108,6 +114,8 @@ class SendSmsFindIdView(APIView):
     """휴대폰 인증번호 발송 — 가입된 LOCAL 번호만 실제 발송 (아이디 찾기)."""
 
     permission_classes = [AllowAny]
+    throttle_classes = [IPRateThrottle, PhoneRateThrottle]
+    throttle_scope = 'find_id_sms'
 
     def post(self, request):
         raw = (request.data.get('phone') or '').strip()
@@ -167,6 +175,8 @@ class FindIdView(APIView):
     """휴대폰 SMS 인증 완료 후 LOCAL 계정 이메일 반환."""
 
     permission_classes = [AllowAny]
+    throttle_classes = [IPRateThrottle]
+    throttle_scope = 'find_id'
 
     def post(self, request):
         raw_phone = (request.data.get('phone') or '').strip()
@@ -195,6 +205,8 @@ class FindIdView(APIView):
 
 class SendPasswordResetCodeView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = [IPRateThrottle]
+    throttle_scope = 'pw_reset_send'
 
     def post(self, request):
         email_raw = (request.data.get('email') or '').strip()
@@ -306,6 +318,15 @@ class SendPasswordResetCodeView(APIView):
 
 class VerifyPasswordResetCodeView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = [IPRateThrottle, AccountRateThrottle]
+    throttle_scope = 'pw_reset_verify'
+
+    def get_throttle_account(self, request):
+        """이메일 또는 휴대폰 번호 (정규화) — 코드 대입 시도를 계정 단위로 제한"""
+        email_norm = normalize_email((request.data.get('email') or '').strip())
+        if email_norm:
+            return email_norm
+        return normalize_phone_kr((request.data.get('phone') or '').strip()) or None
 
     def post(self, request):
         email_norm = normalize_email((request.data.get('email') or '').strip())
@@ -373,6 +394,8 @@ class VerifyPasswordResetCodeView(APIView):
 
 class ResetPasswordView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = [IPRateThrottle]
+    throttle_scope = 'pw_reset'
 
     def post(self, request):
         reset_token = (request.data.get('reset_token') or '').strip()
@@ -25,8 +25,32 @@ from sites.admin_api.content_author.s3_utils import profile_image_to_presigned
 from sites.public_api.article_preview import preview_content_html
 from sites.public_api.library_useractivity_views import _get_member
 from sites.public_api.content_share_service import resolve_share_token
+from core.http_cache import (
+    MEMBER_PRIVATE,
+    NO_STORE,
+    PUBLIC_LIST,
+    PUBLIC_REVALIDATE,
+    VARY_MEMBER,
+    apply_cache_headers,
+    conditional_response,
+    make_etag,
+    model_stamp,
+    presign_window,
+)
 from core.utils import create_success_response, create_error_response
 
+# 응답에 드러나는 값 중 updatedAt 을 바꾸지 않고 갱신되는 카운터까지 포함 (F() UPDATE)
+ARTICLE_STAMP_FIELDS = (
+    'id', 'updatedAt', 'viewCount', 'rating', 'commentCount', 'highlightCount', 'bookmarkCount',
+    'questionCount', 'answeredQuestionCount',
+)
+AUTHOR_STAMP_FIELDS = ('id', 'updated_at')
+
+
+def _article_etag_stamp(article):
+    """아티클 + 연결 작성자(select_related) 버전 스탬프"""
+    return model_stamp(article, ARTICLE_STAMP_FIELDS), model_stamp(getattr(article, 'author_id', None), AUTHOR_STAMP_FIELDS)
+
 
 def _public_client_ip(request):
     """공개 상세 조회수 중복 억제용 클라이언트 IP (비디오 상세와 동일 규칙)."""
@@ -104,6 +128,8 @@ class PublicArticleListView(APIView):
     """
     permission_classes = [AllowAny]
     authentication_classes = []
+    # RequestInstrumentationMiddleware 쿼리 예산 (popular+category: 랭킹·꼬리·본문 3건 + 여유)
+    query_budget = 4
 
     def get(self, request):
         """
@@ -169,8 +195,6 @@ class PublicArticleListView(APIView):
                     a = by_id.get(i)
                     if a:
                         page_objs.append(a)
-                serializer = ArticleListSerializer(page_objs, many=True)
-                articles_data = list(serializer.data)
             else:
                 if sort == 'popular':
                     queryset = queryset.order_by('-viewCount', '-createdAt')
@@ -179,32 +203,41 @@ class PublicArticleListView(APIView):
 
                 paginator = Paginator(queryset, page_size)
                 page_obj = paginator.get_page(page)
-                serializer = ArticleListSerializer(page_obj.object_list, many=True)
-                articles_data = list(serializer.data)
+                page_objs = list(page_obj.object_list)
                 total = paginator.count
 
-            for article_data in articles_data:
-                if article_data.get('thumbnail'):
-                    article_data['thumbnail'] = get_presigned_thumbnail_url(
-                        article_data['thumbnail'],
-                        expires_in=3600,
-                    )
-                if article_data.get('authorProfileImage'):
-                    article_data['authorProfileImage'] = profile_image_to_presigned(
-                        article_data['authorProfileImage'],
-                        expires_in=3600,
-                    )
-
-            result = {
-                'articles': articles_data,
-                'total': total,
-                'page': page,
-                'pageSize': page_size,
-            }
-            return Response(
-                create_success_response(result, '아티클 목록 조회 성공'),
-                status=status.HTTP_200_OK,
+            # 직렬화·presign 전에 페이지 행 스탬프로 ETag — 일치하면 304
+            etag = make_etag(
+                'article_list', total, page, page_size, presign_window(),
+                [_article_etag_stamp(a) for a in page_objs],
             )
+
+            def build():
+                articles_data = list(ArticleListSerializer(page_objs, many=True).data)
+                for article_data in articles_data:
+                    if article_data.get('thumbnail'):
+                        article_data['thumbnail'] = get_presigned_thumbnail_url(
+                            article_data['thumbnail'],
+                            expires_in=3600,
+                        )
+                    if article_data.get('authorProfileImage'):
+                        article_data['authorProfileImage'] = profile_image_to_presigned(
+                            article_data['authorProfileImage'],
+                            expires_in=3600,
+                        )
+
+                result = {
+                    'articles': articles_data,
+                    'total': total,
+                    'page': page,
+                    'pageSize': page_size,
+                }
+                return Response(
+                    create_success_response(result, '아티클 목록 조회 성공'),
+                    status=status.HTTP_200_OK,
+                )
+
+            return conditional_response(request, etag, PUBLIC_LIST, build)
         except (ValueError, TypeError) as e:
             return Response(
                 create_error_response(f'잘못된 요청 파라미터: {str(e)}'),
@@ -228,6 +261,8 @@ class PublicArticleDetailView(APIView):
     """
     permission_classes = [AllowAny]
     authentication_classes = []
+    # 조회·조회수 갱신·재조회·회원·공유 토큰
+    query_budget = 6
 
     def get(self, request, id):
         try:
@@ -251,37 +286,45 @@ class PublicArticleDetailView(APIView):
                 cache.set(view_cache_key, 1, 30)
             article.refresh_from_db(fields=['viewCount'])
 
-            serializer = ArticleSerializer(article)
-            data = serializer.data.copy()
-
             member = _get_member(request)
             is_member = member is not None
             share_ent = _article_share_entitlement(request, article.id)
             full_body = is_member or share_ent
-            content_truncated = False
-            if not full_body and data.get('content'):
-                raw_content = data['content']
-                pct = article.previewLength
-                data['content'], content_truncated = preview_content_html(raw_content, pct)
-            data['contentTruncated'] = content_truncated
-            data['shareEntitlement'] = bool(share_ent and not is_member)
 
-            if data.get('content'):
-                data['content'] = convert_s3_urls_to_presigned(data['content'], expires_in=3600)
-            if data.get('thumbnail'):
-                data['thumbnail'] = get_presigned_thumbnail_url(data['thumbnail'], expires_in=3600)
-            if data.get('authorProfileImage'):
-                data['authorProfileImage'] = profile_image_to_presigned(
-                    data['authorProfileImage'], expires_in=3600
+            def build():
+                serializer = ArticleSerializer(article)
+                data = serializer.data.copy()
+                content_truncated = False
+                if not full_body and data.get('content'):
+                    raw_content = data['content']
+                    pct = article.previewLength
+                    data['content'], content_truncated = preview_content_html(raw_content, pct)
+                data['contentTruncated'] = content_truncated
+                data['shareEntitlement'] = bool(share_ent and not is_member)
+
+                if data.get('content'):
+                    data['content'] = convert_s3_urls_to_presigned(data['content'], expires_in=3600)
+                if data.get('thumbnail'):
+                    data['thumbnail'] = get_presigned_thumbnail_url(data['thumbnail'], expires_in=3600)
+                if data.get('authorProfileImage'):
+                    data['authorProfileImage'] = profile_image_to_presigned(
+                        data['authorProfileImage'], expires_in=3600
+                    )
+
+                return Response(
+                    create_success_response(data, '아티클 조회 성공'),
+                    status=status.HTTP_200_OK,
                 )
 
-            resp = Response(
-                create_success_response(data, '아티클 조회 성공'),
-                status=status.HTTP_200_OK,
-            )
             if share_ent and not is_member:
-                resp['Cache-Control'] = 'private, no-store'
-            return resp
+                # 공유 링크로 열린 전문 — 저장·재검증 모두 하지 않음
+                return apply_cache_headers(build(), None, NO_STORE, VARY_MEMBER)
+            # 회원(전문)·비회원(미리보기) 본문이 다르므로 ETag 에 구분을 넣고 Vary 로 공유 캐시 분리.
+            # 조회수가 매 요청 집계되므로 CDN 도 항상 재검증 (304 로 본문만 절약)
+            audience = 'member' if is_member else 'guest'
+            etag = make_etag('article_detail', audience, presign_window(), _article_etag_stamp(article))
+            policy = MEMBER_PRIVATE if is_member else PUBLIC_REVALIDATE
+            return conditional_response(request, etag, policy, build, VARY_MEMBER)
         except Exception as e:
             return Response(
                 create_error_response(f'아티클 조회 실패: {str(e)}'),
@@ -0,0 +1,112 @@
+"""
+요청 단위 공개 API 인증 컨텍스트 (PublicAuthContextMiddleware 가 request.auth_context 로 주입)
+
+- access 토큰 추출·JWT 검증은 요청당 1회 (처음 접근할 때)
+- 회원(PublicMemberShip) 조회도 요청당 1회 — PublicJWTAuthentication·BoardJWTAuthentication·뷰 헬퍼(_get_member 등)가 같은 인스턴스를 공유
+- (선택) PUBLIC_AUTH_PRINCIPAL_CACHE_TTL > 0 이면 member_sid → 회원 인스턴스를 공용 캐시에 보관해 조회 0회
+  회원 저장·삭제 시 캐시 삭제. LocMem 처럼 프로세스별 캐시면 다른 프로세스(관리 커맨드 등)의 변경은 TTL 안에서 늦게 반영된다.
+- 오류 처리(401 메시지, AuthenticationFailed 여부)는 기존처럼 호출하는 쪽이 결정
+"""
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.functional import cached_property
+
+from sites.public_api.models import PublicMemberShip
+from sites.public_api.utils import get_token_from_request, verify_jwt_token
+
+CACHE_PREFIX = 'auth_member:'
+
+
+def _principal_ttl() -> int:
+    return int(getattr(settings, 'PUBLIC_AUTH_PRINCIPAL_CACHE_TTL', 0) or 0)
+
+
+def _cache_key(member_sid: int) -> str:
+    return f"{CACHE_PREFIX}{member_sid}"
+
+
+class PublicAuthContext:
+    """
+    요청의 access 토큰·payload·회원을 지연 계산해 보관
+
+    Attributes:
+        token: Bearer 헤더 또는 accessToken 쿠키 값 ('' 이면 토큰 없음)
+        payload: 검증된 access payload (없거나 만료·위조면 None)
+        member_sid: payload 의 user_id (형식 오류면 None)
+        member: 활성 PublicMemberShip (없으면 None)
+    """
+
+    def __init__(self, request):
+        self._request = request
+
+    @cached_property
+    def token(self) -> str:
+        return get_token_from_request(self._request) or ''
+
+    @cached_property
+    def payload(self) -> Optional[dict]:
+        return verify_jwt_token(self.token, token_type='access') if self.token else None
+
+    @cached_property
+    def member_sid(self) -> Optional[int]:
+        user_id = self.payload.get('user_id') if self.payload else None
+        if not user_id:
+            return None
+        try:
+            return int(user_id)
+        except (TypeError, ValueError):
+            return None
+
+    @cached_property
+    def member(self) -> Optional[PublicMemberShip]:
+        if self.member_sid is None:
+            return None
+        ttl = _principal_ttl()
+        if ttl > 0:
+            member = cache.get(_cache_key(self.member_sid))
+            if member is not None:
+                return member
+        try:
+            member = PublicMemberShip.objects.get(member_sid=self.member_sid, is_active=True)
+        except PublicMemberShip.DoesNotExist:
+            return None
+        if ttl > 0:
+            cache.set(_cache_key(self.member_sid), member, ttl)
+        return member
+
+
+def get_auth_context(request) -> PublicAuthContext:
+    """
+    request(DRF Request 또는 HttpRequest)의 인증 컨텍스트.
+    미들웨어를 거치지 않은 요청(테스트 클라이언트 RequestFactory 등)이면 여기서 만들어 붙인다.
+    """
+    django_request = getattr(request, '_request', request)
+    context = getattr(django_request, 'auth_context', None)
+    if context is None:
+        context = PublicAuthContext(django_request)
+        django_request.auth_context = context
+    return context
+
+
+def get_request_member(request) -> Optional[PublicMemberShip]:
+    """JWT(access)의 활성 회원. 토큰 없음·만료·회원 없음이면 None."""
+    return get_auth_context(request).member
+
+
+def invalidate_principal_cache(member_sid) -> None:
+    if member_sid is not None:
+        cache.delete(_cache_key(member_sid))
+
+
+@receiver(post_save, sender=PublicMemberShip, dispatch_uid='auth_context.member_saved')
+@receiver(post_delete, sender=PublicMemberShip, dispatch_uid='auth_context.member_deleted')
+def _on_member_change(sender, instance, **kwargs):
+    if _principal_ttl() <= 0:
+        return
+    member_sid = instance.member_sid
+    transaction.on_commit(lambda: invalidate_principal_cache(member_sid))
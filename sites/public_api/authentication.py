@@ -3,11 +3,12 @@ Public API JWT 인증 클래스
 - 토큰: Authorization Bearer 또는 쿠키(accessToken)
 - JWT의 user_id는 로그인 시 PublicMemberShip.member_sid로 채워짐.
 - ArticleHighlight 등은 IndeUser FK를 사용하므로, member_sid → PublicMemberShip → 동일 email의 IndeUser로 조회.
+- 토큰 검증·회원 조회는 요청 인증 컨텍스트(auth_context)를 공유 — 뷰의 _get_member 가 같은 회원을 다시 조회하지 않음.
 """
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
-from sites.public_api.models import IndeUser, PublicMemberShip
-from sites.public_api.utils import get_token_from_request, verify_jwt_token
+from sites.public_api.auth_context import get_auth_context
+from sites.public_api.models import IndeUser
 
 
 def _member_to_inde_user(member):
@@ -44,28 +45,21 @@ class PublicJWTAuthentication(BaseAuthentication):
         Returns:
             tuple: (IndeUser, token) 또는 None
         """
-        access_token = get_token_from_request(request)
+        context = get_auth_context(request)
+        access_token = context.token
         
         if not access_token:
             return None
         
-        payload = verify_jwt_token(access_token, token_type='access')
-        if not payload:
+        if not context.payload:
             # 토큰은 왔으나 만료/위조/형식 오류 — None 반환 시 DRF가 '제공되지 않음'과 동일 처리되어 혼동됨
             raise AuthenticationFailed('유효하지 않거나 만료된 토큰입니다.')
         
-        user_id = payload.get('user_id')
-        if not user_id:
+        if context.member_sid is None:
             return None
         
-        try:
-            member_sid = int(user_id)
-        except (TypeError, ValueError):
-            return None
-        
-        try:
-            member = PublicMemberShip.objects.get(member_sid=member_sid, is_active=True)
-        except PublicMemberShip.DoesNotExist:
+        member = context.member
+        if member is None:
             raise AuthenticationFailed('User not found')
         
         inde_user = _member_to_inde_user(member)
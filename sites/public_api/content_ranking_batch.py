@@ -380,9 +380,10 @@ def _bulk_insert_category_hot(rows: List[Tuple[str, str, float, int]], base_date
     return len(objs)
 
 
-def run_content_ranking_refresh(base_date: date | None = None) -> int:
+def run_content_ranking_refresh(base_date: date | None = None, keep_recommended: bool = False) -> int:
     """
     당일 base_date 캐시를 비우고 HOT·SHARE 각 3건, CATEGORY_HOT, RECOMMENDED 3건, WEEKLY_CROSS 3건을 다시 적재한다.
+    keep_recommended=True (예약 발행 후 재적재): 당일 RECOMMENDED 가 이미 있으면 다시 뽑지 않고 유지.
     Returns: 삽입된 총 행 수.
     """
     if base_date is None:
@@ -395,7 +396,11 @@ def run_content_ranking_refresh(base_date: date | None = None) -> int:
 
     inserted = 0
     with transaction.atomic():
-        ContentRankingCache.objects.filter(base_date=base_date).delete()
+        existing = ContentRankingCache.objects.filter(base_date=base_date)
+        keep_rec = keep_recommended and existing.filter(ranking_type=RECOMMENDED).exists()
+        if keep_rec:
+            existing = existing.exclude(ranking_type=RECOMMENDED)
+        existing.delete()
 
         hot_ranked = _fetch_hot_scores(hot_since)
         hot_filled = _fill_to_three(hot_ranked)
@@ -420,9 +425,10 @@ def run_content_ranking_refresh(base_date: date | None = None) -> int:
         cat_rows = _build_category_hot_insert_rows(hot_since)
         inserted += _bulk_insert_category_hot(cat_rows, base_date)
 
-        rec_pool = _recommended_candidate_pool()
-        rec_rows = _pick_recommended_random(rec_pool)
-        inserted += _bulk_insert(RECOMMENDED, rec_rows, base_date)
+        if not keep_rec:
+            rec_pool = _recommended_candidate_pool()
+            rec_rows = _pick_recommended_random(rec_pool)
+            inserted += _bulk_insert(RECOMMENDED, rec_rows, base_date)
 
         try:
             weekly_ranked = _fetch_weekly_cross_view_scores(weekly_since)
@@ -1,9 +1,13 @@
-"""콘텐츠 랭킹 조회 API — content_ranking_cache 만 사용 (schedulerContentPlan.md)"""
+"""
+콘텐츠 랭킹 조회 API — content_ranking_cache 만 사용 (schedulerContentPlan.md)
+ETag: base_date + 랭킹 행 (배치가 같은 날 다시 돌아 순위가 바뀌면 ETag 도 바뀐다)
+"""
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.utils import timezone
 
+from core.http_cache import PUBLIC_LIST, conditional_response, make_etag
 from core.utils import create_success_response, create_error_response
 from sites.public_api.models import ContentRankingCache
 
@@ -52,18 +56,26 @@ def _ranking_list(ranking_type: str, content_type: str = 'ARTICLE'):
     return items
 
 
+def _ranking_response(request, name: str, items: list):
+    etag = make_etag('ranking', name, timezone.localdate(), items)
+    return conditional_response(
+        request,
+        etag,
+        PUBLIC_LIST,
+        lambda: Response(create_success_response({'list': items}), status=status.HTTP_200_OK),
+    )
+
+
 class LibraryRankingHotView(APIView):
     """GET /api/library/ranking/hot — 당일 HOT 아티클(캐시)"""
 
     permission_classes = []
+    query_budget = 2
 
     def get(self, request):
         try:
             items = _ranking_list(ContentRankingCache.RANKING_HOT)
-            return Response(
-                create_success_response({'list': items}),
-                status=status.HTTP_200_OK,
-            )
+            return _ranking_response(request, ContentRankingCache.RANKING_HOT, items)
         except Exception as e:
             return Response(
                 create_error_response(f'랭킹 조회 실패: {str(e)}'),
@@ -75,6 +87,7 @@ class LibraryRankingShareView(APIView):
     """GET /api/library/ranking/share — 당일 SHARE(캐시). ?contentType=ARTICLE|VIDEO|SEMINAR (기본 ARTICLE)"""
 
     permission_classes = []
+    query_budget = 2
 
     def get(self, request):
         try:
@@ -82,10 +95,7 @@ class LibraryRankingShareView(APIView):
             if ct not in ('ARTICLE', 'VIDEO', 'SEMINAR'):
                 ct = 'ARTICLE'
             items = _ranking_list(ContentRankingCache.RANKING_SHARE, ct)
-            return Response(
-                create_success_response({'list': items}),
-                status=status.HTTP_200_OK,
-            )
+            return _ranking_response(request, f'{ContentRankingCache.RANKING_SHARE}:{ct}', items)
         except Exception as e:
             return Response(
                 create_error_response(f'랭킹 조회 실패: {str(e)}'),
@@ -97,14 +107,12 @@ class LibraryRankingRecommendedView(APIView):
     """GET /api/library/ranking/recommended — 당일 RECOMMENDED 아티클(캐시, §D)"""
 
     permission_classes = []
+    query_budget = 2
 
     def get(self, request):
         try:
             items = _ranking_list(ContentRankingCache.RANKING_RECOMMENDED)
-            return Response(
-                create_success_response({'list': items}),
-                status=status.HTTP_200_OK,
-            )
+            return _ranking_response(request, ContentRankingCache.RANKING_RECOMMENDED, items)
         except Exception as e:
             return Response(
                 create_error_response(f'랭킹 조회 실패: {str(e)}'),
@@ -116,14 +124,12 @@ class LibraryRankingWeeklyCrossView(APIView):
     """GET /api/library/ranking/weekly — 당일 WEEKLY_CROSS(§E), 타입 혼합"""
 
     permission_classes = []
+    query_budget = 2
 
     def get(self, request):
         try:
             items = _weekly_cross_list()
-            return Response(
-                create_success_response({'list': items}),
-                status=status.HTTP_200_OK,
-            )
+            return _ranking_response(request, ContentRankingCache.RANKING_WEEKLY_CROSS, items)
         except Exception as e:
             return Response(
                 create_error_response(f'랭킹 조회 실패: {str(e)}'),
@@ -1,8 +1,18 @@
 """
-콘텐츠 마스터(Article / Video·세미나) rating 필드와 publicUserActivityLog RATING 집계 동기화.
-- POST /api/library/useractivity/rating 및 백필 커맨드에서 공통 사용.
+콘텐츠 마스터(Article / Video·세미나) 별점 집계와 publicUserActivityLog RATING 동기화.
+- 마스터에 ratingSum·ratingCount 를 저장하고 rating = ROUND(ratingSum / ratingCount, 2)
+- 별점 등록·변경·삭제: apply_rating_change 로 합계·건수를 증분 갱신 (UPDATE 1회, 로그 재집계 없음)
+- 드리프트 보정·백필: backfill_rating_aggregates — 콘텐츠 타입별 집합 UPDATE 1회 (backfill_content_ratings_from_logs)
+- sync_content_rating_aggregate: 콘텐츠 1건 재집계 (수동 보정용)
 """
-from django.db.models import Avg, Count
+from typing import Iterable, Optional
+
+from django.db import connection
+from django.db.models import (
+    Avg, Case, CharField, Count, F, FloatField, IntegerField, OuterRef, Q, Subquery, Sum, Value, When,
+)
+from django.db.models.functions import Cast, Coalesce, Round
+from django.db.models.lookups import GreaterThan
 
 from sites.admin_api.articles.models import Article
 from sites.admin_api.video.models import Video
@@ -11,35 +21,204 @@ from sites.public_api.models import PublicUserActivityLog
 CONTENT_TYPES_WITH_RATING_MASTER = frozenset({'ARTICLE', 'VIDEO', 'SEMINAR'})
 ACTIVITY_RATING = 'RATING'
 
+# contentType → (마스터 테이블, Video.contentType 조건)
+_MASTER_TABLES = {
+    'ARTICLE': ('article', None),
+    'VIDEO': ('video', 'video'),
+    'SEMINAR': ('video', 'seminar'),
+}
 
-def sync_content_rating_aggregate(content_type: str, content_code: str) -> None:
-    """
-    publicUserActivityLog 의 RATING 평균을 관리자 마스터(Article.rating / Video.rating)에 반영.
-    별점 로그가 없으면 rating=NULL.
-    """
+
+def _master_queryset(content_type: str):
+    if content_type == 'ARTICLE':
+        return Article.objects.filter(deletedAt__isnull=True)
+    if content_type == 'VIDEO':
+        return Video.objects.filter(contentType__iexact='video', deletedAt__isnull=True)
+    if content_type == 'SEMINAR':
+        return Video.objects.filter(contentType__iexact='seminar', deletedAt__isnull=True)
+    return None
+
+
+def _content_pk(content_type: str, content_code) -> Optional[int]:
     cc = str(content_code or '').strip()
     if not cc or content_type not in CONTENT_TYPES_WITH_RATING_MASTER:
-        return
+        return None
     try:
         pk = int(cc, 10)
     except (TypeError, ValueError):
+        return None
+    return pk if pk >= 1 else None
+
+
+def apply_rating_change(content_type: str, content_code, old_values: Iterable = (), new_value=None) -> None:
+    """
+    별점 로그 변경분을 마스터 ratingSum·ratingCount·rating 에 반영 (호출자 트랜잭션 안에서).
+
+    Args:
+        old_values: 삭제·교체된 기존 별점 값들 (없으면 빈 목록 — 신규 등록)
+        new_value: 새로 기록한 별점 값 (None 이면 삭제만)
+    """
+    pk = _content_pk(content_type, content_code)
+    if pk is None:
         return
-    if pk < 1:
+    old_values = [int(v) for v in old_values if v is not None]
+    sum_delta = (int(new_value) if new_value is not None else 0) - sum(old_values)
+    count_delta = (1 if new_value is not None else 0) - len(old_values)
+    if not sum_delta and not count_delta:
         return
 
+    new_sum = F('ratingSum') + sum_delta
+    new_count = F('ratingCount') + count_delta
+    # rating 을 먼저 둔다: MySQL 은 SET 을 왼쪽부터 평가해 뒤 항목이 갱신된 값을 보므로,
+    # rating 이 앞에 있어야 모든 DB에서 갱신 전 ratingSum·ratingCount 기준으로 계산된다.
+    _master_queryset(content_type).filter(id=pk).update(
+        rating=Case(
+            When(Q(ratingCount__gt=-count_delta), then=Round(Cast(new_sum, FloatField()) / new_count, 2)),
+            default=Value(None),
+            output_field=FloatField(),
+        ),
+        ratingSum=new_sum,
+        ratingCount=new_count,
+    )
+
+
+def sync_content_rating_aggregate(content_type: str, content_code: str) -> None:
+    """
+    콘텐츠 1건의 RATING 로그를 다시 집계해 마스터(rating·ratingSum·ratingCount)에 반영.
+    별점 로그가 없으면 rating=NULL, 합계·건수 0.
+    """
+    pk = _content_pk(content_type, content_code)
+    if pk is None:
+        return
+    cc = str(content_code).strip()
     agg = PublicUserActivityLog.objects.filter(
         content_type=content_type,
         content_code=cc,
         activity_type=ACTIVITY_RATING,
         rating_value__isnull=False,
-    ).aggregate(avg=Avg('rating_value'), cnt=Count('public_user_activity_log_id'))
+    ).aggregate(avg=Avg('rating_value'), total=Sum('rating_value'), cnt=Count('public_user_activity_log_id'))
     cnt = agg['cnt'] or 0
     avg = agg['avg']
     new_rating = round(float(avg), 2) if cnt > 0 and avg is not None else None
+    _master_queryset(content_type).filter(id=pk).update(
+        rating=new_rating, ratingSum=int(agg['total'] or 0), ratingCount=cnt
+    )
 
-    if content_type == 'ARTICLE':
-        Article.objects.filter(id=pk, deletedAt__isnull=True).update(rating=new_rating)
-    elif content_type == 'VIDEO':
-        Video.objects.filter(id=pk, contentType__iexact='video', deletedAt__isnull=True).update(rating=new_rating)
-    elif content_type == 'SEMINAR':
-        Video.objects.filter(id=pk, contentType__iexact='seminar', deletedAt__isnull=True).update(rating=new_rating)
+
+# RATING 로그 contentCode 별 합계·건수 (파생 테이블 g)
+_RATING_GROUP_SQL = """
+    SELECT contentCode, SUM(ratingValue) AS s, COUNT(*) AS c
+    FROM publicUserActivityLog
+    WHERE activityType = 'RATING' AND ratingValue IS NOT NULL AND contentType = %s
+    GROUP BY contentCode
+"""
+
+# 저장값과 집계가 다른 행만 대상
+_RATING_DRIFT_SQL = """
+    m.deletedAt IS NULL {type_filter}
+    AND (m.ratingSum <> COALESCE(g.s, 0)
+         OR m.ratingCount <> COALESCE(g.c, 0)
+         OR NOT (m.rating <=> IF(g.c > 0, ROUND(g.s / g.c, 2), NULL)))
+"""
+
+
+def _backfill_mysql(content_type: str, dry_run: bool) -> int:
+    """UPDATE 마스터 LEFT JOIN (RATING 로그 GROUP BY contentCode) 1회"""
+    table, video_type = _MASTER_TABLES[content_type]
+    params = [content_type]
+    type_filter = ''
+    if video_type:
+        type_filter = 'AND m.contentType = %s'
+        params.append(video_type)
+    joined = f"`{table}` m LEFT JOIN ({_RATING_GROUP_SQL}) g ON g.contentCode = CAST(m.id AS CHAR)"
+    where = _RATING_DRIFT_SQL.format(type_filter=type_filter)
+    with connection.cursor() as cursor:
+        if dry_run:
+            cursor.execute(f"SELECT COUNT(*) FROM {joined} WHERE {where}", params)
+            return int(cursor.fetchone()[0])
+        cursor.execute(
+            f"""
+            UPDATE {joined}
+            SET m.rating = IF(g.c > 0, ROUND(g.s / g.c, 2), NULL),
+                m.ratingSum = COALESCE(g.s, 0),
+                m.ratingCount = COALESCE(g.c, 0)
+            WHERE {where}
+            """,
+            params,
+        )
+        return cursor.rowcount
+
+
+def _rating_log_subquery(content_type: str, aggregate):
+    return Coalesce(
+        Subquery(
+            PublicUserActivityLog.objects.filter(
+                content_type=content_type,
+                activity_type=ACTIVITY_RATING,
+                rating_value__isnull=False,
+                content_code=Cast(OuterRef('pk'), CharField()),
+            )
+            .values('content_code')
+            .annotate(_v=aggregate)
+            .values('_v')[:1],
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def _backfill_orm(content_type: str, dry_run: bool) -> int:
+    """MySQL 외 DB(로컬 SQLite 등): 상관 서브쿼리 UPDATE 1회"""
+    total = _rating_log_subquery(content_type, Sum('rating_value'))
+    cnt = _rating_log_subquery(content_type, Count('public_user_activity_log_id'))
+    qs = _master_queryset(content_type)
+    if dry_run:
+        return qs.annotate(_s=total, _c=cnt).exclude(ratingSum=F('_s'), ratingCount=F('_c')).count()
+    return qs.update(
+        rating=Case(
+            When(GreaterThan(cnt, 0), then=Round(Cast(total, FloatField()) / cnt, 2)),
+            default=Value(None),
+            output_field=FloatField(),
+        ),
+        ratingSum=total,
+        ratingCount=cnt,
+    )
+
+
+def backfill_rating_aggregates(content_types: Iterable[str] = CONTENT_TYPES_WITH_RATING_MASTER, dry_run: bool = False) -> dict:
+    """
+    RATING 로그 전체를 콘텐츠 타입별 집합 UPDATE 1회로 마스터에 반영.
+
+    Returns:
+        {contentType: 갱신(dry_run 이면 불일치) 행 수}
+    """
+    backfill = _backfill_mysql if connection.vendor == 'mysql' else _backfill_orm
+    return {ct: backfill(ct, dry_run) for ct in sorted(content_types)}
+
+
+def member_rating_summary(user_id: int) -> dict:
+    """
+    회원 별점 요약 (마이페이지 별점 모아보기·관리자 회원 활동)
+    조건부 집계 1회 — (userId, activityType, regDateTime) 인덱스 범위 읽기.
+
+    Returns:
+        {'total': RATING 로그 수, 'summary': {'avgRating', 'totalCount', 'distribution': {'1'..'5': n}}}
+    """
+    star_counts = {
+        f's{r}': Count('public_user_activity_log_id', filter=Q(rating_value=r)) for r in range(1, 6)
+    }
+    agg = PublicUserActivityLog.objects.filter(user_id=user_id, activity_type=ACTIVITY_RATING).aggregate(
+        total=Count('public_user_activity_log_id'),
+        rated=Count('rating_value'),
+        avg=Avg('rating_value'),
+        **star_counts,
+    )
+    avg_rating = agg['avg']
+    return {
+        'total': agg['total'] or 0,
+        'summary': {
+            'avgRating': round(float(avg_rating), 1) if avg_rating is not None else 0,
+            'totalCount': agg['rated'] or 0,
+            'distribution': {str(r): agg[f's{r}'] or 0 for r in range(1, 6)},
+        },
+    }
@@ -1,5 +1,11 @@
 """
 회원 short 공유 링크 — contentShareLinkCopy.md §5.3, §10.15
+
+조회 캐시 (Django cache):
+- short_code / share_token → 링크 레코드(content_type, content_id, short_code, share_token, expired_at)
+- 미만료 레코드 TTL = expired_at 까지(최대 LINK_CACHE_MAX_SECONDS), 만료 레코드 EXPIRED_CACHE_SECONDS
+- 없는 코드/토큰은 NEGATIVE_CACHE_SECONDS 동안 음성 캐시
+- ensure_share_link에서 갱신(rotation)·발급 시 이전/신규 키 무효화 후 새 레코드 적재
 """
 from __future__ import annotations
 
@@ -8,6 +14,7 @@ import string
 from datetime import datetime, timedelta, timezone as dt_timezone
 from typing import Any, Dict, Optional
 
+from django.core.cache import cache
 from django.db import connection
 from django.utils import timezone
 
@@ -17,6 +24,14 @@ ALPHABET = string.ascii_letters + string.digits
 FALLBACK_TTL_HOURS = 24
 MAX_SHORT_RETRIES = 5
 
+TTL_HOURS_CACHE_KEY = 'share_link:ttl_hours'
+TTL_HOURS_CACHE_SECONDS = 300
+LINK_CACHE_MAX_SECONDS = 24 * 3600
+EXPIRED_CACHE_SECONDS = 600
+NEGATIVE_CACHE_SECONDS = 60
+# 음성 캐시 값 (None은 cache miss와 구분되지 않음)
+_MISSING = 'missing'
+
 
 def _random_short_code() -> str:
     length = secrets.randbelow(3) + 8  # 8~10
@@ -29,16 +44,21 @@ def _random_share_token() -> str:
 
 
 def get_share_link_ttl_hours() -> int:
-    """SYS26326B001 — sysCodeVal = 유효 시간(시간). 없거나 비정상 시 fallback."""
+    """SYS26326B001 — sysCodeVal = 유효 시간(시간). 없거나 비정상 시 fallback. TTL_HOURS_CACHE_SECONDS 캐시."""
+    cached = cache.get(TTL_HOURS_CACHE_KEY)
+    if cached is not None:
+        return cached
+    hours = FALLBACK_TTL_HOURS
     try:
         row = SysCodeManager.objects.filter(sysCodeSid='SYS26326B001', sysCodeUse='Y').first()
         if row and row.sysCodeVal:
             h = int(float(row.sysCodeVal.strip()))
             if 1 <= h <= 8760:
-                return h
+                hours = h
     except (ValueError, TypeError, AttributeError):
         pass
-    return FALLBACK_TTL_HOURS
+    cache.set(TTL_HOURS_CACHE_KEY, hours, TTL_HOURS_CACHE_SECONDS)
+    return hours
 
 
 def _is_duplicate_key(exc: BaseException) -> bool:
@@ -55,6 +75,97 @@ def _expiry_aware_for_compare(expiry) -> Optional[datetime]:
     return timezone.make_aware(expiry, dt_timezone.utc)
 
 
+def _short_code_key(short_code: str) -> str:
+    return f'share_link:sc:{short_code}'
+
+
+def _share_token_key(token: str) -> str:
+    return f'share_link:tk:{token}'
+
+
+def _cache_link(record: Dict[str, Any]) -> None:
+    """레코드를 short_code·share_token 두 키로 적재. TTL은 expired_at 기준."""
+    remaining = int((record['expired_at'] - timezone.now()).total_seconds())
+    timeout = min(remaining, LINK_CACHE_MAX_SECONDS) if remaining > 0 else EXPIRED_CACHE_SECONDS
+    cache.set_many(
+        {
+            _short_code_key(record['short_code']): record,
+            _share_token_key(record['share_token']): record,
+        },
+        max(1, timeout),
+    )
+
+
+def invalidate_share_link_cache(short_code: Optional[str], share_token: Optional[str]) -> None:
+    """short_code·share_token 캐시 키 삭제 (갱신·정리 시)."""
+    keys = []
+    if short_code:
+        keys.append(_short_code_key(short_code))
+    if share_token:
+        keys.append(_share_token_key(share_token))
+    if keys:
+        cache.delete_many(keys)
+
+
+def _load_link(column: str, value: str) -> Optional[Dict[str, Any]]:
+    """column(short_code|share_token) 단건 조회 → 캐시용 레코드 (expired_at은 UTC aware)."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT content_type, content_id, short_code, share_token, expired_at
+            FROM content_share_link
+            WHERE {column} = %s
+            """,
+            [value],
+        )
+        row = cursor.fetchone()
+    if not row:
+        return None
+    ct, cid, sc, tok, exp_at = row
+    return {
+        'content_type': ct,
+        'content_id': int(cid),
+        'short_code': sc,
+        'share_token': tok,
+        'expired_at': _expiry_aware_for_compare(exp_at),
+    }
+
+
+def _get_link(column: str, value: str) -> Optional[Dict[str, Any]]:
+    """캐시 우선 조회 (없는 값은 음성 캐시)."""
+    key = _short_code_key(value) if column == 'short_code' else _share_token_key(value)
+    cached = cache.get(key)
+    if cached == _MISSING:
+        return None
+    if cached is not None:
+        return cached
+    record = _load_link(column, value)
+    if record is None:
+        cache.set(key, _MISSING, NEGATIVE_CACHE_SECONDS)
+        return None
+    _cache_link(record)
+    return record
+
+
+def _is_expired(record: Dict[str, Any]) -> bool:
+    exp = record.get('expired_at')
+    return exp is None or exp <= timezone.now()
+
+
+def _refresh_link_cache(ct: str, content_id: int, code: str, token: str, expired_at: datetime) -> None:
+    """발급·갱신 직후: 혹시 남은 음성 캐시를 지우고 새 레코드를 적재 (첫 방문부터 DB 미조회)."""
+    invalidate_share_link_cache(code, token)
+    _cache_link(
+        {
+            'content_type': ct,
+            'content_id': int(content_id),
+            'short_code': code,
+            'share_token': token,
+            'expired_at': expired_at,
+        }
+    )
+
+
 def ensure_share_link(user_id: int, content_type: str, content_id: int) -> dict:
     """
     §5.3: 미만료면 반환만, 만료면 UPDATE(short_code+share_token), 없으면 INSERT.
@@ -67,7 +178,7 @@ def ensure_share_link(user_id: int, content_type: str, content_id: int) -> dict:
     with connection.cursor() as cursor:
         cursor.execute(
             """
-            SELECT id, short_code, expired_at
+            SELECT id, short_code, share_token, expired_at
             FROM content_share_link
             WHERE user_id = %s AND content_type = %s AND content_id = %s
             """,
@@ -79,7 +190,7 @@ def ensure_share_link(user_id: int, content_type: str, content_id: int) -> dict:
     new_expired = now + ttl
 
     if row:
-        link_id, short_code, expired_at = row
+        link_id, short_code, old_token, expired_at = row
         exp_cmp = _expiry_aware_for_compare(expired_at)
         if exp_cmp is not None and exp_cmp > now:
             return {'mode': 'active', 'short_code': short_code, 'expired_at': expired_at}
@@ -92,11 +203,13 @@ def ensure_share_link(user_id: int, content_type: str, content_id: int) -> dict:
                     cursor.execute(
                         """
                         UPDATE content_share_link
-                        SET short_code = %s, share_token = %s, expired_at = %s, updated_at = NOW()
+                        SET short_code = %s, share_token = %s, expired_at = %s, updated_at = CURRENT_TIMESTAMP
                         WHERE id = %s
                         """,
                         [code, token, new_expired, link_id],
                     )
+                invalidate_share_link_cache(short_code, old_token)
+                _refresh_link_cache(ct, content_id, code, token, new_expired)
                 return {'mode': 'renewed', 'short_code': code, 'expired_at': new_expired}
             except Exception as e:
                 last_err = e
@@ -115,10 +228,11 @@ def ensure_share_link(user_id: int, content_type: str, content_id: int) -> dict:
                     """
                     INSERT INTO content_share_link
                         (content_type, content_id, user_id, short_code, share_token, expired_at, created_at, updated_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, NOW(), NOW())
+                    VALUES (%s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
                     """,
                     [ct, content_id, user_id, code, token, new_expired],
                 )
+            _refresh_link_cache(ct, content_id, code, token, new_expired)
             return {'mode': 'issued', 'short_code': code, 'expired_at': new_expired}
         except Exception as e:
             last_err = e
@@ -130,90 +244,57 @@ def ensure_share_link(user_id: int, content_type: str, content_id: int) -> dict:
 
 def resolve_short_code(short_code: str) -> Optional[Dict[str, Any]]:
     """
-    short_code로 행 조회. 없으면 None.
+    short_code로 행 조회(캐시 우선). 없으면 None.
     Returns: content_type, content_id, expired (bool)
     """
     sc = (short_code or '').strip()
     if not sc or len(sc) > 12:
         return None
-    with connection.cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT content_type, content_id,
-                   CASE WHEN expired_at > UTC_TIMESTAMP() THEN 0 ELSE 1 END AS is_expired
-            FROM content_share_link
-            WHERE short_code = %s
-            """,
-            [sc],
-        )
-        row = cursor.fetchone()
-    if not row:
+    record = _get_link('short_code', sc)
+    if not record:
         return None
-    ct, cid, is_expired = row
     return {
-        'content_type': ct,
-        'content_id': int(cid),
-        'expired': bool(is_expired),
+        'content_type': record['content_type'],
+        'content_id': record['content_id'],
+        'expired': _is_expired(record),
     }
 
 
 def resolve_share_token(token: str) -> Optional[Dict[str, Any]]:
     """
-    share_token으로 행 조회(entitlement). 없으면 None.
+    share_token으로 행 조회(entitlement, 캐시 우선). 없으면 None.
     Returns: content_type, content_id, expired (bool)
     """
     t = (token or '').strip()
     if not t or len(t) > 64:
         return None
-    with connection.cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT content_type, content_id,
-                   CASE WHEN expired_at > UTC_TIMESTAMP() THEN 0 ELSE 1 END AS is_expired
-            FROM content_share_link
-            WHERE share_token = %s
-            """,
-            [t],
-        )
-        row = cursor.fetchone()
-    if not row:
+    record = _get_link('share_token', t)
+    if not record:
         return None
-    ct, cid, is_expired = row
     return {
-        'content_type': ct,
-        'content_id': int(cid),
-        'expired': bool(is_expired),
+        'content_type': record['content_type'],
+        'content_id': record['content_id'],
+        'expired': _is_expired(record),
     }
 
 
 def get_row_for_visit_by_short_code(short_code: str) -> Optional[Dict[str, Any]]:
     """
-    GET /s/{shortCode} 처리: short_code로 행 조회 + share_token·만료 시각.
-    Returns: content_type, content_id, expired, share_token, expired_at (datetime)
+    GET /s/{shortCode} 처리: short_code로 행 조회(캐시 우선) + share_token·만료 시각.
+    Returns: content_type, content_id, expired, share_token, expired_at (datetime, UTC aware)
     """
     sc = (short_code or '').strip()
     if not sc or len(sc) > 12:
         return None
-    with connection.cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT content_type, content_id, share_token, expired_at,
-                   CASE WHEN expired_at > UTC_TIMESTAMP() THEN 0 ELSE 1 END AS is_expired
-            FROM content_share_link
-            WHERE short_code = %s
-            """,
-            [sc],
-        )
-        row = cursor.fetchone()
-    if not row:
+    record = _get_link('short_code', sc)
+    if not record:
         return None
-    ct, cid, stok, exp_at, is_expired = row
     return {
-        'content_type': ct,
-        'content_id': int(cid),
-        'expired': bool(is_expired),
-        'share_token': stok,
-        'expired_at': exp_at,
+        'content_type': record['content_type'],
+        'content_id': record['content_id'],
+        'expired': _is_expired(record),
+        'share_token': record['share_token'],
+        'expired_at': record['expired_at'],
     }
 
 
@@ -235,19 +316,9 @@ def get_short_code_for_copy_entitlement(
     t = (share_token or '').strip()
     if not t or len(t) > 64:
         return None
-    with connection.cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT short_code
-            FROM content_share_link
-            WHERE share_token = %s
-              AND content_type = %s
-              AND content_id = %s
-              AND expired_at > UTC_TIMESTAMP()
-            """,
-            [t, ct, cid],
-        )
-        row = cursor.fetchone()
-    if not row:
+    record = _get_link('share_token', t)
+    if not record or _is_expired(record):
+        return None
+    if record['content_type'] != ct or record['content_id'] != cid:
         return None
-    return row[0]
+    return record['short_code']
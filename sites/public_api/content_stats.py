@@ -0,0 +1,154 @@
+"""
+콘텐츠별 활동 카운터 (publicContentStats) — 라이브러리 통계 API 저장소
+- bump_content_stats: 조회·공유·북마크·별점 기록 경로에서 증분 갱신 (MySQL: INSERT ... ON DUPLICATE KEY UPDATE)
+- get_content_stats / get_content_stats_many: 공용 캐시(짧은 TTL) → 미스만 테이블 1회 조회
+- rebuild_content_stats: 로그 집계로 전체 재구성 (드리프트 보정, rebuild_content_stats 커맨드)
+조회·공유 증가는 캐시를 지우지 않는다 (TTL 안에서 약간 늦게 반영). 북마크·별점은 본인 화면에 바로 보이도록 캐시를 지운다.
+캐시 삭제가 모든 웹 프로세스에 전달되려면 공유 캐시(REDIS_URL)가 필요하다 (local 외 환경에서 LocMem 이면 core.W001 경고).
+LocMem 이면 TTL 을 PROCESS_LOCAL_CACHE_MAX_TTL(기본 30초) 이하로 줄여, 다른 프로세스가 이전 값을 보여주는 시간을 그만큼으로 제한한다
+(카운터 표시용이라 허용).
+"""
+from typing import Dict, Iterable, List, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
+
+from core.throttling import is_process_local
+from sites.public_api.models import PublicContentStats
+
+CACHE_PREFIX = 'library_stats:'
+
+_COUNTER_FIELDS = {
+    'views': ('view_count', 'viewCount'),
+    'shares': ('share_count', 'shareCount'),
+    'bookmarks': ('bookmark_count', 'bookmarkCount'),
+    'rating_sum': ('rating_sum', 'ratingSum'),
+    'rating_count': ('rating_count', 'ratingCount'),
+}
+
+
+def _ttl() -> int:
+    ttl = int(getattr(settings, 'LIBRARY_STATS_CACHE_TTL', 30))
+    if is_process_local('default'):
+        ttl = min(ttl, int(getattr(settings, 'PROCESS_LOCAL_CACHE_MAX_TTL', 30)))
+    return ttl
+
+
+def _cache_key(content_type: str, content_code: str) -> str:
+    return f"{CACHE_PREFIX}{content_type}:{content_code}"
+
+
+def invalidate_content_stats(content_type: str, content_code: str) -> None:
+    cache.delete(_cache_key(content_type, content_code))
+
+
+def bump_content_stats(content_type: str, content_code: str, invalidate: bool = False, **deltas) -> None:
+    """
+    카운터 증분 (호출자 트랜잭션 안에서)
+
+    Args:
+        deltas: views / shares / bookmarks / rating_sum / rating_count 증감값
+        invalidate: True 면 캐시 삭제 (북마크·별점)
+    """
+    deltas = {name: int(v) for name, v in deltas.items() if v}
+    unknown = set(deltas) - set(_COUNTER_FIELDS)
+    if unknown:
+        raise ValueError(f"알 수 없는 카운터: {', '.join(sorted(unknown))}")
+    if not deltas:
+        return
+    content_code = str(content_code).strip()
+    if connection.vendor == 'mysql':
+        columns = [_COUNTER_FIELDS[name][1] for name in deltas]
+        values = list(deltas.values())
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO publicContentStats (contentType, contentCode, {', '.join(columns)}, updatedAt)
+                VALUES (%s, %s, {', '.join(['GREATEST(%s, 0)'] * len(columns))}, NOW())
+                ON DUPLICATE KEY UPDATE
+                    {', '.join(f'{c} = GREATEST({c} + %s, 0)' for c in columns)},
+                    updatedAt = NOW()
+                """,
+                [content_type, content_code, *values, *values],
+            )
+    else:
+        with transaction.atomic():
+            PublicContentStats.objects.get_or_create(content_type=content_type, content_code=content_code)
+            PublicContentStats.objects.filter(content_type=content_type, content_code=content_code).update(
+                **{_COUNTER_FIELDS[name][0]: Greatest(F(_COUNTER_FIELDS[name][0]) + v, 0) for name, v in deltas.items()}
+            )
+    if invalidate:
+        transaction.on_commit(lambda: invalidate_content_stats(content_type, content_code))
+
+
+def _to_payload(row) -> dict:
+    views, shares, bookmarks, rating_sum, rating_count = row if row else (0, 0, 0, 0, 0)
+    return {
+        'viewCount': int(views),
+        'shareCount': int(shares),
+        'bookmarkCount': int(bookmarks),
+        'rating': (rating_sum / rating_count) if rating_count else None,
+        'ratingCount': int(rating_count),
+    }
+
+
+def get_content_stats_many(pairs: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], dict]:
+    """
+    (contentType, contentCode) 목록의 카운터 — 캐시 get_many 1회 + 미스 테이블 조회 1회
+
+    Returns:
+        {(contentType, contentCode): {'viewCount', 'shareCount', 'bookmarkCount', 'rating', 'ratingCount'}}
+    """
+    pairs = list(dict.fromkeys((ct, str(cc).strip()) for ct, cc in pairs))
+    if not pairs:
+        return {}
+    keys = {_cache_key(ct, cc): (ct, cc) for ct, cc in pairs}
+    cached = cache.get_many(list(keys))
+    out = {keys[k]: v for k, v in cached.items()}
+
+    missing: List[Tuple[str, str]] = [p for p in pairs if p not in out]
+    if missing:
+        cond = Q()
+        for ct, cc in missing:
+            cond |= Q(content_type=ct, content_code=cc)
+        rows = {
+            (ct, cc): (v, s, b, rs, rc)
+            for ct, cc, v, s, b, rs, rc in PublicContentStats.objects.filter(cond).values_list(
+                'content_type', 'content_code', 'view_count', 'share_count', 'bookmark_count', 'rating_sum', 'rating_count'
+            )
+        }
+        fresh = {p: _to_payload(rows.get(p)) for p in missing}
+        cache.set_many({_cache_key(*p): v for p, v in fresh.items()}, _ttl())
+        out.update(fresh)
+    return out
+
+
+def get_content_stats(content_type: str, content_code: str) -> dict:
+    return get_content_stats_many([(content_type, content_code)])[(content_type, str(content_code).strip())]
+
+
+def rebuild_content_stats() -> int:
+    """로그 집계로 카운터 전체 재구성 (집합 INSERT ... SELECT 1회). 반환: 행 수"""
+    with transaction.atomic():
+        PublicContentStats.objects.all().delete()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO publicContentStats
+                    (contentType, contentCode, viewCount, shareCount, bookmarkCount, ratingSum, ratingCount, updatedAt)
+                SELECT contentType, contentCode,
+                    COALESCE(SUM(CASE WHEN activityType = 'VIEW' THEN viewCount ELSE 0 END), 0),
+                    COALESCE(SUM(CASE WHEN activityType = 'SHARE' THEN viewCount ELSE 0 END), 0),
+                    COALESCE(SUM(CASE WHEN activityType = 'BOOKMARK' THEN 1 ELSE 0 END), 0),
+                    COALESCE(SUM(CASE WHEN activityType = 'RATING' THEN ratingValue ELSE 0 END), 0),
+                    COALESCE(SUM(CASE WHEN activityType = 'RATING' AND ratingValue IS NOT NULL THEN 1 ELSE 0 END), 0),
+                    CURRENT_TIMESTAMP
+                FROM publicUserActivityLog
+                GROUP BY contentType, contentCode
+                """
+            )
+            # 캐시는 TTL(LIBRARY_STATS_CACHE_TTL) 후 새 값으로 채워진다
+            return cursor.rowcount
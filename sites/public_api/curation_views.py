@@ -1,17 +1,34 @@
 """
 공개 큐레이션 목록 — curationContentPlan.md §5, 메인 §10 카드 데이터
 한 큐레이션(Curation)에 포함된 여러 CurationItem을 순서대로 노출.
+ETag: 노출 중 큐레이션·항목 + 참조 콘텐츠(updatedAt·삭제·유형) 스탬프 — 일치하면 원본 조회·presign 생략.
 """
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from django.utils import timezone
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
 
+from core.http_cache import PUBLIC_LIST, conditional_response, make_etag, presign_window
 from core.utils import create_success_response
+from sites.admin_api.articles.models import Article
 from sites.admin_api.curation.curation_resolve import build_public_card, resolve_curation_target
-from sites.admin_api.curation.models import Curation
+from sites.admin_api.curation.models import Curation, CurationItem
+from sites.admin_api.video.models import Video
+
+
+def _content_stamps(items):
+    """항목이 참조하는 원본 콘텐츠 버전 (타입별 id__in 1회)"""
+    article_ids = {i.content_code for i in items if i.content_type == CurationItem.ContentType.ARTICLE}
+    video_ids = {i.content_code for i in items if i.content_type != CurationItem.ContentType.ARTICLE}
+    articles = sorted(
+        Article.objects.filter(id__in=article_ids).values_list('id', 'updatedAt', 'deletedAt')
+    ) if article_ids else []
+    videos = sorted(
+        Video.objects.filter(id__in=video_ids).values_list('id', 'updatedAt', 'deletedAt', 'contentType')
+    ) if video_ids else []
+    return articles, videos
 
 
 class PublicCurationListView(APIView):
@@ -25,28 +42,45 @@ class PublicCurationListView(APIView):
             Q(exposure_start_datetime__isnull=True) | Q(exposure_start_datetime__lte=now),
             Q(exposure_end_datetime__isnull=True) | Q(exposure_end_datetime__gte=now),
         ).order_by('-reg_datetime')
-        curations_out = []
-        flat_items = []
-        for c in qs.prefetch_related('items'):
-            cards = []
-            for item in c.items.order_by('sort_order', 'id'):
-                resolved = resolve_curation_target(item.content_type, item.content_code)
-                if not resolved:
-                    continue
-                card = build_public_card(item, resolved)
-                cards.append(card)
-                flat_items.append(card)
-            curations_out.append(
-                {
-                    'curationId': c.id,
-                    'name': c.name or '',
-                    'items': cards,
-                }
-            )
-        return Response(
-            create_success_response(
-                {'curations': curations_out, 'items': flat_items},
-                'SUCCESS',
-            ),
-            status=status.HTTP_200_OK,
+        curations = list(
+            qs.prefetch_related(Prefetch('items', queryset=CurationItem.objects.order_by('sort_order', 'id')))
+        )
+        all_items = [item for c in curations for item in c.items.all()]
+        etag = make_etag(
+            'curation_list',
+            presign_window(),
+            [
+                (c.id, c.name, c.update_datetime, [(i.id, i.content_type, i.content_code, i.custom_title) for i in c.items.all()])
+                for c in curations
+            ],
+            _content_stamps(all_items),
         )
+
+        def build():
+            curations_out = []
+            flat_items = []
+            for c in curations:
+                cards = []
+                for item in c.items.all():
+                    resolved = resolve_curation_target(item.content_type, item.content_code)
+                    if not resolved:
+                        continue
+                    card = build_public_card(item, resolved)
+                    cards.append(card)
+                    flat_items.append(card)
+                curations_out.append(
+                    {
+                        'curationId': c.id,
+                        'name': c.name or '',
+                        'items': cards,
+                    }
+                )
+            return Response(
+                create_success_response(
+                    {'curations': curations_out, 'items': flat_items},
+                    'SUCCESS',
+                ),
+                status=status.HTTP_200_OK,
+            )
+
+        return conditional_response(request, etag, PUBLIC_LIST, build)
@@ -6,6 +6,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 
+from core.http_cache import PUBLIC_REVALIDATE, conditional_response, make_etag, presign_window
 from core.utils import create_success_response, create_error_response
 from sites.admin_api.articles.utils import convert_s3_urls_to_presigned
 from sites.admin_api.homepage_doc.constants import HOMEPAGE_DOC_TYPES
@@ -35,13 +36,15 @@ class PublicHomepageDocDetailView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        data = HomepageDocReadSerializer(obj).data
-        if data.get('bodyHtml'):
-            data['bodyHtml'] = convert_s3_urls_to_presigned(data['bodyHtml'], expires_in=3600)
+        def build():
+            data = HomepageDocReadSerializer(obj).data
+            if data.get('bodyHtml'):
+                data['bodyHtml'] = convert_s3_urls_to_presigned(data['bodyHtml'], expires_in=3600)
+            return Response(
+                create_success_response(data, '홈페이지 문서 조회 성공'),
+                status=status.HTTP_200_OK,
+            )
 
-        # 관리자 저장 직후 www에서 새로고침 시 구버전이 보이지 않도록 브라우저·중간 캐시 보관 최소화
-        return Response(
-            create_success_response(data, '홈페이지 문서 조회 성공'),
-            status=status.HTTP_200_OK,
-            headers={'Cache-Control': 'no-store, max-age=0'},
-        )
+        # 관리자 저장 직후 www에서 새로고침 시 구버전이 보이지 않도록 항상 재검증 (no-cache + updated_at ETag → 변경 없으면 304)
+        etag = make_etag('homepage_doc', obj.pk, obj.updated_at, presign_window())
+        return conditional_response(request, etag, PUBLIC_REVALIDATE, build)
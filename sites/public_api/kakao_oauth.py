@@ -15,7 +15,7 @@ from django.utils import timezone
 from django.views import View
 import requests
 
-from core.models import AuditLog
+from core.audit import record_audit
 from sites.public_api.models import PublicMemberShip
 from sites.public_api.utils import create_public_jwt_tokens, create_oauth_pending_token
 from sites.public_api.jwt_cookies import attach_public_refresh_cookie
@@ -225,7 +225,7 @@ class KakaoCallbackView(View):
             logger.exception('Kakao OAuth: create_public_jwt_tokens failed: %s', e)
             return HttpResponseRedirect(f'{frontend_callback}?error=OAUTH_FAILED')
 
-        AuditLog.objects.create(
+        record_audit(
             user_id=str(member.member_sid),
             site_slug='public_api',
             action='login',
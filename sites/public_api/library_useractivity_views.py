@@ -6,7 +6,6 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.db import connection, transaction
-from django.db.models import Avg, Count, Max, Sum
 from django.utils import timezone
 
 from core.models import SysCodeManager
@@ -15,24 +14,18 @@ from sites.admin_api.articles.models import Article
 from sites.admin_api.articles.utils import get_presigned_thumbnail_url as article_presigned_thumbnail
 from sites.admin_api.video.models import Video
 from sites.admin_api.video.utils import get_presigned_thumbnail_url as video_presigned_thumbnail
-from sites.public_api.models import PublicMemberShip, PublicUserActivityLog
-from sites.public_api.utils import get_token_from_request, verify_jwt_token
-from sites.public_api.content_rating_sync import sync_content_rating_aggregate
+from sites.public_api.models import PublicUserActivityLog
+from sites.public_api.auth_context import get_request_member
+from sites.public_api.content_rating_sync import apply_rating_change, member_rating_summary
+from sites.public_api.content_stats import bump_content_stats, get_content_stats, get_content_stats_many
+from sites.public_api.recent_views import encode_cursor, record_recent_view, recent_views_page
 
 DELETED_CONTENT_TITLE = '삭제된 콘텐츠입니다'
 
 
 def _get_member(request):
-    """JWT에서 회원 조회. 실패 시 None."""
-    token = get_token_from_request(request)
-    payload = verify_jwt_token(token, token_type='access') if token else None
-    if not payload:
-        return None
-    user_id = payload.get('user_id')
-    try:
-        return PublicMemberShip.objects.get(member_sid=int(user_id), is_active=True)
-    except (PublicMemberShip.DoesNotExist, ValueError, TypeError):
-        return None
+    """JWT에서 회원 조회 (요청 인증 컨텍스트 공유 — 요청당 1회). 실패 시 None."""
+    return get_request_member(request)
 
 
 def _get_client_ip(request):
@@ -74,33 +67,11 @@ def _presign_video_thumb(url):
         return url
 
 
-def _latest_view_log(member, content_type: str, content_code: str):
-    cc = str(content_code).strip()
-    return (
-        PublicUserActivityLog.objects.filter(
-            user_id=member.pk,
-            activity_type=ACTIVITY_VIEW,
-            content_type=content_type,
-            content_code=cc,
-        )
-        .order_by('-reg_date_time', '-public_user_activity_log_id')
-        .first()
-    )
-
-
-def _build_me_views_items(member, page_slice: list) -> list:
+def _build_me_views_items(logs: list) -> list:
     """
-    page_slice: values() annotate 결과 dict 목록 (content_type, content_code, max_time).
+    logs: 최근 본 프로젝션 행의 VIEW 로그 객체 (PublicRecentView.as_activity_log) 목록.
     IN 쿼리 + dict 매핑 (wwwMypage_library.md §5.7·§8).
     """
-    logs = []
-    for g in page_slice:
-        ct = g['content_type']
-        cc = str(g['content_code']).strip()
-        log = _latest_view_log(member, ct, cc)
-        if log:
-            logs.append(log)
-
     article_codes = list({str(l.content_code).strip() for l in logs if l.content_type == 'ARTICLE'})
     video_codes = list({str(l.content_code).strip() for l in logs if l.content_type == 'VIDEO'})
     seminar_codes = list({str(l.content_code).strip() for l in logs if l.content_type == 'SEMINAR'})
@@ -318,6 +289,7 @@ class LibraryUserActivityView(APIView):
         ua = (request.META.get('HTTP_USER_AGENT') or '')[:500]
         today = timezone.now().date()
         # INSERT ... ON DUPLICATE KEY UPDATE (uniq_view)
+        # LAST_INSERT_ID(PK): 갱신된 기존 행이어도 lastrowid 로 로그 PK 를 받는다 (최근 본 프로젝션용)
         with connection.cursor() as cursor:
             cursor.execute(
                 """
@@ -325,6 +297,7 @@ class LibraryUserActivityView(APIView):
                     (contentType, contentCode, userId, activityType, viewCount, regDate, ipAddress, userAgent, regDateTime)
                 VALUES (%s, %s, %s, %s, 1, %s, %s, %s, NOW())
                 ON DUPLICATE KEY UPDATE
+                    publicUserActivityLogId = LAST_INSERT_ID(publicUserActivityLogId),
                     viewCount = viewCount + 1,
                     regDateTime = NOW(),
                     ipAddress = VALUES(ipAddress),
@@ -332,6 +305,10 @@ class LibraryUserActivityView(APIView):
                 """,
                 [content_type, content_code, user_id, ACTIVITY_VIEW, today, ip, ua],
             )
+            log_id = cursor.lastrowid
+        bump_content_stats(content_type, content_code, views=1)
+        if user_id:
+            record_recent_view(user_id, content_type, content_code, log_id)
         return Response(
             create_success_response({'result': 'ok'}),
             status=status.HTTP_200_OK,
@@ -371,6 +348,7 @@ class LibraryUserActivityShare(APIView):
                 """,
                 [content_type, content_code, user_id, ACTIVITY_SHARE, today, ip, ua],
             )
+        bump_content_stats(content_type, content_code, shares=1)
         return Response(
             create_success_response({'result': 'ok'}),
             status=status.HTTP_200_OK,
@@ -409,12 +387,15 @@ class LibraryUserActivityRating(APIView):
         now = timezone.now()
         cc = str(content_code).strip()
         with transaction.atomic():
-            PublicUserActivityLog.objects.filter(
+            existing = PublicUserActivityLog.objects.select_for_update().filter(
                 user_id=member.pk,
                 content_type=content_type,
                 content_code=cc,
                 activity_type=ACTIVITY_RATING,
-            ).delete()
+            )
+            old_values = list(existing.values_list('rating_value', flat=True))
+            if old_values:
+                existing.delete()
             PublicUserActivityLog.objects.create(
                 user_id=member.pk,
                 content_type=content_type,
@@ -423,7 +404,12 @@ class LibraryUserActivityRating(APIView):
                 rating_value=rating,
                 reg_date=now.date(),
             )
-            sync_content_rating_aggregate(content_type, cc)
+            # 마스터 ratingSum·ratingCount 증분 갱신 (로그 재집계 없음)
+            apply_rating_change(content_type, cc, old_values=old_values, new_value=rating)
+            rated = [v for v in old_values if v is not None]
+            bump_content_stats(
+                content_type, cc, invalidate=True, rating_sum=rating - sum(rated), rating_count=1 - len(rated)
+            )
         return Response(
             create_success_response({'result': 'ok'}),
             status=status.HTTP_200_OK,
@@ -476,13 +462,16 @@ class LibraryUserActivityBookmark(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         today = timezone.now().date()
-        _, created = PublicUserActivityLog.objects.get_or_create(
-            user_id=member.pk,
-            content_type=content_type,
-            content_code=content_code,
-            activity_type=ACTIVITY_BOOKMARK,
-            defaults={'reg_date': today},
-        )
+        with transaction.atomic():
+            _, created = PublicUserActivityLog.objects.get_or_create(
+                user_id=member.pk,
+                content_type=content_type,
+                content_code=content_code,
+                activity_type=ACTIVITY_BOOKMARK,
+                defaults={'reg_date': today},
+            )
+            if created:
+                bump_content_stats(content_type, content_code, invalidate=True, bookmarks=1)
         return Response(
             create_success_response({'result': 'ok'}),
             status=status.HTTP_200_OK,
@@ -503,37 +492,101 @@ class LibraryUserActivityBookmark(APIView):
                 create_error_response('contentType, contentCode가 필요합니다.'),
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        deleted, _ = PublicUserActivityLog.objects.filter(
-            user_id=member.pk,
-            content_type=content_type,
-            content_code=content_code,
-            activity_type=ACTIVITY_BOOKMARK,
-        ).delete()
+        with transaction.atomic():
+            deleted, _ = PublicUserActivityLog.objects.filter(
+                user_id=member.pk,
+                content_type=content_type,
+                content_code=content_code,
+                activity_type=ACTIVITY_BOOKMARK,
+            ).delete()
+            if deleted:
+                bump_content_stats(content_type, content_code, invalidate=True, bookmarks=-deleted)
         return Response(
             create_success_response({'result': 'ok'}),
             status=status.HTTP_200_OK,
         )
 
 
-class LibraryStatsViewCount(APIView):
-    """GET /api/library/stats/view-count - 콘텐츠별 조회수"""
+def _stats_params(request):
+    content_type = (request.query_params.get('contentType') or '').strip().upper()
+    content_code = (request.query_params.get('contentCode') or '').strip()
+    if content_type not in CONTENT_TYPES or not content_code:
+        return None
+    return content_type, content_code
+
+
+def _stats_bad_request():
+    return Response(
+        create_error_response('contentType, contentCode 쿼리가 필요합니다.'),
+        status=status.HTTP_400_BAD_REQUEST,
+    )
+
+
+# GET /api/library/stats/batch 1회 최대 항목 수
+STATS_BATCH_MAX_ITEMS = 100
+
+
+class LibraryStats(APIView):
+    """GET /api/library/stats - 콘텐츠별 조회·공유·북마크·별점 한 번에 (publicContentStats + 캐시)"""
     permission_classes = []
 
     def get(self, request):
-        content_type = (request.query_params.get('contentType') or '').strip().upper()
-        content_code = (request.query_params.get('contentCode') or '').strip()
-        if content_type not in CONTENT_TYPES or not content_code:
+        params = _stats_params(request)
+        if not params:
+            return _stats_bad_request()
+        return Response(
+            create_success_response(get_content_stats(*params)),
+            status=status.HTTP_200_OK,
+        )
+
+
+class LibraryStatsBatch(APIView):
+    """
+    GET /api/library/stats/batch?items=ARTICLE:12,VIDEO:3 - 목록 화면용 여러 콘텐츠 통계
+    응답 list 는 요청 순서, 항목마다 contentType·contentCode 포함
+    """
+    permission_classes = []
+
+    def get(self, request):
+        raw = (request.query_params.get('items') or '').strip()
+        pairs = []
+        for token in raw.split(','):
+            content_type, _, content_code = token.strip().partition(':')
+            content_type = content_type.strip().upper()
+            content_code = content_code.strip()
+            if content_type in CONTENT_TYPES and content_code:
+                pairs.append((content_type, content_code))
+        if not pairs:
             return Response(
-                create_error_response('contentType, contentCode 쿼리가 필요합니다.'),
+                create_error_response('items 쿼리가 필요합니다. (예: ARTICLE:12,VIDEO:3)'),
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        total = PublicUserActivityLog.objects.filter(
-            content_type=content_type,
-            content_code=content_code,
-            activity_type=ACTIVITY_VIEW,
-        ).aggregate(s=Sum('view_count'))['s'] or 0
+        if len(pairs) > STATS_BATCH_MAX_ITEMS:
+            return Response(
+                create_error_response(f'items는 최대 {STATS_BATCH_MAX_ITEMS}개까지 요청할 수 있습니다.'),
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        stats = get_content_stats_many(pairs)
+        list_data = [
+            {'contentType': ct, 'contentCode': cc, **stats[(ct, cc)]}
+            for ct, cc in dict.fromkeys(pairs)
+        ]
         return Response(
-            create_success_response({'count': int(total)}),
+            create_success_response({'list': list_data}),
+            status=status.HTTP_200_OK,
+        )
+
+
+class LibraryStatsViewCount(APIView):
+    """GET /api/library/stats/view-count - 콘텐츠별 조회수"""
+    permission_classes = []
+
+    def get(self, request):
+        params = _stats_params(request)
+        if not params:
+            return _stats_bad_request()
+        return Response(
+            create_success_response({'count': get_content_stats(*params)['viewCount']}),
             status=status.HTTP_200_OK,
         )
 
@@ -543,23 +596,12 @@ class LibraryStatsRating(APIView):
     permission_classes = []
 
     def get(self, request):
-        content_type = (request.query_params.get('contentType') or '').strip().upper()
-        content_code = (request.query_params.get('contentCode') or '').strip()
-        if content_type not in CONTENT_TYPES or not content_code:
-            return Response(
-                create_error_response('contentType, contentCode 쿼리가 필요합니다.'),
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        agg = PublicUserActivityLog.objects.filter(
-            content_type=content_type,
-            content_code=content_code,
-            activity_type=ACTIVITY_RATING,
-            rating_value__isnull=False,
-        ).aggregate(rating=Avg('rating_value'), ratingCount=Count('public_user_activity_log_id'))
-        rating = float(agg['rating']) if agg['rating'] is not None else None
-        rating_count = agg['ratingCount'] or 0
+        params = _stats_params(request)
+        if not params:
+            return _stats_bad_request()
+        stats = get_content_stats(*params)
         return Response(
-            create_success_response({'rating': rating, 'ratingCount': rating_count}),
+            create_success_response({'rating': stats['rating'], 'ratingCount': stats['ratingCount']}),
             status=status.HTTP_200_OK,
         )
 
@@ -569,20 +611,11 @@ class LibraryStatsBookmark(APIView):
     permission_classes = []
 
     def get(self, request):
-        content_type = (request.query_params.get('contentType') or '').strip().upper()
-        content_code = (request.query_params.get('contentCode') or '').strip()
-        if content_type not in CONTENT_TYPES or not content_code:
-            return Response(
-                create_error_response('contentType, contentCode 쿼리가 필요합니다.'),
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        count = PublicUserActivityLog.objects.filter(
-            content_type=content_type,
-            content_code=content_code,
-            activity_type=ACTIVITY_BOOKMARK,
-        ).count()
+        params = _stats_params(request)
+        if not params:
+            return _stats_bad_request()
         return Response(
-            create_success_response({'count': count}),
+            create_success_response({'count': get_content_stats(*params)['bookmarkCount']}),
             status=status.HTTP_200_OK,
         )
 
@@ -609,23 +642,11 @@ class LibraryMeViews(APIView):
         page_size = min(max(1, page_size), 50)
         page = max(1, page)
 
-        # (contentType, contentCode) 당 최신 VIEW 시각 기준 중복 제거 후, 최신 순 (wwwMypage_library.md §8.7)
-        grouped = (
-            PublicUserActivityLog.objects.filter(user_id=member.pk, activity_type=ACTIVITY_VIEW)
-            .values('content_type', 'content_code')
-            .annotate(max_time=Max('reg_date_time'))
-            .order_by('-max_time')
-        )
-        total = grouped.count()
-        total_pages = max(1, (total + page_size - 1) // page_size) if total > 0 else 1
-        if total > 0 and page > total_pages:
-            page = total_pages
-        if total == 0:
-            page = 1
-
-        start = (page - 1) * page_size
-        page_slice = list(grouped[start : start + page_size])
-        list_data = _build_me_views_items(member, page_slice)
+        # (contentType, contentCode) 당 최신 VIEW 1건 = 최근 본 프로젝션 행, 최신 순 (wwwMypage_library.md §8.7)
+        # cursor(직전 nextCursor)가 있으면 keyset 으로 이어서 조회
+        cursor = (request.query_params.get('cursor') or '').strip()
+        rows, total, page = recent_views_page(member.pk, page, page_size, cursor)
+        list_data = _build_me_views_items([r.as_activity_log() for r in rows])
 
         return Response(
             create_success_response({
@@ -633,6 +654,7 @@ class LibraryMeViews(APIView):
                 'total': total,
                 'page': page,
                 'page_size': page_size,
+                'nextCursor': encode_cursor(rows[-1]) if len(rows) == page_size else None,
             }),
             status=status.HTTP_200_OK,
         )
@@ -694,23 +716,10 @@ class LibraryMeRatings(APIView):
             qs = qs.order_by('rating_value', '-reg_date_time')
         else:
             qs = qs.order_by('-reg_date_time')
-        total = qs.count()
-        # 요약: 평균, 총 개수, 분포
-        summary_qs = PublicUserActivityLog.objects.filter(
-            user_id=member.pk,
-            activity_type=ACTIVITY_RATING,
-            rating_value__isnull=False,
-        )
-        avg_rating = summary_qs.aggregate(avg=Avg('rating_value'))['avg']
-        summary_count = summary_qs.count()
-        distribution = {}
-        for r in range(1, 6):
-            distribution[str(r)] = summary_qs.filter(rating_value=r).count()
-        summary = {
-            'avgRating': round(float(avg_rating), 1) if avg_rating is not None else 0,
-            'totalCount': summary_count,
-            'distribution': distribution,
-        }
+        # 요약(평균·총 개수·분포)과 목록 total 을 조건부 집계 1회로
+        stats = member_rating_summary(member.pk)
+        total = stats['total']
+        summary = stats['summary']
         start = (page - 1) * page_size
         items = list(qs[start : start + page_size])
         list_data = _attach_content_master_to_activity_logs(items)
@@ -1,33 +1,33 @@
 """
-publicUserActivityLog RATING 집계 → Article.rating / Video.rating 백필.
+publicUserActivityLog RATING 집계 → Article·Video 의 rating·ratingSum·ratingCount 백필·드리프트 보정.
+콘텐츠 타입별 집합 UPDATE 1회 (MySQL: UPDATE ... LEFT JOIN (SELECT ... GROUP BY contentCode)).
+평소에는 별점 등록 시 content_rating_sync.apply_rating_change 가 증분 갱신하므로, 이 커맨드는
+컬럼 추가 직후 1회 및 불일치 보정용.
 
   python manage.py backfill_content_ratings_from_logs
   python manage.py backfill_content_ratings_from_logs --dry-run
   python manage.py backfill_content_ratings_from_logs --content-type ARTICLE
-  python manage.py backfill_content_ratings_from_logs --limit 100
 """
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
 from sites.public_api.content_rating_sync import (
-    ACTIVITY_RATING,
     CONTENT_TYPES_WITH_RATING_MASTER,
-    sync_content_rating_aggregate,
+    backfill_rating_aggregates,
 )
-from sites.public_api.models import PublicUserActivityLog
 
 
 class Command(BaseCommand):
     help = (
-        "publicUserActivityLog 의 RATING 을 집계해 Article.rating·Video.rating 에 반영합니다. "
-        "POST /api/library/useractivity/rating 이전에 쌓인 로그만 있는 경우에 사용하세요."
+        "publicUserActivityLog 의 RATING 을 집계해 Article·Video 의 rating·ratingSum·ratingCount 에 일괄 반영합니다. "
+        "저장값과 집계가 다른 행만 갱신합니다."
     )
 
     def add_arguments(self, parser):
         parser.add_argument(
             "--dry-run",
             action="store_true",
-            help="UPDATE 없이 처리 대상 (contentType, contentCode) 쌍 개수만 셉니다.",
+            help="UPDATE 없이 저장값과 실제 집계가 다른 행 개수만 출력합니다.",
         )
         parser.add_argument(
             "--content-type",
@@ -36,51 +36,21 @@ class Command(BaseCommand):
             metavar="ARTICLE|VIDEO|SEMINAR",
             help="해당 타입만 처리합니다. 생략 시 ARTICLE·VIDEO·SEMINAR 전부.",
         )
-        parser.add_argument(
-            "--limit",
-            type=int,
-            default=0,
-            help="처리할 쌍의 최대 개수. 0이면 제한 없음.",
-        )
 
     def handle(self, *args, **options):
         dry_run: bool = options["dry_run"]
-        limit: int = max(0, int(options.get("limit") or 0))
         ct = (options.get("content_type") or "").strip().upper()
 
         if ct and ct not in CONTENT_TYPES_WITH_RATING_MASTER:
             self.stderr.write(self.style.ERROR(f"유효하지 않은 --content-type: {ct!r} (ARTICLE|VIDEO|SEMINAR)"))
             return
 
-        base = PublicUserActivityLog.objects.filter(
-            activity_type=ACTIVITY_RATING,
-            rating_value__isnull=False,
-            content_type__in=CONTENT_TYPES_WITH_RATING_MASTER,
-        )
-        if ct:
-            base = base.filter(content_type=ct)
-
-        distinct_qs = (
-            base.values("content_type", "content_code")
-            .distinct()
-            .order_by("content_type", "content_code")
-        )
-
-        processed = 0
-        for row in distinct_qs.iterator(chunk_size=500):
-            if limit and processed >= limit:
-                break
-            c_type = row["content_type"]
-            code = row["content_code"]
-            processed += 1
-            if dry_run:
-                continue
-            with transaction.atomic():
-                sync_content_rating_aggregate(c_type, code)
-            if processed % 500 == 0:
-                self.stdout.write(f"... synced {processed} pairs")
+        content_types = [ct] if ct else sorted(CONTENT_TYPES_WITH_RATING_MASTER)
+        with transaction.atomic():
+            result = backfill_rating_aggregates(content_types, dry_run=dry_run)
 
+        summary = ", ".join(f"{k} {v}건" for k, v in result.items())
         if dry_run:
-            self.stdout.write(self.style.WARNING(f"[dry-run] RATING 이 있는 고유 (contentType, contentCode) 쌍: {processed}개"))
+            self.stdout.write(self.style.WARNING(f"[dry-run] 별점 집계 불일치: {summary}"))
         else:
-            self.stdout.write(self.style.SUCCESS(f"완료: {processed}개 쌍 동기화"))
+            self.stdout.write(self.style.SUCCESS(f"완료: 별점 집계 갱신 {summary}"))
@@ -1,7 +1,8 @@
 """
-content_question(ARTICLE) 집계 → Article.questionCount,
-content_question_answer(ARTICLE) 집계 → Article.answeredQuestionCount (질문당 distinct, 답변 행 수 합이 아님),
-publicUserActivityLog(BOOKMARK) 집계 → Article·Video.bookmarkCount 백필.
+content_question 집계 → Article·Video.questionCount,
+content_question_answer 집계 → Article·Video.answeredQuestionCount (질문당 distinct, 답변 행 수 합이 아님),
+publicUserActivityLog(BOOKMARK) 집계 → Article·Video.bookmarkCount 백필·드리프트 보정.
+질문/답변 집계는 등록·삭제 시 apps.content_question.question_counters 가 유지하므로, 이 커맨드는 불일치 보정용.
 
   python manage.py backfill_question_bookmark_counts
   python manage.py backfill_question_bookmark_counts --dry-run
@@ -15,37 +16,12 @@ from django.db import transaction
 from django.db.models import CharField, Count, F, IntegerField, OuterRef, Subquery, Value
 from django.db.models.functions import Cast, Coalesce
 
-from apps.content_question.models import ContentQuestion, ContentQuestionAnswer
+from apps.content_question.question_counters import reconcile_question_counts
 from sites.admin_api.articles.models import Article
 from sites.admin_api.video.models import Video
 from sites.public_api.models import PublicUserActivityLog
 
 
-def _question_count_subquery_article():
-    return (
-        ContentQuestion.objects.filter(
-            content_type=ContentQuestion.CONTENT_TYPE_ARTICLE,
-            content_id=OuterRef("pk"),
-        )
-        .values("content_id")
-        .annotate(cnt=Count("question_id"))
-        .values("cnt")[:1]
-    )
-
-
-def _answered_distinct_question_subquery_article():
-    """질문별로 답변이 1건이라도 있으면 1로만 집계(여러 사용자·여러 행이어도 question_id당 1)."""
-    return (
-        ContentQuestionAnswer.objects.filter(
-            content_type=ContentQuestionAnswer.CONTENT_TYPE_ARTICLE,
-            content_id=OuterRef("pk"),
-        )
-        .values("content_id")
-        .annotate(cnt=Count("question_id", distinct=True))
-        .values("cnt")[:1]
-    )
-
-
 def _bookmark_subquery(content_type: str):
     return (
         PublicUserActivityLog.objects.filter(
@@ -61,8 +37,8 @@ def _bookmark_subquery(content_type: str):
 
 class Command(BaseCommand):
     help = (
-        "Article.questionCount ← content_question(ARTICLE) 건수, "
-        "Article.answeredQuestionCount ← 답변이 있는 질문 수(question_id DISTINCT), "
+        "Article·Video.questionCount ← content_question 건수, "
+        "Article·Video.answeredQuestionCount ← 답변이 있는 질문 수(question_id DISTINCT), "
         "Article·Video.bookmarkCount ← publicUserActivityLog BOOKMARK 건수로 일괄 반영합니다."
     )
 
@@ -90,32 +66,18 @@ class Command(BaseCommand):
         do_questions = only in ("", "all", "questions")
         do_bookmarks = only in ("", "all", "bookmarks")
 
-        q_sq = Subquery(_question_count_subquery_article(), output_field=IntegerField())
-        aq_sq = Subquery(
-            _answered_distinct_question_subquery_article(), output_field=IntegerField()
-        )
         bm_art_sq = Subquery(_bookmark_subquery("ARTICLE"), output_field=IntegerField())
         bm_vid_sq = Subquery(_bookmark_subquery("VIDEO"), output_field=IntegerField())
         bm_sem_sq = Subquery(_bookmark_subquery("SEMINAR"), output_field=IntegerField())
 
         if dry_run:
             if do_questions:
-                q_mis = (
-                    Article.objects.annotate(_actual=Coalesce(q_sq, Value(0)))
-                    .exclude(questionCount=F("_actual"))
-                    .count()
-                )
-                self.stdout.write(
-                    self.style.WARNING(f"[dry-run] questionCount 불일치: Article {q_mis}건")
-                )
-                a_mis = (
-                    Article.objects.annotate(_actual=Coalesce(aq_sq, Value(0)))
-                    .exclude(answeredQuestionCount=F("_actual"))
-                    .count()
-                )
+                drift = reconcile_question_counts(dry_run=True)
                 self.stdout.write(
                     self.style.WARNING(
-                        f"[dry-run] answeredQuestionCount 불일치(질문당 distinct): Article {a_mis}건"
+                        "[dry-run] questionCount·answeredQuestionCount 불일치: "
+                        f"Article {drift['ARTICLE']}건, Video(video) {drift['VIDEO']}건, "
+                        f"Video(seminar) {drift['SEMINAR']}건"
                     )
                 )
             if do_bookmarks:
@@ -146,15 +108,11 @@ class Command(BaseCommand):
 
         with transaction.atomic():
             if do_questions:
-                n_q = Article.objects.update(
-                    questionCount=Coalesce(Subquery(_question_count_subquery_article()), Value(0)),
-                    answeredQuestionCount=Coalesce(
-                        Subquery(_answered_distinct_question_subquery_article()), Value(0)
-                    ),
-                )
+                n = reconcile_question_counts()
                 self.stdout.write(
                     self.style.SUCCESS(
-                        f"questionCount·answeredQuestionCount 반영: Article {n_q}행"
+                        "questionCount·answeredQuestionCount 반영: "
+                        f"Article {n['ARTICLE']}행, Video(video) {n['VIDEO']}행, Video(seminar) {n['SEMINAR']}행"
                     )
                 )
             if do_bookmarks:
@@ -0,0 +1,44 @@
+"""
+만료된 content_share_link 행 정리 (cron 하루 1회 또는 run_workers)
+- expired_at < now - --grace-days 인 행을 idx_expired_at 범위 스캔으로 --batch-size 건씩 삭제
+- 삭제한 short_code/share_token 캐시 키도 함께 무효화
+- 만료 직후 행은 ensure_share_link가 같은 행을 갱신(rotation)하므로 유예 기간을 둔다
+
+  python manage.py purge_expired_share_links
+  python manage.py purge_expired_share_links --grace-days 30 --dry-run
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from sites.public_api.content_share_service import invalidate_share_link_cache
+from sites.public_api.models import ContentShareLink
+
+
+class Command(BaseCommand):
+    help = '만료 후 유예 기간이 지난 content_share_link 행 배치 삭제'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace-days', type=int, default=7, help='만료 후 보존 일수')
+        parser.add_argument('--batch-size', type=int, default=1000, help='1회 삭제 건수')
+        parser.add_argument('--dry-run', action='store_true', help='대상 건수만 출력')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['grace_days'])
+        qs = ContentShareLink.objects.filter(expired_at__lt=cutoff).order_by('expired_at')
+        if options['dry_run']:
+            self.stdout.write(f'삭제 대상 {qs.count()}건 (expired_at < {cutoff.isoformat()})')
+            return
+
+        batch_size = options['batch_size']
+        deleted = 0
+        while True:
+            rows = list(qs.values_list('id', 'short_code', 'share_token')[:batch_size])
+            if not rows:
+                break
+            ContentShareLink.objects.filter(id__in=[r[0] for r in rows]).delete()
+            for _id, short_code, share_token in rows:
+                invalidate_share_link_cache(short_code, share_token)
+            deleted += len(rows)
+        self.stdout.write(self.style.SUCCESS(f'content_share_link 만료 행 {deleted}건 삭제'))
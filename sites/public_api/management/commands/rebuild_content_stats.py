@@ -0,0 +1,17 @@
+"""
+publicUserActivityLog 집계 → publicContentStats (라이브러리 통계 카운터) 재구성·드리프트 보정.
+평소에는 조회·공유·북마크·별점 기록 시 content_stats.bump_content_stats 가 증분 갱신한다.
+
+  python manage.py rebuild_content_stats
+"""
+from django.core.management.base import BaseCommand
+
+from sites.public_api.content_stats import rebuild_content_stats
+
+
+class Command(BaseCommand):
+    help = "publicUserActivityLog 를 집계해 publicContentStats(조회·공유·북마크·별점 카운터)를 다시 만듭니다."
+
+    def handle(self, *args, **options):
+        count = rebuild_content_stats()
+        self.stdout.write(self.style.SUCCESS(f"완료: 콘텐츠 통계 {count}행 재구성"))
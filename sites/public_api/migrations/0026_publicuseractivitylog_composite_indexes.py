@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    publicUserActivityLog 복합 인덱스 (index_advisor 점검 결과)
+    - (userId, activityType, regDateTime): 마이페이지·관리자 회원 활동 목록 — user+유형 범위 스캔, 정렬 인덱스 순서
+    - (contentType, activityType, regDateTime): 랭킹 배치 기간 집계 — 풀 스캔 대신 범위 스캔
+    (contentType, contentCode, activityType) 조회는 uniq_view 왼쪽 접두사로 이미 범위 스캔이므로 추가하지 않음.
+    """
+
+    dependencies = [
+        ("public_api", "0025_newsletter_subscriber"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="publicuseractivitylog",
+            index=models.Index(fields=["user_id", "activity_type", "reg_date_time"], name="idx_ual_user_act_time"),
+        ),
+        migrations.AddIndex(
+            model_name="publicuseractivitylog",
+            index=models.Index(fields=["content_type", "activity_type", "reg_date_time"], name="idx_ual_type_act_time"),
+        ),
+    ]
@@ -0,0 +1,61 @@
+from django.db import migrations, models
+
+
+def _backfill(apps, schema_editor):
+    """VIEW 로그 → 최근 본 프로젝션 (회원만). (콘텐츠, 회원, 날짜)당 1행이므로 MAX(PK) 가 마지막 조회 행."""
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO publicRecentView (userId, contentType, contentCode, lastViewedAt, lastLogId)
+            SELECT userId, contentType, contentCode, MAX(regDateTime), MAX(publicUserActivityLogId)
+            FROM publicUserActivityLog
+            WHERE activityType = 'VIEW' AND userId > 0
+            GROUP BY userId, contentType, contentCode
+            """
+        )
+
+
+class Migration(migrations.Migration):
+    """회원별 최근 본 콘텐츠 프로젝션 (마이페이지 최근 본·관리자 회원 활동 조회)"""
+
+    dependencies = [
+        ("public_api", "0026_publicuseractivitylog_composite_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PublicRecentView",
+            fields=[
+                (
+                    "recent_view_id",
+                    models.BigAutoField(
+                        db_column="publicRecentViewId", primary_key=True, serialize=False, verbose_name="최근 본 콘텐츠 PK"
+                    ),
+                ),
+                ("user_id", models.BigIntegerField(db_column="userId", verbose_name="회원 ID")),
+                ("content_type", models.CharField(db_column="contentType", max_length=20, verbose_name="콘텐츠 타입")),
+                ("content_code", models.CharField(db_column="contentCode", max_length=50, verbose_name="콘텐츠 고유 코드")),
+                ("last_viewed_at", models.DateTimeField(db_column="lastViewedAt", verbose_name="마지막 조회 시각")),
+                (
+                    "last_log_id",
+                    models.BigIntegerField(
+                        db_column="lastLogId", verbose_name="마지막 VIEW 로그 PK (publicUserActivityLogId)"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "최근 본 콘텐츠",
+                "verbose_name_plural": "최근 본 콘텐츠",
+                "db_table": "publicRecentView",
+                "indexes": [
+                    models.Index(
+                        fields=["user_id", "last_viewed_at", "recent_view_id"], name="idx_recent_view_user_time"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(fields=("user_id", "content_type", "content_code"), name="uniq_recent_view")
+                ],
+            },
+        ),
+        migrations.RunPython(_backfill, migrations.RunPython.noop),
+    ]
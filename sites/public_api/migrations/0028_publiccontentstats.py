@@ -0,0 +1,66 @@
+from django.db import migrations, models
+
+
+def _backfill(apps, schema_editor):
+    """publicUserActivityLog 집계 → 콘텐츠별 카운터 (집합 INSERT ... SELECT 1회)"""
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO publicContentStats
+                (contentType, contentCode, viewCount, shareCount, bookmarkCount, ratingSum, ratingCount, updatedAt)
+            SELECT contentType, contentCode,
+                COALESCE(SUM(CASE WHEN activityType = 'VIEW' THEN viewCount ELSE 0 END), 0),
+                COALESCE(SUM(CASE WHEN activityType = 'SHARE' THEN viewCount ELSE 0 END), 0),
+                COALESCE(SUM(CASE WHEN activityType = 'BOOKMARK' THEN 1 ELSE 0 END), 0),
+                COALESCE(SUM(CASE WHEN activityType = 'RATING' THEN ratingValue ELSE 0 END), 0),
+                COALESCE(SUM(CASE WHEN activityType = 'RATING' AND ratingValue IS NOT NULL THEN 1 ELSE 0 END), 0),
+                CURRENT_TIMESTAMP
+            FROM publicUserActivityLog
+            GROUP BY contentType, contentCode
+            """
+        )
+
+
+class Migration(migrations.Migration):
+    """콘텐츠별 활동 카운터 (라이브러리 통계 API)"""
+
+    dependencies = [
+        ("public_api", "0027_publicrecentview"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PublicContentStats",
+            fields=[
+                (
+                    "stats_id",
+                    models.BigAutoField(
+                        db_column="publicContentStatsId", primary_key=True, serialize=False, verbose_name="콘텐츠 통계 PK"
+                    ),
+                ),
+                ("content_type", models.CharField(db_column="contentType", max_length=20, verbose_name="콘텐츠 타입")),
+                ("content_code", models.CharField(db_column="contentCode", max_length=50, verbose_name="콘텐츠 고유 코드")),
+                (
+                    "view_count",
+                    models.BigIntegerField(db_column="viewCount", default=0, verbose_name="조회 수 (VIEW viewCount 합)"),
+                ),
+                (
+                    "share_count",
+                    models.BigIntegerField(db_column="shareCount", default=0, verbose_name="공유 수 (SHARE viewCount 합)"),
+                ),
+                ("bookmark_count", models.IntegerField(db_column="bookmarkCount", default=0, verbose_name="북마크 수")),
+                ("rating_sum", models.IntegerField(db_column="ratingSum", default=0, verbose_name="별점 합계")),
+                ("rating_count", models.IntegerField(db_column="ratingCount", default=0, verbose_name="별점 수")),
+                ("updated_at", models.DateTimeField(auto_now=True, db_column="updatedAt", verbose_name="갱신 시각")),
+            ],
+            options={
+                "verbose_name": "콘텐츠 활동 통계",
+                "verbose_name_plural": "콘텐츠 활동 통계",
+                "db_table": "publicContentStats",
+                "constraints": [
+                    models.UniqueConstraint(fields=("content_type", "content_code"), name="uniq_content_stats")
+                ],
+            },
+        ),
+        migrations.RunPython(_backfill, migrations.RunPython.noop),
+    ]
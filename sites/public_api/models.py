@@ -238,6 +238,11 @@ class PublicUserActivityLog(models.Model):
             models.Index(fields=['user_id'], name='idx_user'),
             models.Index(fields=['activity_type'], name='idx_activity'),
             models.Index(fields=['reg_date'], name='idx_regDate'),
+            # 마이페이지·관리자 회원 활동 목록 (userId + activityType, regDateTime 최신순)
+            models.Index(fields=['user_id', 'activity_type', 'reg_date_time'], name='idx_ual_user_act_time'),
+            # 랭킹 배치 기간 집계 (contentType + activityType + regDateTime 범위)
+            models.Index(fields=['content_type', 'activity_type', 'reg_date_time'], name='idx_ual_type_act_time'),
+            # (contentType, contentCode, activityType) 조회는 uniq_view 왼쪽 접두사가 담당
         ]
         constraints = [
             models.UniqueConstraint(
@@ -250,6 +255,77 @@ class PublicUserActivityLog(models.Model):
         return f"{self.user_id} {self.activity_type} {self.content_type}:{self.content_code}"
 
 
+class PublicRecentView(models.Model):
+    """
+    회원별 최근 본 콘텐츠 프로젝션 (테이블: publicRecentView)
+    - (userId, contentType, contentCode) 당 1행: 마지막 VIEW 시각·로그 PK
+    - VIEW 기록(LibraryUserActivityView) 시 upsert — sites.public_api.recent_views
+    - 마이페이지 최근 본 목록·관리자 회원 활동(조회)은 이 테이블만 (userId, lastViewedAt) 순서로 읽는다
+    """
+
+    recent_view_id = models.BigAutoField(primary_key=True, db_column='publicRecentViewId', verbose_name='최근 본 콘텐츠 PK')
+    user_id = models.BigIntegerField(db_column='userId', verbose_name='회원 ID')
+    content_type = models.CharField(max_length=20, db_column='contentType', verbose_name='콘텐츠 타입')
+    content_code = models.CharField(max_length=50, db_column='contentCode', verbose_name='콘텐츠 고유 코드')
+    last_viewed_at = models.DateTimeField(db_column='lastViewedAt', verbose_name='마지막 조회 시각')
+    last_log_id = models.BigIntegerField(db_column='lastLogId', verbose_name='마지막 VIEW 로그 PK (publicUserActivityLogId)')
+
+    class Meta:
+        db_table = 'publicRecentView'
+        verbose_name = '최근 본 콘텐츠'
+        verbose_name_plural = '최근 본 콘텐츠'
+        indexes = [
+            models.Index(fields=['user_id', 'last_viewed_at', 'recent_view_id'], name='idx_recent_view_user_time'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['user_id', 'content_type', 'content_code'], name='uniq_recent_view'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.content_type}:{self.content_code}"
+
+    def as_activity_log(self):
+        """마스터 결합 헬퍼용 (저장하지 않는) VIEW 로그 객체"""
+        return PublicUserActivityLog(
+            public_user_activity_log_id=self.last_log_id,
+            content_type=self.content_type,
+            content_code=self.content_code,
+            user_id=self.user_id,
+            activity_type='VIEW',
+            reg_date_time=self.last_viewed_at,
+        )
+
+
+class PublicContentStats(models.Model):
+    """
+    콘텐츠별 활동 카운터 (테이블: publicContentStats)
+    - (contentType, contentCode) 당 1행: 조회·공유 합계, 북마크 수, 별점 합계·건수
+    - 조회·공유·북마크·별점 기록 시 증분 갱신 — sites.public_api.content_stats
+    - 라이브러리 통계 API 는 로그 집계 대신 이 행(+ 캐시)을 읽는다
+    """
+
+    stats_id = models.BigAutoField(primary_key=True, db_column='publicContentStatsId', verbose_name='콘텐츠 통계 PK')
+    content_type = models.CharField(max_length=20, db_column='contentType', verbose_name='콘텐츠 타입')
+    content_code = models.CharField(max_length=50, db_column='contentCode', verbose_name='콘텐츠 고유 코드')
+    view_count = models.BigIntegerField(default=0, db_column='viewCount', verbose_name='조회 수 (VIEW viewCount 합)')
+    share_count = models.BigIntegerField(default=0, db_column='shareCount', verbose_name='공유 수 (SHARE viewCount 합)')
+    bookmark_count = models.IntegerField(default=0, db_column='bookmarkCount', verbose_name='북마크 수')
+    rating_sum = models.IntegerField(default=0, db_column='ratingSum', verbose_name='별점 합계')
+    rating_count = models.IntegerField(default=0, db_column='ratingCount', verbose_name='별점 수')
+    updated_at = models.DateTimeField(auto_now=True, db_column='updatedAt', verbose_name='갱신 시각')
+
+    class Meta:
+        db_table = 'publicContentStats'
+        verbose_name = '콘텐츠 활동 통계'
+        verbose_name_plural = '콘텐츠 활동 통계'
+        constraints = [
+            models.UniqueConstraint(fields=['content_type', 'content_code'], name='uniq_content_stats'),
+        ]
+
+    def __str__(self):
+        return f"{self.content_type}:{self.content_code}"
+
+
 class SiteVisitEvent(models.Model):
     """
     사이트 단위 방문 이벤트 (테이블: siteVisitEvent)
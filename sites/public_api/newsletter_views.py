@@ -10,7 +10,7 @@ from django.core.exceptions import ValidationError
 
 from sites.public_api.models import PublicMemberShip
 from sites.public_api.newsletter_service import subscribe_from_modal
-from sites.public_api.utils import get_token_from_request, verify_jwt_token
+from sites.public_api.auth_context import get_request_member
 
 
 def _client_ip(request):
@@ -21,15 +21,7 @@ def _client_ip(request):
 
 
 def _optional_member(request) -> PublicMemberShip | None:
-    token = get_token_from_request(request)
-    payload = verify_jwt_token(token, token_type='access') if token else None
-    if not payload:
-        return None
-    user_id = payload.get('user_id')
-    try:
-        return PublicMemberShip.objects.get(member_sid=int(user_id), is_active=True)
-    except (PublicMemberShip.DoesNotExist, ValueError, TypeError):
-        return None
+    return get_request_member(request)
 
 
 class NewsletterSubscribeView(APIView):
@@ -0,0 +1,114 @@
+"""
+회원별 최근 본 콘텐츠 프로젝션 (publicRecentView) 유지·조회
+- record_recent_view: VIEW 기록 직후 upsert (회원만, 비로그인 userId=0 제외)
+- rebuild_recent_views: VIEW 로그에서 집합 INSERT ... SELECT 로 재구성 (마이그레이션 백필·더미 데이터)
+- recent_views_page: (userId, lastViewedAt DESC, PK DESC) 인덱스 순서 페이지 / keyset 커서
+"""
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Iterable, List, Optional, Tuple
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from sites.public_api.models import PublicRecentView
+
+ACTIVITY_VIEW = 'VIEW'
+
+
+def record_recent_view(user_id: int, content_type: str, content_code: str, log_id: int) -> None:
+    """최근 본 콘텐츠 upsert (lastViewedAt 은 VIEW 로그와 같은 NOW())"""
+    if not user_id or not log_id:
+        return
+    if connection.vendor == 'mysql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO publicRecentView (userId, contentType, contentCode, lastViewedAt, lastLogId)
+                VALUES (%s, %s, %s, NOW(), %s)
+                ON DUPLICATE KEY UPDATE
+                    lastViewedAt = VALUES(lastViewedAt),
+                    lastLogId = VALUES(lastLogId)
+                """,
+                [user_id, content_type, content_code, log_id],
+            )
+        return
+    PublicRecentView.objects.update_or_create(
+        user_id=user_id,
+        content_type=content_type,
+        content_code=content_code,
+        defaults={'last_viewed_at': timezone.now(), 'last_log_id': log_id},
+    )
+
+
+def rebuild_recent_views(user_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    VIEW 로그로 프로젝션 재구성 (user_ids 없으면 전체). 반환: 삽입 행 수
+    VIEW 로그는 (콘텐츠, 회원, 날짜)당 1행이고 날짜가 바뀌면 새 행이므로 MAX(PK) 가 마지막 조회 행이다.
+    """
+    params: list = [ACTIVITY_VIEW]
+    user_filter = ''
+    if user_ids is not None:
+        user_ids = [int(u) for u in user_ids]
+        if not user_ids:
+            return 0
+        user_filter = f"AND userId IN ({', '.join(['%s'] * len(user_ids))})"
+        params.extend(user_ids)
+    with transaction.atomic():
+        if user_ids is None:
+            PublicRecentView.objects.all().delete()
+        else:
+            PublicRecentView.objects.filter(user_id__in=user_ids).delete()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO publicRecentView (userId, contentType, contentCode, lastViewedAt, lastLogId)
+                SELECT userId, contentType, contentCode, MAX(regDateTime), MAX(publicUserActivityLogId)
+                FROM publicUserActivityLog
+                WHERE activityType = %s AND userId > 0 {user_filter}
+                GROUP BY userId, contentType, contentCode
+                """,
+                params,
+            )
+            return cursor.rowcount
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def encode_cursor(row: PublicRecentView) -> str:
+    """keyset 커서 '{lastViewedAt epoch µs}_{PK}' (URL 에 그대로 실을 수 있는 형식)"""
+    micros = (row.last_viewed_at - _EPOCH) // timedelta(microseconds=1)
+    return f"{micros}_{row.recent_view_id}"
+
+
+def _decode_cursor(cursor: str) -> Optional[Tuple[datetime, int]]:
+    try:
+        micros, pk = cursor.split('_', 1)
+        return _EPOCH + timedelta(microseconds=int(micros)), int(pk)
+    except (AttributeError, TypeError, ValueError, OverflowError):
+        return None
+
+
+def recent_views_page(user_id: int, page: int, page_size: int, cursor: str = '') -> Tuple[List[PublicRecentView], int, int]:
+    """
+    최근 본 목록 한 페이지
+
+    Args:
+        cursor: 직전 페이지 nextCursor (있으면 page 대신 keyset 으로 이어서 조회)
+
+    Returns:
+        (rows, total, page) — page 는 범위를 넘으면 마지막 페이지로 보정
+    """
+    qs = PublicRecentView.objects.filter(user_id=user_id)
+    total = qs.count()
+    ordered = qs.order_by('-last_viewed_at', '-recent_view_id')
+    position = _decode_cursor(cursor) if cursor else None
+    if position is not None:
+        ts, pk = position
+        rows = list(ordered.filter(Q(last_viewed_at__lt=ts) | Q(last_viewed_at=ts, recent_view_id__lt=pk))[:page_size])
+        return rows, total, page
+    total_pages = max(1, (total + page_size - 1) // page_size)
+    page = min(max(1, page), total_pages)
+    start = (page - 1) * page_size
+    return list(ordered[start : start + page_size]), total, page
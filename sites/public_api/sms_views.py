@@ -17,15 +17,16 @@ from rest_framework import status
 
 from django.conf import settings
 
+from core.throttling import IPRateThrottle, PhoneRateThrottle
 from sites.public_api.aligo_client import send_sms
-from sites.public_api.models import PhoneSmsVerification, PublicMemberShip
+from sites.public_api.models import PhoneSmsVerification
 from sites.public_api.phone_normalize import (
     is_valid_kr_mobile,
     normalize_phone_kr,
     phone_already_registered,
     phone_registered_to_other_member,
 )
-from sites.public_api.utils import get_token_from_request, verify_jwt_token
+from sites.public_api.auth_context import get_auth_context
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,9 @@ MAX_VERIFY_ATTEMPTS = 5
 
 class SendSmsVerificationView(APIView):
     permission_classes = [AllowAny]
+    # IP·번호별 요청 제한 — 거절 시 DB·Aligo 호출 없음
+    throttle_classes = [IPRateThrottle, PhoneRateThrottle]
+    throttle_scope = 'sms_send'
 
     def post(self, request):
         raw = (request.data.get('phone') or '').strip()
@@ -167,17 +171,15 @@ class SendProfilePhoneSmsView(APIView):
     """
 
     permission_classes = [AllowAny]
+    throttle_classes = [IPRateThrottle, PhoneRateThrottle]
+    throttle_scope = 'sms_profile'
 
     def post(self, request):
-        token = get_token_from_request(request)
-        payload = verify_jwt_token(token, token_type='access') if token else None
-        if not payload:
+        context = get_auth_context(request)
+        if not context.payload:
             return Response({'detail': '인증이 필요합니다.'}, status=status.HTTP_401_UNAUTHORIZED)
-        try:
-            member = PublicMemberShip.objects.get(
-                member_sid=int(payload['user_id']), is_active=True
-            )
-        except (PublicMemberShip.DoesNotExist, ValueError, TypeError):
+        member = context.member
+        if member is None:
             return Response({'detail': '사용자를 찾을 수 없습니다.'}, status=status.HTTP_401_UNAUTHORIZED)
 
         raw = (request.data.get('phone') or '').strip()
@@ -1,6 +1,7 @@
 """
 공개 API용 시스템 코드 읽기 전용 뷰.
 홈페이지(www)에서 회원가입/프로필 등에 사용하는 syscode를 8001에서 조회할 수 있도록 함.
+sysCodeManager 에 수정 일시가 없으므로 조회한 코드 행 자체를 버전 스탬프로 ETag (PUBLIC_REFERENCE 캐시).
 """
 from collections import defaultdict
 
@@ -8,11 +9,22 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 
+from core.http_cache import PUBLIC_REFERENCE, conditional_response, make_etag
 from core.models import SysCodeManager
 
 BULK_PARENT_IDS_MAX = 50
 
 
+def _cached_response(request, data):
+    """코드 행(dict) 해시 ETag — 일치하면 304 (본문 인코딩·전송 생략)"""
+    return conditional_response(
+        request,
+        make_etag('syscode', data),
+        PUBLIC_REFERENCE,
+        lambda: Response(data),
+    )
+
+
 def _item_to_dict(item):
     """SysCodeManager 행을 by_parent와 동일한 필드로 변환."""
     return {
@@ -32,7 +44,7 @@ class SysCodeByParentView(APIView):
         parent_id = request.query_params.get('parent_id') or '*'
         queryset = SysCodeManager.objects.filter(sysCodeParentsSid=parent_id).order_by('sysCodeSort', 'sysCodeSid')
         data = [_item_to_dict(item) for item in queryset]
-        return Response(data)
+        return _cached_response(request, data)
 
 
 class SysCodeListByParentsSidView(APIView):
@@ -48,7 +60,7 @@ class SysCodeListByParentsSidView(APIView):
         single_sid = (request.query_params.get('sysCodeSid') or '').strip()
         if single_sid:
             item = SysCodeManager.objects.filter(sysCodeSid=single_sid, sysCodeUse='Y').first()
-            return Response([_item_to_dict(item)] if item else [])
+            return _cached_response(request, [_item_to_dict(item)] if item else [])
 
         parent_id = (request.query_params.get('sysCodeParentsSid') or '').strip()
         if not parent_id:
@@ -57,7 +69,7 @@ class SysCodeListByParentsSidView(APIView):
             'sysCodeSort', 'sysCodeSid'
         )
         data = [_item_to_dict(item) for item in queryset]
-        return Response(data)
+        return _cached_response(request, data)
 
 
 class SysCodeBulkByParentsView(APIView):
@@ -84,4 +96,4 @@ class SysCodeBulkByParentsView(APIView):
             grouped[item.sysCodeParentsSid].append(_item_to_dict(item))
 
         result = {pid: grouped.get(pid, []) for pid in parent_ids}
-        return Response(result)
+        return _cached_response(request, result)
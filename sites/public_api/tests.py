@@ -0,0 +1,597 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+PUBLIC_HOST = 'localhost:8001'
+
+
+def _member(email='member@example.com', **kwargs):
+    from sites.public_api.models import PublicMemberShip
+
+    return PublicMemberShip.objects.create(email=email, name='회원', nickname='회원', phone='01012345678', **kwargs)
+
+
+def _bearer(member):
+    from sites.public_api.utils import create_public_jwt_tokens
+
+    return f"Bearer {create_public_jwt_tokens(member)['access_token']}"
+
+
+class LoginThrottleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_rotating_forwarded_for_does_not_bypass_ip_limit(self):
+        # login.ip = 30/m — X-Forwarded-For 를 매번 바꿔도 REMOTE_ADDR 기준으로 센다
+        statuses = [
+            self.client.post(
+                '/login/', {}, content_type='application/json',
+                HTTP_HOST=PUBLIC_HOST, HTTP_X_FORWARDED_FOR=f'198.51.100.{i}',
+            ).status_code
+            for i in range(35)
+        ]
+        self.assertEqual(statuses[:30], [400] * 30)
+        self.assertEqual(statuses[30:], [429] * 5)
+
+
+@override_settings(REQUEST_INSTRUMENTATION_ENABLED=True, REQUEST_QUERY_BUDGET_ENFORCE=True)
+class QueryBudgetTests(TestCase):
+    """뷰 query_budget 을 강제(QueryBudgetExceeded)한 상태에서 목록 크기와 무관하게 200 인지 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        from sites.admin_api.articles.models import Article
+        from sites.admin_api.content_author.models import ContentAuthor
+        from sites.admin_api.content_publish_syscodes import STATUS_PUBLISHED
+        from sites.public_api.models import ContentRankingCache
+
+        authors = [ContentAuthor.objects.create(name=f'저자{i}') for i in range(3)]
+        cls.articles = [
+            Article.objects.create(
+                title=f'아티클{i}', content='<p>본문</p>', category='CAT1', author=authors[i % 3].name,
+                author_id=authors[i % 3], status=STATUS_PUBLISHED,
+            )
+            for i in range(12)
+        ]
+        today = timezone.localdate()
+        rows = []
+        for ranking_type in (
+            ContentRankingCache.RANKING_HOT, ContentRankingCache.RANKING_SHARE,
+            ContentRankingCache.RANKING_RECOMMENDED, ContentRankingCache.RANKING_WEEKLY_CROSS,
+        ):
+            rows += [
+                ContentRankingCache(
+                    ranking_type=ranking_type, content_type='ARTICLE', content_code=str(a.id),
+                    score=10 - rank, rank_order=rank + 1, base_date=today,
+                )
+                for rank, a in enumerate(cls.articles[:5])
+            ]
+        rows += [
+            ContentRankingCache(
+                ranking_type=ContentRankingCache.RANKING_CATEGORY_HOT, content_type='ARTICLE',
+                content_code=str(a.id), category_code='CAT1', score=10 - rank, rank_order=rank + 1, base_date=today,
+            )
+            for rank, a in enumerate(cls.articles[:3])
+        ]
+        ContentRankingCache.objects.bulk_create(rows)
+
+    def setUp(self):
+        cache.clear()
+
+    def _get(self, path):
+        response = self.client.get(path, HTTP_HOST=PUBLIC_HOST)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()['IndeAPIResponse']['Result']
+
+    def test_article_list_within_budget(self):
+        for query in ('', '?sort=popular', '?sort=popular&category=CAT1', '?category=CAT1&pageSize=5&page=2'):
+            with self.subTest(query=query):
+                self.assertTrue(self._get(f'/api/articles/{query}')['articles'])
+
+    def test_article_detail_within_budget(self):
+        article = self.articles[0]
+        self.assertEqual(self._get(f'/api/articles/{article.id}/')['id'], article.id)
+        # 같은 IP 재조회(조회수 갱신 생략)도 예산 안
+        self._get(f'/api/articles/{article.id}/')
+
+    def test_ranking_views_within_budget(self):
+        for path in (
+            '/api/library/ranking/hot', '/api/library/ranking/share?contentType=ARTICLE',
+            '/api/library/ranking/recommended', '/api/library/ranking/weekly',
+        ):
+            with self.subTest(path=path):
+                self.assertEqual(len(self._get(path)['list']), 5)
+
+
+class ContentRatingSyncTests(TestCase):
+    def _article(self, **kwargs):
+        from sites.admin_api.articles.models import Article
+
+        return Article.objects.create(title='별점', content='<p>본문</p>', **kwargs)
+
+    def _rate(self, content_type, content_code, value, user_id):
+        from sites.public_api.models import PublicUserActivityLog
+
+        PublicUserActivityLog.objects.create(
+            content_type=content_type, content_code=str(content_code), user_id=user_id,
+            activity_type='RATING', rating_value=value, reg_date=timezone.localdate(),
+        )
+
+    def test_apply_rating_change_deltas(self):
+        from sites.public_api.content_rating_sync import apply_rating_change
+
+        article = self._article()
+        apply_rating_change('ARTICLE', article.id, new_value=5)
+        apply_rating_change('ARTICLE', article.id, new_value=2)
+        article.refresh_from_db()
+        self.assertEqual((article.ratingSum, article.ratingCount, article.rating), (7, 2, 3.5))
+
+        # 변경: 5 → 4 (건수 유지)
+        apply_rating_change('ARTICLE', str(article.id), old_values=[5], new_value=4)
+        article.refresh_from_db()
+        self.assertEqual((article.ratingSum, article.ratingCount, article.rating), (6, 2, 3.0))
+
+        # 삭제 후 0건이면 rating NULL
+        apply_rating_change('ARTICLE', article.id, old_values=[4])
+        apply_rating_change('ARTICLE', article.id, old_values=[2])
+        article.refresh_from_db()
+        self.assertEqual((article.ratingSum, article.ratingCount, article.rating), (0, 0, None))
+
+    def test_apply_rating_change_ignores_invalid_targets(self):
+        from sites.public_api.content_rating_sync import apply_rating_change
+
+        article = self._article(deletedAt=timezone.now())
+        apply_rating_change('ARTICLE', article.id, new_value=5)
+        apply_rating_change('ARTICLE', 'abc', new_value=5)
+        apply_rating_change('EVENT', article.id, new_value=5)
+        article.refresh_from_db()
+        self.assertEqual((article.ratingSum, article.ratingCount, article.rating), (0, 0, None))
+
+    def test_backfill_matches_logs(self):
+        from sites.admin_api.articles.models import Article
+        from sites.admin_api.video.models import Video
+        from sites.public_api.content_rating_sync import backfill_rating_aggregates
+
+        rated = self._article(ratingSum=99, ratingCount=9, rating=11.0)
+        unrated = self._article(ratingSum=3, ratingCount=1, rating=3.0)
+        in_sync = self._article()
+        seminar = Video.objects.create(contentType='seminar', title='세미나')
+        video = Video.objects.create(contentType='video', title='비디오', ratingSum=4, ratingCount=1, rating=4.0)
+        for user_id, value in enumerate((5, 4, 4), start=1):
+            self._rate('ARTICLE', rated.id, value, user_id)
+        self._rate('SEMINAR', seminar.id, 3, 1)
+        # 같은 id 라도 VIDEO 로그는 세미나 집계에 섞이지 않는다
+        self._rate('VIDEO', seminar.id, 1, 2)
+        self._rate('VIDEO', video.id, 4, 1)
+
+        self.assertEqual(backfill_rating_aggregates(dry_run=True)['ARTICLE'], 2)
+        backfill_rating_aggregates()
+
+        rows = dict(
+            (a.id, (a.ratingSum, a.ratingCount, a.rating)) for a in Article.objects.filter(
+                id__in=[rated.id, unrated.id, in_sync.id]
+            )
+        )
+        self.assertEqual(rows, {rated.id: (13, 3, 4.33), unrated.id: (0, 0, None), in_sync.id: (0, 0, None)})
+        seminar.refresh_from_db()
+        video.refresh_from_db()
+        self.assertEqual((seminar.ratingSum, seminar.ratingCount, seminar.rating), (3, 1, 3.0))
+        self.assertEqual((video.ratingSum, video.ratingCount, video.rating), (4, 1, 4.0))
+        self.assertEqual(backfill_rating_aggregates(dry_run=True), {'ARTICLE': 0, 'SEMINAR': 0, 'VIDEO': 0})
+
+
+class RecentViewsTests(TestCase):
+    def test_record_upserts_one_row_per_content(self):
+        from sites.public_api.models import PublicRecentView
+        from sites.public_api.recent_views import record_recent_view
+
+        record_recent_view(7, 'ARTICLE', '10', log_id=100)
+        first = PublicRecentView.objects.get(user_id=7)
+        record_recent_view(7, 'ARTICLE', '10', log_id=101)
+        record_recent_view(7, 'VIDEO', '10', log_id=102)
+        # 비로그인(userId=0)·로그 없음은 기록하지 않는다
+        record_recent_view(0, 'ARTICLE', '10', log_id=103)
+        record_recent_view(7, 'ARTICLE', '11', log_id=0)
+
+        rows = {(r.content_type, r.content_code): r for r in PublicRecentView.objects.all()}
+        self.assertEqual(set(rows), {('ARTICLE', '10'), ('VIDEO', '10')})
+        self.assertEqual(rows['ARTICLE', '10'].last_log_id, 101)
+        self.assertGreaterEqual(rows['ARTICLE', '10'].last_viewed_at, first.last_viewed_at)
+
+    def test_rebuild_keeps_latest_view_per_content(self):
+        from sites.public_api.models import PublicRecentView, PublicUserActivityLog
+        from sites.public_api.recent_views import rebuild_recent_views
+
+        today = timezone.localdate()
+        logs = [
+            PublicUserActivityLog.objects.create(
+                content_type='ARTICLE', content_code='10', user_id=user_id, activity_type=activity,
+                reg_date=today - timedelta(days=days),
+            )
+            for user_id, activity, days in ((7, 'VIEW', 1), (7, 'VIEW', 0), (7, 'SHARE', 0), (0, 'VIEW', 0), (8, 'VIEW', 0))
+        ]
+        self.assertEqual(rebuild_recent_views([7]), 1)
+        row = PublicRecentView.objects.get()
+        self.assertEqual((row.user_id, row.last_log_id), (7, logs[1].pk))
+        self.assertEqual(rebuild_recent_views(), 2)
+
+    def test_keyset_cursor_walks_ties_in_offset_order(self):
+        from sites.public_api.models import PublicRecentView
+        from sites.public_api.recent_views import encode_cursor, recent_views_page
+
+        base = timezone.now().replace(microsecond=123456)
+        for i in range(7):
+            PublicRecentView.objects.create(
+                user_id=7, content_type='ARTICLE', content_code=str(i), last_log_id=i + 1,
+                # 3건씩 같은 시각 — PK 로 순서가 갈린다
+                last_viewed_at=base - timedelta(seconds=i // 3),
+            )
+        PublicRecentView.objects.create(
+            user_id=8, content_type='ARTICLE', content_code='0', last_log_id=99, last_viewed_at=base,
+        )
+
+        by_offset = [r.pk for p in (1, 2, 3) for r in recent_views_page(7, p, 3)[0]]
+        walked, cursor = [], ''
+        while True:
+            rows, total, _page = recent_views_page(7, 1, 3, cursor)
+            self.assertEqual(total, 7)
+            if not rows:
+                break
+            walked += [r.pk for r in rows]
+            cursor = encode_cursor(rows[-1])
+        self.assertEqual(walked, by_offset)
+        self.assertEqual(len(set(walked)), 7)
+
+    def test_invalid_cursor_and_page_fall_back_to_offset(self):
+        from sites.public_api.models import PublicRecentView
+        from sites.public_api.recent_views import recent_views_page
+
+        for i in range(4):
+            PublicRecentView.objects.create(
+                user_id=7, content_type='ARTICLE', content_code=str(i), last_log_id=i + 1,
+                last_viewed_at=timezone.now() - timedelta(minutes=i),
+            )
+        rows, total, page = recent_views_page(7, 99, 3, cursor='not-a-cursor')
+        self.assertEqual((len(rows), total, page), (1, 4, 2))
+
+
+class ArticleDetailHttpCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        from sites.admin_api.articles.models import Article
+        from sites.admin_api.content_publish_syscodes import STATUS_PUBLISHED
+
+        cls.article = Article.objects.create(
+            title='캐시', content='<p>' + '본문 ' * 200 + '</p>', status=STATUS_PUBLISHED, previewLength=10,
+        )
+        cls.member = _member()
+
+    def setUp(self):
+        cache.clear()
+        self.path = f'/api/articles/{self.article.id}/'
+
+    def _get(self, **extra):
+        return self.client.get(self.path, HTTP_HOST=PUBLIC_HOST, **extra)
+
+    def test_guest_200_then_304_with_revalidate_and_vary(self):
+        first = self._get()
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first['ETag'].startswith('W/"'))
+        self.assertEqual(first['Cache-Control'], 'public, no-cache')
+        self.assertEqual({v.strip() for v in first['Vary'].split(',')} >= {'Authorization', 'Cookie'}, True)
+
+        # 약한 비교: W/ 없이 보내도, 여러 태그 중 하나만 맞아도 일치
+        for header in (first['ETag'], first['ETag'][2:], f'"other", {first["ETag"]}'):
+            with self.subTest(header=header):
+                second = self._get(HTTP_IF_NONE_MATCH=header)
+                self.assertEqual(second.status_code, 304)
+                self.assertEqual(second.content, b'')
+                self.assertEqual(second['ETag'], first['ETag'])
+        self.assertEqual(self._get(HTTP_IF_NONE_MATCH='W/"stale"').status_code, 200)
+
+    def test_member_body_is_private_with_its_own_etag(self):
+        guest = self._get()
+        member = self._get(HTTP_AUTHORIZATION=_bearer(self.member))
+        self.assertEqual(member.status_code, 200)
+        self.assertEqual(member['Cache-Control'], 'private, no-cache')
+        self.assertNotIn('public', member['Cache-Control'])
+        self.assertNotEqual(member['ETag'], guest['ETag'])
+        self.assertFalse(member.json()['IndeAPIResponse']['Result']['contentTruncated'])
+        self.assertTrue(guest.json()['IndeAPIResponse']['Result']['contentTruncated'])
+        # 비회원 ETag 로 회원 본문을 304 받지 않는다
+        self.assertEqual(
+            self._get(HTTP_AUTHORIZATION=_bearer(self.member), HTTP_IF_NONE_MATCH=guest['ETag']).status_code, 200
+        )
+
+    def test_share_access_body_is_no_store_without_etag(self):
+        guest_etag = self._get()['ETag']
+        entitlement = {'content_type': 'ARTICLE', 'content_id': str(self.article.id), 'expired': False}
+        self.client.cookies['share_access'] = 'token'
+        with mock.patch('sites.public_api.article_views.resolve_share_token', return_value=entitlement):
+            response = self._get()
+            # 공유 본문은 조건부 요청에도 304 가 아닌 전체 본문
+            conditional = self._get(HTTP_IF_NONE_MATCH=guest_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Cache-Control'], 'private, no-store')
+        self.assertFalse(response.has_header('ETag'))
+        self.assertFalse(response.json()['IndeAPIResponse']['Result']['contentTruncated'])
+        self.assertEqual(conditional.status_code, 200)
+
+
+def _signed(member_sid, key=None, **overrides):
+    import jwt
+    from django.conf import settings
+
+    now = timezone.now()
+    payload = {
+        'user_id': str(member_sid), 'iat': now, 'exp': now + timedelta(minutes=5),
+        'site': 'public_api', 'token_type': 'access', **overrides,
+    }
+    return f"Bearer {jwt.encode(payload, key or settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)}"
+
+
+class AuthContextTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        from sites.public_api.models import IndeUser
+
+        cls.member = _member()
+        IndeUser.objects.create(id='USRTEST00000001', email=cls.member.email)
+
+    def setUp(self):
+        cache.clear()
+
+    def _request(self, authorization=None):
+        from django.test import RequestFactory
+
+        extra = {} if authorization is None else {'HTTP_AUTHORIZATION': authorization}
+        return RequestFactory().get('/', **extra)
+
+    def _authenticate(self, request):
+        from sites.public_api.authentication import PublicJWTAuthentication
+
+        return PublicJWTAuthentication().authenticate(request)
+
+    def test_missing_token_is_anonymous(self):
+        from sites.public_api.auth_context import get_request_member
+
+        request = self._request()
+        self.assertIsNone(self._authenticate(request))
+        self.assertIsNone(get_request_member(request))
+
+    def test_expired_or_forged_token_fails_auth_but_helper_returns_none(self):
+        from rest_framework.exceptions import AuthenticationFailed
+
+        from sites.public_api.auth_context import get_request_member
+
+        sid = self.member.member_sid
+        tokens = {
+            'expired': _signed(sid, exp=timezone.now() - timedelta(seconds=1)),
+            'forged': _signed(sid, key='not-the-secret'),
+            'refresh': _signed(sid, token_type='refresh'),
+        }
+        for label, authorization in tokens.items():
+            with self.subTest(label):
+                with self.assertRaises(AuthenticationFailed):
+                    self._authenticate(self._request(authorization))
+                self.assertIsNone(get_request_member(self._request(authorization)))
+
+    def test_inactive_member_is_not_resolved(self):
+        from rest_framework.exceptions import AuthenticationFailed
+
+        from sites.public_api.auth_context import get_request_member
+
+        inactive = _member(email='gone@example.com', is_active=False)
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(self._request(_bearer(inactive)))
+        self.assertIsNone(get_request_member(self._request(_bearer(inactive))))
+
+    def test_one_member_query_per_authenticated_request(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from sites.public_api.auth_context import get_request_member
+
+        request = self._request(_bearer(self.member))
+        with CaptureQueriesContext(connection) as ctx:
+            user, _ = self._authenticate(request)
+            self.assertEqual(get_request_member(request), self.member)
+            self.assertEqual(get_request_member(request).member_sid, self.member.member_sid)
+        member_queries = [q for q in ctx.captured_queries if 'publicMemberShip' in q['sql']]
+        self.assertEqual(len(member_queries), 1)
+        self.assertEqual(user.email, self.member.email)
+
+    @override_settings(PUBLIC_AUTH_PRINCIPAL_CACHE_TTL=60)
+    def test_principal_cache_is_invalidated_on_member_save(self):
+        from sites.public_api.auth_context import get_request_member
+
+        authorization = _bearer(self.member)
+        self.assertEqual(get_request_member(self._request(authorization)).nickname, '회원')
+        with self.assertNumQueries(0):
+            self.assertIsNotNone(get_request_member(self._request(authorization)))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.member.nickname = '바뀐닉네임'
+            self.member.save()
+        self.assertEqual(get_request_member(self._request(authorization)).nickname, '바뀐닉네임')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.member.is_active = False
+            self.member.save()
+        self.assertIsNone(get_request_member(self._request(authorization)))
+
+
+class ContentStatsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _row(self, content_type='ARTICLE', content_code='1'):
+        from sites.public_api.models import PublicContentStats
+
+        return PublicContentStats.objects.values_list(
+            'view_count', 'share_count', 'bookmark_count', 'rating_sum', 'rating_count'
+        ).get(content_type=content_type, content_code=content_code)
+
+    def test_bump_applies_deltas_and_floors_at_zero(self):
+        from sites.public_api.content_stats import bump_content_stats
+
+        bump_content_stats('ARTICLE', ' 1 ', views=3, shares=1)
+        bump_content_stats('ARTICLE', '1', views=2, bookmarks=1, rating_sum=4, rating_count=1)
+        self.assertEqual(self._row(), (5, 1, 1, 4, 1))
+        # 북마크 취소가 중복돼도 음수가 되지 않는다
+        bump_content_stats('ARTICLE', '1', bookmarks=-3, views=0)
+        self.assertEqual(self._row(), (5, 1, 0, 4, 1))
+        with self.assertRaises(ValueError):
+            bump_content_stats('ARTICLE', '1', likes=1)
+
+    def test_rating_replacement_keeps_one_rating_per_member(self):
+        member = _member()
+        for rating in (4, 2):
+            response = self.client.post(
+                '/api/library/useractivity/rating',
+                {'contentType': 'ARTICLE', 'contentCode': '7', 'rating': rating},
+                content_type='application/json', HTTP_HOST=PUBLIC_HOST, HTTP_AUTHORIZATION=_bearer(member),
+            )
+            self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(self._row(content_code='7')[3:], (2, 1))
+        stats = self.client.get(
+            '/api/library/stats', {'contentType': 'ARTICLE', 'contentCode': '7'}, HTTP_HOST=PUBLIC_HOST,
+        ).json()['IndeAPIResponse']['Result']
+        self.assertEqual((stats['rating'], stats['ratingCount']), (2, 1))
+
+    def test_get_many_reads_only_cache_misses(self):
+        from sites.public_api.content_stats import bump_content_stats, get_content_stats_many
+
+        bump_content_stats('ARTICLE', '1', views=2)
+        bump_content_stats('VIDEO', '2', shares=1)
+        with self.assertNumQueries(1):
+            first = get_content_stats_many([('ARTICLE', '1'), ('VIDEO', '2'), ('ARTICLE', '1')])
+        self.assertEqual(len(first), 2)
+        self.assertEqual(first[('ARTICLE', '1')]['viewCount'], 2)
+        self.assertIsNone(first[('ARTICLE', '1')]['rating'])
+        with self.assertNumQueries(0):
+            self.assertEqual(get_content_stats_many([('VIDEO', '2'), ('ARTICLE', '1')]), first)
+        # 조회 증가는 캐시를 지우지 않고, 북마크는 커밋 후 지운다
+        bump_content_stats('ARTICLE', '1', views=1)
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_content_stats('VIDEO', '2', invalidate=True, bookmarks=1)
+        with self.assertNumQueries(1):
+            second = get_content_stats_many([('ARTICLE', '1'), ('VIDEO', '2'), ('SEMINAR', '3')])
+        self.assertEqual(second[('ARTICLE', '1')]['viewCount'], 2)
+        self.assertEqual(second[('VIDEO', '2')]['bookmarkCount'], 1)
+        self.assertEqual(second[('SEMINAR', '3')]['viewCount'], 0)
+
+    def test_batch_endpoint_parses_items_and_caps_count(self):
+        from sites.public_api.content_stats import bump_content_stats
+        from sites.public_api.library_useractivity_views import STATS_BATCH_MAX_ITEMS
+
+        bump_content_stats('VIDEO', '3', views=4)
+
+        def get(items):
+            return self.client.get('/api/library/stats/batch', {'items': items}, HTTP_HOST=PUBLIC_HOST)
+
+        response = get(' video:3 ,ARTICLE:12,bogus:1,ARTICLE:,VIDEO:3')
+        self.assertEqual(response.status_code, 200)
+        rows = response.json()['IndeAPIResponse']['Result']['list']
+        self.assertEqual([(r['contentType'], r['contentCode'], r['viewCount']) for r in rows], [
+            ('VIDEO', '3', 4), ('ARTICLE', '12', 0),
+        ])
+        self.assertEqual(get('bogus:1,ARTICLE:').status_code, 400)
+        limit = ','.join(f'ARTICLE:{i}' for i in range(STATS_BATCH_MAX_ITEMS))
+        self.assertEqual(get(limit).status_code, 200)
+        self.assertEqual(get(f'{limit},VIDEO:1').status_code, 400)
+
+    def test_rebuild_matches_log_aggregates(self):
+        from sites.public_api.content_stats import bump_content_stats, rebuild_content_stats
+        from sites.public_api.models import PublicContentStats, PublicUserActivityLog
+
+        today = timezone.now().date()
+        logs = [
+            ('ARTICLE', '1', 'VIEW', None, 3),
+            ('ARTICLE', '1', 'VIEW', None, 2),
+            ('ARTICLE', '1', 'SHARE', None, 1),
+            ('ARTICLE', '1', 'BOOKMARK', None, 1),
+            ('ARTICLE', '1', 'RATING', 5, 1),
+            ('ARTICLE', '1', 'RATING', 3, 1),
+            ('VIDEO', '2', 'BOOKMARK', None, 1),
+        ]
+        PublicUserActivityLog.objects.bulk_create([
+            PublicUserActivityLog(
+                user_id=user_id, content_type=ct, content_code=cc, activity_type=act,
+                rating_value=rv, view_count=vc, reg_date=today,
+            )
+            for user_id, (ct, cc, act, rv, vc) in enumerate(logs, start=1)
+        ])
+        # 로그와 어긋난 카운터·로그 없는 행은 재구성으로 정리된다
+        bump_content_stats('ARTICLE', '1', views=100)
+        bump_content_stats('SEMINAR', '9', views=1)
+
+        self.assertEqual(rebuild_content_stats(), 2)
+        self.assertEqual(self._row(), (5, 1, 1, 8, 2))
+        self.assertEqual(self._row('VIDEO', '2'), (0, 0, 1, 0, 0))
+        self.assertFalse(PublicContentStats.objects.filter(content_type='SEMINAR').exists())
+
+
+class ShareLinkCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _issue(self, short_code, user_id=1, content_id=5):
+        from sites.public_api import content_share_service as service
+
+        with mock.patch.object(service, '_random_short_code', return_value=short_code):
+            return service.ensure_share_link(user_id, 'article', content_id)
+
+    def test_unknown_code_is_negatively_cached_until_issued(self):
+        from sites.public_api.content_share_service import resolve_share_token, resolve_short_code
+
+        with self.assertNumQueries(1):
+            self.assertIsNone(resolve_short_code('Unknown01'))
+        with self.assertNumQueries(0):
+            self.assertIsNone(resolve_short_code('Unknown01'))
+            self.assertIsNone(resolve_short_code(''))
+            self.assertIsNone(resolve_short_code('x' * 13))
+            self.assertIsNone(resolve_share_token('f' * 65))
+
+        # 발급하면 음성 캐시를 지우고 새 레코드를 바로 적재한다
+        self.assertEqual(self._issue('Unknown01')['mode'], 'issued')
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                resolve_short_code('Unknown01'), {'content_type': 'ARTICLE', 'content_id': 5, 'expired': False},
+            )
+
+    def test_cached_link_expires_after_expired_at(self):
+        from sites.public_api.content_share_service import get_row_for_visit_by_short_code, resolve_share_token
+
+        expired_at = self._issue('Expiring1')['expired_at']
+        token = get_row_for_visit_by_short_code('Expiring1')['share_token']
+        self.assertFalse(resolve_share_token(token)['expired'])
+        with mock.patch('django.utils.timezone.now', return_value=expired_at + timedelta(seconds=1)):
+            with self.assertNumQueries(0):
+                self.assertTrue(resolve_share_token(token)['expired'])
+                self.assertTrue(get_row_for_visit_by_short_code('Expiring1')['expired'])
+
+    def test_rotation_invalidates_old_code_and_token(self):
+        from sites.public_api.content_share_service import (
+            get_row_for_visit_by_short_code, resolve_share_token, resolve_short_code,
+        )
+        from sites.public_api.models import ContentShareLink
+
+        self._issue('OldCode01')
+        old_token = get_row_for_visit_by_short_code('OldCode01')['share_token']
+        self.assertEqual(self._issue('Ignored01')['mode'], 'active')
+
+        ContentShareLink.objects.update(expired_at=timezone.now() - timedelta(minutes=1))
+        renewed = self._issue('NewCode01')
+        self.assertEqual((renewed['mode'], renewed['short_code']), ('renewed', 'NewCode01'))
+
+        self.assertIsNone(resolve_short_code('OldCode01'))
+        self.assertIsNone(resolve_share_token(old_token))
+        with self.assertNumQueries(0):
+            row = get_row_for_visit_by_short_code('NewCode01')
+            self.assertFalse(row['expired'])
+            self.assertNotEqual(row['share_token'], old_token)
+            self.assertEqual(resolve_share_token(row['share_token'])['content_id'], 5)
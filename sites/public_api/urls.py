@@ -52,6 +52,8 @@ from sites.public_api.library_useractivity_views import (
     LibraryUserActivityShare,
     LibraryUserActivityRating,
     LibraryUserActivityBookmark,
+    LibraryStats,
+    LibraryStatsBatch,
     LibraryStatsViewCount,
     LibraryStatsRating,
     LibraryStatsBookmark,
@@ -227,6 +229,10 @@ urlpatterns = [
     path('api/library/useractivity/me/bookmarks/', LibraryMeBookmarks.as_view()),
     path('api/library/useractivity/me/ratings', LibraryMeRatings.as_view()),
     path('api/library/useractivity/me/ratings/', LibraryMeRatings.as_view()),
+    path('api/library/stats', LibraryStats.as_view()),
+    path('api/library/stats/', LibraryStats.as_view()),
+    path('api/library/stats/batch', LibraryStatsBatch.as_view()),
+    path('api/library/stats/batch/', LibraryStatsBatch.as_view()),
     path('api/library/stats/view-count', LibraryStatsViewCount.as_view()),
     path('api/library/stats/view-count/', LibraryStatsViewCount.as_view()),
     path('api/library/stats/rating', LibraryStatsRating.as_view()),
@@ -13,14 +13,15 @@ from rest_framework import status
 from rest_framework.permissions import AllowAny
 from django.conf import settings
 from django.utils import timezone
-from core.models import AuditLog
+from core.audit import record_audit
+from core.throttling import AccountRateThrottle, IPRateThrottle
+from sites.public_api.auth_context import get_auth_context, get_request_member
 from sites.public_api.models import PhoneSmsVerification, PublicMemberShip
 from sites.public_api.phone_normalize import is_valid_kr_mobile, normalize_phone_kr, phone_already_registered
 from sites.public_api.serializers import RegisterSerializer, LoginSerializer
 from sites.public_api.utils import (
     create_public_jwt_tokens,
     get_token_from_cookie,
-    get_token_from_request,
     verify_jwt_token,
     verify_oauth_pending_token,
 )
@@ -304,7 +305,7 @@ class RegisterView(APIView):
 
             tokens = create_public_jwt_tokens(member)
 
-            AuditLog.objects.create(
+            record_audit(
                 user_id=member.member_sid,
                 site_slug='public_api',
                 action='create',
@@ -327,8 +328,10 @@ class RegisterView(APIView):
 
 
 class LoginView(APIView):
-    """로그인 API (PublicMemberShip, 일반 로그인)"""
+    """로그인 API (PublicMemberShip, 일반 로그인) — IP·이메일별 요청 제한 후 비밀번호 검증"""
     permission_classes = [AllowAny]
+    throttle_classes = [IPRateThrottle, AccountRateThrottle]
+    throttle_scope = 'login'
 
     def post(self, request):
         serializer = LoginSerializer(data=request.data)
@@ -349,7 +352,7 @@ class LoginView(APIView):
             }, status=status.HTTP_401_UNAUTHORIZED)
 
         if not member.check_password(password):
-            AuditLog.objects.create(
+            record_audit(
                 user_id=member.member_sid,
                 site_slug='public_api',
                 action='login',
@@ -367,7 +370,7 @@ class LoginView(APIView):
         member.save(update_fields=['last_login'])
 
         tokens = create_public_jwt_tokens(member)
-        AuditLog.objects.create(
+        record_audit(
             user_id=member.member_sid,
             site_slug='public_api',
             action='login',
@@ -573,7 +576,7 @@ class OAuthCompleteSignupView(APIView):
         )
         PhoneSmsVerification.objects.filter(phone=phone_norm).delete()
         tokens = create_public_jwt_tokens(member)
-        AuditLog.objects.create(
+        record_audit(
             user_id=member.member_sid,
             site_slug='public_api',
             action='create',
@@ -672,15 +675,7 @@ class MeView(APIView):
     permission_classes = [AllowAny]
 
     def _get_member(self, request):
-        token = get_token_from_request(request)
-        payload = verify_jwt_token(token, token_type='access') if token else None
-        if not payload:
-            return None
-        user_id = payload.get('user_id')
-        try:
-            return PublicMemberShip.objects.get(member_sid=int(user_id), is_active=True)
-        except (PublicMemberShip.DoesNotExist, ValueError, TypeError):
-            return None
+        return get_request_member(request)
 
     def get(self, request):
         member = self._get_member(request)
@@ -764,13 +759,11 @@ class MeEmailAvailabilityView(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request):
-        token = get_token_from_request(request)
-        payload = verify_jwt_token(token, token_type='access') if token else None
-        if not payload:
+        context = get_auth_context(request)
+        if not context.payload:
             return Response({'detail': '인증이 필요합니다.'}, status=status.HTTP_401_UNAUTHORIZED)
-        try:
-            member = PublicMemberShip.objects.get(member_sid=int(payload.get('user_id')), is_active=True)
-        except (PublicMemberShip.DoesNotExist, ValueError, TypeError):
+        member = context.member
+        if member is None:
             return Response({'detail': '사용자를 찾을 수 없습니다.'}, status=status.HTTP_401_UNAUTHORIZED)
 
         raw = (request.query_params.get('email') or '').strip()
@@ -802,20 +795,19 @@ class VerifyProfilePasswordView(APIView):
     마이페이지 회원정보 수정 전 본인 확인 — JWT(access) 필수, 비밀번호만 검증.
     소셜 가입(비밀번호 없음)은 skipped=True 로 성공 처리(프론트에서 수정 폼 바로 허용).
     비밀번호 불일치 시 400 (401 아님 — axios 인터셉터 토큰 갱신 루프 방지).
+    IP·회원(JWT member_sid)별 요청 제한.
     """
 
     permission_classes = [AllowAny]
+    throttle_classes = [IPRateThrottle, AccountRateThrottle]
+    throttle_scope = 'profile_password'
+
+    def get_throttle_account(self, request):
+        # 토큰 payload 만 사용 (DB 조회 없음)
+        return get_auth_context(request).member_sid
 
     def _get_member(self, request):
-        token = get_token_from_request(request)
-        payload = verify_jwt_token(token, token_type='access') if token else None
-        if not payload:
-            return None
-        user_id = payload.get('user_id')
-        try:
-            return PublicMemberShip.objects.get(member_sid=int(user_id), is_active=True)
-        except (PublicMemberShip.DoesNotExist, ValueError, TypeError):
-            return None
+        return get_request_member(request)
 
     def post(self, request):
         member = self._get_member(request)
@@ -836,15 +828,11 @@ class ProfileCompleteView(APIView):
     permission_classes = [AllowAny]
 
     def put(self, request):
-        token = get_token_from_request(request)
-        payload = verify_jwt_token(token, token_type='access') if token else None
-        if not payload:
+        context = get_auth_context(request)
+        if not context.payload:
             return Response({'detail': '인증이 필요합니다.'}, status=status.HTTP_401_UNAUTHORIZED)
-        try:
-            member = PublicMemberShip.objects.get(
-                member_sid=int(payload['user_id']), is_active=True
-            )
-        except (PublicMemberShip.DoesNotExist, ValueError, TypeError):
+        member = context.member
+        if member is None:
             return Response({'detail': '사용자를 찾을 수 없습니다.'}, status=status.HTTP_401_UNAUTHORIZED)
         data = request.data
         err, send_verification = _apply_profile_email_update(request, member, data, 'PUT /profile/complete/')